@@ -0,0 +1,11 @@
+from structured_output_kit.bench.runner import BenchConfig, BENCH_TARGETS, run_benchmark
+from structured_output_kit.bench.import_time import ImportBenchConfig, IMPORT_TARGETS, run_import_benchmark
+
+__all__ = [
+    "BenchConfig",
+    "BENCH_TARGETS",
+    "run_benchmark",
+    "ImportBenchConfig",
+    "IMPORT_TARGETS",
+    "run_import_benchmark",
+]
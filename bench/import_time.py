@@ -0,0 +1,172 @@
+"""진입점별 콜드 스타트(import 시간, RSS) 측정.
+
+대상마다 새 인터프리터를 띄워 모듈을 import하고, 인터프리터 시작을 포함한 전체 시간과
+import 시간, max RSS, 로드된 모듈 수를 잰다. 한 번은 `-X importtime`으로 실행해
+가장 오래 걸린 최상위 import를 함께 기록한다. 이전 결과(`baseline`)를 주면 차이를 비교한다.
+
+    python main.py --cli bench-import --repeat 5 --baseline result/bench/import_xxx/import_time.json
+"""
+from __future__ import annotations
+
+import os
+import sys
+import csv
+import json
+import time
+import statistics
+import subprocess
+from datetime import datetime
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+
+# 대상 이름 -> (import할 모듈, 이어서 로드할 추출 프레임워크)
+IMPORT_TARGETS: Dict[str, Tuple[str, Optional[str]]] = {
+    "cli": ("structured_output_kit.cli", None),                                  # cli.py extract
+    "cli+OpenAIFramework": ("structured_output_kit.cli", "OpenAIFramework"),     # extract 첫 호출까지
+    "main": ("structured_output_kit.main", None),                                # main.py
+    "server": ("structured_output_kit.server.main", None),                       # API 서버 cold start
+    "workflow_cli": ("structured_output_kit.workflow_cli", None),                # workflow_cli.py
+}
+
+_CHILD = """
+import sys, json, time, resource
+started_at = time.perf_counter()
+import importlib
+importlib.import_module({module!r})
+framework = {framework!r}
+if framework:
+    from structured_output_kit.extraction.factory import load_framework_class
+    load_framework_class(framework)
+elapsed = time.perf_counter() - started_at
+scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+print(json.dumps({{"import_s": elapsed, "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale, "modules": len(sys.modules)}}))
+"""
+
+
+@dataclass
+class ImportBenchConfig:
+    """import 시간 벤치마크 설정"""
+    targets: Optional[List[str]] = None   # 없으면 IMPORT_TARGETS 전체
+    repeat: int = 5
+    top: int = 10                          # 기록할 느린 최상위 import 수
+    baseline: Optional[str] = None         # 비교할 이전 import_time.json
+    output_dir: Optional[str] = None
+
+
+def _run_child(module: str, framework: Optional[str], env: Dict[str, str], importtime: bool = False) -> Tuple[float, Dict[str, Any], str]:
+    command = [sys.executable] + (["-X", "importtime"] if importtime else []) + ["-c", _CHILD.format(module=module, framework=framework)]
+    started_at = time.perf_counter()
+    completed = subprocess.run(command, capture_output=True, text=True, env=env, timeout=600)
+    wall = time.perf_counter() - started_at
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else f"exit {completed.returncode}")
+    return wall, json.loads(completed.stdout.strip().splitlines()[-1]), completed.stderr
+
+
+def parse_importtime(stderr: str, top: int = 10) -> List[Dict[str, Any]]:
+    """`-X importtime` 출력에서 누적 시간이 큰 최상위 import 목록"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        if name[1:].startswith(" "):   # 들여쓰기된 항목은 다른 모듈 안에서 import된 모듈
+            continue
+        rows.append({"module": name.strip(), "cumulative_ms": int(cumulative_us) / 1000, "self_ms": int(self_us) / 1000})
+    rows.sort(key=lambda row: row["cumulative_ms"], reverse=True)
+    return rows[:top]
+
+
+def _measure(name: str, config: ImportBenchConfig, env: Dict[str, str]) -> Dict[str, Any]:
+    module, framework = IMPORT_TARGETS[name]
+    walls, imports, rss, modules = [], [], [], 0
+    for _ in range(max(1, config.repeat)):
+        wall, result, _ = _run_child(module, framework, env)
+        walls.append(wall)
+        imports.append(result["import_s"])
+        rss.append(result["max_rss_mb"])
+        modules = result["modules"]
+    _, _, stderr = _run_child(module, framework, env, importtime=True)
+    return {
+        "target": name,
+        "module": module,
+        "framework": framework,
+        "wall_ms_median": statistics.median(walls) * 1000,
+        "wall_ms_min": min(walls) * 1000,
+        "import_ms_median": statistics.median(imports) * 1000,
+        "import_ms_min": min(imports) * 1000,
+        "max_rss_mb": statistics.median(rss),
+        "modules": modules,
+        "slowest_imports": parse_importtime(stderr, config.top),
+    }
+
+
+def _compare(rows: List[Dict[str, Any]], baseline_path: str) -> None:
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = {row["target"]: row for row in json.load(f).get("results", []) if "error" not in row}
+    for row in rows:
+        previous = baseline.get(row["target"])
+        if previous is None or "error" in row:
+            continue
+        row["baseline_wall_ms"] = previous["wall_ms_median"]
+        row["wall_ms_delta"] = row["wall_ms_median"] - previous["wall_ms_median"]
+        row["max_rss_mb_delta"] = row["max_rss_mb"] - previous["max_rss_mb"]
+
+
+def run_import_benchmark(config: ImportBenchConfig) -> Dict[str, Any]:
+    """진입점별 콜드 스타트를 측정해 JSON/CSV로 저장한다."""
+    targets = config.targets or list(IMPORT_TARGETS)
+    unknown = [name for name in targets if name not in IMPORT_TARGETS]
+    if unknown:
+        raise ValueError(f"알 수 없는 측정 대상: {unknown} (지원: {list(IMPORT_TARGETS)})")
+
+    output_dir = config.output_dir or os.path.join("result", "bench", datetime.now().strftime("import_%Y%m%d_%H%M%S"))
+    os.makedirs(output_dir, exist_ok=True)
+    env = dict(os.environ, LANGFUSE_TRACING_ENABLED="false")
+
+    rows: List[Dict[str, Any]] = []
+    for name in targets:
+        logger.info(f"{name} 측정 중 ({config.repeat}회)")
+        try:
+            row = _measure(name, config, env)
+        except Exception as e:
+            logger.error(f"{name} 측정 실패: {e}")
+            rows.append({"target": name, "module": IMPORT_TARGETS[name][0], "error": str(e)})
+            continue
+        slowest = ", ".join(f"{item['module']} {item['cumulative_ms']:.0f}ms" for item in row["slowest_imports"][:3])
+        logger.info(
+            f"{name}: 전체 {row['wall_ms_median']:.0f}ms (import {row['import_ms_median']:.0f}ms), "
+            f"RSS {row['max_rss_mb']:.0f}MB, 모듈 {row['modules']}개 / 느린 import: {slowest}"
+        )
+        rows.append(row)
+
+    if config.baseline:
+        _compare(rows, config.baseline)
+        for row in rows:
+            if "wall_ms_delta" in row:
+                logger.info(f"{row['target']}: baseline 대비 {row['wall_ms_delta']:+.0f}ms, RSS {row['max_rss_mb_delta']:+.0f}MB")
+
+    report = {
+        "created_at": datetime.now().isoformat(),
+        "config": asdict(config),
+        "python": sys.version.split()[0],
+        "results": rows,
+    }
+    json_path = os.path.join(output_dir, "import_time.json")
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    csv_path = os.path.join(output_dir, "import_time.csv")
+    columns: List[str] = []
+    for row in rows:
+        columns.extend(key for key in row if key not in columns and key != "slowest_imports")
+    with open(csv_path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=columns, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(rows)
+
+    logger.info(f"import 시간 결과 저장: {json_path}, {csv_path}")
+    return dict(report, json_path=json_path, csv_path=csv_path)
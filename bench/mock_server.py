@@ -0,0 +1,528 @@
+"""네트워크 잡음 없이 프레임워크 오버헤드를 재기 위한 로컬 mock LLM 서버.
+
+OpenAI(`/v1/chat/completions`), Anthropic(`/v1/messages`), Ollama(`/api/chat`) 형식의
+요청에 스키마에 맞는 고정 JSON을 돌려준다. 응답 지연(`latency`)과 토큰 스트리밍
+(`chunk_chars`자씩 `token_latency` 간격)을 설정할 수 있다.
+provider batch API(OpenAI `/v1/files`·`/v1/batches`, Anthropic `/v1/messages/batches`)도
+흉내 내며, 제출 후 `batch_delay`초가 지나면 완료 상태가 된다.
+Ollama는 모델 적재도 흉내 낸다: 메모리에 없는 모델의 첫 요청은 `load_delay`초를 더 기다리고
+`load_duration`으로 보고하며, `keep_alive`(`/api/generate` 빈 프롬프트 warm-up, `keep_alive=0` 해제,
+`/api/ps` 조회)를 따른다.
+
+    python -m structured_output_kit.bench.mock_server --port 8765 --latency 0.05
+"""
+from __future__ import annotations
+
+import json
+import time
+import uuid
+import asyncio
+import argparse
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from fastapi import FastAPI, Request, UploadFile, File, Form, HTTPException
+from fastapi.responses import JSONResponse, StreamingResponse, PlainTextResponse
+
+from structured_output_kit.utils.rate_limiter import estimate_tokens
+
+
+@dataclass
+class MockConfig:
+    latency: float = 0.05        # 첫 토큰(비스트리밍이면 전체 응답)까지 지연(초)
+    token_latency: float = 0.0   # 스트리밍 조각 사이 지연(초)
+    chunk_chars: int = 16        # 스트리밍 조각 크기(문자)
+    payload: Optional[Dict[str, Any]] = None  # 요청에 스키마가 없을 때 돌려줄 JSON
+    batch_delay: float = 1.0     # batch 제출 후 완료되기까지 시간(초)
+    prefix_block: int = 32       # prefix 캐시 흉내: 이전 요청과 이 크기(문자) 단위로 앞부분이 같으면 캐시 적중
+    load_delay: float = 0.0      # Ollama 모델이 메모리에 없을 때 요청 전에 적재하는 시간(초)
+
+
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def _keep_alive_seconds(value: Any) -> Optional[float]:
+    """Ollama keep_alive(`"5m"`, `30`, `"-1"`, `0`)를 초로. 음수는 무기한(None)."""
+    if value is None:
+        return 300.0
+    if isinstance(value, str):
+        for unit, scale in sorted(_DURATION_UNITS.items(), key=lambda item: -len(item[0])):
+            if value.endswith(unit) and value[:-len(unit)].lstrip("-").replace(".", "", 1).isdigit():
+                seconds = float(value[:-len(unit)]) * scale
+                break
+        else:
+            seconds = float(value)
+    else:
+        seconds = float(value)
+    return None if seconds < 0 else seconds
+
+
+def sample_from_schema(schema: Dict[str, Any], root: Optional[Dict[str, Any]] = None) -> Any:
+    """JSON schema를 만족하는 최소 예시 값 (모든 속성을 채우고 배열은 원소 하나)"""
+    root = root or schema
+    if "$ref" in schema:
+        node: Any = root
+        for part in schema["$ref"].lstrip("#/").split("/"):
+            node = node[part]
+        return sample_from_schema(node, root)
+    for key in ("anyOf", "oneOf", "allOf"):
+        if key in schema:
+            options = [option for option in schema[key] if option.get("type") != "null"]
+            return sample_from_schema(options[0] if options else schema[key][0], root)
+    if "enum" in schema:
+        return schema["enum"][0]
+    if "const" in schema:
+        return schema["const"]
+    kind = schema.get("type")
+    if isinstance(kind, list):
+        kind = next((k for k in kind if k != "null"), "null")
+    if kind == "object" or "properties" in schema:
+        return {name: sample_from_schema(prop, root) for name, prop in schema.get("properties", {}).items()}
+    if kind == "array":
+        return [sample_from_schema(schema.get("items", {}), root)]
+    if kind == "string":
+        return "sample"
+    if kind == "integer":
+        return 1
+    if kind == "number":
+        return 1.0
+    if kind == "boolean":
+        return True
+    if kind == "null":
+        return None
+    return "sample"
+
+
+def _chunks(text: str, size: int) -> List[str]:
+    size = max(1, size)
+    return [text[i:i + size] for i in range(0, len(text), size)] or [""]
+
+
+def _prompt_text(messages: List[Dict[str, Any]]) -> str:
+    parts = []
+    for message in messages:
+        content = message.get("content")
+        if isinstance(content, list):
+            parts.extend(str(block.get("text", "")) for block in content if isinstance(block, dict))
+        elif content:
+            parts.append(str(content))
+    return "\n".join(parts)
+
+
+def create_app(config: MockConfig) -> FastAPI:
+    app = FastAPI(title="mock LLM server")
+
+    def _payload(schema: Optional[Dict[str, Any]]) -> str:
+        value = sample_from_schema(schema) if schema else (config.payload or {})
+        return json.dumps(value, ensure_ascii=False)
+
+    async def _stream(parts: List[str], render) -> AsyncIterator[str]:
+        await asyncio.sleep(config.latency)
+        for i, part in enumerate(parts):
+            if i and config.token_latency:
+                await asyncio.sleep(config.token_latency)
+            yield render(part)
+
+    seen_prefixes: set = set()
+
+    def _cached_chars(text: str) -> int:
+        """앞에서부터 `prefix_block`자 단위로 이전 요청과 같은 길이 (서버 prefix/KV 캐시 흉내)"""
+        ends = range(config.prefix_block, len(text) + 1, config.prefix_block) if config.prefix_block > 0 else []
+        cached = 0
+        for end in ends:
+            if text[:end] not in seen_prefixes:
+                break
+            cached = end
+        seen_prefixes.update(text[:end] for end in ends)
+        return cached
+
+    def _cached_tokens(text: str) -> int:
+        cached = _cached_chars(text)
+        return estimate_tokens(text[:cached]) if cached else 0
+
+    @app.get("/health")
+    async def health() -> Dict[str, Any]:
+        return {"status": "ok"}
+
+    # ------------------------------------------------------------------ OpenAI
+    def _openai_target(body: Dict[str, Any]):
+        tools = body.get("tools") or []
+        response_format = body.get("response_format") or {}
+        if tools:
+            function = tools[0].get("function", {})
+            return function.get("name", "extract"), function.get("parameters")
+        return None, (response_format.get("json_schema") or {}).get("schema")
+
+    def _openai_usage(body: Dict[str, Any], text: str) -> Dict[str, Any]:
+        prompt = _prompt_text(body.get("messages", []))
+        usage: Dict[str, Any] = {
+            "prompt_tokens": estimate_tokens(prompt),
+            "completion_tokens": estimate_tokens(text),
+            "prompt_tokens_details": {"cached_tokens": _cached_tokens(prompt)},
+        }
+        usage["total_tokens"] = usage["prompt_tokens"] + usage["completion_tokens"]
+        return usage
+
+    def _completion(body: Dict[str, Any]) -> Dict[str, Any]:
+        """비스트리밍 chat completion 응답 (batch 결과에도 사용)"""
+        name, schema = _openai_target(body)
+        text = _payload(schema)
+        if name:
+            message = {"role": "assistant", "content": None, "tool_calls": [
+                {"id": "call_0", "type": "function", "function": {"name": name, "arguments": text}}
+            ]}
+        else:
+            message = {"role": "assistant", "content": text}
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex[:12]}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "mock-model"),
+            "choices": [{"index": 0, "message": message, "finish_reason": "tool_calls" if name else "stop"}],
+            "usage": _openai_usage(body, text),
+        }
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        model = body.get("model", "mock-model")
+        name, schema = _openai_target(body)
+        text = _payload(schema)
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+        created = int(time.time())
+
+        if body.get("stream"):
+            usage = _openai_usage(body, text)
+
+            def render(part: str) -> str:
+                if name:
+                    delta = {"tool_calls": [{"index": 0, "id": "call_0", "type": "function", "function": {"name": name, "arguments": part}}]}
+                else:
+                    delta = {"role": "assistant", "content": part}
+                chunk = {"id": completion_id, "object": "chat.completion.chunk", "created": created, "model": model,
+                         "choices": [{"index": 0, "delta": delta, "finish_reason": None}]}
+                return f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n"
+
+            async def events() -> AsyncIterator[str]:
+                async for line in _stream(_chunks(text, config.chunk_chars), render):
+                    yield line
+                final = {"id": completion_id, "object": "chat.completion.chunk", "created": created, "model": model,
+                         "choices": [{"index": 0, "delta": {}, "finish_reason": "tool_calls" if name else "stop"}]}
+                if (body.get("stream_options") or {}).get("include_usage"):
+                    final["usage"] = usage
+                yield f"data: {json.dumps(final)}\n\n"
+                yield "data: [DONE]\n\n"
+            return StreamingResponse(events(), media_type="text/event-stream")
+
+        await asyncio.sleep(config.latency)
+        return JSONResponse(_completion(body))
+
+    # --------------------------------------------------------------- Anthropic
+    def _anthropic_target(body: Dict[str, Any]):
+        tools = body.get("tools") or []
+        return (tools[0].get("name", "extract_info"), tools[0].get("input_schema")) if tools else (None, None)
+
+    def _anthropic_usage(body: Dict[str, Any], text: str) -> Dict[str, int]:
+        """cache_control이 달린 블록까지를 캐시 대상으로 본다 (처음이면 쓰기, 이후 읽기)"""
+        total = estimate_tokens(_prompt_text(body.get("messages", [])))
+        cached_prefix = ""
+        for message in body.get("messages", []):
+            blocks = message.get("content") if isinstance(message.get("content"), list) else []
+            for i, block in enumerate(blocks):
+                if isinstance(block, dict) and block.get("cache_control"):
+                    cached_prefix = _prompt_text([{"content": blocks[:i + 1]}])
+        usage = {"input_tokens": total, "output_tokens": estimate_tokens(text),
+                 "cache_read_input_tokens": 0, "cache_creation_input_tokens": 0}
+        if cached_prefix:
+            key = "cache_read_input_tokens" if ("anthropic", cached_prefix) in seen_prefixes else "cache_creation_input_tokens"
+            seen_prefixes.add(("anthropic", cached_prefix))
+            usage[key] = min(estimate_tokens(cached_prefix), total)
+            usage["input_tokens"] = total - usage[key]
+        return usage
+
+    def _message(body: Dict[str, Any]) -> Dict[str, Any]:
+        """비스트리밍 messages 응답 (batch 결과에도 사용)"""
+        name, schema = _anthropic_target(body)
+        text = _payload(schema)
+        if name:
+            content = [{"type": "tool_use", "id": "toolu_0", "name": name, "input": json.loads(text)}]
+        else:
+            content = [{"type": "text", "text": text}]
+        return {
+            "id": f"msg_{uuid.uuid4().hex[:12]}",
+            "type": "message",
+            "role": "assistant",
+            "model": body.get("model", "mock-model"),
+            "content": content,
+            "stop_reason": "tool_use" if name else "end_turn",
+            "stop_sequence": None,
+            "usage": _anthropic_usage(body, text),
+        }
+
+    @app.post("/v1/messages")
+    async def messages(request: Request):
+        body = await request.json()
+        model = body.get("model", "mock-model")
+        name, schema = _anthropic_target(body)
+        text = _payload(schema)
+        message_id = f"msg_{uuid.uuid4().hex[:12]}"
+
+        if body.get("stream"):
+            usage = _anthropic_usage(body, text)
+
+            def sse(event: str, data: Dict[str, Any]) -> str:
+                return f"event: {event}\ndata: {json.dumps(dict(data, type=event), ensure_ascii=False)}\n\n"
+
+            def render(part: str) -> str:
+                delta = {"type": "input_json_delta", "partial_json": part} if name else {"type": "text_delta", "text": part}
+                return sse("content_block_delta", {"index": 0, "delta": delta})
+
+            async def events() -> AsyncIterator[str]:
+                yield sse("message_start", {"message": {
+                    "id": message_id, "type": "message", "role": "assistant", "model": model, "content": [],
+                    "stop_reason": None, "stop_sequence": None,
+                    "usage": {"input_tokens": usage["input_tokens"], "output_tokens": 0},
+                }})
+                block = {"type": "tool_use", "id": "toolu_0", "name": name, "input": {}} if name else {"type": "text", "text": ""}
+                yield sse("content_block_start", {"index": 0, "content_block": block})
+                async for line in _stream(_chunks(text, config.chunk_chars), render):
+                    yield line
+                yield sse("content_block_stop", {"index": 0})
+                yield sse("message_delta", {"delta": {"stop_reason": "tool_use" if name else "end_turn", "stop_sequence": None},
+                                            "usage": {"output_tokens": usage["output_tokens"]}})
+                yield sse("message_stop", {})
+            return StreamingResponse(events(), media_type="text/event-stream")
+
+        await asyncio.sleep(config.latency)
+        return JSONResponse(_message(body))
+
+    # ------------------------------------------------------------------ Ollama
+    loaded_models: Dict[str, Optional[float]] = {}  # 모델 → 만료 시각 (None이면 무기한)
+
+    async def _ollama_load(model: str, keep_alive: Any) -> int:
+        """모델이 메모리에 없으면 `load_delay`만큼 적재하고 keep_alive로 만료 시각을 갱신. load_duration(ns) 반환."""
+        now = time.time()
+        expires_at = loaded_models.get(model, now)
+        load_ns = 0
+        if model not in loaded_models or (expires_at is not None and expires_at < now):
+            started_at = time.perf_counter()
+            await asyncio.sleep(config.load_delay)
+            load_ns = int((time.perf_counter() - started_at) * 1e9)
+        seconds = _keep_alive_seconds(keep_alive)
+        if seconds == 0:
+            loaded_models.pop(model, None)
+        else:
+            loaded_models[model] = None if seconds is None else time.time() + seconds
+        return load_ns
+
+    @app.post("/api/generate")
+    async def ollama_generate(request: Request):
+        body = await request.json()
+        model = body.get("model", "mock-model")
+        created_at = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        keep_alive = body.get("keep_alive")
+        if keep_alive is not None and _keep_alive_seconds(keep_alive) == 0 and not body.get("prompt"):
+            loaded_models.pop(model, None)
+            return JSONResponse({"model": model, "created_at": created_at, "response": "", "done": True,
+                                 "done_reason": "unload"})
+        load_ns = await _ollama_load(model, keep_alive)
+        if not body.get("prompt"):
+            # 빈 프롬프트: 모델만 올린다 (warm-up)
+            return JSONResponse({"model": model, "created_at": created_at, "response": "", "done": True,
+                                 "done_reason": "load", "load_duration": load_ns, "total_duration": load_ns})
+        schema = body.get("format") if isinstance(body.get("format"), dict) else None
+        text = _payload(schema)
+        await asyncio.sleep(config.latency)
+        return JSONResponse({
+            "model": model, "created_at": created_at, "response": text, "done": True, "done_reason": "stop",
+            "total_duration": load_ns + int(config.latency * 1e9), "load_duration": load_ns,
+            "prompt_eval_count": estimate_tokens(body["prompt"]), "prompt_eval_duration": int(config.latency * 1e9),
+            "eval_count": estimate_tokens(text), "eval_duration": 0,
+        })
+
+    @app.get("/api/ps")
+    async def ollama_ps() -> Dict[str, Any]:
+        now = time.time()
+        return {"models": [
+            {"name": model, "model": model,
+             "expires_at": _iso(expires_at) if expires_at is not None else "0001-01-01T00:00:00Z"}
+            for model, expires_at in loaded_models.items() if expires_at is None or expires_at >= now
+        ]}
+
+    @app.post("/api/chat")
+    async def ollama_chat(request: Request):
+        body = await request.json()
+        model = body.get("model", "mock-model")
+        load_ns = await _ollama_load(model, body.get("keep_alive"))
+        schema = body.get("format") if isinstance(body.get("format"), dict) else None
+        text = _payload(schema)
+        prompt_tokens = estimate_tokens(_prompt_text(body.get("messages", [])))
+        completion_tokens = estimate_tokens(text)
+        parts = _chunks(text, config.chunk_chars)
+        decode_ns = int(config.token_latency * max(len(parts) - 1, 0) * 1e9)
+        done = {
+            "model": model,
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "done": True,
+            "done_reason": "stop",
+            "total_duration": load_ns + int(config.latency * 1e9) + decode_ns,
+            "load_duration": load_ns,
+            "prompt_eval_count": prompt_tokens,
+            "prompt_eval_duration": int(config.latency * 1e9),
+            "eval_count": completion_tokens,
+            "eval_duration": decode_ns,
+        }
+
+        if body.get("stream", True):
+            def render(part: str) -> str:
+                return json.dumps({"model": model, "created_at": done["created_at"],
+                                   "message": {"role": "assistant", "content": part}, "done": False},
+                                  ensure_ascii=False) + "\n"
+
+            async def lines() -> AsyncIterator[str]:
+                async for line in _stream(parts, render):
+                    yield line
+                yield json.dumps(dict(done, message={"role": "assistant", "content": ""})) + "\n"
+            return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+        await asyncio.sleep(config.latency)
+        return JSONResponse(dict(done, message={"role": "assistant", "content": text}))
+
+    # ------------------------------------------------------------ batch APIs
+    files: Dict[str, Dict[str, Any]] = {}
+    batches: Dict[str, Dict[str, Any]] = {}
+
+    def _iso(ts: float) -> str:
+        return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(ts))
+
+    def _ended(batch: Dict[str, Any]) -> bool:
+        return time.time() - batch["submitted_at"] >= config.batch_delay
+
+    def _new_file(content: bytes, filename: str, purpose: str) -> Dict[str, Any]:
+        file_id = f"file-{uuid.uuid4().hex[:12]}"
+        files[file_id] = {"id": file_id, "object": "file", "bytes": len(content), "created_at": int(time.time()),
+                          "filename": filename, "purpose": purpose, "status": "processed", "content": content}
+        return files[file_id]
+
+    def _public(record: Dict[str, Any]) -> Dict[str, Any]:
+        return {key: value for key, value in record.items() if key != "content"}
+
+    @app.post("/v1/files")
+    async def upload_file(file: UploadFile = File(...), purpose: str = Form("batch")):
+        return _public(_new_file(await file.read(), file.filename or "upload.jsonl", purpose))
+
+    @app.get("/v1/files/{file_id}/content")
+    async def file_content(file_id: str):
+        if file_id not in files:
+            raise HTTPException(status_code=404, detail=f"file {file_id} not found")
+        return PlainTextResponse(files[file_id]["content"].decode("utf-8"), media_type="application/jsonl")
+
+    def _openai_batch(batch: Dict[str, Any]) -> Dict[str, Any]:
+        if _ended(batch) and batch["status"] == "in_progress":
+            # 완료 시점에 요청마다 응답을 만들어 출력 파일로 저장
+            lines = []
+            for line in files[batch["input_file_id"]]["content"].decode("utf-8").splitlines():
+                if not line.strip():
+                    continue
+                item = json.loads(line)
+                lines.append(json.dumps({
+                    "id": f"batch_req_{uuid.uuid4().hex[:12]}",
+                    "custom_id": item["custom_id"],
+                    "response": {"status_code": 200, "request_id": uuid.uuid4().hex, "body": _completion(item["body"])},
+                    "error": None,
+                }, ensure_ascii=False))
+            output = _new_file(("\n".join(lines) + "\n").encode("utf-8"), f"{batch['id']}_output.jsonl", "batch_output")
+            batch.update(status="completed", output_file_id=output["id"], completed_at=int(time.time()),
+                         request_counts={"total": len(lines), "completed": len(lines), "failed": 0})
+        return {key: value for key, value in batch.items() if key != "submitted_at"}
+
+    @app.post("/v1/batches")
+    async def create_batch(request: Request):
+        body = await request.json()
+        if body.get("input_file_id") not in files:
+            raise HTTPException(status_code=400, detail="input_file_id not found")
+        total = sum(1 for line in files[body["input_file_id"]]["content"].splitlines() if line.strip())
+        batch_id = f"batch_{uuid.uuid4().hex[:12]}"
+        batches[batch_id] = {
+            "id": batch_id, "object": "batch", "endpoint": body.get("endpoint", "/v1/chat/completions"),
+            "input_file_id": body["input_file_id"], "completion_window": body.get("completion_window", "24h"),
+            "status": "in_progress", "output_file_id": None, "error_file_id": None, "errors": None,
+            "created_at": int(time.time()), "completed_at": None, "metadata": body.get("metadata"),
+            "request_counts": {"total": total, "completed": 0, "failed": 0}, "submitted_at": time.time(),
+        }
+        return _openai_batch(batches[batch_id])
+
+    @app.get("/v1/batches/{batch_id}")
+    async def retrieve_batch(batch_id: str):
+        if batch_id not in batches:
+            raise HTTPException(status_code=404, detail=f"batch {batch_id} not found")
+        return _openai_batch(batches[batch_id])
+
+    def _anthropic_batch(batch: Dict[str, Any], base_url: str) -> Dict[str, Any]:
+        ended = _ended(batch)
+        total = len(batch["requests"])
+        return {
+            "id": batch["id"], "type": "message_batch",
+            "processing_status": "ended" if ended else "in_progress",
+            "request_counts": {"processing": 0 if ended else total, "succeeded": total if ended else 0,
+                               "errored": 0, "canceled": 0, "expired": 0},
+            "created_at": _iso(batch["submitted_at"]), "expires_at": _iso(batch["submitted_at"] + 86400),
+            "ended_at": _iso(batch["submitted_at"] + config.batch_delay) if ended else None,
+            "archived_at": None, "cancel_initiated_at": None,
+            "results_url": f"{base_url}v1/messages/batches/{batch['id']}/results" if ended else None,
+        }
+
+    @app.post("/v1/messages/batches")
+    async def create_message_batch(request: Request):
+        body = await request.json()
+        batch_id = f"msgbatch_{uuid.uuid4().hex[:12]}"
+        batches[batch_id] = {"id": batch_id, "requests": body.get("requests", []), "submitted_at": time.time()}
+        return _anthropic_batch(batches[batch_id], str(request.base_url))
+
+    @app.get("/v1/messages/batches/{batch_id}")
+    async def retrieve_message_batch(batch_id: str, request: Request):
+        if batch_id not in batches:
+            raise HTTPException(status_code=404, detail=f"batch {batch_id} not found")
+        return _anthropic_batch(batches[batch_id], str(request.base_url))
+
+    @app.get("/v1/messages/batches/{batch_id}/results")
+    async def message_batch_results(batch_id: str):
+        batch = batches.get(batch_id)
+        if batch is None or not _ended(batch):
+            raise HTTPException(status_code=404, detail=f"batch {batch_id} results not ready")
+        lines = [
+            json.dumps({"custom_id": item["custom_id"], "result": {"type": "succeeded", "message": _message(item["params"])}}, ensure_ascii=False)
+            for item in batch["requests"]
+        ]
+        return PlainTextResponse("\n".join(lines) + "\n", media_type="application/x-jsonl")
+
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="mock LLM server for framework overhead benchmarks")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--token-latency", type=float, default=0.0)
+    parser.add_argument("--chunk-chars", type=int, default=16)
+    parser.add_argument("--payload", default=None, help="요청에 스키마가 없을 때 돌려줄 JSON 파일")
+    parser.add_argument("--batch-delay", type=float, default=1.0, help="batch 제출 후 완료되기까지 시간(초)")
+    parser.add_argument("--prefix-block", type=int, default=32, help="prefix 캐시 흉내 단위(문자), 0이면 끔")
+    parser.add_argument("--load-delay", type=float, default=0.0, help="Ollama 모델이 메모리에 없을 때 적재 시간(초)")
+    args = parser.parse_args()
+
+    payload = None
+    if args.payload:
+        with open(args.payload, "r", encoding="utf-8") as f:
+            payload = json.load(f)
+
+    import uvicorn
+    config = MockConfig(latency=args.latency, token_latency=args.token_latency, chunk_chars=args.chunk_chars,
+                        payload=payload, batch_delay=args.batch_delay, prefix_block=args.prefix_block,
+                        load_delay=args.load_delay)
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning", access_log=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,321 @@
+"""프레임워크 오버헤드 마이크로벤치마크.
+
+로컬 mock 서버(`bench.mock_server`)를 별도 프로세스로 띄우고, 프레임워크마다 새 프로세스에서
+같은 요청을 설정한 동시성으로 반복 실행한다. 서버 지연은 고정이므로
+`호출 시간 - 서버 지연`이 곧 클라이언트 쪽 오버헤드(프롬프트 구성, 직렬화, HTTP 클라이언트,
+파싱·검증)다. 프로세스를 분리해 CPU 시간과 max RSS가 프레임워크별로 섞이지 않게 한다.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import csv
+import json
+import math
+import time
+import socket
+import asyncio
+import tempfile
+import resource
+import tracemalloc
+import subprocess
+import urllib.request
+import concurrent.futures
+import multiprocessing
+from datetime import datetime
+from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+
+# 프레임워크별 mock 서버 접속 방식: (provider, base_url 경로)
+# GoogleFramework(genai SDK)와 LMFormatEnforcerFramework(로컬 transformers)는 mock 대상이 아님
+BENCH_TARGETS: Dict[str, Tuple[str, str]] = {
+    "OpenAIFramework": ("openai_compatible", "/v1"),
+    "InstructorFramework": ("openai_compatible", "/v1"),
+    "LangchainToolFramework": ("openai_compatible", "/v1"),
+    "LangchainParserFramework": ("openai_compatible", "/v1"),
+    "MirascopeFramework": ("openai_compatible", "/v1"),
+    "LlamaIndexFramework": ("openai_compatible", "/v1"),
+    "MarvinFramework": ("openai_compatible", "/v1"),
+    "OllamaFramework": ("ollama", ""),
+    "AnthropicFramework": ("anthropic", ""),
+}
+
+SAMPLE_INPUT = "홍길동입니다. 서울대학교 컴퓨터공학과를 졸업하고 카카오에서 3년간 백엔드 개발자로 근무했습니다."
+
+
+@dataclass
+class BenchConfig:
+    """벤치마크 설정"""
+    frameworks: Optional[List[str]] = None   # 없으면 BENCH_TARGETS 전체
+    schema_name: str = "schema_han"
+    requests: int = 50                       # 동시성 수준마다 측정할 요청 수
+    warmup: int = 3
+    concurrency: List[int] = field(default_factory=lambda: [1])
+    latency: float = 0.05                    # mock 서버 응답 지연(초)
+    token_latency: float = 0.0               # 스트리밍 조각 간 지연(초)
+    chunk_chars: int = 16
+    stream: bool = False                     # 스트리밍 지원 프레임워크는 astream 경로로 측정
+    alloc_samples: int = 5                   # tracemalloc으로 따로 측정할 요청 수
+    input_text: str = SAMPLE_INPUT
+    output_dir: Optional[str] = None
+
+
+def percentile(values: List[float], p: float) -> Optional[float]:
+    """nearest-rank 백분위수"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(math.ceil(p / 100.0 * len(ordered)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _rusage() -> Tuple[float, float]:
+    """(CPU 시간(초), max RSS(MB))"""
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return usage.ru_utime + usage.ru_stime, usage.ru_maxrss / scale
+
+
+class MockServer:
+    """mock 서버 프로세스를 띄우고 준비될 때까지 기다리는 컨텍스트 매니저"""
+
+    def __init__(self, config: BenchConfig, payload: Dict[str, Any]):
+        self.config = config
+        self.payload = payload
+        self.port = _free_port()
+        self.url = f"http://127.0.0.1:{self.port}"
+        self._process: Optional[subprocess.Popen] = None
+        self._payload_file: Optional[str] = None
+
+    def __enter__(self) -> "MockServer":
+        fd, self._payload_file = tempfile.mkstemp(suffix=".json")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(self.payload, f, ensure_ascii=False)
+        self._process = subprocess.Popen([
+            sys.executable, "-m", "structured_output_kit.bench.mock_server",
+            "--port", str(self.port),
+            "--latency", str(self.config.latency),
+            "--token-latency", str(self.config.token_latency),
+            "--chunk-chars", str(self.config.chunk_chars),
+            "--payload", self._payload_file,
+        ])
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            if self._process.poll() is not None:
+                raise RuntimeError(f"mock 서버 시작 실패 (exit {self._process.returncode})")
+            try:
+                with urllib.request.urlopen(f"{self.url}/health", timeout=1):
+                    logger.info(f"mock 서버 시작: {self.url}")
+                    return self
+            except OSError:
+                time.sleep(0.1)
+        self.__exit__(None, None, None)
+        raise RuntimeError("mock 서버가 30초 안에 준비되지 않았습니다")
+
+    def __exit__(self, *exc) -> None:
+        if self._process is not None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+        if self._payload_file and os.path.exists(self._payload_file):
+            os.remove(self._payload_file)
+
+
+def _server_time(config: BenchConfig, payload_chars: int, streaming: bool) -> float:
+    """mock 서버가 한 요청에 쓰는 시간(초): 첫 토큰 지연 + 스트리밍 조각 간 지연"""
+    if not streaming:
+        return config.latency
+    chunks = max(1, math.ceil(payload_chars / max(1, config.chunk_chars)))
+    return config.latency + config.token_latency * (chunks - 1)
+
+
+def _bench_worker(framework: str, config: BenchConfig, server_url: str, payload_chars: int) -> List[Dict[str, Any]]:
+    """새 프로세스에서 한 프레임워크를 측정한다 (동시성 수준마다 한 행)."""
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+    provider, path = BENCH_TARGETS[framework]
+    base_url = f"{server_url}{path}"
+    # 프레임워크가 base_url 대신 환경변수를 읽는 경우를 위해 함께 설정
+    os.environ.update({
+        "OPENAI_COMPATIBLE_BASEURL": base_url,
+        "OPENAI_COMPATIBLE_API_KEY": "dummy",
+        "ANTHROPIC_BASE_URL": server_url,
+        "ANTHROPIC_API_KEY": "dummy",
+        "LANGFUSE_TRACING_ENABLED": "false",
+    })
+
+    from structured_output_kit.extraction.factory import factory
+    from structured_output_kit.extraction.utils import convert_schema, load_prompt
+    from structured_output_kit.extraction.prompting import build_template
+
+    _, rss_before = _rusage()
+    instance = factory(
+        framework,
+        provider=provider,
+        model="mock-model",
+        base_url=base_url,
+        api_key="dummy",
+        prompt=build_template(load_prompt()),
+        response_model=convert_schema(config.schema_name),
+        api_delay_seconds=0,
+        extra_kwargs={},
+    )
+    _, rss_ready = _rusage()
+    streaming = config.stream and instance.supports_streaming
+    server_time = _server_time(config, payload_chars, streaming)
+    inputs = {"content": config.input_text}
+
+    async def _call() -> Tuple[float, bool]:
+        started_at = time.perf_counter()
+        if streaming:
+            last = None
+            async for last in instance.astream(inputs=inputs):
+                pass
+            ok = last is not None
+        else:
+            predictions, _, _ = await instance.arun(retries=1, inputs=inputs)
+            ok = bool(predictions) and isinstance(predictions[0], dict)
+        return time.perf_counter() - started_at, ok
+
+    async def _run(count: int, concurrency: int) -> List[Tuple[float, bool]]:
+        limit = asyncio.Semaphore(max(1, concurrency))
+
+        async def _one():
+            async with limit:
+                return await _call()
+        return await asyncio.gather(*(_one() for _ in range(count)))
+
+    async def _measure() -> List[Dict[str, Any]]:
+        await _run(config.warmup, 1)
+        rows = []
+        for concurrency in config.concurrency:
+            cpu_before, _ = _rusage()
+            started_at = time.perf_counter()
+            results = await _run(config.requests, concurrency)
+            wall = time.perf_counter() - started_at
+            cpu_after, max_rss = _rusage()
+
+            latencies = [latency for latency, ok in results if ok]
+            overheads = [max(latency - server_time, 0.0) for latency in latencies]
+            rows.append({
+                "framework": framework,
+                "provider": provider,
+                "mode": "stream" if streaming else "call",
+                "concurrency": concurrency,
+                "requests": len(results),
+                "errors": sum(1 for _, ok in results if not ok),
+                "server_time_ms": server_time * 1000,
+                "latency_p50_ms": _ms(percentile(latencies, 50)),
+                "overhead_p50_ms": _ms(percentile(overheads, 50)),
+                "overhead_p95_ms": _ms(percentile(overheads, 95)),
+                "overhead_p99_ms": _ms(percentile(overheads, 99)),
+                "throughput_rps": len(results) / wall if wall else None,
+                "cpu_ms_per_request": (cpu_after - cpu_before) * 1000 / max(len(results), 1),
+                "max_rss_mb": max_rss,
+                "init_rss_mb": rss_ready - rss_before,
+            })
+
+        # 할당량은 tracemalloc 자체 오버헤드가 커서 시간 측정과 분리해 순차로 잰다
+        peaks, blocks = [], []
+        tracemalloc.start()
+        for _ in range(config.alloc_samples):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+            await _call()
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - before)
+            blocks.append(sum(stat.count_diff for stat in tracemalloc.take_snapshot().compare_to(snapshot, "filename") if stat.count_diff > 0))
+        tracemalloc.stop()
+        for row in rows:
+            row["alloc_peak_kb"] = sum(peaks) / len(peaks) / 1024 if peaks else None
+            row["alloc_blocks"] = sum(blocks) / len(blocks) if blocks else None
+        return rows
+
+    try:
+        return asyncio.run(_measure())
+    finally:
+        instance.close()
+
+
+def _ms(value: Optional[float]) -> Optional[float]:
+    return None if value is None else value * 1000
+
+
+def _failed_row(framework: str, error: str) -> Dict[str, Any]:
+    return {"framework": framework, "provider": BENCH_TARGETS.get(framework, ("", ""))[0], "error": error}
+
+
+def run_benchmark(config: BenchConfig) -> Dict[str, Any]:
+    """mock 서버를 띄우고 프레임워크별 오버헤드를 측정해 JSON/CSV로 저장한다."""
+    from structured_output_kit.bench.mock_server import sample_from_schema
+    from structured_output_kit.extraction.utils import convert_schema
+    from structured_output_kit.extraction.schema_registry import schema_registry
+
+    frameworks = config.frameworks or list(BENCH_TARGETS)
+    unknown = [name for name in frameworks if name not in BENCH_TARGETS]
+    if unknown:
+        raise ValueError(f"벤치마크를 지원하지 않는 프레임워크: {unknown} (지원: {list(BENCH_TARGETS)})")
+
+    output_dir = config.output_dir or os.path.join("result", "bench", datetime.now().strftime("%Y%m%d_%H%M%S"))
+    os.makedirs(output_dir, exist_ok=True)
+
+    payload = sample_from_schema(schema_registry.json_schema(convert_schema(config.schema_name)))
+    payload_chars = len(json.dumps(payload, ensure_ascii=False))
+
+    rows: List[Dict[str, Any]] = []
+    with MockServer(config, payload) as server:
+        context = multiprocessing.get_context("spawn")
+        for framework in frameworks:
+            logger.info(f"{framework} 측정 중 (요청 {config.requests}개, 동시성 {config.concurrency})")
+            with concurrent.futures.ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                try:
+                    framework_rows = executor.submit(_bench_worker, framework, config, server.url, payload_chars).result()
+                except Exception as e:
+                    logger.error(f"{framework} 측정 실패: {e}")
+                    framework_rows = [_failed_row(framework, str(e))]
+            for row in framework_rows:
+                if "error" in row:
+                    continue
+                if row["overhead_p50_ms"] is None:
+                    logger.warning(f"{framework} c={row['concurrency']}: 성공한 요청 없음")
+                    continue
+                logger.info(
+                    f"{framework} c={row['concurrency']}: overhead p50 {row['overhead_p50_ms']:.2f}ms "
+                    f"p95 {row['overhead_p95_ms']:.2f}ms p99 {row['overhead_p99_ms']:.2f}ms, "
+                    f"CPU {row['cpu_ms_per_request']:.2f}ms/req, max RSS {row['max_rss_mb']:.0f}MB"
+                )
+            rows.extend(framework_rows)
+
+    report = {
+        "created_at": datetime.now().isoformat(),
+        "config": asdict(config),
+        "python": sys.version.split()[0],
+        "results": rows,
+    }
+    json_path = os.path.join(output_dir, "bench.json")
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    csv_path = os.path.join(output_dir, "bench.csv")
+    columns: List[str] = []
+    for row in rows:
+        columns.extend(key for key in row if key not in columns)
+    with open(csv_path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=columns)
+        writer.writeheader()
+        writer.writerows(rows)
+
+    logger.info(f"벤치마크 결과 저장: {json_path}, {csv_path}")
+    return dict(report, json_path=json_path, csv_path=csv_path)
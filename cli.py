@@ -1,7 +1,7 @@
 import os
 import asyncio
 import typer
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator
 import json
 from dotenv import load_dotenv
 from langfuse import get_client
@@ -9,8 +9,10 @@ from langfuse import get_client
 from structured_output_kit.utils.cli_helpers import select_llm, select_embed, select_framework
 from structured_output_kit.utils.types import ExtractionRequest, EvaluationRequest, ParsingRequest, HostInfo
 from structured_output_kit.utils.common import check_host_info
-from structured_output_kit.extraction.core import run_extraction_core
+from structured_output_kit.extraction.core import run_extraction_core, run_extraction_batch, run_extraction_stream, run_extraction_provider_batch
+from structured_output_kit.extraction.batch_api import BatchApiConfig
 from structured_output_kit.extraction.utils import load_prompt
+from structured_output_kit.extraction.cassette import use_cassette
 from structured_output_kit.evaluation.core import run_evaluation_core
 from structured_output_kit.parsing.core import run_parsing_core
 from structured_output_kit.utils.visualization import run_visualization_core
@@ -32,15 +34,144 @@ def extract(
     save: Optional[bool] = typer.Option(False, "--save", help="결과 저장 여부"),
     # Host info 딕셔너리 형태로 전달
     host_info: Optional[str] = typer.Option(None, "--host-info", help='Host 정보 JSON 문자열. 예: "{\"provider\":\"openai\",\"model\":\"gpt-4\",\"api_key\":\"sk-...\"}"'),
-    framework: Optional[str] = typer.Option(None, "--framework", help="사용할 프레임워크")
+    framework: Optional[str] = typer.Option(None, "--framework", help="사용할 프레임워크"),
+    cache_mode: str = typer.Option("off", "--cache", help="LLM 응답 캐시 모드 (off, read-write, read-only, refresh)"),
+    hedge: bool = typer.Option(False, "--hedge", help="응답이 최근 지연시간 백분위수를 넘기면 헤지 요청 전송"),
+    hedge_percentile: Optional[float] = typer.Option(None, "--hedge-percentile", help="헤지 기준 백분위수 (기본값: 95)"),
+    hedge_hosts: Optional[str] = typer.Option(None, "--hedge-hosts", help='헤지 요청을 보낼 보조 호스트 JSON 리스트. 예: "[{\"provider\":\"openai_compatible\",\"model\":\"...\",\"base_url\":\"...\"}]"'),
+    chunking: bool = typer.Option(False, "--chunk", help="긴 문서를 청크로 나눠 병렬 추출 후 병합"),
+    chunk_max_tokens: int = typer.Option(6000, "--chunk-tokens", help="청크당 최대 토큰 수"),
+    chunk_overlap_tokens: int = typer.Option(400, "--chunk-overlap", help="인접 청크 간 겹치는 토큰 수"),
+    parallel_fields: bool = typer.Option(False, "--parallel-fields", help="최상위 필드 그룹별로 병렬 추출 후 조립"),
+    field_groups: Optional[str] = typer.Option(None, "--field-groups", help='필드 그룹 JSON. 예: "[[\"personal_info\",\"summary_info\"],[\"careers\"]]"'),
+    stream: bool = typer.Option(False, "--stream", help="부분 결과를 생성되는 대로 출력 (OpenAI/Anthropic/Ollama/Instructor)"),
+    samples: int = typer.Option(1, "--samples", help="self-consistency 샘플 수 (2 이상이면 필드별 투표 후 합의도 보고)"),
+    vote_strings: str = typer.Option("vote", "--vote-strings", help="문자열 필드 병합 방식 (vote, centroid)"),
+    compact: bool = typer.Option(False, "--compact", help="추출 전 입력 압축 (base64 이미지, 반복 머리말/꼬리말, 표 패딩, 공백 제거)"),
+    compact_drop_sections: bool = typer.Option(False, "--compact-drop-sections", help="압축 시 스키마 필드와 관련 없는 제목 섹션도 제거 (손실 가능)"),
+    cascade_hosts: Optional[str] = typer.Option(None, "--cascade-hosts", help='--host-info 결과가 검사를 통과하지 못하면 순서대로 다시 추출할 상위 모델 JSON 리스트. 예: "[{\"provider\":\"openai\",\"model\":\"gpt-4o\"}]"'),
+    cascade_framework: Optional[str] = typer.Option(None, "--cascade-framework", help="상위 모델에 쓸 프레임워크 (기본값: --framework와 같음)"),
+    cascade_min_filled: float = typer.Option(0.0, "--cascade-min-filled", help="cascade 통과 기준: 채워진 필드 비율 하한 (0~1)"),
+    cascade_required: Optional[str] = typer.Option(None, "--cascade-required", help="cascade 통과 기준: 반드시 채워져야 하는 필드 경로 (쉼표 구분). 예: personal_info.name,careers.company_name"),
+    cassette: Optional[str] = typer.Option(None, "--cassette", help="HTTP 기록/재생 카세트 파일 (JSONL)"),
+    cassette_mode: str = typer.Option("off", "--cassette-mode", help="카세트 모드 (off, record, replay)"),
+    cassette_latency: bool = typer.Option(False, "--cassette-latency", help="재생 시 기록된 원래 지연시간 재현"),
 ):
     """현재 프로세스 실행 (extraction)"""
     try:
         extra_kwargs: Dict[str, Any] = json.loads(extra_kwargs) if extra_kwargs else {}
     except json.JSONDecodeError as e:
         raise typer.BadParameter(f"--kwargs JSON 파싱 실패: {e}")
+    try:
+        hedge_hosts_list = json.loads(hedge_hosts) if hedge_hosts else None
+    except json.JSONDecodeError as e:
+        raise typer.BadParameter(f"--hedge-hosts JSON 파싱 실패: {e}")
+    try:
+        field_groups_list = json.loads(field_groups) if field_groups else None
+    except json.JSONDecodeError as e:
+        raise typer.BadParameter(f"--field-groups JSON 파싱 실패: {e}")
+    try:
+        cascade_hosts_list = json.loads(cascade_hosts) if cascade_hosts else None
+    except json.JSONDecodeError as e:
+        raise typer.BadParameter(f"--cascade-hosts JSON 파싱 실패: {e}")
+    cascade_required_list = [path.strip() for path in (cascade_required or "").split(",") if path.strip()]
+
+    if cassette_mode != "off":
+        use_cassette(cassette, cassette_mode, cassette_latency)
+
+    asyncio.run(run_extraction(
+        prompt, input_text, retries, schema_name, extra_kwargs, langfuse_trace_id, save, host_info, framework, cache_mode,
+        hedge, hedge_percentile, hedge_hosts_list, chunking, chunk_max_tokens, chunk_overlap_tokens,
+        parallel_fields, field_groups_list, stream, samples, vote_strings, compact, compact_drop_sections,
+        cascade_hosts_list, cascade_framework, cascade_min_filled, cascade_required_list
+    ))
+
+
+@app.command("extract-batch")
+def extract_batch(
+    requests_path: str = typer.Option(..., "--file", help="ExtractionRequest JSONL 파일 경로 (한 줄에 요청 하나)"),
+    max_concurrency: int = typer.Option(8, "--concurrency", help="전체 동시 실행 수"),
+    provider_limits: str = typer.Option("{}", "--provider-limits", help='provider별 동시 실행 한도 JSON 문자열. 예: "{\"openai\":4,\"ollama\":2}"'),
+    host_info: Optional[str] = typer.Option(None, "--host-info", help="요청에 host_info가 없을 때 사용할 Host 정보 JSON 문자열"),
+    framework: Optional[str] = typer.Option(None, "--framework", help="요청에 framework가 없을 때 사용할 프레임워크"),
+    output_dir: Optional[str] = typer.Option(None, "--output", help="배치 결과 출력 디렉토리"),
+    save: Optional[bool] = typer.Option(False, "--save", help="결과 저장 여부 (요청에 save가 없을 때)"),
+    cache_mode: str = typer.Option("off", "--cache", help="요청에 cache_mode가 없을 때 사용할 LLM 응답 캐시 모드 (off, read-write, read-only, refresh)"),
+    provider_batch: bool = typer.Option(False, "--provider-batch", help="OpenAI/Anthropic batch API로 제출 (비용 절반, 결과까지 최대 24시간. 같은 --output으로 다시 실행하면 이어서 대기)"),
+    poll_interval: float = typer.Option(30.0, "--poll-interval", help="provider batch 상태 확인 간격(초)"),
+    batch_timeout: Optional[float] = typer.Option(None, "--batch-timeout", help="provider batch 최대 대기 시간(초)"),
+):
+    """JSONL 파일의 추출 요청들을 동시에 실행 (extraction batch)"""
+    try:
+        provider_limits_dict: Dict[str, int] = json.loads(provider_limits) if provider_limits else {}
+    except json.JSONDecodeError as e:
+        raise typer.BadParameter(f"--provider-limits JSON 파싱 실패: {e}")
+    try:
+        default_host_info: Optional[Dict[str, Any]] = json.loads(host_info) if host_info else None
+    except json.JSONDecodeError as e:
+        raise typer.BadParameter(f"--host-info JSON 파싱 실패: {e}")
+
+    if provider_batch:
+        run_provider_batch_process(requests_path, default_host_info, framework, output_dir, save, poll_interval, batch_timeout)
+        return
+    asyncio.run(run_extraction_batch_process(
+        requests_path, max_concurrency, provider_limits_dict, default_host_info, framework, output_dir, save, cache_mode
+    ))
 
-    asyncio.run(run_extraction(prompt, input_text, retries, schema_name, extra_kwargs, langfuse_trace_id, save, host_info, framework))
+
+@app.command()
+def bench(
+    frameworks: Optional[str] = typer.Option(None, "--frameworks", help="측정할 프레임워크 (쉼표 구분, 기본값: mock 서버로 측정 가능한 전체)"),
+    schema_name: str = typer.Option("schema_han", "--schema", help="스키마 이름"),
+    requests: int = typer.Option(50, "--requests", help="동시성 수준마다 측정할 요청 수"),
+    warmup: int = typer.Option(3, "--warmup", help="측정 전 워밍업 요청 수"),
+    concurrency: str = typer.Option("1", "--concurrency", help="동시성 수준 (쉼표 구분). 예: 1,8,32"),
+    latency: float = typer.Option(0.05, "--latency", help="mock 서버 응답 지연(초)"),
+    token_latency: float = typer.Option(0.0, "--token-latency", help="스트리밍 조각 간 지연(초)"),
+    chunk_chars: int = typer.Option(16, "--chunk-chars", help="스트리밍 조각 크기(문자)"),
+    stream: bool = typer.Option(False, "--stream", help="스트리밍 지원 프레임워크는 스트리밍 경로로 측정"),
+    output_dir: Optional[str] = typer.Option(None, "--output", help="결과(bench.json, bench.csv) 출력 디렉토리"),
+):
+    """로컬 mock LLM 서버로 프레임워크별 클라이언트 오버헤드 측정 (benchmark)"""
+    from structured_output_kit.bench import BenchConfig, run_benchmark
+    try:
+        levels = [int(level) for level in concurrency.split(",") if level.strip()]
+    except ValueError as e:
+        raise typer.BadParameter(f"--concurrency 파싱 실패: {e}")
+
+    report = run_benchmark(BenchConfig(
+        frameworks=[name.strip() for name in frameworks.split(",") if name.strip()] if frameworks else None,
+        schema_name=schema_name,
+        requests=requests,
+        warmup=warmup,
+        concurrency=levels or [1],
+        latency=latency,
+        token_latency=token_latency,
+        chunk_chars=chunk_chars,
+        stream=stream,
+        output_dir=output_dir,
+    ))
+    print(f"결과: {report['json_path']}, {report['csv_path']}")
+
+
+@app.command("bench-import")
+def bench_import(
+    targets: Optional[str] = typer.Option(None, "--targets", help="측정 대상 (쉼표 구분: cli, cli+OpenAIFramework, main, server, workflow_cli)"),
+    repeat: int = typer.Option(5, "--repeat", help="대상별 반복 횟수 (새 인터프리터로 측정)"),
+    top: int = typer.Option(10, "--top", help="기록할 느린 최상위 import 수"),
+    baseline: Optional[str] = typer.Option(None, "--baseline", help="비교할 이전 import_time.json"),
+    output_dir: Optional[str] = typer.Option(None, "--output", help="결과(import_time.json, import_time.csv) 출력 디렉토리"),
+):
+    """진입점별 콜드 스타트(import 시간, RSS) 측정 (benchmark)"""
+    from structured_output_kit.bench import ImportBenchConfig, run_import_benchmark
+    report = run_import_benchmark(ImportBenchConfig(
+        targets=[name.strip() for name in targets.split(",") if name.strip()] if targets else None,
+        repeat=repeat,
+        top=top,
+        baseline=baseline,
+        output_dir=output_dir,
+    ))
+    print(f"결과: {report['json_path']}, {report['csv_path']}")
 
 
 @app.command() 
@@ -65,7 +196,8 @@ def parse(
     prompt: Optional[str] = typer.Option(None, "--prompt", help="VLM 사용시 프롬프트"),
     save: Optional[bool] = typer.Option(False, "--save", help="결과 저장 여부"),
     # Host info 딕셔너리 형태로 전달 (VLM 사용시에만 필요)
-    host_info: Optional[str] = typer.Option(None, "--host-info", help='Host 정보 JSON 문자열 (VLM 사용시). 예: "{\"provider\":\"openai\",\"model\":\"gpt-4\",\"api_key\":\"sk-...\"}"')
+    host_info: Optional[str] = typer.Option(None, "--host-info", help='Host 정보 JSON 문자열 (VLM 사용시). 예: "{\"provider\":\"openai\",\"model\":\"gpt-4\",\"api_key\":\"sk-...\"}"'),
+    cache_mode: str = typer.Option("read-write", "--cache", help="파싱 결과 캐시 모드 (off, read-write, read-only, refresh). 파일 내용 해시 기준"),
 ):
     """PDF/이미지 파싱 프로세스 실행"""
     try:
@@ -73,7 +205,7 @@ def parse(
     except json.JSONDecodeError as e:
         raise typer.BadParameter(f"--kwargs JSON 파싱 실패: {e}")
 
-    asyncio.run(run_parsing_process(file_path, framework, extra_kwargs_dict, prompt, save, host_info))
+    asyncio.run(run_parsing_process(file_path, framework, extra_kwargs_dict, prompt, save, host_info, cache_mode))
 
 # viz 명령 단순화: streamlit 앱 직접 실행
 @app.command()
@@ -99,7 +231,25 @@ async def run_extraction(prompt: Optional[str],
                          langfuse_trace_id: Optional[str] = None,
                          save: Optional[bool] = False,
                          host_info_json: Optional[str] = None,
-                         framework_name: Optional[str] = None):
+                         framework_name: Optional[str] = None,
+                         cache_mode: str = "off",
+                         hedge: bool = False,
+                         hedge_percentile: Optional[float] = None,
+                         hedge_hosts: Optional[list] = None,
+                         chunking: bool = False,
+                         chunk_max_tokens: int = 6000,
+                         chunk_overlap_tokens: int = 400,
+                         parallel_fields: bool = False,
+                         field_groups: Optional[list] = None,
+                         stream: bool = False,
+                         samples: int = 1,
+                         vote_strings: str = "vote",
+                         compact: bool = False,
+                         compact_drop_sections: bool = False,
+                         cascade_hosts: Optional[list] = None,
+                         cascade_framework: Optional[str] = None,
+                         cascade_min_filled: float = 0.0,
+                         cascade_required_fields: Optional[list] = None):
     """Extraction 실행 함수 (core 유즈케이스 호출)"""
     
     # host_info가 제공되었다면 JSON 파싱하여 사용, 아니면 interactive 선택
@@ -136,11 +286,112 @@ async def run_extraction(prompt: Optional[str],
             "api_key": host_info_dict["api_key"]
         }),
         langfuse_trace_id=langfuse_trace_id,
-        save=save
+        save=save,
+        cache_mode=cache_mode,
+        hedge=hedge,
+        hedge_percentile=hedge_percentile,
+        hedge_hosts=[HostInfo(**host) for host in hedge_hosts] if hedge_hosts else None,
+        chunking=chunking,
+        chunk_max_tokens=chunk_max_tokens,
+        chunk_overlap_tokens=chunk_overlap_tokens,
+        parallel_fields=parallel_fields,
+        field_groups=field_groups,
+        consistency_samples=samples,
+        consistency_strings=vote_strings,
+        compact=compact or compact_drop_sections,
+        compact_drop_irrelevant=compact_drop_sections,
+        cascade_hosts=[HostInfo(**check_host_info(host)) for host in cascade_hosts] if cascade_hosts else None,
+        cascade_framework=cascade_framework,
+        cascade_min_filled=cascade_min_filled,
+        cascade_required_fields=cascade_required_fields or []
     )
+    if stream:
+        async for event in run_extraction_stream(core_req):
+            if event["event"] == "partial":
+                print(f"[{event['elapsed']:.2f}s] {json.dumps(event['data'], ensure_ascii=False)}")
+            elif event["event"] == "final" and event["data"].get("ttff") is not None:
+                print(f"첫 필드까지: {event['data']['ttff']:.2f}s")
+        return
     _ = run_extraction_core(core_req)
 
 
+def iter_batch_requests(requests_path: str,
+                        default_host_info: Optional[Dict[str, Any]] = None,
+                        default_framework: Optional[str] = None,
+                        default_save: Optional[bool] = False,
+                        default_cache_mode: str = "off") -> Iterator[ExtractionRequest]:
+    """JSONL 파일을 한 줄씩 읽어 ExtractionRequest로 변환 (대용량 파일도 메모리에 모두 올리지 않음)"""
+    with open(requests_path, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise typer.BadParameter(f"{requests_path}:{line_no} JSON 파싱 실패: {e}")
+            host_info_dict = check_host_info(dict(item.get("host_info") or default_host_info or {}))
+            item["host_info"] = HostInfo(**{
+                "provider": host_info_dict["provider"],
+                "base_url": host_info_dict["base_url"],
+                "model": host_info_dict["model"],
+                "api_key": host_info_dict["api_key"]
+            })
+            item.setdefault("prompt", load_prompt())
+            item.setdefault("save", default_save)
+            item.setdefault("cache_mode", default_cache_mode)
+            if default_framework:
+                item.setdefault("framework", default_framework)
+            yield ExtractionRequest(**item)
+
+
+async def run_extraction_batch_process(requests_path: str,
+                                       max_concurrency: int,
+                                       provider_limits: Dict[str, int],
+                                       default_host_info: Optional[Dict[str, Any]] = None,
+                                       default_framework: Optional[str] = None,
+                                       output_dir: Optional[str] = None,
+                                       save: Optional[bool] = False,
+                                       cache_mode: str = "off"):
+    """Batch extraction 실행 함수 (core 유즈케이스 호출)"""
+    total, succeeded = 0, 0
+    requests = iter_batch_requests(requests_path, default_host_info, default_framework, save, cache_mode)
+    async for result in run_extraction_batch(
+        requests,
+        max_concurrency=max_concurrency,
+        per_provider_limits=provider_limits,
+        output_dir=output_dir,
+    ):
+        total += 1
+        succeeded += int(result.success)
+        status = "✅" if result.success else "❌"
+        latency = f"{result.latency:.2f}s" if result.latency else "-"
+        cached = " [cache]" if result.cache_hit else ""
+        print(f"{status} #{result.batch_index} ({latency}){cached} → {result.result_json_path}")
+
+    print(f"\n📊 배치 추출 완료: {succeeded}/{total} 성공")
+
+
+def run_provider_batch_process(requests_path: str,
+                               default_host_info: Optional[Dict[str, Any]] = None,
+                               default_framework: Optional[str] = None,
+                               output_dir: Optional[str] = None,
+                               save: Optional[bool] = False,
+                               poll_interval: float = 30.0,
+                               batch_timeout: Optional[float] = None):
+    """provider batch API 추출 실행 함수 (core 유즈케이스 호출)"""
+    total, succeeded = 0, 0
+    requests = iter_batch_requests(requests_path, default_host_info, default_framework, save)
+    config = BatchApiConfig(poll_interval=poll_interval, timeout=batch_timeout)
+    for result in run_extraction_provider_batch(requests, config=config, output_dir=output_dir):
+        total += 1
+        succeeded += int(result.success)
+        status = "✅" if result.success else "❌"
+        print(f"{status} #{result.batch_index} [{result.provider_batch_id or '-'}] → {result.result_json_path}")
+
+    print(f"\n📊 provider batch 추출 완료: {succeeded}/{total} 성공")
+
+
 async def run_evaluation(pred_json_path: str, 
                          gt_json_path: str, 
                          schema_name: str, 
@@ -182,7 +433,8 @@ async def run_parsing_process(file_path: str,
                              extra_kwargs: Dict[str, Any], 
                              prompt: Optional[str] = None,
                              save: Optional[bool] = False,
-                             host_info_json: Optional[str] = None):
+                             host_info_json: Optional[str] = None,
+                             cache_mode: str = "read-write"):
     """Parsing 실행 함수 (core 유즈케이스 호출)"""
     host_info = None
     
@@ -221,7 +473,8 @@ async def run_parsing_process(file_path: str,
         extra_kwargs=extra_kwargs,
         host_info=host_info,
         prompt=prompt,
-        save=save
+        save=save,
+        cache_mode=cache_mode
     )
     
     result = run_parsing_core(core_req)
@@ -231,6 +484,8 @@ async def run_parsing_process(file_path: str,
         print(f"📁 파일: {result.file_path}")
         print(f"🔧 프레임워크: {result.framework}")
         print(f"📝 추출된 텍스트 길이: {len(result.content)} 문자")
+        if result.cache_hit:
+            print(f"♻️  캐시 적중 (처음 파싱 시간: {result.parse_time:.2f}초)" if result.parse_time is not None else "♻️  캐시 적중")
         if result.result_txt_path:
             print(f"💾 결과 저장: {result.result_txt_path}")
         
@@ -58,6 +58,9 @@ def run_evaluation_core(req: EvaluationRequest) -> EvaluationResult:
 
     logger.success("평가 완료!")
     logger.info(f"점수: {eval_result.get('overall_score', 0):.3f}")
+    embedding_usage = eval_result.get("embedding_usage") or {}
+    if embedding_usage.get("requests"):
+        logger.info(f"임베딩 토큰(추정)/비용: {embedding_usage['prompt_tokens']} / {embedding_usage['cost']}")
 
     # 평가 결과 저장
     eval_result_save_path = os.path.join(output_dir, "eval_result.json")
@@ -77,11 +80,15 @@ def run_evaluation_core(req: EvaluationRequest) -> EvaluationResult:
         overall_score=eval_result.get('overall_score', 0),
         eval_result_path=eval_result_save_path,
         save=req.save,
+        embedding_tokens=embedding_usage.get("prompt_tokens"),
+        cost=embedding_usage.get("cost"),
     )
 
     return EvaluationResult(
         result=eval_result,
         overall_score=eval_result.get('overall_score', 0),
         eval_result_path=eval_result_save_path,
-        output_dir=output_dir
+        output_dir=output_dir,
+        embedding_tokens=embedding_usage.get("prompt_tokens"),
+        cost=embedding_usage.get("cost")
     )
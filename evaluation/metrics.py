@@ -6,9 +6,8 @@ import numpy as np
 from typing import Dict, Optional
 from loguru import logger
 
-from langchain_openai import OpenAIEmbeddings
-from langchain_huggingface import HuggingFaceEmbeddings
-from scipy.optimize import linear_sum_assignment
+from structured_output_kit.utils.accounting import UsageMeter, usage_ledger
+from structured_output_kit.utils.rate_limiter import estimate_tokens
 
 
 def normalize_field_path(field_path):
@@ -19,12 +18,20 @@ class EmbeddingBackend:
     def __init__(self, provider: str = 'huggingface', model: Optional[str] = None, api_key: Optional[str] = None, base_url: Optional[str] = None):
         self.provider = provider
         self.model = model
+        self.model_name = model  # self.model은 아래에서 임베딩 객체로 바뀐다
         self.api_key = api_key
         self.base_url = base_url
+        # LangChain 임베딩은 사용량을 돌려주지 않으므로 입력 토큰은 문자 길이로 추정한다
+        self.usage = UsageMeter()
+
+        # 임베딩 백엔드는 평가 시점에만 필요하므로 CLI/서버 시작 시 import하지 않음
+        if provider in ('openai', 'ollama', 'openai_compatible'):
+            from langchain_openai import OpenAIEmbeddings
 
         if provider == 'openai':
+            self.model_name = model or 'text-embedding-ada-002'
             self.model = OpenAIEmbeddings(
-                model=model or 'text-embedding-ada-002',
+                model=self.model_name,
             )
         elif provider == 'ollama':
             self.model = OpenAIEmbeddings(
@@ -39,7 +46,9 @@ class EmbeddingBackend:
                 openai_api_base=base_url
             )
         elif provider == 'huggingface':
-            self.model = HuggingFaceEmbeddings(model_name=model or 'jhgan/ko-sroberta-multitask')
+            from langchain_huggingface import HuggingFaceEmbeddings
+            self.model_name = model or 'jhgan/ko-sroberta-multitask'
+            self.model = HuggingFaceEmbeddings(model_name=self.model_name)
         else:
             logger.error(f"Unsupported embedding backend: {provider}")
             raise NotImplementedError(f"Backend {provider} not supported.")
@@ -47,7 +56,12 @@ class EmbeddingBackend:
     def embed(self, texts):
         if isinstance(texts, str):
             texts = [texts]
-        return np.array(self.model.embed_documents(texts))
+        vectors = np.array(self.model.embed_documents(texts))
+        usage_ledger.record(
+            "embedding", self.provider, self.model_name,
+            sum(estimate_tokens(text) for text in texts), 0, meter=self.usage,
+        )
+        return vectors
 
 
 def cosine_similarity(a, b):
@@ -161,6 +175,7 @@ def eval_json(gt, pred, host_info, field_eval_criteria=None, weights: Optional[D
                 for j in range(len(pred_val)):
                     sim_matrix[i, j] = cosine_similarity(gt_embs[i], pred_embs[j])
             try:
+                from scipy.optimize import linear_sum_assignment
                 row_ind, col_ind = linear_sum_assignment(-sim_matrix)
                 match_pairs = [(i, j, sim_matrix[i, j]) for i, j in zip(row_ind, col_ind)]
                 gt_matched = set(row_ind)
@@ -289,6 +304,7 @@ def eval_json(gt, pred, host_info, field_eval_criteria=None, weights: Optional[D
     report = {
         "overall_score": content_score,
         "fields": field_reports,
-        "field_eval_criteria": field_eval_criteria or {}
+        "field_eval_criteria": field_eval_criteria or {},
+        "embedding_usage": embedder.usage.to_dict() if embedder is not None else None
     }
     return report
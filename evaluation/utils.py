@@ -103,6 +103,8 @@ def record_evaluation(
     overall_score: float,
     eval_result_path: str,
     save: Optional[bool] = False,
+    embedding_tokens: Optional[int] = None,
+    cost: Optional[float] = None,
 ):
     if save:
         csv_path = "result/evaluation_result.csv"
@@ -115,6 +117,8 @@ def record_evaluation(
             "criteria_path": criteria_path,
             "overall_score": overall_score,
             "eval_result_path": eval_result_path,
+            "embedding_tokens": embedding_tokens,
+            "cost": cost,
         }
         if os.path.isfile(csv_path):
             df = pd.read_csv(csv_path)
@@ -1,5 +1,15 @@
-from structured_output_kit.extraction.core import run_extraction_core
+from structured_output_kit.extraction.core import (
+    run_extraction_core,
+    run_extraction_core_async,
+    run_extraction_stream,
+    extract_with_framework,
+    extract_with_framework_async,
+)
 
 __all__ = [
     "run_extraction_core",
+    "run_extraction_core_async",
+    "run_extraction_stream",
+    "extract_with_framework",
+    "extract_with_framework_async",
 ]
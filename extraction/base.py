@@ -1,51 +1,190 @@
 import os
 import time
+import asyncio
+import inspect
 import traceback
+import contextvars
+import concurrent.futures
 from tqdm import tqdm
 from loguru import logger
-from typing import Any, Callable
+from typing import Any, AsyncIterator, Callable, Iterator, Optional, Sequence
+from contextlib import nullcontext
 from abc import ABC, abstractmethod
 
 from structured_output_kit.extraction.utils import response_parsing
+from structured_output_kit.extraction.cache import CacheMode, ResponseCache, get_response_cache
+from structured_output_kit.extraction.stats import RunStats, current_stats
+from structured_output_kit.extraction.hedging import HedgePolicy, AttemptClock, latency_tracker, attempt_in_flight, run_with_clock, arun_with_clock
+from structured_output_kit.extraction.streaming import stream_partials, astream_partials
+from structured_output_kit.extraction.usage import attempt_scope
+from structured_output_kit.extraction.cassette import use_cassette_from_env
+from structured_output_kit.extraction.retry import RetryPolicy, AttemptRecord, DEFAULT_RETRY_POLICY, classify_error
+from structured_output_kit.utils.rate_limiter import rate_limiter, estimate_tokens
+from structured_output_kit.utils.http_pool import http_clients
+from structured_output_kit.utils.accounting import usage_ledger
+
+# 실행 중인 루프에서 예약한 비동기 close() (완료될 때까지 참조 유지)
+_closing_tasks: set = set()
+
+
+# 원 요청이 rate limiter/백오프 대기 중일 때 헤지 시계가 다시 돌기 시작했는지 확인하는 간격(초)
+_HEDGE_POLL_SECONDS = 0.05
+
+
+def _next_hedge_in(clock: AttemptClock, delay: float, last_fired: Optional[float]) -> Optional[float]:
+    """다음 헤지까지 남은 시간(초). 원 요청이 API 호출 중이 아니면(대기/백오프) None.
+    시계는 현재 시도의 호출 시작과 직전 헤지 중 늦은 쪽부터 센다."""
+    elapsed = clock.elapsed()
+    if elapsed is None:
+        return None
+    if last_fired is not None:
+        elapsed = min(elapsed, time.perf_counter() - last_fired)
+    return delay - elapsed
+
+
+def _call_inputs(args: tuple, kwargs: dict) -> dict:
+    if args and isinstance(args[0], dict):
+        return args[0]
+    return kwargs.get("inputs", {})
+
+
+def _record_wait(wait: float) -> None:
+    stats = current_stats()
+    if stats is not None and wait:
+        stats.rate_limit_wait += wait
+
+
+def _parse_response(response: Any) -> Any:
+    logger.debug(f"Response: {str(response)[:200]}...")
+    response = response_parsing(response)
+    if "classes" in response:
+        response = response_parsing(response["classes"])
+    return response
+
+
+def _on_failure(policy: RetryPolicy, attempt: int, retries: int, e: Exception, record: AttemptRecord, label: str) -> Optional[float]:
+    """실패한 시도를 분류/기록하고, 재시도할 경우 대기 시간을 반환 (재시도하지 않으면 None)"""
+    kind = classify_error(e)
+    record.error_kind = kind.value
+    record.error = str(e)
+    logger.error(f"{label} {attempt}/{retries} Failure ({kind.value}): {str(e)}")
+    logger.error(traceback.format_exc())
+    if attempt >= retries:
+        return None
+    if not policy.should_retry(kind):
+        logger.warning(f"{kind.value} 오류는 재시도하지 않음")
+        return None
+    record.backoff = policy.delay(attempt, e)
+    logger.info(f"{record.backoff:.2f}초 후 재시도")
+    return record.backoff
+
+
+def _record_cost(framework: Optional["BaseFramework"], attempts: list[AttemptRecord]) -> None:
+    """토큰 사용량이 보고된 시도를 가격표로 계산해 공용 집계에 남긴다 (실패한 시도의 토큰도 비용)"""
+    if framework is None:
+        return
+    for record in attempts:
+        if record.prompt_tokens is None and record.completion_tokens is None:
+            continue
+        record.cost = usage_ledger.record(
+            "extraction", framework.provider, framework.model,
+            record.prompt_tokens, record.completion_tokens, record.cached_tokens,
+        )
+
+
+def _finish(label: str, responses: list, latencies: list, attempts: list[AttemptRecord]) -> tuple[list[Any], float, list[float]]:
+    stats = current_stats()
+    if stats is not None:
+        stats.attempts.extend(record.to_dict() for record in attempts)
+    succeeded = bool(latencies)
+    percent_successful = (1 / len(attempts)) if succeeded else 0.0
+    logger.debug(f"{label}: 총 {len(attempts)}회 시도, {'성공' if succeeded else '실패'} (성공률: {percent_successful:.2%})")
+    return responses, percent_successful, latencies
 
 
 def experiment(
     retries: int = 1,
+    framework: Optional["BaseFramework"] = None,
 ) -> Callable[..., tuple[list[Any], float, list[float]]]:
+    """`framework`가 주어지면 매 시도를 provider+model 단위 rate limiter에 통과시키고
+    `framework.retry_policy`에 따라 일시적 오류만 백오프 후 재시도한다.
+    시도 시간은 perf_counter로 재며, 프레임워크가 `api_call()`/`record_usage()`로
+    HTTP 호출 시간과 토큰 사용량을 같은 AttemptRecord에 남긴다."""
     def experiment_decorator(func):
         def wrapper(*args, **kwargs):
-            api_delay_seconds = getattr(args[0], "api_delay_seconds", 0)
-            responses, latencies = [], []
-            actual_runs = 0
+            policy = getattr(framework, "retry_policy", DEFAULT_RETRY_POLICY)
+            limiter = framework.rate_limiter() if framework is not None else None
+            tokens = framework.estimate_tokens(_call_inputs(args, kwargs)) if framework is not None else 0
+            responses, latencies, attempts = [], [], []
             for i in tqdm(range(retries), leave=False, desc="Extracting"):
-                actual_runs = i + 1
+                record = AttemptRecord(attempt=i + 1, latency=0.0)
+                attempts.append(record)
+                start_time = time.perf_counter()
                 try:
-                    start_time = time.time()
                     logger.debug(f"실험 실행 {i+1}/{retries} 시작")
-                    response = func(*args, **kwargs)
-                    end_time = time.time()
-                    logger.debug(f"Response: {str(response)[:200]}...")
-                    response = response_parsing(response)
-                    if "classes" in response:
-                        response = response_parsing(response["classes"]) 
-                    responses.append(response)
-                    latencies.append(end_time - start_time)
-                    logger.debug(f"실험 실행 {i+1}/{retries} Success (Time: {end_time - start_time:.2f}초)")
+                    with limiter.limit(tokens) if limiter else nullcontext(0.0) as wait:
+                        _record_wait(wait)
+                        record.rate_limit_wait = wait
+                        start_time = time.perf_counter()
+                        with attempt_scope(record), attempt_in_flight():
+                            response = func(*args, **kwargs)
+                        end_time = time.perf_counter()
+                    record.latency = end_time - start_time
+                    responses = [_parse_response(response)]
+                    latencies.append(record.latency)
+                    logger.debug(f"실험 실행 {i+1}/{retries} Success (Time: {record.latency:.2f}초)")
+                    break
+                except Exception as e:
+                    record.latency = record.latency or time.perf_counter() - start_time
+                    responses = [f"ERROR:{str(e)}"]
+                    backoff = _on_failure(policy, i + 1, retries, e, record, "실험 실행")
+                    if backoff is None:
+                        break
+                    time.sleep(backoff)
+            _record_cost(framework, attempts)
+            return _finish("실험 실행", responses, latencies, attempts)
+        return wrapper
+    return experiment_decorator
+
+
+def experiment_async(
+    retries: int = 1,
+    framework: Optional["BaseFramework"] = None,
+) -> Callable[..., tuple[list[Any], float, list[float]]]:
+    """`experiment`의 비동기 버전. 코루틴을 감싸 이벤트 루프를 막지 않고 재시도한다."""
+    def experiment_decorator(func):
+        async def wrapper(*args, **kwargs):
+            policy = getattr(framework, "retry_policy", DEFAULT_RETRY_POLICY)
+            limiter = framework.rate_limiter() if framework is not None else None
+            tokens = framework.estimate_tokens(_call_inputs(args, kwargs)) if framework is not None else 0
+            responses, latencies, attempts = [], [], []
+            for i in range(retries):
+                record = AttemptRecord(attempt=i + 1, latency=0.0)
+                attempts.append(record)
+                start_time = time.perf_counter()
+                try:
+                    logger.debug(f"비동기 실험 실행 {i+1}/{retries} 시작")
+                    async with limiter.alimit(tokens) if limiter else nullcontext(0.0) as wait:
+                        _record_wait(wait)
+                        record.rate_limit_wait = wait
+                        start_time = time.perf_counter()
+                        with attempt_scope(record), attempt_in_flight():
+                            response = await func(*args, **kwargs)
+                        end_time = time.perf_counter()
+                    record.latency = end_time - start_time
+                    responses = [_parse_response(response)]
+                    latencies.append(record.latency)
+                    logger.debug(f"비동기 실험 실행 {i+1}/{retries} Success (Time: {record.latency:.2f}초)")
                     break
                 except Exception as e:
-                    logger.error(f"실험 실행 {i+1}/{retries} Failure: {str(e)}")
-                    logger.error(traceback.format_exc())
-                    if api_delay_seconds > 0:
-                        time.sleep(api_delay_seconds)
-                    responses=[f"ERROR:{str(e)}"]
-            num_successful = len(responses)
-            percent_successful = num_successful / actual_runs
-            logger.debug(f"총 {actual_runs}회 시도 중 {num_successful}회 성공 (성공률: {percent_successful:.2%})")
-            return (
-                responses,
-                percent_successful,
-                latencies,
-            )
+                    record.latency = record.latency or time.perf_counter() - start_time
+                    responses = [f"ERROR:{str(e)}"]
+                    backoff = _on_failure(policy, i + 1, retries, e, record, "비동기 실험 실행")
+                    if backoff is None:
+                        break
+                    await asyncio.sleep(backoff)
+            _record_cost(framework, attempts)
+            return _finish("비동기 실험 실행", responses, latencies, attempts)
         return wrapper
     return experiment_decorator
 
@@ -69,12 +208,15 @@ class BaseFramework(ABC):
         self.api_key = kwargs.get('api_key', self.load_api_key())
         self.device = kwargs.get("device", "cpu")
         self.api_delay_seconds = kwargs.get("api_delay_seconds", 0)
+        self.retry_policy: RetryPolicy = kwargs.get("retry_policy") or RetryPolicy.from_env(self.api_delay_seconds)
         self.retries = kwargs.get("retries", 3)
         self.timeout = kwargs.get("timeout", 900)
         self.temperature = kwargs.get("temperature", 1.0)
         self.response_model = kwargs.get("response_model", None)
         self.langfuse_trace_id = kwargs.get("langfuse_trace_id", None)
         self.extra_kwargs = {k: v for k, v in kwargs.get("extra_kwargs", {}).items()}
+        # CASSETTE_MODE가 설정돼 있으면 provider HTTP 호출을 기록/재생 (프로세스당 한 번 설치)
+        use_cassette_from_env()
         logger.info(f"{self.__class__.__name__} 초기화 완료")
     
     def load_base_url(self):
@@ -93,6 +235,251 @@ class BaseFramework(ABC):
         else:
             return ""
 
+    def rate_limiter(self):
+        """이 프레임워크의 provider+model에 해당하는 공유 rate limiter"""
+        return rate_limiter.get(self.provider, self.model)
+
+    def estimate_tokens(self, inputs: dict) -> int:
+        """프롬프트와 입력 길이로 요청 토큰 수를 추정 (TPM 예산 계산용)"""
+        return estimate_tokens(self.prompt, *inputs.values())
+
+    def close(self) -> None:
+        """보유한 sync/async 클라이언트 연결을 정리한다. 공용 HTTP 클라이언트를 쓰는 SDK 클라이언트는 그대로 둔다."""
+        for attr in ("client", "async_client"):
+            client = getattr(self, attr, None)
+            close = getattr(client, "close", None)
+            if not callable(close) or http_clients.is_shared(client):
+                continue
+            try:
+                result = close()
+                if inspect.isawaitable(result):
+                    try:
+                        task = asyncio.get_running_loop().create_task(result)
+                    except RuntimeError:
+                        asyncio.run(result)
+                    else:
+                        # 루프가 참조를 약하게만 잡으므로 끝날 때까지 붙잡아 둔다
+                        _closing_tasks.add(task)
+                        task.add_done_callback(_closing_tasks.discard)
+            except Exception as e:
+                logger.debug(f"{self.__class__.__name__}.{attr} 종료 실패: {e}")
+
     @abstractmethod
     def run(self, retries: int, expected_response: Any = None, inputs: dict = {}) -> tuple[list[Any], float, list[float]]: 
-        pass
\ No newline at end of file
+        pass
+
+    async def arun(self, retries: int, inputs: dict = {}, **kwargs) -> tuple[list[Any], float, list[float]]:
+        """비동기 실행. 비동기 클라이언트가 없는 프레임워크는 스레드에서 `run`을 실행한다."""
+        return await asyncio.to_thread(self.run, retries=retries, inputs=inputs, **kwargs)
+
+    # 스트리밍: 지원하는 프레임워크는 `_stream_deltas`/`_astream_deltas`(JSON 텍스트 조각)를
+    # 구현하거나, 부분 객체를 직접 주는 경우 `_stream_partials`/`_astream_partials`를 재정의한다.
+    supports_streaming: bool = False
+
+    def _stream_deltas(self, inputs: dict) -> Iterator[str]:
+        raise NotImplementedError(f"{self.__class__.__name__}는 스트리밍을 지원하지 않습니다")
+
+    def _astream_deltas(self, inputs: dict) -> AsyncIterator[str]:
+        raise NotImplementedError(f"{self.__class__.__name__}는 스트리밍을 지원하지 않습니다")
+
+    def _stream_partials(self, inputs: dict, stats: Optional[RunStats] = None) -> Iterator[Any]:
+        return stream_partials(self._stream_deltas(inputs), self.response_model, self.__class__.__name__, stats)
+
+    def _astream_partials(self, inputs: dict, stats: Optional[RunStats] = None) -> AsyncIterator[Any]:
+        return astream_partials(self._astream_deltas(inputs), self.response_model, self.__class__.__name__, stats)
+
+    def stream(self, inputs: dict = {}, stats: Optional[RunStats] = None) -> Iterator[Any]:
+        """검증된 부분 결과(response_model 인스턴스)를 생성되는 대로 반환한다. 마지막 값이 최종 결과.
+        `stats`를 주면 (없으면 현재 컨텍스트의 통계) TTFT/TTFF를 기록한다."""
+        if not self.supports_streaming:
+            raise NotImplementedError(f"{self.__class__.__name__}는 스트리밍을 지원하지 않습니다")
+        with self.rate_limiter().limit(self.estimate_tokens(inputs)) as wait:
+            _record_wait(wait)
+            yield from self._stream_partials(inputs, stats)
+
+    async def astream(self, inputs: dict = {}, stats: Optional[RunStats] = None) -> AsyncIterator[Any]:
+        """`stream`의 비동기 버전"""
+        if not self.supports_streaming:
+            raise NotImplementedError(f"{self.__class__.__name__}는 스트리밍을 지원하지 않습니다")
+        async with self.rate_limiter().alimit(self.estimate_tokens(inputs)) as wait:
+            _record_wait(wait)
+            async for partial in self._astream_partials(inputs, stats):
+                yield partial
+
+    # 한 요청으로 여러 샘플을 받을 수 있는 프레임워크(OpenAI `n=`)는 `run_n`/`arun_n`을 구현하고
+    # `supports_n`이 True를 반환하게 한다. 결과의 predictions[0]은 {"samples": [dict, ...]} 형태.
+    @property
+    def supports_n(self) -> bool:
+        return False
+
+    def run_n(self, retries: int, inputs: dict = {}, n: int = 1) -> tuple[list[Any], float, list[float]]:
+        raise NotImplementedError(f"{self.__class__.__name__}는 n 샘플링을 지원하지 않습니다")
+
+    async def arun_n(self, retries: int, inputs: dict = {}, n: int = 1) -> tuple[list[Any], float, list[float]]:
+        raise NotImplementedError(f"{self.__class__.__name__}는 n 샘플링을 지원하지 않습니다")
+
+    def _cache_lookup(self, cache_mode: str, inputs: dict):
+        mode = CacheMode(cache_mode or CacheMode.OFF)
+        if mode is CacheMode.OFF:
+            return mode, None, None
+        key = ResponseCache.make_key(
+            self.__class__.__name__, self.provider, self.model,
+            self.prompt, inputs, self.response_model, self.extra_kwargs,
+        )
+        if mode.reads:
+            cached = get_response_cache().get(key)
+            if cached is not None:
+                stats = current_stats()
+                if stats is not None:
+                    stats.cache_hit = True
+                logger.info(f"{self.__class__.__name__} 응답 캐시 적중 ({key[:12]})")
+                return mode, key, cached
+        return mode, key, None
+
+    def _cache_store(self, mode: CacheMode, key: str, result: tuple[list[Any], float, list[float]]) -> None:
+        predictions, percent_successful, latencies = result
+        if mode.writes and predictions and isinstance(predictions[0], dict):
+            get_response_cache().put(key, predictions, percent_successful, latencies)
+
+    def latency_key(self) -> tuple[str, str, str]:
+        return (self.provider, self.model, self.base_url or "")
+
+    @staticmethod
+    def _is_valid(result: tuple[list[Any], float, list[float]]) -> bool:
+        predictions = result[0]
+        return bool(predictions) and isinstance(predictions[0], dict)
+
+    def _run_tracked(self, retries: int, inputs: dict, kwargs: dict) -> tuple[list[Any], float, list[float]]:
+        result = self.run(retries=retries, inputs=inputs, **kwargs)
+        if result[2]:
+            latency_tracker.record(self.latency_key(), result[2][-1])
+        return result
+
+    async def _arun_tracked(self, retries: int, inputs: dict, kwargs: dict) -> tuple[list[Any], float, list[float]]:
+        result = await self.arun(retries=retries, inputs=inputs, **kwargs)
+        if result[2]:
+            latency_tracker.record(self.latency_key(), result[2][-1])
+        return result
+
+    def _hedge_plan(self, hedge: Optional[HedgePolicy], hedge_frameworks: Sequence["BaseFramework"]):
+        """헤지 대기 시간과 헤지 대상(보조 호스트가 없으면 자기 자신) 목록"""
+        if hedge is None:
+            return None, []
+        delay = hedge.delay(latency_tracker, self.latency_key())
+        return delay, list(hedge_frameworks) or [self]
+
+    def _on_hedge_fired(self, target: "BaseFramework", delay: float) -> None:
+        stats = current_stats()
+        if stats is not None:
+            stats.hedge_fired += 1
+        logger.info(f"{self.__class__.__name__} {delay:.2f}초 내 응답 없음 → 헤지 요청 ({target.provider}/{target.model})")
+
+    def _on_hedge_won(self) -> None:
+        stats = current_stats()
+        if stats is not None:
+            stats.hedge_won += 1
+        logger.info(f"{self.__class__.__name__} 헤지 요청이 먼저 완료됨")
+
+    def _run_hedged(self, retries: int, inputs: dict, hedge: Optional[HedgePolicy], hedge_frameworks: Sequence["BaseFramework"], kwargs: dict) -> tuple[list[Any], float, list[float]]:
+        """스레드로 원 요청을 보내고, 지연되면 헤지 요청을 추가해 먼저 성공한 결과를 쓴다.
+        헤지 시계는 원 요청의 시도가 rate limiter를 통과해 API를 호출하는 동안만 간다.
+        스레드는 중단할 수 없으므로 진 요청은 끝까지 실행되지만 결과는 버린다."""
+        delay, targets = self._hedge_plan(hedge, hedge_frameworks)
+        if delay is None:
+            return self._run_tracked(retries, inputs, kwargs)
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1 + hedge.max_hedges)
+        clock = AttemptClock()
+        primary = executor.submit(contextvars.copy_context().run, run_with_clock, clock, self._run_tracked, retries, inputs, kwargs)
+        pending, fired, last_fired, result = {primary}, 0, None, None
+        try:
+            while pending:
+                timeout = None
+                if fired < hedge.max_hedges and not primary.done():
+                    remaining = _next_hedge_in(clock, delay, last_fired)
+                    if remaining is not None and remaining <= 0:
+                        target = targets[fired % len(targets)]
+                        fired, last_fired = fired + 1, time.perf_counter()
+                        self._on_hedge_fired(target, delay)
+                        pending.add(executor.submit(contextvars.copy_context().run, target._run_tracked, retries, inputs, kwargs))
+                        continue
+                    timeout = _HEDGE_POLL_SECONDS if remaining is None else remaining
+                done, pending = concurrent.futures.wait(pending, timeout=timeout, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    if self._is_valid(result):
+                        if future is not primary:
+                            self._on_hedge_won()
+                        return result
+            return result
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _arun_hedged(self, retries: int, inputs: dict, hedge: Optional[HedgePolicy], hedge_frameworks: Sequence["BaseFramework"], kwargs: dict) -> tuple[list[Any], float, list[float]]:
+        """`_run_hedged`의 비동기 버전. 먼저 성공한 쪽을 쓰고 나머지 태스크는 취소한다."""
+        delay, targets = self._hedge_plan(hedge, hedge_frameworks)
+        if delay is None:
+            return await self._arun_tracked(retries, inputs, kwargs)
+        clock = AttemptClock()
+        primary = asyncio.create_task(arun_with_clock(clock, self._arun_tracked, retries, inputs, kwargs))
+        pending, fired, last_fired, result = {primary}, 0, None, None
+        try:
+            while pending:
+                timeout = None
+                if fired < hedge.max_hedges and not primary.done():
+                    remaining = _next_hedge_in(clock, delay, last_fired)
+                    if remaining is not None and remaining <= 0:
+                        target = targets[fired % len(targets)]
+                        fired, last_fired = fired + 1, time.perf_counter()
+                        self._on_hedge_fired(target, delay)
+                        pending.add(asyncio.create_task(target._arun_tracked(retries, inputs, kwargs)))
+                        continue
+                    timeout = _HEDGE_POLL_SECONDS if remaining is None else remaining
+                done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    result = task.result()
+                    if self._is_valid(result):
+                        if task is not primary:
+                            self._on_hedge_won()
+                        return result
+            return result
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def execute(
+        self,
+        retries: int,
+        inputs: dict = {},
+        cache_mode: str = "off",
+        hedge: Optional[HedgePolicy] = None,
+        hedge_frameworks: Sequence["BaseFramework"] = (),
+        **kwargs,
+    ) -> tuple[list[Any], float, list[float]]:
+        """응답 캐시를 거쳐 `run`을 실행한다. `hedge`가 주어지면 느린 요청을 헤지한다."""
+        mode, key, cached = self._cache_lookup(cache_mode, inputs)
+        if cached is not None:
+            return cached
+        result = self._run_hedged(retries, inputs, hedge, hedge_frameworks, kwargs)
+        if key is not None:
+            self._cache_store(mode, key, result)
+        return result
+
+    async def aexecute(
+        self,
+        retries: int,
+        inputs: dict = {},
+        cache_mode: str = "off",
+        hedge: Optional[HedgePolicy] = None,
+        hedge_frameworks: Sequence["BaseFramework"] = (),
+        **kwargs,
+    ) -> tuple[list[Any], float, list[float]]:
+        """응답 캐시를 거쳐 `arun`을 실행한다. `hedge`가 주어지면 느린 요청을 헤지한다."""
+        mode, key, cached = self._cache_lookup(cache_mode, inputs)
+        if cached is not None:
+            return cached
+        result = await self._arun_hedged(retries, inputs, hedge, hedge_frameworks, kwargs)
+        if key is not None:
+            self._cache_store(mode, key, result)
+        return result
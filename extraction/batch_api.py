@@ -0,0 +1,190 @@
+"""provider batch API로 대량 추출 (OpenAI `/v1/batches`, Anthropic `/v1/messages/batches`).
+
+대화형 지연이 필요 없는 오프라인 벤치마크용. 요청들을 JSONL/요청 목록으로 직렬화해 제출하고,
+끝날 때까지 polling한 뒤 `custom_id`로 결과를 원래 요청에 되돌린다. 비용이 절반이고 처리량 한도가 크다.
+요청 형식(프롬프트, 스키마, extra_kwargs)은 각 프레임워크 인스턴스의 것을 그대로 쓴다.
+"""
+from __future__ import annotations
+
+import io
+import json
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from loguru import logger
+
+from structured_output_kit.extraction.base import _parse_response
+from structured_output_kit.extraction.usage import Usage, extract_usage
+
+
+@dataclass
+class BatchApiConfig:
+    """provider batch 작업 설정"""
+    poll_interval: float = 30.0          # 상태 확인 간격(초)
+    timeout: Optional[float] = None      # 전체 대기 상한(초). 없으면 provider가 끝낼 때까지
+    completion_window: str = "24h"       # OpenAI completion_window
+    max_requests: int = 10000            # batch 하나에 넣을 최대 요청 수 (넘으면 나눠서 제출)
+
+
+@dataclass
+class BatchOutput:
+    """batch 결과 한 건"""
+    custom_id: str
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    usage: Optional[Usage] = None
+
+
+class BatchBackend:
+    """provider batch API 어댑터. 프레임워크 인스턴스의 클라이언트와 요청 형식을 재사용한다."""
+    provider_name = ""
+
+    def __init__(self, framework: Any):
+        self.framework = framework
+
+    def build(self, custom_id: str, inputs: dict) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    def submit(self, items: List[Dict[str, Any]], config: BatchApiConfig) -> str:
+        raise NotImplementedError
+
+    def status(self, batch_id: str) -> Tuple[bool, Dict[str, Any]]:
+        """(종료 여부, {"status", "counts", ...})"""
+        raise NotImplementedError
+
+    def results(self, batch_id: str, info: Dict[str, Any]) -> Iterator[BatchOutput]:
+        raise NotImplementedError
+
+    def _validate(self, custom_id: str, data: Any, usage: Optional[Usage]) -> BatchOutput:
+        try:
+            model = self.framework.response_model
+            parsed = model.model_validate(data) if hasattr(model, "model_validate") else data
+            return BatchOutput(custom_id, result=_parse_response(parsed), usage=usage)
+        except Exception as e:
+            return BatchOutput(custom_id, error=f"ERROR:{e}", usage=usage)
+
+
+class OpenAIBatchBackend(BatchBackend):
+    """OpenAI Batch API: 입력 JSONL 업로드 → batch 생성 → 출력/오류 파일 다운로드"""
+    provider_name = "openai"
+    endpoint = "/v1/chat/completions"
+
+    def build(self, custom_id: str, inputs: dict) -> Dict[str, Any]:
+        from openai.lib._parsing._completions import type_to_response_format_param
+        body = self.framework._stream_kwargs(inputs)
+        body["response_format"] = type_to_response_format_param(body["response_format"])
+        return {"custom_id": custom_id, "method": "POST", "url": self.endpoint, "body": body}
+
+    def submit(self, items: List[Dict[str, Any]], config: BatchApiConfig) -> str:
+        client = self.framework.client
+        payload = "".join(json.dumps(item, ensure_ascii=False) + "\n" for item in items).encode("utf-8")
+        input_file = client.files.create(file=("batch_input.jsonl", io.BytesIO(payload)), purpose="batch")
+        batch = client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=self.endpoint,
+            completion_window=config.completion_window,
+        )
+        return batch.id
+
+    def status(self, batch_id: str) -> Tuple[bool, Dict[str, Any]]:
+        batch = self.framework.client.batches.retrieve(batch_id)
+        counts = batch.request_counts.model_dump() if batch.request_counts else {}
+        info = {
+            "status": batch.status,
+            "counts": counts,
+            "output_file_id": batch.output_file_id,
+            "error_file_id": batch.error_file_id,
+            "errors": batch.errors.model_dump() if batch.errors else None,
+        }
+        return batch.status in ("completed", "failed", "expired", "cancelled"), info
+
+    def results(self, batch_id: str, info: Dict[str, Any]) -> Iterator[BatchOutput]:
+        client = self.framework.client
+        for file_id in (info.get("output_file_id"), info.get("error_file_id")):
+            if not file_id:
+                continue
+            for line in client.files.content(file_id).text.splitlines():
+                if line.strip():
+                    yield self._parse_line(json.loads(line))
+
+    def _parse_line(self, line: Dict[str, Any]) -> BatchOutput:
+        custom_id = line["custom_id"]
+        response = line.get("response") or {}
+        body = response.get("body") or {}
+        if line.get("error") or response.get("status_code") != 200:
+            error = line.get("error") or body.get("error") or f"status {response.get('status_code')}"
+            return BatchOutput(custom_id, error=f"ERROR:{error.get('message', error) if isinstance(error, dict) else error}")
+        usage = extract_usage(body)
+        message = (body.get("choices") or [{}])[0].get("message") or {}
+        if message.get("refusal"):
+            return BatchOutput(custom_id, error=f"ERROR:refusal: {message['refusal']}", usage=usage)
+        try:
+            data = json.loads(message.get("content") or "")
+        except json.JSONDecodeError as e:
+            return BatchOutput(custom_id, error=f"ERROR:JSON 파싱 실패: {e}", usage=usage)
+        return self._validate(custom_id, data, usage)
+
+
+class AnthropicBatchBackend(BatchBackend):
+    """Anthropic Message Batches API: 요청 목록 제출 → processing_status가 ended가 되면 결과 JSONL 조회"""
+    provider_name = "anthropic"
+
+    def build(self, custom_id: str, inputs: dict) -> Dict[str, Any]:
+        return {"custom_id": custom_id, "params": self.framework._build_request(inputs)}
+
+    def submit(self, items: List[Dict[str, Any]], config: BatchApiConfig) -> str:
+        return self.framework.client.messages.batches.create(requests=items).id
+
+    def status(self, batch_id: str) -> Tuple[bool, Dict[str, Any]]:
+        batch = self.framework.client.messages.batches.retrieve(batch_id)
+        info = {"status": batch.processing_status, "counts": batch.request_counts.model_dump()}
+        return batch.processing_status == "ended", info
+
+    def results(self, batch_id: str, info: Dict[str, Any]) -> Iterator[BatchOutput]:
+        for entry in self.framework.client.messages.batches.results(batch_id):
+            result = entry.result
+            if result.type != "succeeded":
+                error = getattr(result, "error", None)
+                yield BatchOutput(entry.custom_id, error=f"ERROR:{result.type}" + (f": {error}" if error else ""))
+                continue
+            usage = extract_usage(result.message)
+            try:
+                data = self.framework._extract_tool_input(result.message)
+            except ValueError as e:
+                yield BatchOutput(entry.custom_id, error=f"ERROR:{e}", usage=usage)
+                continue
+            yield self._validate(entry.custom_id, data, usage)
+
+
+BATCH_BACKENDS: Dict[str, type] = {
+    "OpenAIFramework": OpenAIBatchBackend,
+    "AnthropicFramework": AnthropicBatchBackend,
+}
+
+
+def batch_backend(framework_name: str, framework: Any) -> BatchBackend:
+    backend_class = BATCH_BACKENDS.get(framework_name)
+    if backend_class is None:
+        raise ValueError(f"{framework_name}는 provider batch API를 지원하지 않습니다 (지원: {list(BATCH_BACKENDS)})")
+    return backend_class(framework)
+
+
+def wait_for_batches(jobs: Dict[str, Tuple[BatchBackend, str]], config: BatchApiConfig) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """제출한 batch들을 `poll_interval`마다 확인하고, 끝나는 순서대로 (job 키, 상태 정보)를 반환한다."""
+    started_at = time.monotonic()
+    pending = dict(jobs)
+    while pending:
+        for key, (backend, batch_id) in list(pending.items()):
+            done, info = backend.status(batch_id)
+            if done:
+                logger.info(f"batch {batch_id} 종료: {info['status']} {info['counts']}")
+                del pending[key]
+                yield key, info
+            else:
+                logger.info(f"batch {batch_id} 진행 중: {info['status']} {info['counts']}")
+        if not pending:
+            break
+        if config.timeout is not None and time.monotonic() - started_at > config.timeout:
+            raise TimeoutError(f"batch 대기 시간 초과 ({config.timeout}초): {[batch_id for _, batch_id in pending.values()]}")
+        time.sleep(config.poll_interval)
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import os
+import json
+import hashlib
+import threading
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+from structured_output_kit.utils.cache import CACHE_MODES, CacheMode, SqliteCache
+from structured_output_kit.extraction.schema_registry import schema_registry
+
+
+class ResponseCache:
+    """(framework, provider, model, prompt, input, schema, extra_kwargs) 해시를 키로 하는 추출 결과 캐시.
+
+    파싱된 결과와 원래 지연시간을 함께 저장하므로, 캐시 적중 시에도 원래
+    측정값을 그대로 보고할 수 있다.
+    """
+
+    def __init__(self, path: str, ttl_seconds: Optional[float] = None, max_bytes: Optional[int] = None):
+        self.store = SqliteCache(path, ttl_seconds=ttl_seconds, max_bytes=max_bytes)
+
+    @staticmethod
+    def make_key(
+        framework: str,
+        provider: str,
+        model: str,
+        prompt: str,
+        inputs: Dict[str, Any],
+        response_model: Any,
+        extra_kwargs: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        schema = schema_registry.digest(response_model) if hasattr(response_model, "model_json_schema") else response_model
+        material = json.dumps(
+            {
+                "framework": framework,
+                "provider": provider,
+                "model": model,
+                "prompt": prompt,
+                "inputs": inputs,
+                "schema": schema,
+                "extra_kwargs": extra_kwargs or {},
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[tuple[list[Any], float, list[float]]]:
+        entry = self.store.get(key)
+        if entry is None:
+            return None
+        return entry["predictions"], entry["percent_successful"], entry["latencies"]
+
+    def put(self, key: str, predictions: list[Any], percent_successful: float, latencies: list[float]) -> None:
+        self.store.set(key, {
+            "predictions": predictions,
+            "percent_successful": percent_successful,
+            "latencies": latencies,
+        })
+
+
+_response_cache: Optional[ResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """프로세스 공용 응답 캐시 (경로/TTL/용량은 환경변수로 설정)"""
+    global _response_cache
+    with _response_cache_lock:
+        if _response_cache is None:
+            path = os.getenv("RESPONSE_CACHE_PATH", os.path.join("result", ".cache", "responses.sqlite"))
+            ttl = float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+            max_mb = float(os.getenv("RESPONSE_CACHE_MAX_MB", "512"))
+            _response_cache = ResponseCache(
+                path,
+                ttl_seconds=ttl if ttl > 0 else None,
+                max_bytes=int(max_mb * 1024 * 1024) if max_mb > 0 else None,
+            )
+            logger.debug(f"응답 캐시 사용: {path}")
+        return _response_cache
@@ -0,0 +1,194 @@
+"""작은 모델 우선 추출(cascade).
+
+빠른 모델(예: Ollama 8B)로 먼저 추출하고, 결과가 스키마 검증과 완성도 검사(채워진 필드 비율, 필수 필드)를
+통과하면 그대로 쓴다. 통과하지 못한 문서만 다음 단계(더 큰 모델)로 올려 보낸다. 모든 단계가 검사에
+실패하면 마지막으로 성공한 단계의 결과를 반환한다.
+
+단계별 기록은 `RunStats.cascade`에 남고, 여러 문서를 모아 `summarize()`로 escalation 비율과
+blended latency(문서당 전체 지연시간 평균, 올려 보낸 문서는 앞 단계 시간 포함)를 계산한다.
+"""
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+from pydantic import BaseModel, ValidationError
+
+from structured_output_kit.extraction.stats import current_stats
+from structured_output_kit.extraction.schema_utils import is_empty
+
+
+@dataclass
+class CascadeConfig:
+    """cascade 설정. 첫 단계는 요청의 host_info/framework, 이후 단계는 `hosts` 순서."""
+    hosts: List[Any] = field(default_factory=list)  # 올려 보낼 상위 모델 HostInfo 목록
+    framework: Optional[str] = None    # 상위 모델에 쓸 프레임워크 (없으면 첫 단계와 같은 프레임워크)
+    min_filled_ratio: float = 0.0      # 채워진 leaf 필드 비율 하한 (0~1)
+    required_fields: List[str] = field(default_factory=list)  # 반드시 채워져야 하는 필드 경로 (예: personal_info.name, careers.company_name)
+
+
+# ---------------------------------------------------------------------------
+# 완성도 검사
+# ---------------------------------------------------------------------------
+
+def _leaves(value: Any) -> List[Any]:
+    """객체를 leaf 값 목록으로 편다. 빈 리스트/객체는 비어 있는 leaf 하나로 센다."""
+    if isinstance(value, dict):
+        return [leaf for item in value.values() for leaf in _leaves(item)] if value else [value]
+    if isinstance(value, list) and any(isinstance(item, dict) for item in value):
+        return [leaf for item in value for leaf in _leaves(item)]
+    return [value]
+
+
+def filled_ratio(value: Any) -> float:
+    leaves = _leaves(value)
+    return sum(1 for leaf in leaves if not is_empty(leaf)) / len(leaves) if leaves else 0.0
+
+
+def _lookup(value: Any, path: List[str]) -> List[Any]:
+    """점 경로의 값들. 중간에 리스트가 있으면 항목마다 따라간다."""
+    if not path:
+        return [value]
+    if isinstance(value, list):
+        return [found for item in value for found in _lookup(item, path)]
+    if isinstance(value, dict) and path[0] in value:
+        return _lookup(value[path[0]], path[1:])
+    return []
+
+
+def check_result(result: Dict[str, Any], response_model: type[BaseModel], config: CascadeConfig) -> List[str]:
+    """결과가 통과하지 못한 이유 목록 (비어 있으면 통과).
+
+    스키마로 다시 검증한 뒤 기본값까지 채운 전체 필드를 기준으로 채워진 leaf 비율을 계산한다
+    (exclude_none으로 빠진 필드도 빈 필드로 센다). 필수 필드는 경로의 값 중 하나라도 채워져 있으면 통과.
+    """
+    try:
+        full = response_model.model_validate(result).model_dump()
+    except ValidationError as e:
+        return [f"스키마 검증 실패: {e.error_count()}개 오류"]
+
+    reasons = []
+    ratio = filled_ratio(full)
+    if ratio < config.min_filled_ratio:
+        reasons.append(f"채워진 필드 비율 {ratio:.0%} < {config.min_filled_ratio:.0%}")
+    for path in config.required_fields:
+        if all(is_empty(found) for found in _lookup(full, path.split("."))):
+            reasons.append(f"필수 필드 비어 있음: {path}")
+    return reasons
+
+
+# ---------------------------------------------------------------------------
+# 단계 실행
+# ---------------------------------------------------------------------------
+
+Tier = Tuple[str, Any]  # (framework, HostInfo)
+
+
+def _record(tier: Tier, level: int, elapsed: float, success: bool, reasons: List[str]) -> bool:
+    framework, host = tier
+    passed = success and not reasons
+    stats = current_stats()
+    if stats is not None:
+        stats.cascade.append({
+            "level": level,
+            "framework": framework,
+            "provider": host.provider,
+            "model": host.model,
+            "latency": elapsed,
+            "success": success,
+            "passed": passed,
+            "reasons": reasons,
+        })
+    if not success:
+        logger.warning(f"cascade {level}단계 {host.model} 추출 실패")
+    elif reasons:
+        logger.warning(f"cascade {level}단계 {host.model} 검사 실패: {reasons}")
+    else:
+        logger.info(f"cascade {level}단계 {host.model} 통과 ({elapsed:.2f}초)")
+    return passed
+
+
+def _select(outputs: List[tuple], started_at: float) -> tuple[Dict[str, Any], bool, Any]:
+    """검사를 통과한 마지막 결과, 없으면 추출에 성공한 가장 높은 단계의 결과"""
+    elapsed = time.perf_counter() - started_at
+    for result, success, _ in reversed(outputs):
+        if success:
+            return result, True, [elapsed]
+    return outputs[-1][0], False, [elapsed]
+
+
+def run_cascade(
+    tiers: List[Tier],
+    runner: Callable[[str, Any], tuple],
+    response_model: type[BaseModel],
+    config: CascadeConfig,
+) -> tuple[Dict[str, Any], bool, Any]:
+    """`runner(framework, host)`를 단계 순서대로 실행하고, 검사를 통과하면 멈춘다.
+    반환 지연시간은 거친 모든 단계를 합친 시간이다."""
+    started_at = time.perf_counter()
+    outputs = []
+    for level, tier in enumerate(tiers):
+        tier_started = time.perf_counter()
+        result, success, latencies = runner(*tier)
+        outputs.append((result, success, latencies))
+        reasons = check_result(result, response_model, config) if success else []
+        if _record(tier, level, time.perf_counter() - tier_started, success, reasons):
+            break
+    return _select(outputs, started_at)
+
+
+async def arun_cascade(
+    tiers: List[Tier],
+    runner: Callable[[str, Any], Awaitable[tuple]],
+    response_model: type[BaseModel],
+    config: CascadeConfig,
+) -> tuple[Dict[str, Any], bool, Any]:
+    """`run_cascade`의 비동기 버전."""
+    started_at = time.perf_counter()
+    outputs = []
+    for level, tier in enumerate(tiers):
+        tier_started = time.perf_counter()
+        result, success, latencies = await runner(*tier)
+        outputs.append((result, success, latencies))
+        reasons = check_result(result, response_model, config) if success else []
+        if _record(tier, level, time.perf_counter() - tier_started, success, reasons):
+            break
+    return _select(outputs, started_at)
+
+
+# ---------------------------------------------------------------------------
+# 보고
+# ---------------------------------------------------------------------------
+
+def report(tiers: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """요청 하나의 cascade 요약 (cascade를 쓰지 않았으면 None)"""
+    if not tiers:
+        return None
+    final = tiers[-1]
+    return {
+        "escalated": len(tiers) > 1,
+        "level": final["level"],
+        "model": final["model"],
+        "passed": final["passed"],
+        "latency": sum(tier["latency"] for tier in tiers),
+        "tiers": tiers,
+    }
+
+
+def summarize(reports: List[Optional[Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+    """여러 문서의 escalation 비율과 blended latency"""
+    reports = [r for r in reports if r]
+    if not reports:
+        return None
+    escalated = sum(1 for r in reports if r["escalated"])
+    first = [r["tiers"][0]["latency"] for r in reports]
+    return {
+        "documents": len(reports),
+        "escalated": escalated,
+        "escalation_rate": escalated / len(reports),
+        "blended_latency": sum(r["latency"] for r in reports) / len(reports),
+        "first_tier_latency": sum(first) / len(first),
+        "passed_rate": sum(1 for r in reports if r["passed"]) / len(reports),
+    }
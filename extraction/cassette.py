@@ -0,0 +1,298 @@
+from __future__ import annotations
+
+import os
+import json
+import time
+import base64
+import asyncio
+import hashlib
+import threading
+from enum import Enum
+from urllib.parse import urlparse
+from typing import Any, Dict, Iterator, AsyncIterator, List, Optional
+
+import httpx
+from loguru import logger
+
+
+class CassetteMode(str, Enum):
+    """HTTP 기록/재생 모드"""
+    OFF = "off"
+    RECORD = "record"   # 실제로 호출하고 요청/응답(스트리밍 조각, 시간 포함)을 기록
+    REPLAY = "replay"   # 기록된 응답만 사용, 없는 요청은 CassetteMissError
+
+
+CASSETTE_MODES = [mode.value for mode in CassetteMode]
+
+
+class CassetteMissError(RuntimeError):
+    """재생 모드에서 기록되지 않은 요청을 보냈을 때"""
+
+
+def _canonical_body(content: bytes) -> str:
+    try:
+        return json.dumps(json.loads(content), sort_keys=True, ensure_ascii=False)
+    except (ValueError, UnicodeDecodeError):
+        return hashlib.sha256(content).hexdigest()
+
+
+def request_key(request: httpx.Request) -> str:
+    """메서드, URL(호스트 제외 경로+쿼리), 정규화한 본문으로 만든 요청 키.
+    헤더(인증키, 요청 ID 등)와 호스트는 키에 넣지 않아 다른 환경에서도 재생할 수 있다."""
+    url = request.url
+    material = "\n".join([
+        request.method,
+        url.raw_path.decode("ascii", "replace"),
+        _canonical_body(request.content),
+    ])
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class Cassette:
+    """JSONL 파일 하나에 요청별 응답을 기록하고 재생한다.
+
+    같은 키의 요청이 여러 번 기록되면 재생 시 기록된 순서대로 돌아가며 사용한다.
+    `simulate_latency`가 켜져 있으면 원래 응답 헤더/조각 도착 시각에 맞춰 기다린다.
+    """
+
+    def __init__(self, path: str, mode: CassetteMode, simulate_latency: bool = False):
+        self.path = path
+        self.mode = mode
+        self.simulate_latency = simulate_latency
+        self._entries: Dict[str, List[Dict[str, Any]]] = {}
+        self._cursor: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.recorded = 0
+        self._load()
+
+    def _load(self) -> None:
+        if not os.path.isfile(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    entry = json.loads(line)
+                    self._entries.setdefault(entry["key"], []).append(entry)
+        logger.info(f"카세트 로드: {self.path} ({sum(len(v) for v in self._entries.values())}개 응답)")
+
+    def ignores(self, request: httpx.Request) -> bool:
+        """트레이싱 등 LLM 호출이 아닌 요청은 그대로 통과시킨다."""
+        url = request.url
+        ignored = _ignored_hosts()
+        return url.host in ignored or f"{url.host}:{url.port}" in ignored
+
+    def lookup(self, request: httpx.Request) -> Dict[str, Any]:
+        key = request_key(request)
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                self.misses += 1
+                raise CassetteMissError(f"카세트에 기록되지 않은 요청: {request.method} {request.url.path} ({key[:12]})")
+            index = self._cursor.get(key, 0)
+            self._cursor[key] = index + 1
+            self.hits += 1
+            return entries[index % len(entries)]
+
+    def save(self, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries.setdefault(entry["key"], []).append(entry)
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self.recorded += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"mode": self.mode.value, "path": self.path, "hits": self.hits, "misses": self.misses, "recorded": self.recorded}
+
+
+def _ignored_hosts() -> set:
+    """기록/재생하지 않을 `host` 또는 `host:port` 목록"""
+    hosts = {"cloud.langfuse.com", "us.cloud.langfuse.com"}
+    langfuse_host = os.getenv("LANGFUSE_HOST")
+    if langfuse_host:
+        parsed = urlparse(langfuse_host)
+        hosts.add(f"{parsed.hostname}:{parsed.port}" if parsed.port else parsed.hostname)
+    hosts.update(h.strip() for h in os.getenv("CASSETTE_IGNORE_HOSTS", "").split(",") if h.strip())
+    return hosts
+
+
+def _new_entry(request: httpx.Request, response: httpx.Response, elapsed: float) -> Dict[str, Any]:
+    return {
+        "key": request_key(request),
+        "method": request.method,
+        "url": str(request.url.copy_with(query=None)),
+        "status": response.status_code,
+        "headers": [[k.decode("latin-1"), v.decode("latin-1")] for k, v in response.headers.raw],
+        "elapsed": elapsed,  # 응답 헤더까지 걸린 시간(초)
+        "chunks": [],        # [요청 시작부터 시각(초), base64 원본 바이트]
+        "recorded_at": time.time(),
+    }
+
+
+def _encode(chunk: bytes) -> str:
+    return base64.b64encode(chunk).decode("ascii")
+
+
+class _RecordingStream(httpx.SyncByteStream):
+    def __init__(self, stream: Any, cassette: Cassette, entry: Dict[str, Any], started_at: float):
+        self._stream, self._cassette, self._entry, self._started_at = stream, cassette, entry, started_at
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._stream:
+            self._entry["chunks"].append([time.perf_counter() - self._started_at, _encode(chunk)])
+            yield chunk
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            self._cassette.save(self._entry)
+
+
+class _AsyncRecordingStream(httpx.AsyncByteStream):
+    def __init__(self, stream: Any, cassette: Cassette, entry: Dict[str, Any], started_at: float):
+        self._stream, self._cassette, self._entry, self._started_at = stream, cassette, entry, started_at
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            self._entry["chunks"].append([time.perf_counter() - self._started_at, _encode(chunk)])
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._cassette.save(self._entry)
+
+
+class _ReplayStream(httpx.SyncByteStream):
+    def __init__(self, entry: Dict[str, Any], simulate: bool):
+        self._entry, self._simulate = entry, simulate
+
+    def __iter__(self) -> Iterator[bytes]:
+        previous = self._entry["elapsed"]
+        for offset, data in self._entry["chunks"]:
+            if self._simulate and offset > previous:
+                time.sleep(offset - previous)
+            previous = offset
+            yield base64.b64decode(data)
+
+
+class _AsyncReplayStream(httpx.AsyncByteStream):
+    def __init__(self, entry: Dict[str, Any], simulate: bool):
+        self._entry, self._simulate = entry, simulate
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        previous = self._entry["elapsed"]
+        for offset, data in self._entry["chunks"]:
+            if self._simulate and offset > previous:
+                await asyncio.sleep(offset - previous)
+            previous = offset
+            yield base64.b64decode(data)
+
+
+def _replay_response(entry: Dict[str, Any], stream: Any) -> httpx.Response:
+    return httpx.Response(
+        status_code=entry["status"],
+        headers=[(k, v) for k, v in entry["headers"]],
+        stream=stream,
+    )
+
+
+# ---------------------------------------------------------------------------
+# httpx transport 패치: OpenAI/Anthropic/Ollama SDK와 LangChain/LlamaIndex 등 그 위의
+# 프레임워크가 모두 httpx를 쓰므로 transport 한 곳에서 모든 provider 호출을 가로챈다.
+# ---------------------------------------------------------------------------
+
+_active: Optional[Cassette] = None
+_original_handle = httpx.HTTPTransport.handle_request
+_original_handle_async = httpx.AsyncHTTPTransport.handle_async_request
+
+
+def _handle_request(self, request: httpx.Request) -> httpx.Response:
+    cassette = _active
+    if cassette is None or cassette.ignores(request):
+        return _original_handle(self, request)
+    request.read()
+    if cassette.mode is CassetteMode.REPLAY:
+        entry = cassette.lookup(request)
+        if cassette.simulate_latency:
+            time.sleep(entry["elapsed"])
+        return _replay_response(entry, _ReplayStream(entry, cassette.simulate_latency))
+    started_at = time.perf_counter()
+    response = _original_handle(self, request)
+    entry = _new_entry(request, response, time.perf_counter() - started_at)
+    return httpx.Response(
+        status_code=response.status_code,
+        headers=response.headers,
+        stream=_RecordingStream(response.stream, cassette, entry, started_at),
+        extensions=response.extensions,
+    )
+
+
+async def _handle_async_request(self, request: httpx.Request) -> httpx.Response:
+    cassette = _active
+    if cassette is None or cassette.ignores(request):
+        return await _original_handle_async(self, request)
+    await request.aread()
+    if cassette.mode is CassetteMode.REPLAY:
+        entry = cassette.lookup(request)
+        if cassette.simulate_latency:
+            await asyncio.sleep(entry["elapsed"])
+        return _replay_response(entry, _AsyncReplayStream(entry, cassette.simulate_latency))
+    started_at = time.perf_counter()
+    response = await _original_handle_async(self, request)
+    entry = _new_entry(request, response, time.perf_counter() - started_at)
+    return httpx.Response(
+        status_code=response.status_code,
+        headers=response.headers,
+        stream=_AsyncRecordingStream(response.stream, cassette, entry, started_at),
+        extensions=response.extensions,
+    )
+
+
+_install_lock = threading.Lock()
+
+
+def default_cassette_path() -> str:
+    return os.getenv("CASSETTE_PATH", os.path.join("result", "cassettes", "default.jsonl"))
+
+
+def use_cassette(path: Optional[str], mode: str = "off", simulate_latency: bool = False) -> Optional[Cassette]:
+    """프로세스 전체의 HTTP 기록/재생을 설정한다. `mode`가 off면 해제.
+    `path`가 없으면 CASSETTE_PATH (기본값 result/cassettes/default.jsonl)."""
+    global _active
+    mode = CassetteMode(mode or CassetteMode.OFF)
+    with _install_lock:
+        if mode is CassetteMode.OFF:
+            httpx.HTTPTransport.handle_request = _original_handle
+            httpx.AsyncHTTPTransport.handle_async_request = _original_handle_async
+            _active = None
+            return None
+        path = path or default_cassette_path()
+        if _active is not None and _active.path == path and _active.mode is mode:
+            _active.simulate_latency = simulate_latency
+            return _active
+        _active = Cassette(path, mode, simulate_latency)
+        httpx.HTTPTransport.handle_request = _handle_request
+        httpx.AsyncHTTPTransport.handle_async_request = _handle_async_request
+        logger.info(f"HTTP 카세트 {mode.value}: {path}" + (" (원래 지연 재현)" if simulate_latency else ""))
+        return _active
+
+
+def active_cassette() -> Optional[Cassette]:
+    return _active
+
+
+def use_cassette_from_env() -> Optional[Cassette]:
+    """CASSETTE_MODE / CASSETTE_PATH / CASSETTE_SIMULATE_LATENCY 환경변수로 설정 (이미 설정돼 있으면 유지)"""
+    mode = os.getenv("CASSETTE_MODE", "off").lower()
+    if mode == CassetteMode.OFF.value:
+        return _active
+    path = default_cassette_path()
+    simulate = os.getenv("CASSETTE_SIMULATE_LATENCY", "false").lower() in ("1", "true", "yes")
+    return use_cassette(path, mode, simulate)
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import re
+import json
+import time
+import asyncio
+import contextvars
+import concurrent.futures
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, get_origin
+
+from loguru import logger
+
+from structured_output_kit.utils.rate_limiter import CHARS_PER_TOKEN
+from structured_output_kit.extraction.stats import current_stats
+from structured_output_kit.extraction.schema_utils import compact, is_empty, is_model, unwrap_optional
+
+
+# 파서가 페이지 경계를 남기는 경우 (form feed, docling page break placeholder 등)
+PAGE_BREAK_PATTERN = re.compile(r"\f|<!--\s*page[ _-]?break\s*-->|<!--\s*page\s*\d+\s*-->", re.IGNORECASE)
+
+
+@dataclass
+class ChunkingConfig:
+    """긴 문서 분할 추출 설정 (토큰 수는 문자 길이 기반 추정치)"""
+    max_tokens: int = 6000
+    overlap_tokens: int = 400
+    max_concurrency: int = 4
+
+
+def split_pages(content: str) -> List[str]:
+    """페이지 경계가 있으면 페이지 단위로, 없으면 통째로 반환"""
+    pages = [page for page in PAGE_BREAK_PATTERN.split(content) if page.strip()]
+    return pages or [content]
+
+
+def _split_units(text: str, max_chars: int) -> List[str]:
+    """`max_chars`를 넘는 텍스트를 문단 → 줄 → 문자 순으로 잘게 나눈다."""
+    if len(text) <= max_chars:
+        return [text]
+    for separator in ("\n\n", "\n"):
+        parts = [part + separator for part in text.split(separator)]
+        if len(parts) > 1:
+            units: List[str] = []
+            for part in parts:
+                units.extend(_split_units(part, max_chars))
+            return units
+    return [text[i:i + max_chars] for i in range(0, len(text), max_chars)]
+
+
+def chunk_text(content: str, max_tokens: int = 6000, overlap_tokens: int = 400) -> List[str]:
+    """`content`를 토큰 상한을 넘지 않는, 서로 조금씩 겹치는 청크로 나눈다.
+
+    페이지 경계가 있으면 페이지를 가능한 한 쪼개지 않고 묶으며, 다음 청크는 이전
+    청크 끝부분(`overlap_tokens`)을 다시 포함해 경계에 걸친 항목을 놓치지 않게 한다.
+    """
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    overlap_chars = min(overlap_tokens * CHARS_PER_TOKEN, max_chars // 2)
+    if len(content) <= max_chars:
+        return [content]
+
+    units: List[str] = []
+    for page in split_pages(content):
+        units.extend(_split_units(page if page.endswith("\n") else page + "\n", max_chars - overlap_chars))
+
+    chunks: List[str] = []
+    current: List[str] = []
+    size = 0
+    for unit in units:
+        if current and size + len(unit) > max_chars:
+            chunks.append("".join(current))
+            # 이전 청크의 끝부분을 overlap으로 이어받는다
+            carried: List[str] = []
+            carried_size = 0
+            for previous in reversed(current):
+                if carried_size + len(previous) > overlap_chars:
+                    break
+                carried.insert(0, previous)
+                carried_size += len(previous)
+            if not carried and overlap_chars:
+                carried = [current[-1][-overlap_chars:]]
+                carried_size = len(carried[0])
+            current, size = carried, carried_size
+        current.append(unit)
+        size += len(unit)
+    if current:
+        chunks.append("".join(current))
+    return chunks
+
+
+# ---------------------------------------------------------------------------
+# schema-aware merge
+# ---------------------------------------------------------------------------
+
+def _subsumes(big: Any, small: Any) -> bool:
+    """`small`의 값이 모두 `big`에 들어 있는지 (overlap으로 잘린 중복 항목 제거용)"""
+    if isinstance(big, dict) and isinstance(small, dict):
+        return all(k in big and _subsumes(big[k], v) for k, v in small.items())
+    return big == small
+
+
+def _merge_list(values: List[List[Any]]) -> List[Any]:
+    """리스트 필드: 이어 붙인 뒤 중복(또는 다른 항목에 포함되는 항목) 제거"""
+    items = [item for value in values for item in value if not is_empty(item)]
+    compacted = [compact(item) for item in items]
+    keys = [json.dumps(item, ensure_ascii=False, sort_keys=True) for item in compacted]
+    merged: List[Any] = []
+    seen = set()
+    for i, (item, compacted_item, key) in enumerate(zip(items, compacted, keys)):
+        if key in seen:
+            continue
+        # 더 많은 정보를 가진 다른 항목에 포함되면 버린다
+        if any(j != i and keys[j] != key and _subsumes(compacted[j], compacted_item) for j in range(len(items))):
+            continue
+        seen.add(key)
+        merged.append(item)
+    return merged
+
+
+def _vote(values: List[Any]) -> Any:
+    """스칼라 필드: null이 아닌 값 중 다수결, 동률이면 문서 앞쪽 값"""
+    candidates = [value for value in values if not is_empty(value)]
+    if not candidates:
+        return values[0] if values else None
+    counts = Counter(json.dumps(value, ensure_ascii=False, sort_keys=True) for value in candidates)
+    best = max(counts.values())
+    for value in candidates:
+        if counts[json.dumps(value, ensure_ascii=False, sort_keys=True)] == best:
+            return value
+
+
+def _merge_value(values: List[Any], annotation: Any = None) -> Any:
+    annotation = unwrap_optional(annotation)
+    present = [value for value in values if value is not None]
+    if get_origin(annotation) in (list, List) or (annotation is None and present and all(isinstance(v, list) for v in present)):
+        return _merge_list([value for value in present if isinstance(value, list)])
+    if is_model(annotation) or (annotation is None and present and all(isinstance(v, dict) for v in present)):
+        dicts = [value for value in present if isinstance(value, dict)]
+        return merge_results(dicts, annotation if is_model(annotation) else None) if dicts else None
+    return _vote(values)
+
+
+def merge_results(results: List[Dict[str, Any]], response_model: Any = None) -> Dict[str, Any]:
+    """청크별 부분 추출 결과를 스키마에 맞춰 하나로 합친다.
+
+    - 리스트 필드: 이어 붙인 뒤 중복 제거
+    - 중첩 모델 필드: 재귀적으로 병합
+    - 스칼라 필드: null이 아닌 값 중 다수결 (동률이면 먼저 나온 값)
+    스키마(pydantic 모델)가 없으면 값의 타입으로 판단한다.
+    """
+    fields = response_model.model_fields if is_model(response_model) else {}
+    keys: List[str] = list(fields)
+    for result in results:
+        keys.extend(key for key in result if key not in keys)
+    merged: Dict[str, Any] = {}
+    for key in keys:
+        values = [result.get(key) for result in results if key in result]
+        if not values:
+            continue
+        annotation = fields[key].annotation if key in fields else None
+        merged[key] = _merge_value(values, annotation)
+    return merged
+
+
+# ---------------------------------------------------------------------------
+# map (청크별 병렬 실행) + reduce (병합)
+# ---------------------------------------------------------------------------
+
+def _reduce(framework_instance: Any, outputs: List[tuple], started_at: float) -> tuple[list[Any], float, list[float]]:
+    partials = [predictions[0] for predictions, _, _ in outputs if predictions and isinstance(predictions[0], dict)]
+    elapsed = time.perf_counter() - started_at
+    stats = current_stats()
+    if stats is not None:
+        stats.chunks = len(outputs)
+    logger.info(f"청크 {len(outputs)}개 중 {len(partials)}개 성공, 병합 중 (총 {elapsed:.2f}초)")
+    if not partials:
+        errors = [predictions[0] for predictions, _, _ in outputs if predictions]
+        return errors[:1] or ["ERROR:모든 청크 추출 실패"], 0.0, []
+    merged = merge_results(partials, framework_instance.response_model)
+    return [merged], len(partials) / len(outputs), [elapsed]
+
+
+def run_chunked(framework_instance: Any, chunks: List[str], config: ChunkingConfig, **execute_kwargs) -> tuple[list[Any], float, list[float]]:
+    """청크마다 `execute`를 스레드로 병렬 실행하고 결과를 병합한다."""
+    started_at = time.perf_counter()
+    logger.info(f"{len(chunks)}개 청크로 분할 추출 (동시 {config.max_concurrency}개)")
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, config.max_concurrency)) as executor:
+        futures = [
+            executor.submit(
+                contextvars.copy_context().run,
+                framework_instance.execute,
+                inputs={"content": chunk},
+                **execute_kwargs,
+            )
+            for chunk in chunks
+        ]
+        outputs = [future.result() for future in futures]
+    return _reduce(framework_instance, outputs, started_at)
+
+
+async def arun_chunked(framework_instance: Any, chunks: List[str], config: ChunkingConfig, **execute_kwargs) -> tuple[list[Any], float, list[float]]:
+    """`run_chunked`의 비동기 버전."""
+    started_at = time.perf_counter()
+    logger.info(f"{len(chunks)}개 청크로 분할 추출 (동시 {config.max_concurrency}개)")
+    limit = asyncio.Semaphore(max(1, config.max_concurrency))
+
+    async def _run(chunk: str):
+        async with limit:
+            return await framework_instance.aexecute(inputs={"content": chunk}, **execute_kwargs)
+
+    outputs = await asyncio.gather(*(_run(chunk) for chunk in chunks))
+    return _reduce(framework_instance, list(outputs), started_at)
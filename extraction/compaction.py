@@ -0,0 +1,289 @@
+"""추출 전 입력 압축.
+
+파서 출력(Docling/VLM 마크다운)에는 base64 이미지 data URL, 페이지마다 반복되는 머리말/꼬리말,
+셀 패딩이 큰 표, 연속 공백이 섞여 있어 추출에 쓸모없는 입력 토큰과 prefill 시간을 늘린다.
+추출 직전에 이를 걷어 내고, 원하면 스키마 필드와 관련 없는 섹션까지 뺀 뒤 줄어든 토큰 수를 보고한다.
+
+이미지 제거/공백 정리/표 압축은 내용을 바꾸지 않는다. 머리말/꼬리말은 첫 번째만 남기고,
+섹션 제거(`drop_irrelevant`)는 손실이 있을 수 있어 기본으로 꺼져 있다.
+"""
+from __future__ import annotations
+
+import re
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from structured_output_kit.utils.rate_limiter import estimate_tokens
+from structured_output_kit.extraction.chunking import PAGE_BREAK_PATTERN, split_pages
+
+
+@dataclass
+class CompactionConfig:
+    """입력 압축 설정"""
+    strip_images: bool = True         # base64 data URL 이미지/이미지 자리표시자 제거 (alt 텍스트는 남김)
+    dedupe_headers: bool = True       # 페이지마다 반복되는 머리말/꼬리말/쪽번호 제거
+    compact_tables: bool = True       # 마크다운 표 셀 패딩·구분선, HTML 표 속성 정리
+    collapse_whitespace: bool = True  # 줄 끝 공백, 줄 안 연속 공백, 3줄 이상 빈 줄 정리 (들여쓰기는 유지)
+    drop_irrelevant: bool = False     # 스키마 필드와 관련 없는 제목 섹션 제거 (손실 가능)
+    min_repeats: int = 3              # 머리말/꼬리말로 볼 최소 반복 횟수
+    edge_lines: int = 3               # 페이지 경계가 있을 때 머리말/꼬리말을 찾을 페이지 앞뒤 줄 수
+    min_gap: int = 10                 # 페이지 경계가 없을 때 반복 줄 사이 최소 간격(줄)
+
+
+@dataclass
+class CompactionReport:
+    """압축 결과 요약"""
+    original_chars: int = 0
+    compacted_chars: int = 0
+    original_tokens: int = 0
+    compacted_tokens: int = 0
+    elapsed: float = 0.0                                     # 압축에 쓴 시간(초)
+    removed: Dict[str, int] = field(default_factory=dict)    # 단계별 제거 건수 (images, header_lines, table_rows, sections)
+
+    @property
+    def saved_tokens(self) -> int:
+        return self.original_tokens - self.compacted_tokens
+
+    @property
+    def reduction(self) -> float:
+        """입력 토큰 감소율 (0~1)"""
+        return self.saved_tokens / self.original_tokens if self.original_tokens else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(asdict(self), saved_tokens=self.saved_tokens, reduction=self.reduction)
+
+
+# ------------------------------------------------------------------ 이미지
+_MD_IMAGE = re.compile(r"!\[([^\]]*)\]\(\s*data:[^)]*\)")
+_HTML_IMAGE = re.compile(r"<img\b[^>]*?\bsrc\s*=\s*[\"']data:[^\"']*[\"'][^>]*>", re.IGNORECASE)
+_DATA_URL = re.compile(r"data:[\w.+-]+/[\w.+-]+;base64,[A-Za-z0-9+/=\s]{64,}")
+_IMAGE_PLACEHOLDER = re.compile(r"<!--\s*image\s*-->", re.IGNORECASE)
+_HTML_ALT = re.compile(r"\balt\s*=\s*[\"']([^\"']*)[\"']", re.IGNORECASE)
+
+
+def strip_images(text: str) -> Tuple[str, int]:
+    """base64 이미지를 지우고 alt 텍스트만 남긴다. (결과, 제거한 이미지 수)"""
+    count = 0
+
+    def _alt(match: re.Match, alt: Optional[str]) -> str:
+        nonlocal count
+        count += 1
+        return alt.strip() if alt else ""
+
+    text = _MD_IMAGE.sub(lambda m: _alt(m, m.group(1)), text)
+    text = _HTML_IMAGE.sub(lambda m: _alt(m, (_HTML_ALT.search(m.group(0)) or [None, None])[1]), text)
+    text = _DATA_URL.sub(lambda m: _alt(m, None), text)
+    text = _IMAGE_PLACEHOLDER.sub(lambda m: _alt(m, None), text)
+    return text, count
+
+
+# ------------------------------------------------------------------ 머리말/꼬리말
+# 쪽번호 정도의 짧은 숫자만 정규화 (연도 등 긴 숫자는 그대로 두어 반복으로 오인하지 않게)
+_DIGITS = re.compile(r"(?<!\d)\d{1,3}(?!\d)")
+_PAGE_NUMBER = re.compile(r"^[\W_]*(?:page|p\.|쪽|페이지)?\s*#\s*(?:(?:/|of|중)\s*#)?\s*(?:쪽|페이지)?[\W_]*$", re.IGNORECASE)
+
+
+def _normalize_line(line: str) -> str:
+    """비교 키: 쪽번호 줄은 숫자를 `#`로 바꿔 서로 같게, 그 밖의 줄은 공백만 정리 (`경력 1`/`경력 2`는 다른 줄)"""
+    line = " ".join(line.split()).lower()
+    numbered = _DIGITS.sub("#", line)
+    return numbered if _PAGE_NUMBER.match(numbered) else line
+
+
+def _is_candidate(line: str) -> bool:
+    stripped = line.strip()
+    if not stripped or len(stripped) > 100 or PAGE_BREAK_PATTERN.fullmatch(stripped):
+        return False
+    if _PAGE_NUMBER.match(_DIGITS.sub("#", stripped)):
+        return True
+    # 표 행이나 목록 항목은 반복돼도 내용일 수 있다
+    return not (stripped.startswith(("|", "<t", "- ", "* ", "+ ")) or re.match(r"^\d+[.)]\s", stripped))
+
+
+def _edge_keys(pages: List[str], edge_lines: int) -> Counter:
+    """페이지마다 앞뒤 `edge_lines`줄에 나온 (정규화한) 줄이 몇 페이지에 나왔는지"""
+    counts: Counter = Counter()
+    for page in pages:
+        lines = [line for line in page.splitlines() if line.strip()]
+        edges = lines[:edge_lines] + lines[-edge_lines:]
+        counts.update({_normalize_line(line) for line in edges if _is_candidate(line)})
+    return counts
+
+
+def repeated_lines(text: str, config: CompactionConfig) -> Set[str]:
+    """머리말/꼬리말로 보이는 줄의 정규화 키.
+
+    페이지 경계가 있으면 여러 페이지의 앞뒤 줄에 반복해서 나오는 줄, 없으면 `min_repeats`번 이상
+    나오면서 `min_gap`줄 이상 일정한 간격으로 떨어져 있는 짧은 줄 (가까이 또는 불규칙하게 반복되는
+    목록 값·항목 이름은 내용으로 본다).
+    """
+    pages = split_pages(text)
+    if len(pages) > 1:
+        threshold = max(2, min(config.min_repeats, len(pages) // 2 + 1))
+        return {key for key, count in _edge_keys(pages, config.edge_lines).items() if count >= threshold}
+
+    positions: Dict[str, List[int]] = defaultdict(list)
+    for index, line in enumerate(text.split("\n")):
+        if _is_candidate(line):
+            positions[_normalize_line(line)].append(index)
+    keys = set()
+    for key, found in positions.items():
+        if len(found) < config.min_repeats:
+            continue
+        gaps = [b - a for a, b in zip(found, found[1:])]
+        if min(gaps) >= config.min_gap and max(gaps) <= 2 * min(gaps):
+            keys.add(key)
+    return keys
+
+
+def dedupe_headers(text: str, config: CompactionConfig) -> Tuple[str, int]:
+    """반복 머리말/꼬리말은 첫 번째만 남기고, 쪽번호 줄은 모두 지운다. (결과, 지운 줄 수)"""
+    keys = repeated_lines(text, config)
+    if not keys:
+        return text, 0
+    seen: Set[str] = set()
+    kept, removed = [], 0
+    for line in text.split("\n"):
+        key = _normalize_line(line) if _is_candidate(line) else None
+        if key in keys and (key in seen or _PAGE_NUMBER.match(key)):
+            removed += 1
+            continue
+        if key is not None:
+            seen.add(key)
+        kept.append(line)
+    return "\n".join(kept), removed
+
+
+# ------------------------------------------------------------------ 표
+_TABLE_SEPARATOR = re.compile(r"^\s*\|?\s*:?-{2,}:?\s*(\|\s*:?-{2,}:?\s*)*\|?\s*$")
+_HTML_TAG_ATTRS = re.compile(r"<(t[dhr]|table|thead|tbody)\b([^>]*)>", re.IGNORECASE)
+_KEEP_ATTRS = re.compile(r"\b(colspan|rowspan)\s*=\s*[\"']?\d+[\"']?", re.IGNORECASE)
+_BETWEEN_TAGS = re.compile(r">\s+<")
+
+
+def compact_tables(text: str) -> Tuple[str, int]:
+    """마크다운 표 셀 패딩을 없애고 구분선을 최소화, HTML 표는 colspan/rowspan 외 속성과 태그 사이 공백 제거.
+    (결과, 압축한 표 행 수)"""
+    rows = 0
+    lines = []
+    for line in text.split("\n"):
+        stripped = line.strip()
+        if stripped.startswith("|") and stripped.endswith("|") and len(stripped) > 1:
+            rows += 1
+            if _TABLE_SEPARATOR.match(stripped):
+                line = "|" + "|".join("-" for _ in stripped.strip("|").split("|")) + "|"
+            else:
+                line = "|" + "|".join(" ".join(cell.split()) for cell in stripped[1:-1].split("|")) + "|"
+        lines.append(line)
+    text = "\n".join(lines)
+
+    def _attrs(match: re.Match) -> str:
+        kept = " ".join(attr.group(0) for attr in _KEEP_ATTRS.finditer(match.group(2)))
+        return f"<{match.group(1)}{' ' + kept if kept else ''}>"
+
+    if "<t" in text.lower():
+        text = _HTML_TAG_ATTRS.sub(_attrs, text)
+        text = _BETWEEN_TAGS.sub("><", text)
+    return text, rows
+
+
+# ------------------------------------------------------------------ 공백
+def collapse_whitespace(text: str) -> str:
+    """줄 안쪽의 연속 공백과 줄 끝 공백만 줄인다. 줄 앞 들여쓰기는 목록/코드 블록 구조라 그대로 둔다."""
+    text = text.replace("\u00a0", " ")
+    text = re.sub(r"(?<=\S)[ \t]+", " ", text)
+    text = re.sub(r"[ \t]+$", "", text, flags=re.MULTILINE)
+    # 긴 점선/밑줄 (목차 리더, 서식용 구분선)
+    text = re.sub(r"([.·_=\-~])\1{5,}", r"\1\1\1", text)
+    text = re.sub(r"\n{3,}", "\n\n", text)
+    return text.strip("\n")
+
+
+# ------------------------------------------------------------------ 섹션
+_HEADING = re.compile(r"^#{1,6}\s+\S")
+_WORD = re.compile(r"[A-Za-z]+|[^\W\d_A-Za-z]+")
+
+
+def _schema_nodes(schema: Dict[str, Any]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    for definitions in (schema.get("$defs"), schema.get("definitions")):
+        for name, node in (definitions or {}).items():
+            yield name, node
+    stack: List[Tuple[str, Dict[str, Any]]] = [("", schema)]
+    while stack:
+        name, node = stack.pop()
+        if not isinstance(node, dict):
+            continue
+        yield name, node
+        for key, child in (node.get("properties") or {}).items():
+            stack.append((key, child))
+        for key in ("items", "anyOf", "oneOf", "allOf"):
+            children = node.get(key)
+            for child in children if isinstance(children, list) else [children]:
+                stack.append(("", child))
+
+
+def schema_vocabulary(schema: Dict[str, Any]) -> Set[str]:
+    """스키마의 필드 이름(snake/camel case 분리)·title·description에 나오는 단어 (소문자)"""
+    words: Set[str] = set()
+    for name, node in _schema_nodes(schema):
+        texts = [re.sub(r"([a-z])([A-Z])", r"\1 \2", name).replace("_", " ")]
+        texts += [str(node.get(key)) for key in ("title", "description") if node.get(key)]
+        for text in texts:
+            for word in _WORD.findall(text):
+                # 영어는 3자 이상, 한글 등은 2자 이상만 (관사·조사 수준의 짧은 단어 제외)
+                if len(word) >= (3 if word.isascii() else 2):
+                    words.add(word.lower())
+    return words
+
+
+def drop_irrelevant_sections(text: str, vocabulary: Set[str]) -> Tuple[str, int]:
+    """마크다운 제목으로 나눈 섹션 중 제목·본문 어디에도 스키마 단어가 없는 섹션을 뺀다.
+    첫 제목 앞부분은 항상 남긴다. (결과, 뺀 섹션 수)"""
+    if not vocabulary:
+        return text, 0
+    sections: List[List[str]] = [[]]
+    for line in text.split("\n"):
+        if _HEADING.match(line):
+            sections.append([])
+        sections[-1].append(line)
+
+    kept, dropped = sections[:1], 0
+    for section in sections[1:]:
+        body = "\n".join(section).lower()
+        if any(word in body for word in vocabulary):
+            kept.append(section)
+        else:
+            dropped += 1
+    return "\n".join(line for section in kept for line in section), dropped
+
+
+# ------------------------------------------------------------------ 전체
+def compact_text(
+    text: str,
+    config: Optional[CompactionConfig] = None,
+    schema: Optional[Dict[str, Any]] = None,
+) -> Tuple[str, CompactionReport]:
+    """설정된 단계를 차례로 적용한 텍스트와 압축 보고서를 반환한다."""
+    config = config or CompactionConfig()
+    started_at = time.perf_counter()
+    report = CompactionReport(original_chars=len(text), original_tokens=estimate_tokens(text))
+
+    if config.strip_images:
+        text, report.removed["images"] = strip_images(text)
+    if config.collapse_whitespace:
+        text = collapse_whitespace(text)
+    if config.dedupe_headers:
+        text, report.removed["header_lines"] = dedupe_headers(text, config)
+    if config.compact_tables:
+        text, report.removed["table_rows"] = compact_tables(text)
+    if config.drop_irrelevant and schema:
+        text, report.removed["sections"] = drop_irrelevant_sections(text, schema_vocabulary(schema))
+    if config.collapse_whitespace:
+        text = collapse_whitespace(text)
+
+    report.compacted_chars = len(text)
+    report.compacted_tokens = estimate_tokens(text)
+    report.elapsed = time.perf_counter() - started_at
+    return text, report
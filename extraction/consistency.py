@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import json
+import time
+import asyncio
+import functools
+import contextvars
+import concurrent.futures
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple, get_args, get_origin
+
+from loguru import logger
+
+from structured_output_kit.extraction.stats import current_stats
+from structured_output_kit.extraction.schema_utils import compact, is_empty, is_model, unwrap_optional
+
+
+STRING_STRATEGIES = ("vote", "centroid")
+
+
+@dataclass
+class ConsistencyConfig:
+    """self-consistency 설정: 같은 문서를 `samples`번 추출해 필드별로 투표한다."""
+    samples: int = 5
+    max_concurrency: int = 5
+    strings: str = "vote"         # 문자열 필드: vote(정확히 같은 값 다수결) 또는 centroid(임베딩 중심에 가장 가까운 값)
+    native_n: bool = True         # provider가 `n=`을 지원하면 한 요청으로 샘플링
+    embed: Optional[Callable[[List[str]], Any]] = None  # centroid용 임베딩 함수 (텍스트 목록 -> 벡터 목록)
+
+
+@functools.lru_cache(maxsize=4)
+def load_embed_fn(provider: str = "huggingface", model: Optional[str] = None, base_url: Optional[str] = None) -> Callable[[List[str]], Any]:
+    """평가용 임베딩 백엔드를 centroid 투표에 재사용 (호스트별로 한 번만 로드)"""
+    from structured_output_kit.evaluation.metrics import load_embedder
+    embedder = load_embedder(provider, model=model, base_url=base_url)
+    if embedder is None:
+        raise ValueError(f"지원하지 않는 임베딩 provider: {provider}")
+    return embedder.embed
+
+
+# ---------------------------------------------------------------------------
+# 필드별 투표
+# ---------------------------------------------------------------------------
+
+def _key(value: Any) -> str:
+    return json.dumps(compact(value), ensure_ascii=False, sort_keys=True, default=str)
+
+
+def _cosine(a: Any, b: Any) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = (sum(x * x for x in a) ** 0.5) * (sum(y * y for y in b) ** 0.5)
+    return dot / norm if norm else 0.0
+
+
+def _collect_strings(value: Any, out: set) -> None:
+    if isinstance(value, str) and value.strip():
+        out.add(value)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _collect_strings(item, out)
+    elif isinstance(value, list):
+        for item in value:
+            _collect_strings(item, out)
+
+
+class _Voter:
+    def __init__(self, n: int, strings: str, vectors: Optional[Dict[str, Any]]):
+        self.n = n
+        self.strings = strings
+        self.vectors = vectors or {}
+        self.agreement: Dict[str, float] = {}
+
+    def scalar(self, values: List[Any], path: str) -> Any:
+        values = values + [None] * (self.n - len(values))
+        present = [value for value in values if isinstance(value, str) and value in self.vectors]
+        # 과반이 문자열 값을 냈을 때만 임베딩 중심으로 고르고, 아니면 다수결 (빈 값 포함)
+        if self.strings == "centroid" and len(present) * 2 > self.n:
+            return self.centroid(present, path)
+        return self.majority(values, path)
+
+    def majority(self, values: List[Any], path: str) -> Any:
+        """다수결. 빠진 샘플은 None에 투표한 것으로 보고, 동률이면 먼저 나온 값."""
+        keys = [_key(value) for value in values]
+        counts = Counter(keys)
+        best = max(counts.values())
+        self.agreement[path] = best / self.n
+        return next(value for value, key in zip(values, keys) if counts[key] == best)
+
+    def centroid(self, present: List[str], path: str) -> str:
+        """문자열: 샘플 임베딩의 중심에 가장 가까운 후보. 합의도는 샘플과 선택값의 평균 유사도."""
+        dims = len(self.vectors[present[0]])
+        center = [sum(self.vectors[value][i] for value in present) / len(present) for i in range(dims)]
+        chosen = max(dict.fromkeys(present), key=lambda value: _cosine(self.vectors[value], center))
+        similarity = [max(_cosine(self.vectors[value], self.vectors[chosen]), 0.0) for value in present]
+        self.agreement[path] = sum(similarity) / self.n
+        return chosen
+
+    def merge(self, values: List[Any], path: str, annotation: Any = None) -> Any:
+        annotation = unwrap_optional(annotation)
+        present = [value for value in values if value is not None]
+        is_list = get_origin(annotation) in (list, List) or (annotation is None and present and all(isinstance(v, list) for v in present))
+        if is_list:
+            item_annotation = get_args(annotation)[0] if get_args(annotation) else None
+            lists = [value if isinstance(value, list) else [] for value in values]
+            if is_model(unwrap_optional(item_annotation)) or any(isinstance(item, dict) for value in lists for item in value):
+                return self.records(lists, path, item_annotation)
+            return self.members(lists, path)
+        if is_model(annotation) or (annotation is None and present and all(isinstance(v, dict) for v in present)):
+            return self.object([value if isinstance(value, dict) else {} for value in values], path, annotation if is_model(annotation) else None)
+        return self.scalar(values, path)
+
+    def object(self, values: List[Dict[str, Any]], path: str, model: Any = None) -> Dict[str, Any]:
+        fields = model.model_fields if is_model(model) else {}
+        keys: List[str] = list(fields)
+        for value in values:
+            keys.extend(key for key in value if key not in keys)
+        merged = {}
+        for key in keys:
+            annotation = fields[key].annotation if key in fields else None
+            merged[key] = self.merge([value.get(key) for value in values], f"{path}.{key}" if path else key, annotation)
+        return merged
+
+    def records(self, lists: List[List[Any]], path: str, item_annotation: Any) -> List[Any]:
+        """객체 리스트: 길이를 다수결로 정하고, 같은 위치의 항목끼리 재귀적으로 투표"""
+        lists = lists + [[]] * (self.n - len(lists))
+        lengths = Counter(len(value) for value in lists)
+        length = max(lengths, key=lambda size: (lengths[size], -size))
+        self.agreement[f"{path}[]"] = lengths[length] / self.n
+        merged = []
+        for i in range(length):
+            items = [value[i] for value in lists if len(value) > i]
+            merged.append(self.merge(items, f"{path}[{i}]", item_annotation))
+        return merged
+
+    def members(self, lists: List[List[Any]], path: str) -> List[Any]:
+        """스칼라 리스트: 과반 샘플에 나온 항목만 남긴다. 합의도는 샘플과 결과의 평균 Jaccard 유사도."""
+        support: Counter = Counter()
+        first: Dict[str, Any] = {}
+        for value in lists:
+            for key in dict.fromkeys(_key(item) for item in value if not is_empty(item)):
+                support[key] += 1
+        for value in lists:
+            for item in value:
+                first.setdefault(_key(item), item)
+        kept = [key for key in first if support[key] * 2 > self.n]
+        kept_set = set(kept)
+        jaccard = []
+        for value in lists:
+            keys = {_key(item) for item in value if not is_empty(item)}
+            union = keys | kept_set
+            jaccard.append(len(keys & kept_set) / len(union) if union else 1.0)
+        jaccard.extend([0.0 if kept_set else 1.0] * (self.n - len(lists)))
+        self.agreement[path] = sum(jaccard) / self.n
+        return [first[key] for key in kept]
+
+
+def vote_results(
+    samples: List[Dict[str, Any]],
+    response_model: Any = None,
+    strings: str = "vote",
+    embed: Optional[Callable[[List[str]], Any]] = None,
+) -> Tuple[Dict[str, Any], Dict[str, float]]:
+    """샘플들을 필드별로 합친 결과와 필드 경로별 합의도(0~1)를 반환한다.
+
+    - 스칼라: 다수결 (빠진 값은 None 표로 계산)
+    - 문자열(`strings="centroid"`): 임베딩 중심에 가장 가까운 샘플 값
+    - 객체 리스트: 길이 다수결 후 위치별 재귀 투표 (`path[]`에 길이 합의도)
+    - 스칼라 리스트: 과반 샘플에 나온 항목
+    """
+    vectors = None
+    if strings == "centroid" and embed is not None:
+        texts: set = set()
+        for sample in samples:
+            _collect_strings(sample, texts)
+        texts_list = sorted(texts)
+        if texts_list:
+            # 모든 필드의 문자열을 한 번에 임베딩
+            vectors = {text: [float(x) for x in vector] for text, vector in zip(texts_list, embed(texts_list))}
+    voter = _Voter(len(samples), strings, vectors)
+    merged = voter.object(samples, "", response_model if is_model(response_model) else None)
+    return merged, voter.agreement
+
+
+# ---------------------------------------------------------------------------
+# 샘플링 (provider `n=` 또는 병렬 요청) + 투표
+# ---------------------------------------------------------------------------
+
+def _valid(predictions: list) -> bool:
+    return bool(predictions) and isinstance(predictions[0], dict)
+
+
+def _native_samples(result: tuple) -> List[Dict[str, Any]]:
+    predictions = result[0]
+    if not _valid(predictions):
+        return []
+    return [sample for sample in predictions[0].get("samples", []) if isinstance(sample, dict)]
+
+
+def _reduce(framework_instance: Any, samples: List[Dict[str, Any]], errors: List[Any], config: ConsistencyConfig, started_at: float) -> tuple[list[Any], float, list[float]]:
+    elapsed = time.perf_counter() - started_at
+    if not samples:
+        return errors[:1] or ["ERROR:모든 샘플 추출 실패"], 0.0, []
+    merged, agreement = vote_results(samples, framework_instance.response_model, config.strings, config.embed)
+    consistency = sum(agreement.values()) / len(agreement) if agreement else 1.0
+    stats = current_stats()
+    if stats is not None:
+        stats.samples = max(stats.samples, len(samples))
+        stats.agreement.update(agreement)
+    logger.info(f"샘플 {config.samples}개 중 {len(samples)}개 성공, 필드 평균 합의도 {consistency:.2f} (총 {elapsed:.2f}초)")
+    return [merged], len(samples) / config.samples, [elapsed]
+
+
+def run_self_consistency(framework_instance: Any, content: str, config: ConsistencyConfig, retries: int = 1, **execute_kwargs) -> tuple[list[Any], float, list[float]]:
+    """같은 입력으로 `config.samples`개를 추출해 필드별로 투표한다.
+    provider가 `n=`을 지원하면 한 요청으로 받고, 모자란 만큼은 병렬 요청으로 채운다."""
+    started_at = time.perf_counter()
+    inputs = {"content": content}
+    samples: List[Dict[str, Any]] = []
+    errors: List[Any] = []
+    if config.native_n and getattr(framework_instance, "supports_n", False):
+        result = framework_instance.run_n(retries=retries, inputs=inputs, n=config.samples)
+        samples.extend(_native_samples(result)[:config.samples])
+        logger.info(f"n={config.samples} 요청으로 샘플 {len(samples)}개 수신")
+    missing = config.samples - len(samples)
+    if missing > 0:
+        logger.info(f"샘플 {missing}개 병렬 요청 (동시 {config.max_concurrency}개)")
+        # 샘플마다 다른 응답이 필요하므로 응답 캐시는 쓰지 않는다
+        execute_kwargs = dict(execute_kwargs, cache_mode="off")
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, config.max_concurrency)) as executor:
+            futures = [
+                executor.submit(contextvars.copy_context().run, framework_instance.execute, retries=retries, inputs=inputs, **execute_kwargs)
+                for _ in range(missing)
+            ]
+            outputs = [future.result() for future in futures]
+        samples.extend(predictions[0] for predictions, _, _ in outputs if _valid(predictions))
+        errors.extend(predictions[0] for predictions, _, _ in outputs if predictions and not _valid(predictions))
+    return _reduce(framework_instance, samples, errors, config, started_at)
+
+
+async def arun_self_consistency(framework_instance: Any, content: str, config: ConsistencyConfig, retries: int = 1, **execute_kwargs) -> tuple[list[Any], float, list[float]]:
+    """`run_self_consistency`의 비동기 버전."""
+    started_at = time.perf_counter()
+    inputs = {"content": content}
+    samples: List[Dict[str, Any]] = []
+    errors: List[Any] = []
+    if config.native_n and getattr(framework_instance, "supports_n", False):
+        result = await framework_instance.arun_n(retries=retries, inputs=inputs, n=config.samples)
+        samples.extend(_native_samples(result)[:config.samples])
+        logger.info(f"n={config.samples} 요청으로 샘플 {len(samples)}개 수신")
+    missing = config.samples - len(samples)
+    if missing > 0:
+        logger.info(f"샘플 {missing}개 병렬 요청 (동시 {config.max_concurrency}개)")
+        execute_kwargs = dict(execute_kwargs, cache_mode="off")
+        limit = asyncio.Semaphore(max(1, config.max_concurrency))
+
+        async def _run():
+            async with limit:
+                return await framework_instance.aexecute(retries=retries, inputs=inputs, **execute_kwargs)
+
+        outputs = await asyncio.gather(*(_run() for _ in range(missing)))
+        samples.extend(predictions[0] for predictions, _, _ in outputs if _valid(predictions))
+        errors.extend(predictions[0] for predictions, _, _ in outputs if predictions and not _valid(predictions))
+    return _reduce(framework_instance, samples, errors, config, started_at)
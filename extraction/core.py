@@ -2,14 +2,183 @@ from __future__ import annotations
 
 import os
 import json
+import time
 import uuid
-from typing import Dict, Any, Optional
+import hashlib
+import asyncio
+import contextlib
+from typing import Dict, Any, Optional, Iterable, Iterator, AsyncIterator, Tuple
 
 from loguru import logger
-from structured_output_kit.extraction.utils import record_extraction, convert_schema
+from structured_output_kit.extraction.utils import record_extraction, extraction_record, save_extraction_records, convert_schema, load_prompt
+from structured_output_kit.extraction.stats import RunStats, collect_stats
+from structured_output_kit.extraction.hedging import HedgePolicy
+from structured_output_kit.extraction.retry import RetryPolicy
+from structured_output_kit.extraction.compaction import CompactionConfig, CompactionReport, compact_text
+from structured_output_kit.extraction.chunking import ChunkingConfig, chunk_text, run_chunked, arun_chunked
+from structured_output_kit.extraction.field_groups import FieldGroupConfig, run_field_groups, arun_field_groups, group_retry_policy
+from structured_output_kit.extraction.consistency import ConsistencyConfig, run_self_consistency, arun_self_consistency, load_embed_fn
+from structured_output_kit.extraction.cascade import CascadeConfig, run_cascade, arun_cascade, report as cascade_report, summarize as summarize_cascade
+from structured_output_kit.extraction.batch_api import BatchApiConfig, BatchOutput, batch_backend, wait_for_batches
+from structured_output_kit.extraction.schema_registry import schema_registry
+from structured_output_kit.extraction.prompting import build_template
 from structured_output_kit.utils.types import HostInfo, ExtractionRequest, ExtractionResult
 from structured_output_kit.utils.logging import setup_logger, box_line, log_response, final_report
 from structured_output_kit.utils.tracing import Tracer
+from structured_output_kit.utils.accounting import usage_ledger
+
+
+def _build_init_kwargs(
+	host_info: HostInfo,
+	prompt: str,
+	schema_name: str,
+	api_delay_seconds: float,
+	langfuse_trace_id: Optional[str],
+	extra_kwargs: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+	"""프레임워크 생성자 인자 구성"""
+	return {
+		"provider": host_info.provider,
+		"model": host_info.model,
+		"base_url": host_info.base_url,
+		"api_key": host_info.api_key,
+		"prompt": prompt,
+		"response_model": convert_schema(schema_name),
+		"api_delay_seconds": api_delay_seconds,
+		"langfuse_trace_id": langfuse_trace_id,
+		"extra_kwargs": extra_kwargs,
+	}
+
+
+def _create_framework(framework: str, init_kwargs: Dict[str, Any]) -> Any:
+	"""프로세스 공용 풀에서 프레임워크 인스턴스를 가져온다 (없으면 생성)."""
+	from structured_output_kit.extraction.factory import framework_pool
+	framework_instance = framework_pool.get(framework, **init_kwargs)
+	logger.debug(f"{framework} 준비 완료")
+	return framework_instance
+
+
+def _process_predictions(
+	framework: str,
+	predictions: Any,
+	percent_successful: float,
+	latencies: Any,
+) -> tuple[Dict[str, Any], bool, Any]:
+	"""프레임워크 실행 결과를 (result, success, latencies) 형태로 정리"""
+	if predictions and len(predictions) > 0 and isinstance(predictions[0], dict):
+		result = predictions[0]
+		if hasattr(result, "model_dump"):
+			result = result.model_dump(exclude_none=True)
+		elif hasattr(result, "dict"):
+			result = result.dict(exclude_none=True)
+		logger.debug(f"Framework {framework} 실행 성공: 성공률 {percent_successful:.2%}")
+		return result, True, latencies
+	else:
+		if predictions and isinstance(predictions[0], str) and predictions[0].startswith("ERROR"):
+			logger.error(f"Framework {framework} 실행 실패: {predictions[0]}")
+		else:
+			logger.error("Framework 실행 실패: 성공한 응답 없음")
+		return {"error": f"성공한 응답이 없습니다: {predictions[0] if predictions else 'no predictions'}"}, False, 0
+
+
+def _create_hedge_frameworks(framework: str, init_kwargs: Dict[str, Any], hedge_hosts: Optional[list[HostInfo]]) -> list[Any]:
+	"""헤지 요청을 보낼 보조 호스트용 프레임워크 인스턴스 (보조 호스트가 없으면 빈 리스트 → 같은 호스트로 헤지)"""
+	frameworks = []
+	for host in hedge_hosts or []:
+		hedge_kwargs = dict(
+			init_kwargs,
+			provider=host.provider,
+			model=host.model,
+			base_url=host.base_url,
+			api_key=host.api_key,
+		)
+		frameworks.append(_create_framework(framework, hedge_kwargs))
+	return frameworks
+
+
+def _create_group_targets(
+	framework: str,
+	init_kwargs: Dict[str, Any],
+	field_groups: FieldGroupConfig,
+	hedge: Optional[HedgePolicy],
+	hedge_hosts: Optional[list[HostInfo]],
+) -> list[tuple[list[str], tuple[Any, list[Any]]]]:
+	"""response_model의 최상위 필드를 그룹별 하위 모델로 나누고, 그룹마다 (프레임워크, 헤지 프레임워크)를 준비.
+	그룹 프레임워크는 스키마 검증 실패도 재시도한다."""
+	targets = []
+	retry_policy = group_retry_policy(RetryPolicy.from_env(init_kwargs["api_delay_seconds"]))
+	for fields, sub_model in schema_registry.field_groups(init_kwargs["response_model"], field_groups.groups):
+		group_kwargs = dict(init_kwargs, response_model=sub_model, retry_policy=retry_policy)
+		instance = _create_framework(framework, group_kwargs)
+		hedges = _create_hedge_frameworks(framework, group_kwargs, hedge_hosts) if hedge else []
+		targets.append((fields, (instance, hedges)))
+	return targets
+
+
+def _execute(
+	framework_instance: Any,
+	content: str,
+	chunking: Optional[ChunkingConfig],
+	groups: Optional[list] = None,
+	field_groups: Optional[FieldGroupConfig] = None,
+	consistency: Optional[ConsistencyConfig] = None,
+	response_model: Optional[Any] = None,
+	**execute_kwargs,
+) -> tuple[list[Any], float, list[float]]:
+	"""필드 그룹이 있으면 그룹별 병렬 추출(조립한 결과는 전체 `response_model`로 검증), 문서가 청크 상한을 넘으면
+	분할 추출, 아니면 한 번에 실행. `consistency`가 주어지면 한 번에 실행하는 자리에서 여러 샘플을 뽑아 필드별로 투표한다."""
+	if groups:
+		def _run_group(target):
+			instance, hedges = target
+			return _execute(instance, content, chunking, consistency=consistency, **dict(execute_kwargs, hedge_frameworks=hedges))
+		return run_field_groups(groups, _run_group, field_groups, response_model)
+	chunks = chunk_text(content, chunking.max_tokens, chunking.overlap_tokens) if chunking else [content]
+	if len(chunks) > 1:
+		_warn_chunked_consistency(consistency)
+		return run_chunked(framework_instance, chunks, chunking, **execute_kwargs)
+	if consistency:
+		return run_self_consistency(framework_instance, content, consistency, **execute_kwargs)
+	return framework_instance.execute(inputs={"content": content}, **execute_kwargs)
+
+
+async def _aexecute(
+	framework_instance: Any,
+	content: str,
+	chunking: Optional[ChunkingConfig],
+	groups: Optional[list] = None,
+	field_groups: Optional[FieldGroupConfig] = None,
+	consistency: Optional[ConsistencyConfig] = None,
+	response_model: Optional[Any] = None,
+	**execute_kwargs,
+) -> tuple[list[Any], float, list[float]]:
+	"""`_execute`의 비동기 버전"""
+	if groups:
+		async def _run_group(target):
+			instance, hedges = target
+			return await _aexecute(instance, content, chunking, consistency=consistency, **dict(execute_kwargs, hedge_frameworks=hedges))
+		return await arun_field_groups(groups, _run_group, field_groups, response_model)
+	chunks = chunk_text(content, chunking.max_tokens, chunking.overlap_tokens) if chunking else [content]
+	if len(chunks) > 1:
+		_warn_chunked_consistency(consistency)
+		return await arun_chunked(framework_instance, chunks, chunking, **execute_kwargs)
+	if consistency:
+		return await arun_self_consistency(framework_instance, content, consistency, **execute_kwargs)
+	return await framework_instance.aexecute(inputs={"content": content}, **execute_kwargs)
+
+
+def _warn_chunked_consistency(consistency: Optional[ConsistencyConfig]) -> None:
+	if consistency:
+		logger.warning("청크로 나뉜 문서는 self-consistency 샘플링 없이 청크별로 한 번씩 추출합니다")
+
+
+def _cascade_tiers(framework: str, host_info: HostInfo, cascade: CascadeConfig) -> list[tuple[str, HostInfo]]:
+	"""cascade 단계 목록: 요청 호스트가 첫 단계, 이후 상위 모델"""
+	return [(framework, host_info)] + [(cascade.framework or framework, host) for host in cascade.hosts]
+
+
+def _tier_hedge_hosts(tier_host: HostInfo, host_info: HostInfo, hedge_hosts: Optional[list[HostInfo]]) -> Optional[list[HostInfo]]:
+	"""헤지 보조 호스트는 첫 단계 모델용이므로 상위 모델 단계에서는 같은 호스트로 헤지한다"""
+	return hedge_hosts if tier_host is host_info else None
 
 
 def extract_with_framework(
@@ -22,40 +191,56 @@ def extract_with_framework(
 	api_delay_seconds: float = 0,
 	langfuse_trace_id: Optional[str] = None,
 	extra_kwargs: Optional[Dict[str, Any]] = None,
+	cache_mode: str = "off",
+	hedge: Optional[HedgePolicy] = None,
+	hedge_hosts: Optional[list[HostInfo]] = None,
+	chunking: Optional[ChunkingConfig] = None,
+	field_groups: Optional[FieldGroupConfig] = None,
+	consistency: Optional[ConsistencyConfig] = None,
+	cascade: Optional[CascadeConfig] = None,
 ) -> tuple[Dict[str, Any], bool, Any]:
-	"""선택된 프레임워크를 사용하여 JSON 추출 수행"""
+	"""선택된 프레임워크를 사용하여 JSON 추출 수행.
+	`cascade`가 주어지면 이 호스트로 먼저 추출하고, 검사를 통과하지 못하면 상위 모델로 다시 추출한다."""
+	if cascade:
+		def _run_tier(tier_framework: str, tier_host: HostInfo):
+			return extract_with_framework(
+				tier_framework, tier_host, content, prompt, schema_name, retries, api_delay_seconds,
+				langfuse_trace_id, extra_kwargs, cache_mode, hedge, _tier_hedge_hosts(tier_host, host_info, hedge_hosts),
+				chunking, field_groups, consistency,
+			)
+		return run_cascade(_cascade_tiers(framework, host_info, cascade), _run_tier, convert_schema(schema_name), cascade)
+
 	try:
-		response_model = convert_schema(schema_name)
-
-		init_kwargs = {
-			"provider": host_info.provider,
-			"model": host_info.model,
-			"base_url": host_info.base_url,
-			"api_key": host_info.api_key,
-			"prompt": prompt,
-			"response_model": response_model,
-			"api_delay_seconds": api_delay_seconds,
-			"langfuse_trace_id": langfuse_trace_id,
-			"extra_kwargs": extra_kwargs,
-		}
+		init_kwargs = _build_init_kwargs(
+			host_info, prompt, schema_name, api_delay_seconds, langfuse_trace_id, extra_kwargs
+		)
 
 		# 프레임워크 인스턴스 생성
 		try:
-			from structured_output_kit.extraction.factory import factory
-			framework_instance = factory(framework, **init_kwargs)
-			logger.debug(f"{framework} 초기화 완료")
+			framework_instance, hedge_frameworks, groups = None, [], None
+			if field_groups:
+				groups = _create_group_targets(framework, init_kwargs, field_groups, hedge, hedge_hosts)
+			else:
+				framework_instance = _create_framework(framework, init_kwargs)
+				hedge_frameworks = _create_hedge_frameworks(framework, init_kwargs, hedge_hosts) if hedge else []
 		except Exception as e:
 			logger.error(f"{framework} 초기화 실패: {str(e)}")
 			return {"error": f"프레임워크 초기화 실패: {str(e)}"}, False, 0
 
-		# 입력 데이터 준비
-		inputs = {"content": content}
-
-		# 프레임워크 실행
+		# 프레임워크 실행 (chunking이 주어지면 긴 문서는 청크별 병렬 추출 후 병합)
 		try:
-			predictions, percent_successful, latencies = framework_instance.run(
+			predictions, percent_successful, latencies = _execute(
+				framework_instance,
+				content,
+				chunking,
+				groups=groups,
+				field_groups=field_groups,
+				consistency=consistency,
+				response_model=init_kwargs["response_model"],
 				retries=retries,
-				inputs=inputs,
+				cache_mode=cache_mode,
+				hedge=hedge,
+				hedge_frameworks=hedge_frameworks,
 				langfuse_trace_id=langfuse_trace_id,
 			)
 			logger.debug(
@@ -66,27 +251,88 @@ def extract_with_framework(
 			return {"error": f"프레임워크 실행 실패: {str(e)}"}, False, 0
 
 		# 결과 처리
-		if predictions and len(predictions) > 0 and isinstance(predictions[0], dict):
-			result = predictions[0]
-			if hasattr(result, "model_dump"):
-				result = result.model_dump(exclude_none=True)
-			elif hasattr(result, "dict"):
-				result = result.dict(exclude_none=True)
-			logger.debug(f"Framework {framework} 실행 성공: 성공률 {percent_successful:.2%}")
-			return result, True, latencies
-		else:
-			if predictions and isinstance(predictions[0], str) and predictions[0].startswith("ERROR"):
-				logger.error(f"Framework {framework} 실행 실패: {predictions[0]}")
+		return _process_predictions(framework, predictions, percent_successful, latencies)
+
+	except Exception as e:
+		logger.error(f"Framework {framework} 실행 중 예상치 못한 오류 발생: {str(e)}")
+		return {"error": str(e)}, False, 0
+
+
+async def extract_with_framework_async(
+	framework: str,
+	host_info: HostInfo,
+	content: str,
+	prompt: str,
+	schema_name: str,
+	retries: int = 1,
+	api_delay_seconds: float = 0,
+	langfuse_trace_id: Optional[str] = None,
+	extra_kwargs: Optional[Dict[str, Any]] = None,
+	cache_mode: str = "off",
+	hedge: Optional[HedgePolicy] = None,
+	hedge_hosts: Optional[list[HostInfo]] = None,
+	chunking: Optional[ChunkingConfig] = None,
+	field_groups: Optional[FieldGroupConfig] = None,
+	consistency: Optional[ConsistencyConfig] = None,
+	cascade: Optional[CascadeConfig] = None,
+) -> tuple[Dict[str, Any], bool, Any]:
+	"""`extract_with_framework`의 비동기 버전. 프레임워크의 `arun`을 사용한다."""
+	if cascade:
+		async def _run_tier(tier_framework: str, tier_host: HostInfo):
+			return await extract_with_framework_async(
+				tier_framework, tier_host, content, prompt, schema_name, retries, api_delay_seconds,
+				langfuse_trace_id, extra_kwargs, cache_mode, hedge, _tier_hedge_hosts(tier_host, host_info, hedge_hosts),
+				chunking, field_groups, consistency,
+			)
+		return await arun_cascade(_cascade_tiers(framework, host_info, cascade), _run_tier, convert_schema(schema_name), cascade)
+
+	try:
+		init_kwargs = _build_init_kwargs(
+			host_info, prompt, schema_name, api_delay_seconds, langfuse_trace_id, extra_kwargs
+		)
+
+		try:
+			framework_instance, hedge_frameworks, groups = None, [], None
+			if field_groups:
+				groups = _create_group_targets(framework, init_kwargs, field_groups, hedge, hedge_hosts)
 			else:
-				logger.error("Framework 실행 실패: 성공한 응답 없음")
-			return {"error": f"성공한 응답이 없습니다: {predictions[0] if predictions else 'no predictions'}"}, False, 0
+				framework_instance = _create_framework(framework, init_kwargs)
+				hedge_frameworks = _create_hedge_frameworks(framework, init_kwargs, hedge_hosts) if hedge else []
+		except Exception as e:
+			logger.error(f"{framework} 초기화 실패: {str(e)}")
+			return {"error": f"프레임워크 초기화 실패: {str(e)}"}, False, 0
+
+		try:
+			predictions, percent_successful, latencies = await _aexecute(
+				framework_instance,
+				content,
+				chunking,
+				groups=groups,
+				field_groups=field_groups,
+				consistency=consistency,
+				response_model=init_kwargs["response_model"],
+				retries=retries,
+				cache_mode=cache_mode,
+				hedge=hedge,
+				hedge_frameworks=hedge_frameworks,
+				langfuse_trace_id=langfuse_trace_id,
+			)
+			logger.debug(
+				f"프레임워크 비동기 실행 완료: 성공률 {percent_successful:.2%}, 응답 수 {len(predictions) if predictions else 0}"
+			)
+		except Exception as e:
+			logger.error(f"프레임워크 실행 중 오류: {str(e)}")
+			return {"error": f"프레임워크 실행 실패: {str(e)}"}, False, 0
+
+		return _process_predictions(framework, predictions, percent_successful, latencies)
 
 	except Exception as e:
 		logger.error(f"Framework {framework} 실행 중 예상치 못한 오류 발생: {str(e)}")
 		return {"error": str(e)}, False, 0
 
 
-def run_extraction_core(req: ExtractionRequest) -> ExtractionResult:
+def _prepare_extraction(req: ExtractionRequest) -> Dict[str, Any]:
+	"""로거/트레이스 설정 및 입력 텍스트 로드"""
 	output_dir, log_filename = setup_logger(task="extraction", output_dir=req.output_dir)
 
 	tracer = Tracer(enabled=True)
@@ -112,23 +358,141 @@ def run_extraction_core(req: ExtractionRequest) -> ExtractionResult:
 	for line in exp_info:
 		logger.info(line)
 
-	input_text = req.input_text
-	if os.path.isfile(input_text):
-		with open(input_text, "r", encoding="utf-8") as f:
-			input_text = f.read()
+	input_text, compaction = _compact_input(req, _read_input_text(req.input_text))
+
+	return {
+		"output_dir": output_dir,
+		"log_filename": log_filename,
+		"tracer": tracer,
+		"trace_id": trace_id,
+		"exp_info": exp_info,
+		"input_text": input_text,
+		"compaction": compaction,
+	}
+
+
+def _compact_input(req: ExtractionRequest, input_text: str) -> Tuple[str, Optional[CompactionReport]]:
+	"""`req.compact`이면 추출 전에 입력을 압축한다 (섹션 제거는 스키마 필드 단어 기준)"""
+	if not req.compact:
+		return input_text, None
+	schema = schema_registry.json_schema(convert_schema(req.schema_name)) if req.compact_drop_irrelevant else None
+	input_text, report = compact_text(input_text, CompactionConfig(drop_irrelevant=req.compact_drop_irrelevant), schema)
+	logger.info(
+		f"입력 압축: {report.original_tokens} → {report.compacted_tokens} 토큰 "
+		f"(-{report.reduction:.1%}, {report.elapsed * 1000:.1f}ms, 제거 {report.removed})"
+	)
+	return input_text, report
+
+
+def _compaction_summary(report: Optional[CompactionReport], performance: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+	"""압축 보고에 추정 지연시간 절감을 더한다.
+
+	prefill은 입력 토큰 수에 거의 비례하므로, 압축한 본문의 토큰당 ttft로 줄인 토큰만큼의 prefill 시간을 추정하고
+	압축에 쓴 시간을 뺀다. provider가 ttft를 보고하지 않으면 None.
+	"""
+	if report is None:
+		return None
+	summary = report.to_dict()
+	ttft = performance.get("ttft")
+	if ttft and report.compacted_tokens:
+		summary["est_latency_saved"] = ttft * report.saved_tokens / report.compacted_tokens - report.elapsed
+	else:
+		summary["est_latency_saved"] = None
+	return summary
+
+
+def _prompt_template(req: ExtractionRequest) -> str:
+	"""문서 본문은 맨 뒤 `{content}` 자리표시자로 남겨 프롬프트 앞부분을 문서와 무관하게 유지한다 (prefix 캐시 재사용)."""
+	return build_template(req.prompt or load_prompt())
 
-	result, success, latencies = extract_with_framework(
+
+def _extraction_kwargs(req: ExtractionRequest, ctx: Dict[str, Any]) -> Dict[str, Any]:
+	return dict(
 		framework=req.framework,
-		host_info=host_info,
-		content=input_text,
-		prompt=f"{req.prompt}\n{input_text}",
+		host_info=req.host_info,
+		content=ctx["input_text"],
+		prompt=_prompt_template(req),
 		schema_name=req.schema_name,
 		retries=req.retries,
-		api_delay_seconds=0.5,
-		langfuse_trace_id=trace_id,
-		extra_kwargs=req.extra_kwargs,
+		api_delay_seconds=0,
+		langfuse_trace_id=ctx["trace_id"],
+		extra_kwargs=_extra_kwargs(req),
+		cache_mode=req.cache_mode,
+		hedge=_hedge_policy(req),
+		hedge_hosts=req.hedge_hosts,
+		chunking=_chunking_config(req),
+		field_groups=_field_group_config(req),
+		consistency=_consistency_config(req),
+		cascade=_cascade_config(req),
 	)
 
+
+def _hedge_policy(req: ExtractionRequest) -> Optional[HedgePolicy]:
+	return HedgePolicy.from_env(req.hedge_percentile) if req.hedge else None
+
+
+def _field_group_config(req: ExtractionRequest) -> Optional[FieldGroupConfig]:
+	if not (req.parallel_fields or req.field_groups):
+		return None
+	return FieldGroupConfig(groups=req.field_groups, max_concurrency=req.field_group_concurrency)
+
+
+def _extra_kwargs(req: ExtractionRequest) -> Dict[str, Any]:
+	"""self-consistency 샘플링이면 `consistency_temperature`를 temperature로 쓴다 (extra_kwargs에 직접 준 값이 우선)"""
+	if req.consistency_samples > 1 and req.consistency_temperature is not None:
+		return {"temperature": req.consistency_temperature, **req.extra_kwargs}
+	return req.extra_kwargs
+
+
+def _consistency_config(req: ExtractionRequest) -> Optional[ConsistencyConfig]:
+	if req.consistency_samples <= 1:
+		return None
+	embed = None
+	if req.consistency_strings == "centroid":
+		host = req.consistency_embedder
+		embed = load_embed_fn(host.provider, host.model, host.base_url) if host else load_embed_fn("huggingface")
+	return ConsistencyConfig(
+		samples=req.consistency_samples,
+		max_concurrency=req.consistency_concurrency,
+		strings=req.consistency_strings,
+		embed=embed,
+	)
+
+
+def _cascade_config(req: ExtractionRequest) -> Optional[CascadeConfig]:
+	if not req.cascade_hosts:
+		return None
+	return CascadeConfig(
+		hosts=req.cascade_hosts,
+		framework=req.cascade_framework,
+		min_filled_ratio=req.cascade_min_filled,
+		required_fields=req.cascade_required_fields,
+	)
+
+
+def _chunking_config(req: ExtractionRequest) -> Optional[ChunkingConfig]:
+	if not req.chunking:
+		return None
+	return ChunkingConfig(
+		max_tokens=req.chunk_max_tokens,
+		overlap_tokens=req.chunk_overlap_tokens,
+		max_concurrency=req.chunk_concurrency,
+	)
+
+
+def _finalize_extraction(
+	req: ExtractionRequest,
+	ctx: Dict[str, Any],
+	result: Dict[str, Any],
+	success: bool,
+	latencies: Any,
+	stats: RunStats,
+) -> ExtractionResult:
+	"""결과 저장, 리포트 출력 및 CSV 기록"""
+	host_info = req.host_info
+	output_dir = ctx["output_dir"]
+	input_text = ctx["input_text"]
+
 	result_json_path = os.path.join(output_dir, "result.json")
 	with open(result_json_path, "w", encoding="utf-8") as f:
 		json.dump(result, f, ensure_ascii=False, indent=2)
@@ -137,12 +501,27 @@ def run_extraction_core(req: ExtractionRequest) -> ExtractionResult:
 	logger.info("Framework single experiment completed")
 	logger.info(f"Success rate: {success:.2%}")
 	log_response(logger, result, latency, success)
+	if len(stats.attempts) > 1:
+		logger.info(f"시도 기록: {stats.attempts}")
+	if stats.hedge_fired:
+		logger.info(f"헤지 요청: {stats.hedge_fired}회 발사, {stats.hedge_won}회 승리")
+	performance = stats.performance()
+	compaction = _compaction_summary(ctx.get("compaction"), performance)
+	if stats.samples:
+		consistency = stats.consistency()["consistency"]
+		logger.info(f"self-consistency: 샘플 {stats.samples}개, 평균 합의도 {consistency}")
+	cascade = cascade_report(stats.cascade)
+	if cascade:
+		logger.info(f"cascade: 최종 {cascade['level']}단계 {cascade['model']} (상위 모델 사용: {cascade['escalated']})")
+	logger.info(f"성능: {performance}")
+	if compaction and compaction["est_latency_saved"] is not None:
+		logger.info(f"입력 압축 추정 지연시간 절감: {compaction['est_latency_saved']:.3f}초")
 
-	langfuse_url = tracer.get_url(trace_id)
-	final_report(exp_info, logger, latency, langfuse_url, success)
+	langfuse_url = ctx["tracer"].get_url(ctx["trace_id"])
+	final_report(ctx["exp_info"], logger, latency, langfuse_url, success)
 
 	record_extraction(
-		log_filename=log_filename,
+		log_filename=ctx["log_filename"],
 		provider=host_info.provider,
 		model=host_info.model,
 		prompt=f"{req.prompt}\n{input_text}",
@@ -152,7 +531,9 @@ def run_extraction_core(req: ExtractionRequest) -> ExtractionResult:
 		langfuse_url=langfuse_url,
 		csv_path="result/extraction_result.csv",
 		result_json_path=result_json_path,
-		save=req.save
+		save=req.save,
+		cache_hit=stats.cache_hit,
+		performance=_csv_performance(stats, performance, compaction),
 	)
 
 	return ExtractionResult(
@@ -163,4 +544,433 @@ def run_extraction_core(req: ExtractionRequest) -> ExtractionResult:
 		output_dir=output_dir,
 		result_json_path=result_json_path,
 		langfuse_url=langfuse_url,
+		cache_hit=stats.cache_hit,
+		attempts=stats.attempts,
+		hedge_fired=stats.hedge_fired,
+		hedge_won=stats.hedge_won,
+		chunks=stats.chunks,
+		field_groups=stats.field_groups,
+		failed_groups=stats.failed_groups,
+		ttff=stats.ttff,
+		compaction=compaction,
+		cascade=cascade,
+		**stats.consistency(),
+		**performance,
+	)
+
+
+def _csv_performance(stats: RunStats, performance: Dict[str, Any], compaction: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+	"""CSV 기록용 성능 지표 (self-consistency를 쓴 경우 샘플 수와 평균 합의도, 입력 압축을 쓴 경우 토큰 감소,
+	cascade를 쓴 경우 최종 모델과 상위 모델 사용 여부 포함)"""
+	record = dict(performance)
+	if stats.samples:
+		record.update(samples=stats.samples, consistency=stats.consistency()["consistency"])
+	if stats.cascade:
+		record.update(cascade_model=stats.cascade[-1]["model"], cascade_escalated=len(stats.cascade) > 1)
+	if compaction:
+		record.update(
+			compaction_saved_tokens=compaction["saved_tokens"],
+			compaction_reduction=compaction["reduction"],
+			compaction_latency_saved=compaction["est_latency_saved"],
+		)
+	return record
+
+
+def run_extraction_core(req: ExtractionRequest) -> ExtractionResult:
+	ctx = _prepare_extraction(req)
+	with collect_stats() as stats:
+		result, success, latencies = extract_with_framework(**_extraction_kwargs(req, ctx))
+	return _finalize_extraction(req, ctx, result, success, latencies, stats)
+
+
+async def run_extraction_core_async(req: ExtractionRequest) -> ExtractionResult:
+	"""`run_extraction_core`의 비동기 버전. LLM 호출 동안 이벤트 루프를 막지 않는다."""
+	ctx = _prepare_extraction(req)
+	with collect_stats() as stats:
+		result, success, latencies = await extract_with_framework_async(**_extraction_kwargs(req, ctx))
+	return _finalize_extraction(req, ctx, result, success, latencies, stats)
+
+
+async def run_extraction_stream(req: ExtractionRequest) -> AsyncIterator[Dict[str, Any]]:
+	"""스트리밍 추출. 검증된 부분 결과를 `partial` 이벤트로 내보내고, 마지막에 `final` 이벤트로
+	ExtractionResult를 내보낸다 (실패 시 `error` 이벤트 후 `final`). 최상위 JSON이 닫히기 전에
+	스트림이 끝나면 마지막 부분 결과가 있어도 실패로 처리한다.
+
+	이벤트: {"event": "partial" | "error" | "final", "data": {...}, "elapsed": 초}
+	분할 추출/필드 그룹/헤지/캐시/cascade는 적용하지 않는다.
+	"""
+	ctx = _prepare_extraction(req)
+	stats = RunStats()
+	result, success, latencies = {"error": "스트림에서 유효한 결과를 받지 못했습니다"}, False, 0
+	started_at = time.perf_counter()
+	try:
+		init_kwargs = _build_init_kwargs(
+			req.host_info, _prompt_template(req), req.schema_name, 0, ctx["trace_id"], req.extra_kwargs
+		)
+		framework_instance = _create_framework(req.framework, init_kwargs)
+		if not framework_instance.supports_streaming:
+			raise NotImplementedError(f"{req.framework}는 스트리밍을 지원하지 않습니다")
+
+		last = None
+		# contextvar는 yield를 넘나들 수 없으므로 통계 객체를 직접 넘겨 TTFT/TTFF를 기록한다
+		async for partial in framework_instance.astream(inputs={"content": ctx["input_text"]}, stats=stats):
+			elapsed = time.perf_counter() - started_at
+			data = partial.model_dump(exclude_none=True) if hasattr(partial, "model_dump") else partial
+			last = data
+			yield {"event": "partial", "data": data, "elapsed": elapsed}
+
+		if last is not None and stats.stream_complete:
+			result, success, latencies = last, True, [time.perf_counter() - started_at]
+		elif last is not None:
+			# 필드가 모두 선택적인 스키마는 잘린 결과도 검증을 통과하므로 JSON이 닫혔는지로 판단한다
+			result = {"error": "스트림이 결과 JSON이 끝나기 전에 종료됐습니다 (max_tokens 초과 또는 연결 끊김)", "partial": last}
+			yield {"event": "error", "data": result, "elapsed": time.perf_counter() - started_at}
+	except Exception as e:
+		logger.error(f"{req.framework} 스트리밍 추출 실패: {str(e)}")
+		result = {"error": str(e)}
+		yield {"event": "error", "data": result, "elapsed": time.perf_counter() - started_at}
+
+	final = _finalize_extraction(req, ctx, result, success, latencies, stats)
+	yield {"event": "final", "data": final.model_dump(), "elapsed": time.perf_counter() - started_at}
+
+
+def _read_input_text(input_text: str) -> str:
+	if os.path.isfile(input_text):
+		with open(input_text, "r", encoding="utf-8") as f:
+			return f.read()
+	return input_text
+
+
+async def run_extraction_batch(
+	requests: Iterable[ExtractionRequest],
+	max_concurrency: int = 8,
+	per_provider_limits: Optional[Dict[str, int]] = None,
+	output_dir: Optional[str] = None,
+) -> AsyncIterator[ExtractionResult]:
+	"""여러 ExtractionRequest를 제한된 동시성으로 실행하고 완료 순서대로 결과를 반환한다.
+
+	- (framework, provider, model, schema) 조합마다 프레임워크 인스턴스를 풀에서 재사용
+	- `max_concurrency`로 전체 동시 실행 수를, `per_provider_limits`로 provider별 동시 실행 수를 제한
+	- `requests`는 리스트뿐 아니라 이터레이터도 허용하며, 동시 실행 한도만큼만 미리 소비한다
+	"""
+	batch_dir, log_filename = setup_logger(task="extraction_batch", output_dir=output_dir)
+	tracer = Tracer(enabled=True)
+
+	global_limit = asyncio.Semaphore(max(1, max_concurrency))
+	provider_limits = {
+		provider: asyncio.Semaphore(max(1, limit))
+		for provider, limit in (per_provider_limits or {}).items()
+	}
+
+	# CSV 행은 모아 두었다가 배치 끝에 한 번에 쓴다 (요청마다 파일 전체를 다시 쓰면 O(n²)이고 이벤트 루프를 막는다)
+	records: list[Dict[str, Any]] = []
+	csv_path = "result/extraction_result.csv"
+
+	async def _run_item(index: int, req: ExtractionRequest) -> ExtractionResult:
+		"""요청 하나를 실행한다. 결과 저장/기록 단계의 오류도 실패한 결과로 바꿔 배치 전체가 멈추지 않게 한다."""
+		item_dir = req.output_dir or os.path.join(batch_dir, f"{index:05d}")
+		try:
+			return await _process_item(index, req, item_dir)
+		except Exception as e:
+			logger.error(f"[batch {index}] 결과 처리 실패: {str(e)}")
+			return ExtractionResult(
+				success=False,
+				result={"error": str(e)},
+				success_rate=0,
+				latency=None,
+				output_dir=item_dir,
+				result_json_path="",
+				batch_index=index,
+			)
+
+	async def _process_item(index: int, req: ExtractionRequest, item_dir: str) -> ExtractionResult:
+		host_info = req.host_info
+		os.makedirs(item_dir, exist_ok=True)
+		trace_id = req.langfuse_trace_id or tracer.start_trace(seed=f"batch-{uuid.uuid4()}")
+		input_text = ""
+		compaction = None
+		stats = RunStats()
+		try:
+			input_text, compaction = _compact_input(req, _read_input_text(req.input_text))
+
+			if req.cascade_hosts:
+				# cascade는 단계마다 호스트가 달라 extract_with_framework에 맡긴다 (provider 제한은 첫 단계 기준)
+				async with provider_limits.get(host_info.provider) or contextlib.nullcontext():
+					with collect_stats() as stats:
+						result, success, latencies = await extract_with_framework_async(
+							**_extraction_kwargs(req, {"input_text": input_text, "trace_id": trace_id})
+						)
+			else:
+				init_kwargs = _build_init_kwargs(
+					host_info, _prompt_template(req), req.schema_name, 0, None, _extra_kwargs(req)
+				)
+				hedge = _hedge_policy(req)
+				field_groups = _field_group_config(req)
+				framework_instance, hedge_frameworks, groups = None, [], None
+				if field_groups:
+					groups = _create_group_targets(req.framework, init_kwargs, field_groups, hedge, req.hedge_hosts)
+				else:
+					framework_instance = _create_framework(req.framework, init_kwargs)
+					hedge_frameworks = _create_hedge_frameworks(req.framework, init_kwargs, req.hedge_hosts) if hedge else []
+
+				async with provider_limits.get(host_info.provider) or contextlib.nullcontext():
+					with collect_stats() as stats:
+						predictions, percent_successful, latencies = await _aexecute(
+							framework_instance,
+							input_text,
+							_chunking_config(req),
+							groups=groups,
+							field_groups=field_groups,
+							consistency=_consistency_config(req),
+							response_model=init_kwargs["response_model"],
+							retries=req.retries,
+							cache_mode=req.cache_mode,
+							hedge=hedge,
+							hedge_frameworks=hedge_frameworks,
+							langfuse_trace_id=trace_id,
+						)
+				result, success, latencies = _process_predictions(
+					req.framework, predictions, percent_successful, latencies
+				)
+		except Exception as e:
+			logger.error(f"[batch {index}] {req.framework} 실행 실패: {str(e)}")
+			result, success, latencies = {"error": str(e)}, False, 0
+
+		result_json_path = os.path.join(item_dir, "result.json")
+		with open(result_json_path, "w", encoding="utf-8") as f:
+			json.dump(result, f, ensure_ascii=False, indent=2)
+
+		latency = latencies[0] if isinstance(latencies, list) and latencies else latencies
+		performance = stats.performance()
+		compaction = _compaction_summary(compaction, performance)
+		langfuse_url = tracer.get_url(trace_id)
+		log_response(logger, result, latency, success)
+		if req.save:
+			records.append(extraction_record(
+				log_filename=log_filename,
+				provider=host_info.provider,
+				model=host_info.model,
+				prompt=f"{req.prompt or load_prompt()}\n{input_text}",
+				framework=req.framework,
+				success=success,
+				latency=latency,
+				langfuse_url=langfuse_url,
+				result_json_path=result_json_path,
+				save=req.save,
+				cache_hit=stats.cache_hit,
+				performance=_csv_performance(stats, performance, compaction),
+			))
+		return ExtractionResult(
+			success=success,
+			result=result,
+			success_rate=success,
+			latency=latency,
+			output_dir=item_dir,
+			result_json_path=result_json_path,
+			langfuse_url=langfuse_url,
+			batch_index=index,
+			cache_hit=stats.cache_hit,
+			attempts=stats.attempts,
+			hedge_fired=stats.hedge_fired,
+			hedge_won=stats.hedge_won,
+			chunks=stats.chunks,
+			field_groups=stats.field_groups,
+			failed_groups=stats.failed_groups,
+			compaction=compaction,
+			cascade=cascade_report(stats.cascade),
+			**stats.consistency(),
+			**performance,
+		)
+
+	pending: set = set()
+	submitted = 0
+	cascades = []
+	try:
+		for index, req in enumerate(requests):
+			await global_limit.acquire()
+			task = asyncio.create_task(_run_item(index, req))
+			task.add_done_callback(lambda _: global_limit.release())
+			pending.add(task)
+			submitted += 1
+
+			finished = {t for t in pending if t.done()}
+			pending -= finished
+			for task in finished:
+				cascades.append(task.result().cascade)
+				yield task.result()
+
+		while pending:
+			finished, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+			for task in finished:
+				cascades.append(task.result().cascade)
+				yield task.result()
+
+		rows, records[:] = list(records), []
+		await asyncio.to_thread(save_extraction_records, rows, csv_path)
+	finally:
+		# 소비자가 중간에 멈추면 남은 요청은 취소하고, 이미 끝난 요청의 기록은 남긴다
+		for task in pending:
+			task.cancel()
+		save_extraction_records(records, csv_path)
+
+	from structured_output_kit.extraction.factory import framework_pool
+	logger.info(f"배치 추출 완료: {submitted}건 (프레임워크 풀: {framework_pool.stats()})")
+	cascade = summarize_cascade(cascades)
+	if cascade:
+		logger.info(
+			f"cascade: {cascade['documents']}건 중 {cascade['escalated']}건 상위 모델 사용 "
+			f"({cascade['escalation_rate']:.1%}), blended latency {cascade['blended_latency']:.2f}초"
+		)
+
+
+def _batch_group_key(req: ExtractionRequest) -> str:
+	"""같은 batch로 묶을 수 있는 요청인지 판단하는 키 (프레임워크, 호스트, 스키마, 프롬프트, kwargs)"""
+	host_info = req.host_info
+	material = [req.framework, host_info.provider, host_info.model, host_info.base_url, req.schema_name, _prompt_template(req), req.extra_kwargs]
+	return hashlib.sha256(json.dumps(material, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")).hexdigest()[:16]
+
+
+def _provider_batch_result(
+	index: int,
+	req: ExtractionRequest,
+	input_text: str,
+	output: BatchOutput,
+	latency: float,
+	batch_id: Optional[str],
+	batch_dir: str,
+	log_filename: str,
+	compaction: Optional[CompactionReport] = None,
+) -> ExtractionResult:
+	"""batch 결과 한 건을 result.json / CSV 기록 / ExtractionResult로 변환"""
+	item_dir = req.output_dir or os.path.join(batch_dir, f"{index:05d}")
+	os.makedirs(item_dir, exist_ok=True)
+	if output.result is not None:
+		result, success = output.result, True
+	else:
+		logger.error(f"[batch {index}] {req.framework} 실패: {output.error}")
+		result, success = {"error": f"성공한 응답이 없습니다: {output.error}"}, False
+
+	result_json_path = os.path.join(item_dir, "result.json")
+	with open(result_json_path, "w", encoding="utf-8") as f:
+		json.dump(result, f, ensure_ascii=False, indent=2)
+
+	performance = RunStats().performance()
+	if output.usage is not None:
+		performance.update(
+			prompt_tokens=output.usage.prompt_tokens,
+			completion_tokens=output.usage.completion_tokens,
+			cached_tokens=output.usage.cached_tokens,
+			cost=usage_ledger.record(
+				"extraction", req.host_info.provider, req.host_info.model,
+				output.usage.prompt_tokens, output.usage.completion_tokens, output.usage.cached_tokens, batch=True,
+			),
+		)
+	compaction = _compaction_summary(compaction, performance)
+	record_extraction(
+		log_filename=log_filename,
+		provider=req.host_info.provider,
+		model=req.host_info.model,
+		prompt=f"{req.prompt or load_prompt()}\n{input_text}",
+		framework=req.framework,
+		success=success,
+		latency=latency,
+		langfuse_url=None,
+		csv_path="result/extraction_result.csv",
+		result_json_path=result_json_path,
+		save=req.save,
+		performance=_csv_performance(RunStats(), performance, compaction),
+	)
+	return ExtractionResult(
+		success=success,
+		result=result,
+		success_rate=float(success),
+		latency=latency,
+		output_dir=item_dir,
+		result_json_path=result_json_path,
+		batch_index=index,
+		provider_batch_id=batch_id,
+		compaction=compaction,
+		**performance,
 	)
+
+
+def run_extraction_provider_batch(
+	requests: Iterable[ExtractionRequest],
+	config: Optional[BatchApiConfig] = None,
+	output_dir: Optional[str] = None,
+) -> Iterator[ExtractionResult]:
+	"""여러 ExtractionRequest를 provider batch API(OpenAI/Anthropic)로 제출하고, batch가 끝나는 순서대로 결과를 반환한다.
+
+	- (프레임워크, 호스트, 스키마, 프롬프트, kwargs)가 같은 요청끼리 batch 하나로 묶고 `max_requests`개씩 나눠 제출
+	- 제출한 batch ID는 출력 디렉토리의 batch_jobs.json에 기록한다. 같은 출력 디렉토리로 다시 실행하면
+	  다시 제출하지 않고 기존 batch를 이어서 기다린다
+	- latency는 제출부터 결과 수신까지 걸린 시간. 분할 추출/필드 그룹/self-consistency/헤지/캐시/cascade는 적용하지 않는다
+	"""
+	config = config or BatchApiConfig()
+	batch_dir, log_filename = setup_logger(task="extraction_provider_batch", output_dir=output_dir)
+	manifest_path = os.path.join(batch_dir, "batch_jobs.json")
+	submitted_jobs: Dict[str, Dict[str, Any]] = {}
+	if os.path.isfile(manifest_path):
+		with open(manifest_path, "r", encoding="utf-8") as f:
+			submitted_jobs = {job["job"]: job for job in json.load(f).get("jobs", [])}
+		logger.info(f"기존 batch 작업 {len(submitted_jobs)}개 발견: {manifest_path}")
+
+	groups: Dict[str, Dict[str, Any]] = {}
+	items: Dict[str, tuple] = {}
+	for index, req in enumerate(requests):
+		if req.chunking or req.parallel_fields or req.consistency_samples > 1 or req.hedge or req.cascade_hosts:
+			logger.warning(f"[batch {index}] provider batch에서는 분할 추출/필드 그룹/self-consistency/헤지/cascade를 적용하지 않습니다")
+		input_text, compaction = "", None
+		try:
+			input_text, compaction = _compact_input(req, _read_input_text(req.input_text))
+			key = _batch_group_key(req)
+			if key not in groups:
+				init_kwargs = _build_init_kwargs(
+					req.host_info, _prompt_template(req), req.schema_name, 0, None, req.extra_kwargs
+				)
+				backend = batch_backend(req.framework, _create_framework(req.framework, init_kwargs))
+				groups[key] = {"backend": backend, "req": req, "items": []}
+			custom_id = f"req-{index:06d}"
+			groups[key]["items"].append(groups[key]["backend"].build(custom_id, {"content": input_text}))
+			items[custom_id] = (index, req, input_text, compaction)
+		except Exception as e:
+			logger.error(f"[batch {index}] {req.framework} 요청 준비 실패: {str(e)}")
+			yield _provider_batch_result(index, req, input_text, BatchOutput("", error=str(e)), 0, None, batch_dir, log_filename)
+
+	jobs: Dict[str, tuple] = {}
+	started_at = time.perf_counter()
+	for key, group in groups.items():
+		backend, req = group["backend"], group["req"]
+		for offset in range(0, len(group["items"]), max(1, config.max_requests)):
+			chunk = group["items"][offset:offset + max(1, config.max_requests)]
+			custom_ids = [item["custom_id"] for item in chunk]
+			job_key = f"{key}:{offset}"
+			previous = submitted_jobs.get(job_key)
+			if previous and previous["custom_ids"] == custom_ids:
+				logger.info(f"batch {previous['batch_id']} 이어서 대기 ({len(chunk)}건)")
+			else:
+				batch_id = backend.submit(chunk, config)
+				logger.info(f"{req.framework}/{req.host_info.model} batch 제출: {batch_id} ({len(chunk)}건)")
+				submitted_jobs[job_key] = {
+					"job": job_key,
+					"batch_id": batch_id,
+					"framework": req.framework,
+					"provider": req.host_info.provider,
+					"model": req.host_info.model,
+					"custom_ids": custom_ids,
+					"submitted_at": time.time(),
+				}
+				with open(manifest_path, "w", encoding="utf-8") as f:
+					json.dump({"jobs": list(submitted_jobs.values())}, f, ensure_ascii=False, indent=2)
+			jobs[job_key] = (backend, submitted_jobs[job_key]["batch_id"])
+
+	for job_key, info in wait_for_batches(jobs, config):
+		backend, batch_id = jobs[job_key]
+		latency = time.perf_counter() - started_at
+		outputs = {output.custom_id: output for output in backend.results(batch_id, info)}
+		for custom_id in submitted_jobs[job_key]["custom_ids"]:
+			index, req, input_text, compaction = items[custom_id]
+			output = outputs.get(custom_id) or BatchOutput(custom_id, error=f"ERROR:batch {info['status']}: 결과 없음")
+			yield _provider_batch_result(index, req, input_text, output, latency, batch_id, batch_dir, log_filename, compaction)
+
+	logger.info(f"provider batch 추출 완료: {len(items)}건, batch {len(jobs)}개 ({time.perf_counter() - started_at:.1f}초)")
@@ -1,34 +1,172 @@
-from typing import Any
+import os
+import json
+import time
+import importlib
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, is_dataclass
+from typing import Any, Dict, Hashable
 
-from structured_output_kit.extraction.frameworks.openai_framework import OpenAIFramework
-from structured_output_kit.extraction.frameworks.instructor_framework import InstructorFramework
-from structured_output_kit.extraction.frameworks.langchain_tool_framework import LangchainToolFramework
-from structured_output_kit.extraction.frameworks.langchain_parser_framework import LangchainParserFramework
-from structured_output_kit.extraction.frameworks.mirascope_framework import MirascopeFramework
-from structured_output_kit.extraction.frameworks.llamaindex_framework import LlamaIndexFramework
-from structured_output_kit.extraction.frameworks.marvin_framework import MarvinFramework
-from structured_output_kit.extraction.frameworks.ollama_framework import OllamaFramework
-from structured_output_kit.extraction.frameworks.google_framework import GoogleFramework
-from structured_output_kit.extraction.frameworks.lm_format_enforcer_framework import LMFormatEnforcerFramework
-from structured_output_kit.extraction.frameworks.anthropic_framework import AnthropicFramework
+from loguru import logger
 
+from structured_output_kit.extraction.schema_registry import schema_registry
 
-def factory(class_name: str, *args, **kwargs) -> Any:
-    frameworks = {
-        "OpenAIFramework": OpenAIFramework,
-        "InstructorFramework": InstructorFramework,
-        "LangchainToolFramework": LangchainToolFramework,
-        "LangchainParserFramework": LangchainParserFramework,
-        "MirascopeFramework": MirascopeFramework,
-        "LlamaIndexFramework": LlamaIndexFramework,
-        "MarvinFramework": MarvinFramework,
-        "OllamaFramework": OllamaFramework,
-        "GoogleFramework": GoogleFramework,
-        "LMFormatEnforcerFramework": LMFormatEnforcerFramework,
-        "AnthropicFramework": AnthropicFramework,
-    }
+
+# 프레임워크 이름 -> "모듈:클래스". 모듈은 처음 사용할 때 import 한다.
+# langchain, llama_index, google.genai, transformers 등은 해당 프레임워크를 쓸 때만 로드된다.
+_FRAMEWORKS_PACKAGE = "structured_output_kit.extraction.frameworks"
+FRAMEWORK_REGISTRY: Dict[str, str] = {
+    "OpenAIFramework": f"{_FRAMEWORKS_PACKAGE}.openai_framework:OpenAIFramework",
+    "InstructorFramework": f"{_FRAMEWORKS_PACKAGE}.instructor_framework:InstructorFramework",
+    "LangchainToolFramework": f"{_FRAMEWORKS_PACKAGE}.langchain_tool_framework:LangchainToolFramework",
+    "LangchainParserFramework": f"{_FRAMEWORKS_PACKAGE}.langchain_parser_framework:LangchainParserFramework",
+    "MirascopeFramework": f"{_FRAMEWORKS_PACKAGE}.mirascope_framework:MirascopeFramework",
+    "LlamaIndexFramework": f"{_FRAMEWORKS_PACKAGE}.llamaindex_framework:LlamaIndexFramework",
+    "MarvinFramework": f"{_FRAMEWORKS_PACKAGE}.marvin_framework:MarvinFramework",
+    "OllamaFramework": f"{_FRAMEWORKS_PACKAGE}.ollama_framework:OllamaFramework",
+    "GoogleFramework": f"{_FRAMEWORKS_PACKAGE}.google_framework:GoogleFramework",
+    "LMFormatEnforcerFramework": f"{_FRAMEWORKS_PACKAGE}.lm_format_enforcer_framework:LMFormatEnforcerFramework",
+    "AnthropicFramework": f"{_FRAMEWORKS_PACKAGE}.anthropic_framework:AnthropicFramework",
+}
+
+_loaded_classes: Dict[str, type] = {}
+_load_lock = threading.Lock()
+
+
+def register_framework(class_name: str, target: str) -> None:
+    """커스텀 프레임워크 등록. `target`은 "패키지.모듈:클래스" 형식"""
+    if ":" not in target:
+        raise ValueError(f"'모듈:클래스' 형식이 아닙니다: {target}")
+    FRAMEWORK_REGISTRY[class_name] = target
+    _loaded_classes.pop(class_name, None)
+
+
+def load_framework_class(class_name: str) -> type:
+    """프레임워크 클래스를 반환한다. 처음 요청될 때 해당 모듈만 import."""
+    cls = _loaded_classes.get(class_name)
+    if cls is not None:
+        return cls
     try:
-        cls = frameworks[class_name]
+        target = FRAMEWORK_REGISTRY[class_name]
     except KeyError as e:
-        raise ValueError(f"Invalid class name: {class_name}. Available frameworks: {list(frameworks.keys())}") from e
-    return cls(*args, **kwargs)
+        raise ValueError(f"Invalid class name: {class_name}. Available frameworks: {list(FRAMEWORK_REGISTRY.keys())}") from e
+    module_name, attr = target.split(":", 1)
+    with _load_lock:
+        cls = _loaded_classes.get(class_name)
+        if cls is None:
+            started_at = time.perf_counter()
+            cls = getattr(importlib.import_module(module_name), attr)
+            _loaded_classes[class_name] = cls
+            logger.debug(f"{class_name} 모듈 로드 ({time.perf_counter() - started_at:.2f}초)")
+    return cls
+
+
+def factory(class_name: str, *args, **kwargs) -> Any:
+    return load_framework_class(class_name)(*args, **kwargs)
+
+
+# 요청마다 달라지지만 인스턴스 동작에는 영향을 주지 않는 인자
+_POOL_KEY_EXCLUDES = {"langfuse_trace_id"}
+
+
+def _freeze(value: Any) -> Hashable:
+    """생성자 인자를 해시 가능한 값으로 변환"""
+    if hasattr(value, "model_json_schema"):
+        return ("schema", getattr(value, "__name__", ""), schema_registry.digest(value))
+    if is_dataclass(value) and not isinstance(value, type):
+        # RetryPolicy 등 설정 객체: 필드 값이 같으면 같은 키
+        return (type(value).__name__, _freeze(asdict(value)))
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return json.dumps(value, sort_keys=True, default=str)
+
+
+class FrameworkPool:
+    """생성된 프레임워크 인스턴스를 설정 키(framework/provider/model/schema 등)별로 재사용하는 LRU 풀.
+
+    HTTP 클라이언트, LangChain/LlamaIndex 래퍼, transformers pipeline 등의 생성 비용을
+    요청마다 다시 지불하지 않도록 한다. `max_size`가 0이면 캐싱하지 않는다.
+    LRU로 밀려난 인스턴스는 다른 요청이 아직 쓰고 있을 수 있으므로 닫지 않고 풀에서만 빼며,
+    마지막 참조가 사라지면 GC가 정리한다. 명시적 종료는 `close()`(서버 종료 시)에서만 한다.
+    """
+
+    def __init__(self, max_size: int = 32):
+        self.max_size = max_size
+        self._instances: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(class_name: str, **kwargs) -> Hashable:
+        return (class_name, _freeze({k: v for k, v in kwargs.items() if k not in _POOL_KEY_EXCLUDES}))
+
+    def get(self, class_name: str, **kwargs) -> Any:
+        """풀에서 인스턴스를 가져오거나 새로 생성해 등록"""
+        if self.max_size <= 0:
+            return factory(class_name, **kwargs)
+
+        key = self.make_key(class_name, **kwargs)
+        with self._lock:
+            instance = self._instances.get(key)
+            if instance is not None:
+                self._instances.move_to_end(key)
+                self.hits += 1
+                logger.debug(f"{class_name} 인스턴스 재사용 (pool hit)")
+                return instance
+            self.misses += 1
+
+        instance = factory(class_name, **kwargs)
+
+        duplicate = None
+        with self._lock:
+            existing = self._instances.get(key)
+            if existing is not None:
+                # 동시에 생성된 경우 먼저 등록된 인스턴스를 사용 (방금 만든 인스턴스는 아무도 쓰지 않았으므로 바로 닫는다)
+                duplicate, instance = instance, existing
+            else:
+                self._instances[key] = instance
+                while len(self._instances) > self.max_size:
+                    # 진행 중인 요청이 들고 있을 수 있어 닫지 않는다
+                    self._instances.popitem(last=False)
+        if duplicate is not None:
+            self._close_instance(duplicate)
+        return instance
+
+    @staticmethod
+    def _close_instance(instance: Any) -> None:
+        close = getattr(instance, "close", None)
+        if callable(close):
+            try:
+                close()
+            except Exception as e:
+                logger.warning(f"{instance.__class__.__name__} 종료 중 오류: {e}")
+
+    def close(self) -> None:
+        """풀에 있는 모든 인스턴스를 종료하고 비움"""
+        with self._lock:
+            instances = list(self._instances.values())
+            self._instances.clear()
+        for instance in instances:
+            self._close_instance(instance)
+        logger.debug(f"프레임워크 풀 종료: {len(instances)}개 인스턴스 해제")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "size": len(self._instances),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+framework_pool = FrameworkPool(max_size=int(os.getenv("FRAMEWORK_POOL_SIZE", "32")))
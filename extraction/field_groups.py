@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import time
+import asyncio
+import contextvars
+import concurrent.futures
+from dataclasses import dataclass, replace
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
+
+from loguru import logger
+from pydantic import BaseModel, ValidationError
+
+from structured_output_kit.extraction.stats import current_stats
+from structured_output_kit.extraction.retry import ErrorKind, RetryPolicy
+
+
+@dataclass
+class FieldGroupConfig:
+    """필드 그룹 병렬 추출 설정. `groups`가 없으면 최상위 필드마다 하나의 그룹."""
+    groups: Optional[List[List[str]]] = None
+    max_concurrency: int = 8
+
+
+def group_retry_policy(policy: RetryPolicy) -> RetryPolicy:
+    """그룹 추출용 재시도 정책: 스키마 검증 실패도 재시도한다.
+    그룹 하나가 검증에 실패하면 그 필드가 통째로 빠지므로 RETRY_ON_VALIDATION과 관계없이 켠다."""
+    return replace(policy, retry_on=policy.retry_on | {ErrorKind.VALIDATION})
+
+
+def _assemble(
+    outputs: List[Tuple[List[str], tuple]],
+    started_at: float,
+    response_model: Optional[type[BaseModel]] = None,
+) -> tuple[list[Any], float, list[float]]:
+    """그룹별 결과를 하나의 객체로 조립. 실패한 그룹의 필드는 비워 둔다.
+    `response_model`이 주어지면 조립한 객체를 전체 모델로 검증하고, 통과하지 못하면
+    (예: 실패한 그룹에 필수 필드가 있었으면) 추출 실패로 처리한다."""
+    merged: dict = {}
+    failed: List[str] = []
+    errors: List[str] = []
+    for fields, (predictions, _, _) in outputs:
+        if predictions and isinstance(predictions[0], dict):
+            for name in fields:
+                merged[name] = predictions[0].get(name)
+        else:
+            failed.append("+".join(fields))
+            if predictions:
+                errors.append(str(predictions[0]))
+    elapsed = time.perf_counter() - started_at
+    stats = current_stats()
+    if stats is not None:
+        stats.field_groups = len(outputs)
+        stats.failed_groups = failed
+    succeeded = len(outputs) - len(failed)
+    logger.info(f"필드 그룹 {len(outputs)}개 중 {succeeded}개 성공 (총 {elapsed:.2f}초)")
+    if failed:
+        logger.warning(f"실패한 필드 그룹: {failed}")
+    if not succeeded:
+        return errors[:1] or ["ERROR:모든 필드 그룹 추출 실패"], 0.0, []
+    if response_model is not None:
+        try:
+            response_model.model_validate(merged)
+        except ValidationError as e:
+            missing = sorted({".".join(map(str, err["loc"])) for err in e.errors()})
+            logger.warning(f"조립한 결과가 전체 스키마 검증 실패: {missing}")
+            return [f"ERROR:필드 그룹 조립 결과 스키마 검증 실패 ({e.error_count()}개 오류: {', '.join(missing)})"], 0.0, []
+    return [merged], succeeded / len(outputs), [elapsed]
+
+
+def run_field_groups(
+    groups: List[Tuple[List[str], Any]],
+    runner: Callable[[Any], tuple],
+    config: FieldGroupConfig,
+    response_model: Optional[type[BaseModel]] = None,
+) -> tuple[list[Any], float, list[float]]:
+    """그룹마다 `runner(target)`을 스레드로 병렬 실행하고 결과를 조립한다.
+    재시도는 각 그룹 안에서 독립적으로 일어나며, 조립한 객체는 `response_model`로 검증한다."""
+    started_at = time.perf_counter()
+    logger.info(f"{len(groups)}개 필드 그룹으로 병렬 추출 (동시 {config.max_concurrency}개)")
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, config.max_concurrency)) as executor:
+        futures = [
+            (fields, executor.submit(contextvars.copy_context().run, runner, target))
+            for fields, target in groups
+        ]
+        outputs = [(fields, future.result()) for fields, future in futures]
+    return _assemble(outputs, started_at, response_model)
+
+
+async def arun_field_groups(
+    groups: List[Tuple[List[str], Any]],
+    runner: Callable[[Any], Awaitable[tuple]],
+    config: FieldGroupConfig,
+    response_model: Optional[type[BaseModel]] = None,
+) -> tuple[list[Any], float, list[float]]:
+    """`run_field_groups`의 비동기 버전."""
+    started_at = time.perf_counter()
+    logger.info(f"{len(groups)}개 필드 그룹으로 병렬 추출 (동시 {config.max_concurrency}개)")
+    limit = asyncio.Semaphore(max(1, config.max_concurrency))
+
+    async def _run(target: Any):
+        async with limit:
+            return await runner(target)
+
+    results = await asyncio.gather(*(_run(target) for _, target in groups))
+    return _assemble([(fields, result) for (fields, _), result in zip(groups, results)], started_at, response_model)
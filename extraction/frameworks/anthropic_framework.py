@@ -5,16 +5,31 @@ import anthropic
 from loguru import logger
 from langfuse import observe
 
-from structured_output_kit.extraction.base import BaseFramework, experiment
+from structured_output_kit.extraction.schema_registry import schema_registry
+from structured_output_kit.extraction.prompting import anthropic_content
+from structured_output_kit.extraction.base import BaseFramework, experiment, experiment_async
+from structured_output_kit.extraction.usage import api_call, record_usage
+from structured_output_kit.utils.http_pool import http_clients
 
 
 class AnthropicFramework(BaseFramework):
+    supports_streaming = True
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         
+        base_url = os.getenv("ANTHROPIC_BASE_URL")
         self.client = anthropic.Anthropic(
             api_key=os.getenv("ANTHROPIC_API_KEY"),
             timeout=self.timeout,
+            max_retries=0,
+            http_client=http_clients.sdk_client(anthropic, base_url),
+        )
+        self.async_client = anthropic.AsyncAnthropic(
+            api_key=os.getenv("ANTHROPIC_API_KEY"),
+            timeout=self.timeout,
+            max_retries=0,
+            http_client=http_clients.sdk_async_client(anthropic, base_url),
         )
         
         self.tool_schema = self._convert_schema_to_tool()
@@ -23,40 +38,70 @@ class AnthropicFramework(BaseFramework):
         if not self.response_model:
             raise ValueError("response_model이 설정되지 않았습니다.")
         if hasattr(self.response_model, 'model_json_schema'):
-            schema = self.response_model.model_json_schema()
-        else:
-            schema = self.response_model
+            return schema_registry.anthropic_tool(self.response_model)
+        schema = self.response_model
         return {
             "name": "extract_info",
             "description": "Extract structured information from the given text using well-defined JSON schema.",
             "input_schema": schema
         }
 
+    def _build_request(self, inputs: dict) -> dict:
+        return dict(
+            model=self.model,
+            max_tokens=32768,
+            tools=[self.tool_schema],
+            tool_choice={"type": "tool", "name": self.tool_schema["name"]},
+            messages=[
+                {
+                    "role": "user",
+                    # 고정 지시문 블록에 cache_control, 문서는 마지막 블록
+                    "content": anthropic_content(self.prompt, inputs),
+                }
+            ],
+            **self.extra_kwargs
+        )
+
+    def _extract_tool_input(self, response) -> Any:
+        if response.content and len(response.content) > 0:
+            for content_block in response.content:
+                if content_block.type == "tool_use":
+                    return content_block.input
+        raise ValueError("응답에서 structured output을 찾을 수 없습니다.")
+
     @observe(name='Anthropic Framework')
     def run(self, retries: int, inputs: dict = {}) -> tuple[list[Any], float, list[float]]:
-        @experiment(retries=retries)
+        @experiment(retries=retries, framework=self)
         def run_experiment(inputs):
-            formatted_prompt = self.prompt.format(**inputs)
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=32768,
-                tools=[self.tool_schema],
-                tool_choice={"type": "tool", "name": self.tool_schema["name"]},
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {"type": "text", "text": formatted_prompt},
-                        ],
-                    }
-                ],
-                **self.extra_kwargs
-            )
-            if response.content and len(response.content) > 0:
-                for content_block in response.content:
-                    if content_block.type == "tool_use":
-                        return content_block.input
-            raise ValueError("응답에서 structured output을 찾을 수 없습니다.")
+            with api_call():
+                response = self.client.messages.create(**self._build_request(inputs))
+            record_usage(response)
+            return self._extract_tool_input(response)
 
         predictions, percent_successful, latencies = run_experiment(inputs)
         return predictions, percent_successful, latencies
+
+    @observe(name='Anthropic Framework')
+    async def arun(self, retries: int, inputs: dict = {}) -> tuple[list[Any], float, list[float]]:
+        @experiment_async(retries=retries, framework=self)
+        async def run_experiment(inputs):
+            with api_call():
+                response = await self.async_client.messages.create(**self._build_request(inputs))
+            record_usage(response)
+            return self._extract_tool_input(response)
+
+        predictions, percent_successful, latencies = await run_experiment(inputs)
+        return predictions, percent_successful, latencies
+
+    def _stream_deltas(self, inputs: dict):
+        # tool_use 입력이 input_json 이벤트로 조각조각 들어온다
+        with self.client.messages.stream(**self._build_request(inputs)) as stream:
+            for event in stream:
+                if event.type == "input_json":
+                    yield event.partial_json
+
+    async def _astream_deltas(self, inputs: dict):
+        async with self.async_client.messages.stream(**self._build_request(inputs)) as stream:
+            async for event in stream:
+                if event.type == "input_json":
+                    yield event.partial_json
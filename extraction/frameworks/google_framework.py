@@ -4,7 +4,8 @@ from google import genai
 from google.genai import types
 
 from langfuse import observe
-from structured_output_kit.extraction.base import BaseFramework, experiment
+from structured_output_kit.extraction.base import BaseFramework, experiment, experiment_async
+from structured_output_kit.extraction.usage import api_call, record_usage
 
 
 class GoogleFramework(BaseFramework):
@@ -16,18 +17,42 @@ class GoogleFramework(BaseFramework):
     def run(
         self, retries: int, inputs: dict = {}
     ) -> tuple[list[Any], float, dict, list[list[float]]]:
-        @experiment(retries=retries)
+        @experiment(retries=retries, framework=self)
         def run_experiment(inputs):
-            response = self.client.models.generate_content(
-                model = self.model,
-                contents = self.prompt.format(**inputs),
-                config=types.GenerateContentConfig(
-                    response_schema=self.response_model,
-                    response_mime_type="application/json",
-                ),
-                **self.extra_kwargs
-            )
+            with api_call():
+                response = self.client.models.generate_content(
+                    model = self.model,
+                    contents = self.prompt.format(**inputs),
+                    config=types.GenerateContentConfig(
+                        response_schema=self.response_model,
+                        response_mime_type="application/json",
+                    ),
+                    **self.extra_kwargs
+                )
+            record_usage(response)
             return json.loads(response.candidates[0].content.parts[0].text)
            
         predictions, percent_successful, latencies = run_experiment(inputs)
         return predictions, percent_successful, latencies
+
+    @observe(name='Google Framework')
+    async def arun(
+        self, retries: int, inputs: dict = {}
+    ) -> tuple[list[Any], float, list[float]]:
+        @experiment_async(retries=retries, framework=self)
+        async def run_experiment(inputs):
+            with api_call():
+                response = await self.client.aio.models.generate_content(
+                    model = self.model,
+                    contents = self.prompt.format(**inputs),
+                    config=types.GenerateContentConfig(
+                        response_schema=self.response_model,
+                        response_mime_type="application/json",
+                    ),
+                    **self.extra_kwargs
+                )
+            record_usage(response)
+            return json.loads(response.candidates[0].content.parts[0].text)
+
+        predictions, percent_successful, latencies = await run_experiment(inputs)
+        return predictions, percent_successful, latencies
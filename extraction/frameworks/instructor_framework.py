@@ -6,10 +6,14 @@ import instructor
 from openai import OpenAI
 from langfuse import observe
 
-from structured_output_kit.extraction.base import BaseFramework, experiment
+from structured_output_kit.extraction.base import BaseFramework, experiment, experiment_async
+from structured_output_kit.extraction.usage import api_call, record_usage
+from structured_output_kit.extraction.streaming import stream_models, astream_models
 
 
 class InstructorFramework(BaseFramework):
+    supports_streaming = True
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
  
@@ -18,25 +22,65 @@ class InstructorFramework(BaseFramework):
         if self.provider in ['ollama', 'openai_compatible']:
             base_url = os.getenv("OLLAMA_BASEURL") if provider=='ollama' else os.getenv("OPENAI_COMPATIBLE_BASEURL")
             provider = 'ollama'
-            self.client = instructor.from_provider(f"{provider}/{self.model}",
-                                                   base_url=base_url,
-                                                   api_key=self.api_key or os.getenv("OLLAMA_API_KEY") or os.getenv("OPENAI_COMPATIBLE_API_KEY", "dummy"),
-                                                   )
+            client_kwargs = {
+                "base_url": base_url,
+                "api_key": self.api_key or os.getenv("OLLAMA_API_KEY") or os.getenv("OPENAI_COMPATIBLE_API_KEY", "dummy"),
+            }
         else:
-            self.client = instructor.from_provider(f"{provider}/{self.model}")
+            client_kwargs = {}
+
+        self.client = instructor.from_provider(f"{provider}/{self.model}", **client_kwargs)
+        self.async_client = instructor.from_provider(f"{provider}/{self.model}", async_client=True, **client_kwargs)
 
     @observe(name='Instructor Framework')
     def run(
         self, retries: int, inputs: dict = {}
     ) -> tuple[list[Any], float, list[float]]:
-        @experiment(retries=retries)
+        @experiment(retries=retries, framework=self)
         def run_experiment(inputs):
-            response = self.client.chat.completions.create(
-                response_model=self.response_model,
-                messages=[{"role": "user", "content": self.prompt.format(**inputs)}],
-                **self.extra_kwargs
-            )
+            with api_call():
+                response = self.client.chat.completions.create(
+                    response_model=self.response_model,
+                    messages=[{"role": "user", "content": self.prompt.format(**inputs)}],
+                    **self.extra_kwargs
+                )
+            record_usage(response)
             return response
 
         predictions, percent_successful, latencies = run_experiment(inputs)
         return predictions, percent_successful, latencies
+
+    @observe(name='Instructor Framework')
+    async def arun(
+        self, retries: int, inputs: dict = {}
+    ) -> tuple[list[Any], float, list[float]]:
+        @experiment_async(retries=retries, framework=self)
+        async def run_experiment(inputs):
+            with api_call():
+                response = await self.async_client.chat.completions.create(
+                    response_model=self.response_model,
+                    messages=[{"role": "user", "content": self.prompt.format(**inputs)}],
+                    **self.extra_kwargs
+                )
+            record_usage(response)
+            return response
+
+        predictions, percent_successful, latencies = await run_experiment(inputs)
+        return predictions, percent_successful, latencies
+
+    def _stream_partials(self, inputs: dict, stats=None):
+        # instructor가 부분 객체(Partial[response_model])를 직접 만들어 준다
+        partials = self.client.chat.completions.create_partial(
+            response_model=self.response_model,
+            messages=[{"role": "user", "content": self.prompt.format(**inputs)}],
+            **self.extra_kwargs
+        )
+        return stream_models(partials, self.response_model, self.__class__.__name__, stats)
+
+    def _astream_partials(self, inputs: dict, stats=None):
+        partials = self.async_client.chat.completions.create_partial(
+            response_model=self.response_model,
+            messages=[{"role": "user", "content": self.prompt.format(**inputs)}],
+            **self.extra_kwargs
+        )
+        return astream_models(partials, self.response_model, self.__class__.__name__, stats)
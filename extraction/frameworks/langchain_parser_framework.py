@@ -8,7 +8,11 @@ from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_ollama import ChatOllama
 from langchain_anthropic import ChatAnthropic
 from langfuse import observe
-from structured_output_kit.extraction.base import BaseFramework, experiment
+from structured_output_kit.extraction.schema_registry import schema_registry
+from structured_output_kit.extraction.prompting import insert_static
+from structured_output_kit.extraction.base import BaseFramework, experiment, experiment_async
+from structured_output_kit.extraction.usage import langchain_usage_callback
+from structured_output_kit.utils.http_pool import http_clients
 
 
 class LangchainParserFramework(BaseFramework):
@@ -19,6 +23,8 @@ class LangchainParserFramework(BaseFramework):
             self.llm = ChatOpenAI(
                 model=self.model,
                 max_retries=0,
+                http_client=http_clients.sync_client(os.getenv("OPENAI_BASE_URL")),
+                http_async_client=http_clients.async_client(os.getenv("OPENAI_BASE_URL")),
                 **self.extra_kwargs
             )
 
@@ -36,6 +42,8 @@ class LangchainParserFramework(BaseFramework):
                 base_url=self.base_url,
                 api_key=self.api_key or os.getenv("OPENAI_COMPATIBLE_API_KEY", "dummy"),
                 max_retries=0,
+                http_client=http_clients.sync_client(self.base_url),
+                http_async_client=http_clients.async_client(self.base_url),
                 **self.extra_kwargs
             )
             
@@ -55,22 +63,40 @@ class LangchainParserFramework(BaseFramework):
 
         self.parser = PydanticOutputParser(pydantic_object=self.response_model)
         
+    def _build_chain(self):
+        prompt = ChatPromptTemplate.from_messages([
+            # 형식 지시는 고정 부분이므로 문서 앞에 둔다 (prefix 캐시 재사용)
+            ("user", insert_static(self.prompt, "{format_instructions}"))
+        ])
+
+        prompt = prompt.partial(format_instructions=schema_registry.format_instructions(self.response_model))
+
+        return prompt | self.llm | self.parser
+
     @observe(name='LangchainParser Framework')
     def run(
         self, retries: int, inputs: dict = {}
     ) -> tuple[list[Any], float, list[float]]:
-        @experiment(retries=retries)
+        @experiment(retries=retries, framework=self)
         def run_experiment(inputs):
-            prompt = ChatPromptTemplate.from_messages([
-                ("user", self.prompt + "\n{format_instructions}")
-            ])
+            chain = self._build_chain()
 
-            prompt = prompt.partial(format_instructions=self.parser.get_format_instructions())
+            response = chain.invoke(inputs, config={"callbacks": [langchain_usage_callback()]})
+            return response
 
-            chain = prompt | self.llm | self.parser
+        predictions, percent_successful, latencies = run_experiment(inputs)
+        return predictions, percent_successful, latencies
 
-            response = chain.invoke(inputs)
+    @observe(name='LangchainParser Framework')
+    async def arun(
+        self, retries: int, inputs: dict = {}
+    ) -> tuple[list[Any], float, list[float]]:
+        @experiment_async(retries=retries, framework=self)
+        async def run_experiment(inputs):
+            chain = self._build_chain()
+
+            response = await chain.ainvoke(inputs, config={"callbacks": [langchain_usage_callback()]})
             return response
 
-        predictions, percent_successful, latencies = run_experiment(inputs)
+        predictions, percent_successful, latencies = await run_experiment(inputs)
         return predictions, percent_successful, latencies
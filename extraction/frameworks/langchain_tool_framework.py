@@ -6,7 +6,9 @@ from langchain_openai import ChatOpenAI
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_anthropic import ChatAnthropic
 from langfuse import observe
-from structured_output_kit.extraction.base import BaseFramework, experiment
+from structured_output_kit.extraction.base import BaseFramework, experiment, experiment_async
+from structured_output_kit.extraction.usage import langchain_usage_callback
+from structured_output_kit.utils.http_pool import http_clients
 
 
 class LangchainToolFramework(BaseFramework):
@@ -14,18 +16,25 @@ class LangchainToolFramework(BaseFramework):
         super().__init__(*args, **kwargs)
         
         if self.provider == "openai":
-            self.llm = ChatOpenAI(model=self.model,max_retries=0, **self.extra_kwargs)
+            self.llm = ChatOpenAI(model=self.model,max_retries=0,
+                                  http_client=http_clients.sync_client(os.getenv("OPENAI_BASE_URL")),
+                                  http_async_client=http_clients.async_client(os.getenv("OPENAI_BASE_URL")),
+                                  **self.extra_kwargs)
 
         elif self.provider == "ollama":
             self.llm = ChatOpenAI(model=self.model,
                                   base_url=self.base_url,
                                   api_key=self.api_key or os.getenv("OLLAMA_API_KEY", "dummy"),
+                                  http_client=http_clients.sync_client(self.base_url),
+                                  http_async_client=http_clients.async_client(self.base_url),
                                   max_retries=0, **self.extra_kwargs)
 
         elif self.provider == "openai_compatible":
             self.llm = ChatOpenAI(model=self.model,
                                   base_url=self.base_url,
                                   api_key=self.api_key or os.getenv("OPENAI_COMPATIBLE_API_KEY", "dummy"),
+                                  http_client=http_clients.sync_client(self.base_url),
+                                  http_async_client=http_clients.async_client(self.base_url),
                                   max_retries=0, **self.extra_kwargs)
 
         elif self.provider == "google":
@@ -38,21 +47,37 @@ class LangchainToolFramework(BaseFramework):
 
         self.structured_llm = self.llm.with_structured_output(self.response_model)
 
+    def _build_chain(self):
+        prompt = ChatPromptTemplate.from_messages([
+            ("user", self.prompt)
+        ])
+
+        return prompt | self.structured_llm
+
     @observe(name='LangchainTool Framework')
     def run(
         self, retries: int, inputs: dict = {}
     ) -> tuple[list[Any], float, list[float]]:
-        @experiment(retries=retries)
+        @experiment(retries=retries, framework=self)
         def run_experiment(inputs):
+            chain = self._build_chain()
 
-            prompt = ChatPromptTemplate.from_messages([
-                ("user", self.prompt)
-            ])
+            response = chain.invoke(inputs, config={"callbacks": [langchain_usage_callback()]}) 
+            return response
+
+        predictions, percent_successful, latencies = run_experiment(inputs)
+        return predictions, percent_successful, latencies
 
-            chain = prompt | self.structured_llm
+    @observe(name='LangchainTool Framework')
+    async def arun(
+        self, retries: int, inputs: dict = {}
+    ) -> tuple[list[Any], float, list[float]]:
+        @experiment_async(retries=retries, framework=self)
+        async def run_experiment(inputs):
+            chain = self._build_chain()
 
-            response = chain.invoke(inputs) 
+            response = await chain.ainvoke(inputs, config={"callbacks": [langchain_usage_callback()]})
             return response
 
-        predictions, percent_successful, latencies = run_experiment(inputs)
+        predictions, percent_successful, latencies = await run_experiment(inputs)
         return predictions, percent_successful, latencies
@@ -6,9 +6,30 @@ from llama_index.llms.openai_like import OpenAILike
 from llama_index.llms.google_genai import GoogleGenAI
 from llama_index.core.program import LLMTextCompletionProgram
 from llama_index.core.output_parsers import PydanticOutputParser
+from llama_index.core.instrumentation import get_dispatcher
+from llama_index.core.instrumentation.event_handlers import BaseEventHandler
+from llama_index.core.instrumentation.events.llm import LLMChatEndEvent, LLMCompletionEndEvent
 
 from langfuse import observe
-from structured_output_kit.extraction.base import BaseFramework, experiment
+from structured_output_kit.extraction.base import BaseFramework, experiment, experiment_async
+from structured_output_kit.extraction.usage import record_usage
+from structured_output_kit.utils.http_pool import http_clients
+
+
+class _UsageEventHandler(BaseEventHandler):
+    """LLM 호출 종료 이벤트의 원본 응답(`response.raw`)에서 사용량을 현재 시도에 기록한다.
+    이벤트는 호출한 쪽 컨텍스트에서 발생하므로 동시에 실행 중인 다른 요청과 섞이지 않는다."""
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "UsageEventHandler"
+
+    def handle(self, event, **kwargs) -> None:
+        if isinstance(event, (LLMChatEndEvent, LLMCompletionEndEvent)) and event.response is not None:
+            record_usage(getattr(event.response, "raw", None))
+
+
+get_dispatcher().add_event_handler(_UsageEventHandler())
 
 
 class LlamaIndexFramework(BaseFramework):
@@ -16,14 +37,18 @@ class LlamaIndexFramework(BaseFramework):
         super().__init__(*args, **kwargs)
         
         if self.provider == "openai":
-            self.client = OpenAI(model=self.model,max_retries=0,)
+            self.client = OpenAI(model=self.model,max_retries=0,
+                                 http_client=http_clients.sync_client(os.getenv("OPENAI_BASE_URL")),
+                                 async_http_client=http_clients.async_client(os.getenv("OPENAI_BASE_URL")),)
 
         elif self.provider == "ollama":
             self.client = OpenAILike(
                 api_base=self.base_url,
                 api_key=self.api_key or os.getenv("OLLAMA_API_KEY", "dummy"),
                 model=self.model,
-                max_retries=0, 
+                max_retries=0,
+                http_client=http_clients.sync_client(self.base_url),
+                async_http_client=http_clients.async_client(self.base_url),
             )
 
         elif self.provider == "openai_compatible":
@@ -31,7 +56,9 @@ class LlamaIndexFramework(BaseFramework):
                 api_base=self.base_url,
                 api_key=self.api_key or os.getenv("OPENAI_COMPATIBLE_API_KEY", "dummy"),
                 model=self.model,
-                max_retries=0, 
+                max_retries=0,
+                http_client=http_clients.sync_client(self.base_url),
+                async_http_client=http_clients.async_client(self.base_url),
             )
             
         elif self.provider == "google":
@@ -50,7 +77,7 @@ class LlamaIndexFramework(BaseFramework):
     def run(
         self, retries: int, inputs: dict = {}
     ) -> tuple[list[Any], float, dict, list[list[float]]]:
-        @experiment(retries=retries)
+        @experiment(retries=retries, framework=self)
         def run_experiment(inputs):
 
             response = self.llamaindex_client(llm_kwargs=self.extra_kwargs, **inputs)
@@ -59,3 +86,17 @@ class LlamaIndexFramework(BaseFramework):
 
         predictions, percent_successful, latencies = run_experiment(inputs)
         return predictions, percent_successful, latencies
+
+    @observe(name='Llamaindex Framework')
+    async def arun(
+        self, retries: int, inputs: dict = {}
+    ) -> tuple[list[Any], float, list[float]]:
+        @experiment_async(retries=retries, framework=self)
+        async def run_experiment(inputs):
+
+            response = await self.llamaindex_client.acall(llm_kwargs=self.extra_kwargs, **inputs)
+
+            return response
+
+        predictions, percent_successful, latencies = await run_experiment(inputs)
+        return predictions, percent_successful, latencies
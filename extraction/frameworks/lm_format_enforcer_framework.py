@@ -1,48 +1,35 @@
-import json
 from typing import Any
 
-from lmformatenforcer import JsonSchemaParser
-from lmformatenforcer.integrations.transformers import (
-    build_transformers_prefix_allowed_tokens_fn,
-)
-from transformers import pipeline
-
+from structured_output_kit.extraction.schema_registry import schema_registry
 from structured_output_kit.extraction.base import BaseFramework, experiment
+from structured_output_kit.extraction.local_engine import local_engine
+from structured_output_kit.extraction.usage import api_call, record_usage
 
 
 class LMFormatEnforcerFramework(BaseFramework):
+    # 모델/토큰 트리는 (model, device)별 공용 엔진에 한 번만 로드되고,
+    # 동시에 들어온 요청(extract-batch 등)은 엔진에서 한 배치로 묶여 생성된다.
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
-        self.parser = JsonSchemaParser(self.response_model.schema())
-        max_length = kwargs.get("max_length", 4096)
+        if self.provider != "transformers":
+            raise ValueError(f"Model provider: {self.provider} not supported")
 
-        if self.provider == "transformers":
-            self.hf_pipeline = pipeline(
-                "text-generation",
-                model=self.model,
-                device_map=self.device,
-                max_length=max_length,
-            )
-            self.prefix_function = build_transformers_prefix_allowed_tokens_fn(
-                self.hf_pipeline.tokenizer, self.parser
-            )
-        else:
-            raise ValueError(f"Model provider: {self.llm_provider} not supported")
+        self.json_schema = schema_registry.json_schema(self.response_model)
+        self.engine = local_engine(self.model, self.device)
+        # 스키마 파서는 첫 요청 전에 준비
+        self.engine.prepare(self.json_schema)
 
     def run(
         self, retries: int, expected_response: Any = None, inputs: dict = {}
     ) -> tuple[list[Any], float, list[float]]:
-        @experiment(retries=retries,)
+        @experiment(retries=retries, framework=self)
         def run_experiment(inputs):
-            prompt = self.prompt.format(
-                json_schema=self.response_model.schema(), **inputs
-            )
-            response = self.hf_pipeline(
-                prompt, prefix_allowed_tokens_fn=self.prefix_function
-            )
-            response = response[0]["generated_text"][len(prompt) :].strip()
-            response = self.response_model(**json.loads(response))
-            return response
+            prompt = self.prompt.format(json_schema=self.json_schema, **inputs)
+            with api_call():
+                generation = self.engine.submit(prompt, self.json_schema).result()
+            record_usage(generation)
+            return self.response_model.model_validate_json(generation.text)
 
         predictions, percent_successful, latencies = run_experiment(inputs)
         return predictions, percent_successful, latencies
@@ -10,7 +10,7 @@ from pydantic_ai.models.anthropic import AnthropicModel, AnthropicModelSettings
 from pydantic_ai.providers.anthropic import AnthropicProvider
 
 from langfuse import observe
-from structured_output_kit.extraction.base import BaseFramework, experiment
+from structured_output_kit.extraction.base import BaseFramework, experiment, experiment_async
 
 
 class MarvinFramework(BaseFramework):
@@ -59,10 +59,22 @@ class MarvinFramework(BaseFramework):
     def run(
         self, retries: int, inputs: dict = {}
     ) -> tuple[list[Any], float, list[float]]:
-        @experiment(retries=retries)
+        @experiment(retries=retries, framework=self)
         def run_experiment(inputs):
             response = self.client.run(self.prompt.format(**inputs), result_type=self.response_model)
             return response
 
         predictions, percent_successful, latencies = run_experiment(inputs)
         return predictions, percent_successful, latencies
+
+    @observe(name='Marvin Framework')
+    async def arun(
+        self, retries: int, inputs: dict = {}
+    ) -> tuple[list[Any], float, list[float]]:
+        @experiment_async(retries=retries, framework=self)
+        async def run_experiment(inputs):
+            response = await self.client.run_async(self.prompt.format(**inputs), result_type=self.response_model)
+            return response
+
+        predictions, percent_successful, latencies = await run_experiment(inputs)
+        return predictions, percent_successful, latencies
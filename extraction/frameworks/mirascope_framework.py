@@ -2,52 +2,101 @@ import os
 from typing import Any
 from mirascope import llm
 from mirascope.core import openai
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
 from langfuse import observe
-from structured_output_kit.extraction.base import BaseFramework, experiment
+from structured_output_kit.extraction.base import BaseFramework, experiment, experiment_async
+from structured_output_kit.extraction.usage import record_usage
+from structured_output_kit.utils.http_pool import http_clients
+
+_GOOGLE_BASE_URL = "https://generativelanguage.googleapis.com"
+
+
+def _messages(query: str, call_params=None) -> dict:
+    return {
+        "messages": [{"role": "user", "content": query}],
+        "call_params": call_params,
+    }
+
+
+async def _amessages(query: str, call_params=None) -> dict:
+    return _messages(query, call_params)
 
 
 class MirascopeFramework(BaseFramework):
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
 
-    def response(self, prompt, call_params=None):
-        if self.provider == 'openai' or self.provider == 'google':
-            @llm.call(provider=self.provider, model=self.model, response_model=self.response_model)
-            def extract_info(query: str, call_params=None):
-                return {
-                    "messages": [{"role": "user", "content": query}],
-                    "call_params": call_params,
-                }
+        # SDK 클라이언트와 mirascope 호출 함수는 인스턴스당 한 번만 만든다 (프레임워크 풀에서 재사용)
+        self.client, self.async_client = self._create_clients()
+        # genai 클라이언트는 sync/async 겸용이고 공용 연결을 쓰므로 BaseFramework.close 대상(client/async_client)에서 뺀다
+        google_client = self._create_google_client() if self.provider == 'google' else None
+        self._extract = self._call(google_client or self.client)(_messages)
+        self._aextract = self._call(google_client or self.async_client)(_amessages)
+
+    def _create_clients(self):
+        """openai/ollama/openai_compatible용 OpenAI 클라이언트 (공용 HTTP 연결 풀 사용). google이면 (None, None)."""
+        if self.provider == 'openai':
+            base_url, api_key = os.getenv("OPENAI_BASE_URL") or None, self.api_key or os.getenv("OPENAI_API_KEY")
+        elif self.provider == 'ollama':
+            base_url, api_key = self.base_url, self.api_key or os.getenv("OLLAMA_API_KEY", "dummy")
+        elif self.provider == 'openai_compatible':
+            base_url, api_key = self.base_url, self.api_key or os.getenv("OPENAI_COMPATIBLE_API_KEY", "dummy")
         else:
-            if self.provider == 'ollama':
-                client = OpenAI(
-                    base_url=self.base_url,
-                    api_key=self.api_key or os.getenv("OLLAMA_API_KEY", "dummy"),
-                    max_retries=0,
-                    timeout=self.timeout)
-            else:
-                client = OpenAI(
-                    base_url=self.base_url,
-                    api_key=self.api_key or os.getenv("OPENAI_COMPATIBLE_API_KEY", "dummy"),
-                    max_retries=0,
-                    timeout=self.timeout)
-            @openai.call(self.model, response_model=self.response_model, client=client)
-            def extract_info(query: str, call_params=None):
-                return {
-                    "messages": [{"role": "user", "content": query}],
-                    "call_params": call_params,
-                }
-        return extract_info(prompt, call_params=call_params)
+            return None, None
+        client_kwargs = {"base_url": base_url, "api_key": api_key, "max_retries": 0, "timeout": self.timeout}
+        return (
+            OpenAI(**client_kwargs, http_client=http_clients.sync_client(base_url)),
+            AsyncOpenAI(**client_kwargs, http_client=http_clients.async_client(base_url)),
+        )
+
+    def _create_google_client(self):
+        """mirascope google provider에 넘길 genai 클라이언트. google-genai가 httpx 클라이언트 주입을
+        지원하는 버전이면 공용 연결 풀을 쓴다."""
+        from google import genai
+        from google.genai import types
+
+        if "httpx_client" not in types.HttpOptions.model_fields:
+            return genai.Client()
+        return genai.Client(http_options=types.HttpOptions(
+            httpx_client=http_clients.sync_client(_GOOGLE_BASE_URL),
+            httpx_async_client=http_clients.async_client(_GOOGLE_BASE_URL),
+        ))
+
+    def _call(self, client):
+        """mirascope 호출 데코레이터 (인스턴스가 가진 클라이언트를 그대로 쓴다)"""
+        if self.provider == 'google':
+            return llm.call(provider='google', model=self.model, response_model=self.response_model, client=client)
+        return openai.call(self.model, response_model=self.response_model, client=client)
+
+    def response(self, prompt, call_params=None):
+        return self._extract(prompt, call_params=call_params)
+
+    async def aresponse(self, prompt, call_params=None):
+        return await self._aextract(prompt, call_params=call_params)
 
     @observe(name='Mirascope Framework')
     def run(
         self, retries: int, inputs: dict = {}, kwargs: dict = {}
     ) -> tuple[list[Any], float, dict, list[list[float]]]:
-        @experiment(retries=retries)
+        @experiment(retries=retries, framework=self)
         def run_experiment(inputs):
             response = self.response(self.prompt.format(**inputs), call_params=self.extra_kwargs)
+            # response_model 결과에 붙어 있는 call response에서 사용량
+            record_usage(getattr(response, "_response", None))
             return response
 
         predictions, percent_successful, latencies = run_experiment(inputs)
         return predictions, percent_successful, latencies
+
+    @observe(name='Mirascope Framework')
+    async def arun(
+        self, retries: int, inputs: dict = {}, kwargs: dict = {}
+    ) -> tuple[list[Any], float, dict, list[list[float]]]:
+        @experiment_async(retries=retries, framework=self)
+        async def run_experiment(inputs):
+            response = await self.aresponse(self.prompt.format(**inputs), call_params=self.extra_kwargs)
+            record_usage(getattr(response, "_response", None))
+            return response
+
+        predictions, percent_successful, latencies = await run_experiment(inputs)
+        return predictions, percent_successful, latencies
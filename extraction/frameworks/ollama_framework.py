@@ -2,36 +2,89 @@ import os
 import json
 from typing import Any
 from langfuse import observe
-from ollama._client import Client
-from structured_output_kit.extraction.base import BaseFramework, experiment
+from ollama._client import Client, AsyncClient
+from structured_output_kit.extraction.schema_registry import schema_registry
+from structured_output_kit.extraction.base import BaseFramework, experiment, experiment_async
+from structured_output_kit.extraction.usage import api_call, record_usage
+from structured_output_kit.utils.ollama_host import ollama_hosts
 
 
 class OllamaFramework(BaseFramework):
     """_summary_
     https://ollama.com/blog/structured-outputs
     """
+    supports_streaming = True
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self.client = Client(self.base_url,
                              api_key=self.api_key or os.getenv("OLLAMA_API_KEY", "dummy"))
+        self.async_client = AsyncClient(self.base_url,
+                                        api_key=self.api_key or os.getenv("OLLAMA_API_KEY", "dummy"))
 
     @observe(name='Ollama Framework')
     def run(
         self, retries: int, inputs: dict = {}
     ) -> tuple[list[Any], float, list[float]]:
-        @experiment(retries=retries)
+        @experiment(retries=retries, framework=self)
         def run_experiment(inputs):
             
-            response = self.client.chat(
-                model=self.model,
-                format=self.response_model.model_json_schema(),
-                messages=[
-                    {"role": "user", "content": self.prompt.format(**inputs)}
-                ],
-            )
+            with api_call():
+                response = self.client.chat(
+                    model=self.model,
+                    format=schema_registry.json_schema(self.response_model),
+                    messages=[
+                        {"role": "user", "content": self.prompt.format(**inputs)}
+                    ],
+                    keep_alive=ollama_hosts.keep_alive(self.base_url, self.model),
+                )
+            record_usage(response)
             content = json.loads(response.message.content)
             
             return content
 
         predictions, percent_successful, latencies = run_experiment(inputs)
         return predictions, percent_successful, latencies
+
+    @observe(name='Ollama Framework')
+    async def arun(
+        self, retries: int, inputs: dict = {}
+    ) -> tuple[list[Any], float, list[float]]:
+        @experiment_async(retries=retries, framework=self)
+        async def run_experiment(inputs):
+
+            with api_call():
+                response = await self.async_client.chat(
+                    model=self.model,
+                    format=schema_registry.json_schema(self.response_model),
+                    messages=[
+                        {"role": "user", "content": self.prompt.format(**inputs)}
+                    ],
+                    keep_alive=ollama_hosts.keep_alive(self.base_url, self.model),
+                )
+            record_usage(response)
+            content = json.loads(response.message.content)
+
+            return content
+
+        predictions, percent_successful, latencies = await run_experiment(inputs)
+        return predictions, percent_successful, latencies
+
+    def _stream_kwargs(self, inputs: dict) -> dict:
+        return dict(
+            model=self.model,
+            format=schema_registry.json_schema(self.response_model),
+            messages=[
+                {"role": "user", "content": self.prompt.format(**inputs)}
+            ],
+            stream=True,
+            keep_alive=ollama_hosts.keep_alive(self.base_url, self.model),
+        )
+
+    def _stream_deltas(self, inputs: dict):
+        for part in self.client.chat(**self._stream_kwargs(inputs)):
+            yield part.message.content
+
+    async def _astream_deltas(self, inputs: dict):
+        async for part in await self.async_client.chat(**self._stream_kwargs(inputs)):
+            yield part.message.content
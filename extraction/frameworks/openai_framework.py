@@ -1,71 +1,141 @@
 import os
 from typing import Any
-from pydantic import create_model
-from typing import get_args, get_origin
 
-from langfuse.openai import OpenAI
+from langfuse.openai import OpenAI, AsyncOpenAI
 from loguru import logger
 from langfuse import observe
-from structured_output_kit.extraction.base import BaseFramework, experiment
+from structured_output_kit.extraction.schema_registry import schema_registry
+from structured_output_kit.extraction.base import BaseFramework, experiment, experiment_async
+from structured_output_kit.extraction.usage import api_call, record_usage
+from structured_output_kit.utils.http_pool import http_clients
 
 
 class OpenAIFramework(BaseFramework):
+    supports_streaming = True
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
 
         if self.provider == "openai":
-            self.client = OpenAI(max_retries=0)
+            client_kwargs = {"max_retries": 0}
 
         elif self.provider == "ollama":
-            self.client = OpenAI(
-                base_url=self.base_url,
-                api_key=self.api_key or os.getenv("OLLAMA_API_KEY", "dummy"),
-                max_retries=0,
-            )
+            client_kwargs = {
+                "base_url": self.base_url,
+                "api_key": self.api_key or os.getenv("OLLAMA_API_KEY", "dummy"),
+                "max_retries": 0,
+            }
         elif self.provider == "openai_compatible":
-            self.client = OpenAI(
-                base_url=self.base_url,
-                api_key=self.api_key or os.getenv("OPENAI_COMPATIBLE_API_KEY", "dummy"),
-                max_retries=0,
-            )
+            client_kwargs = {
+                "base_url": self.base_url,
+                "api_key": self.api_key or os.getenv("OPENAI_COMPATIBLE_API_KEY", "dummy"),
+                "max_retries": 0,
+            }
         elif self.provider == "google":
-            self.client = OpenAI(
-                base_url=self.base_url,
-                api_key=os.getenv("GOOGLE_API_KEY"),
-                max_retries=0,
-            )
+            client_kwargs = {
+                "base_url": self.base_url,
+                "api_key": os.getenv("GOOGLE_API_KEY"),
+                "max_retries": 0,
+            }
             self.response_model = self.remove_optional()
 
+        base_url = client_kwargs.get("base_url") or os.getenv("OPENAI_BASE_URL")
+        self.client = OpenAI(**client_kwargs, http_client=http_clients.sync_client(base_url))
+        self.async_client = AsyncOpenAI(**client_kwargs, http_client=http_clients.async_client(base_url))
+
     def remove_optional(self):
-        schema = self.response_model
-        fields = {}
-        for name, field in schema.model_fields.items():
-            typ = field.annotation
-            if get_origin(typ) is not None and get_origin(typ).__name__ == "Union":
-                args = [a for a in get_args(typ) if a is not type(None)]
-                if args:
-                    typ = args[0]
-            fields[name] = (typ, ...)
-        NewModel = create_model(
-            schema.__name__ + "Required",
-            **fields,
-            __base__=schema.__base__
-        )
-        return NewModel
+        return schema_registry.required_variant(self.response_model)
 
     @observe(name='OpenAI Framework')
     def run(self, retries: int, inputs: dict = {}) -> tuple[list[Any], float, list[float]]:
-        @experiment(retries=retries)
+        @experiment(retries=retries, framework=self)
         def run_experiment(inputs):
-            response = self.client.chat.completions.parse(
-                model=self.model,
-                messages=[
-                    {"role": "user", "content": self.prompt.format(**inputs)}
-                ],
-                response_format=self.response_model,
-                **self.extra_kwargs
-            )
+            with api_call():
+                response = self.client.chat.completions.parse(
+                    model=self.model,
+                    messages=[
+                        {"role": "user", "content": self.prompt.format(**inputs)}
+                    ],
+                    response_format=self.response_model,
+                    **self.extra_kwargs
+                )
+            record_usage(response)
             return response.choices[0].message.parsed
 
         predictions, percent_successful, latencies = run_experiment(inputs)
         return predictions, percent_successful, latencies
+
+    @observe(name='OpenAI Framework')
+    async def arun(self, retries: int, inputs: dict = {}) -> tuple[list[Any], float, list[float]]:
+        @experiment_async(retries=retries, framework=self)
+        async def run_experiment(inputs):
+            with api_call():
+                response = await self.async_client.chat.completions.parse(
+                    model=self.model,
+                    messages=[
+                        {"role": "user", "content": self.prompt.format(**inputs)}
+                    ],
+                    response_format=self.response_model,
+                    **self.extra_kwargs
+                )
+            record_usage(response)
+            return response.choices[0].message.parsed
+
+        predictions, percent_successful, latencies = await run_experiment(inputs)
+        return predictions, percent_successful, latencies
+
+    @property
+    def supports_n(self) -> bool:
+        # Ollama/Gemini의 OpenAI 호환 API는 n을 무시하거나 거부하므로 OpenAI와 호환 서버(vLLM 등)만 사용
+        return self.provider in ("openai", "openai_compatible")
+
+    def _samples(self, response) -> dict:
+        return {"samples": [choice.message.parsed.model_dump(exclude_none=True) for choice in response.choices if choice.message.parsed is not None]}
+
+    @observe(name='OpenAI Framework')
+    def run_n(self, retries: int, inputs: dict = {}, n: int = 1) -> tuple[list[Any], float, list[float]]:
+        @experiment(retries=retries, framework=self)
+        def run_experiment(inputs):
+            with api_call():
+                response = self.client.chat.completions.parse(**self._n_kwargs(inputs, n))
+            record_usage(response)
+            return self._samples(response)
+
+        return run_experiment(inputs)
+
+    @observe(name='OpenAI Framework')
+    async def arun_n(self, retries: int, inputs: dict = {}, n: int = 1) -> tuple[list[Any], float, list[float]]:
+        @experiment_async(retries=retries, framework=self)
+        async def run_experiment(inputs):
+            with api_call():
+                response = await self.async_client.chat.completions.parse(**self._n_kwargs(inputs, n))
+            record_usage(response)
+            return self._samples(response)
+
+        return await run_experiment(inputs)
+
+    def _n_kwargs(self, inputs: dict, n: int) -> dict:
+        # extra_kwargs에 n이 있어도 샘플 수는 self-consistency 설정을 따른다 (중복 인자 TypeError 방지)
+        return dict(self._stream_kwargs(inputs), n=n)
+
+    def _stream_kwargs(self, inputs: dict) -> dict:
+        return dict(
+            model=self.model,
+            messages=[
+                {"role": "user", "content": self.prompt.format(**inputs)}
+            ],
+            response_format=self.response_model,
+            **self.extra_kwargs
+        )
+
+    def _stream_deltas(self, inputs: dict):
+        with self.client.chat.completions.stream(**self._stream_kwargs(inputs)) as stream:
+            for event in stream:
+                if event.type == "content.delta":
+                    yield event.delta
+
+    async def _astream_deltas(self, inputs: dict):
+        async with self.async_client.chat.completions.stream(**self._stream_kwargs(inputs)) as stream:
+            async for event in stream:
+                if event.type == "content.delta":
+                    yield event.delta
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import os
+import math
+import time
+import threading
+import contextvars
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterator, Optional, Tuple
+
+
+class LatencyTracker:
+    """(provider, model, base_url)별 최근 성공 지연시간을 보관하고 백분위수를 계산한다."""
+
+    def __init__(self, window: int = 200):
+        self.window = window
+        self._samples: Dict[Tuple[str, str, str], Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, key: Tuple[str, str, str], latency: float) -> None:
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = self._samples[key] = deque(maxlen=self.window)
+            samples.append(latency)
+
+    def count(self, key: Tuple[str, str, str]) -> int:
+        with self._lock:
+            return len(self._samples.get(key, ()))
+
+    def percentile(self, key: Tuple[str, str, str], p: float) -> Optional[float]:
+        with self._lock:
+            samples = sorted(self._samples.get(key, ()))
+        if not samples:
+            return None
+        rank = max(math.ceil(p / 100.0 * len(samples)) - 1, 0)
+        return samples[min(rank, len(samples) - 1)]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._samples.clear()
+
+
+@dataclass
+class HedgePolicy:
+    """헤지 요청 정책.
+
+    최근 지연시간의 `percentile` 백분위수가 지나도록 응답이 없으면 중복 요청을
+    최대 `max_hedges`번 보낸다. 표본이 `min_samples`보다 적으면 `initial_delay`를
+    쓰고, 그것도 없으면 헤지하지 않는다.
+    """
+    percentile: float = 95.0
+    min_samples: int = 10
+    initial_delay: Optional[float] = None
+    min_delay: float = 0.05
+    max_hedges: int = 1
+
+    @classmethod
+    def from_env(cls, percentile: Optional[float] = None) -> "HedgePolicy":
+        initial_delay = os.getenv("HEDGE_INITIAL_DELAY")
+        return cls(
+            percentile=percentile if percentile is not None else float(os.getenv("HEDGE_PERCENTILE", "95")),
+            min_samples=int(os.getenv("HEDGE_MIN_SAMPLES", "10")),
+            initial_delay=float(initial_delay) if initial_delay else None,
+            max_hedges=int(os.getenv("HEDGE_MAX_HEDGES", "1")),
+        )
+
+    def delay(self, tracker: LatencyTracker, key: Tuple[str, str, str]) -> Optional[float]:
+        """헤지를 보내기까지 기다릴 시간(초). None이면 헤지하지 않는다."""
+        if tracker.count(key) < self.min_samples:
+            return self.initial_delay
+        value = tracker.percentile(key, self.percentile)
+        return None if value is None else max(value, self.min_delay)
+
+
+latency_tracker = LatencyTracker(window=int(os.getenv("HEDGE_LATENCY_WINDOW", "200")))
+
+
+class AttemptClock:
+    """헤지 대상인 원 요청의 현재 시도가 API 호출을 시작한 시각.
+
+    rate limiter 대기나 재시도 백오프 중에는 `started`가 None이라 헤지 시계가 멈춘다.
+    헤지 대기 시간은 API 호출 지연시간 분포로 정하므로, 대기 시간까지 세면 한도에 걸린
+    요청마다 헤지를 보내 부하만 늘린다.
+    """
+
+    def __init__(self) -> None:
+        self.started: Optional[float] = None
+
+    @contextmanager
+    def running(self) -> Iterator[None]:
+        self.started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.started = None
+
+    def elapsed(self) -> Optional[float]:
+        started = self.started
+        return None if started is None else time.perf_counter() - started
+
+
+_attempt_clock: contextvars.ContextVar[Optional[AttemptClock]] = contextvars.ContextVar("hedge_attempt_clock", default=None)
+
+
+def attempt_in_flight():
+    """`experiment`가 API 호출을 감싸는 구간. 헤지 중인 원 요청이면 그 구간만 시계를 돌린다."""
+    clock = _attempt_clock.get()
+    return clock.running() if clock is not None else nullcontext()
+
+
+def run_with_clock(clock: AttemptClock, func: Callable[..., Any], *args: Any) -> Any:
+    """`clock`을 현재 컨텍스트에 걸고 `func` 실행 (스레드에서 `copy_context().run`으로 호출)"""
+    _attempt_clock.set(clock)
+    return func(*args)
+
+
+async def arun_with_clock(clock: AttemptClock, func: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+    """`run_with_clock`의 비동기 버전 (태스크마다 컨텍스트가 복사되므로 이 태스크에만 걸린다)"""
+    _attempt_clock.set(clock)
+    return await func(*args)
@@ -0,0 +1,204 @@
+"""프로세스 내 로컬 구조화 디코딩 엔진 (transformers + lm-format-enforcer).
+
+- (model, device)마다 모델/토크나이저를 한 번만 로드하고, 토크나이저 어휘로 만드는
+  lm-format-enforcer 토큰 트리(TokenEnforcerTokenizerData)도 한 번만 만든다
+- 스키마마다 JsonSchemaParser/TokenEnforcer를 캐시해 상태별 허용 토큰 계산 결과를 요청 사이에 재사용
+- 동시에 들어온 요청을 `batch_wait`초 동안 모아 왼쪽 padding 후 한 번의 generate로 생성한다
+  (배치 안의 시퀀스마다 자기 스키마의 TokenEnforcer로 제약)
+
+CPU에서도 작은 모델(예: HuggingFaceTB/SmolLM2-135M-Instruct)로 네트워크 없이 전체 파이프라인을 돌릴 수 있다.
+"""
+from __future__ import annotations
+
+import os
+import json
+import time
+import queue
+import hashlib
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+
+@dataclass
+class LocalGeneration:
+    """로컬 생성 결과 한 건 (`usage`는 extract_usage가 읽는 형식)"""
+    text: str
+    usage: Dict[str, int] = field(default_factory=dict)
+    batch_size: int = 1
+
+
+@dataclass
+class _Pending:
+    prompt: str
+    schema_key: str
+    future: Future
+
+
+def _schema_key(schema: Dict[str, Any]) -> str:
+    return hashlib.sha256(json.dumps(schema, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+class LocalEngine:
+    """로컬 모델 하나를 감싸는 배치 생성 엔진. `local_engine()`으로 프로세스 공용 인스턴스를 얻는다."""
+
+    def __init__(
+        self,
+        model: str,
+        device: str = "cpu",
+        batch_size: int = 8,
+        batch_wait: float = 0.02,
+        max_new_tokens: int = 1024,
+        max_length: Optional[int] = None,
+    ):
+        from transformers import AutoModelForCausalLM, AutoTokenizer
+        from lmformatenforcer.integrations.transformers import build_token_enforcer_tokenizer_data
+
+        started_at = time.perf_counter()
+        self.model_name = model
+        self.batch_size = max(1, batch_size)
+        self.batch_wait = batch_wait
+        self.max_new_tokens = max_new_tokens
+        self.max_length = max_length
+
+        self.tokenizer = AutoTokenizer.from_pretrained(model)
+        # 배치 생성 시 프롬프트 끝이 맞도록 왼쪽 padding
+        self.tokenizer.padding_side = "left"
+        if self.tokenizer.pad_token is None:
+            self.tokenizer.pad_token = self.tokenizer.eos_token
+        self.model = AutoModelForCausalLM.from_pretrained(model, device_map=device)
+        self.model.eval()
+        self.chat = bool(getattr(self.tokenizer, "chat_template", None))
+        # 어휘 전체를 훑는 토큰 트리 구성은 비싸므로 엔진당 한 번
+        self.tokenizer_data = build_token_enforcer_tokenizer_data(self.tokenizer)
+
+        self._enforcers: Dict[str, Any] = {}
+        self._enforcer_lock = threading.Lock()
+        self._queue: "queue.Queue[_Pending]" = queue.Queue()
+        self._worker = threading.Thread(target=self._run, name=f"local-engine-{model}", daemon=True)
+        self._worker.start()
+        logger.info(f"로컬 엔진 준비: {model} ({device}), 배치 {self.batch_size}, 로드 {time.perf_counter() - started_at:.1f}초")
+
+    # ------------------------------------------------------------------ 스키마
+    def prepare(self, schema: Dict[str, Any]) -> str:
+        """스키마의 JsonSchemaParser/TokenEnforcer를 미리 만든다. 스키마 키를 반환."""
+        from lmformatenforcer import JsonSchemaParser
+        from lmformatenforcer.tokenenforcer import TokenEnforcer
+
+        key = _schema_key(schema)
+        with self._enforcer_lock:
+            if key not in self._enforcers:
+                self._enforcers[key] = TokenEnforcer(self.tokenizer_data, JsonSchemaParser(schema))
+        return key
+
+    def render(self, prompt: str) -> str:
+        """chat 템플릿이 있는 모델(instruct)은 user 메시지로 감싼다."""
+        if self.chat:
+            return self.tokenizer.apply_chat_template(
+                [{"role": "user", "content": prompt}], tokenize=False, add_generation_prompt=True
+            )
+        return prompt
+
+    # ------------------------------------------------------------------ 요청
+    def submit(self, prompt: str, schema: Dict[str, Any]) -> "Future[LocalGeneration]":
+        """생성 요청을 큐에 넣는다. 같은 시기에 들어온 요청들과 한 배치로 생성된다."""
+        future: "Future[LocalGeneration]" = Future()
+        self._queue.put(_Pending(self.render(prompt), self.prepare(schema), future))
+        return future
+
+    def generate(self, prompts: List[str], schema: Dict[str, Any]) -> List[LocalGeneration]:
+        """여러 프롬프트를 배치로 생성 (동기)"""
+        futures = [self.submit(prompt, schema) for prompt in prompts]
+        return [future.result() for future in futures]
+
+    # ------------------------------------------------------------------ 워커
+    def _collect(self) -> List[_Pending]:
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.batch_wait
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._collect()
+            try:
+                results = self._generate_batch(batch)
+            except Exception as e:
+                logger.error(f"로컬 배치 생성 실패 ({len(batch)}건): {e}")
+                for item in batch:
+                    item.future.set_exception(e)
+                continue
+            for item, result in zip(batch, results):
+                item.future.set_result(result)
+
+    def _generate_batch(self, batch: List[_Pending]) -> List[LocalGeneration]:
+        import torch
+
+        enforcers = [self._enforcers[item.schema_key] for item in batch]
+        for enforcer in {id(e): e for e in enforcers}.values():
+            # 토큰 시퀀스별 상태는 배치마다 비우고, 파서 상태별 허용 토큰 캐시는 유지
+            enforcer.prefix_states.clear()
+
+        def allowed_tokens(batch_id: int, sent: "torch.Tensor") -> List[int]:
+            return enforcers[batch_id].get_allowed_tokens(sent.tolist()).allowed_tokens
+
+        encoded = self.tokenizer(
+            [item.prompt for item in batch],
+            return_tensors="pt",
+            padding=True,
+            truncation=self.max_length is not None,
+            max_length=self.max_length,
+            add_special_tokens=not self.chat,  # chat 템플릿에는 BOS 등이 이미 들어 있다
+        ).to(self.model.device)
+        started_at = time.perf_counter()
+        with torch.inference_mode():
+            generated = self.model.generate(
+                **encoded,
+                max_new_tokens=self.max_new_tokens,
+                do_sample=False,
+                prefix_allowed_tokens_fn=allowed_tokens,
+                pad_token_id=self.tokenizer.pad_token_id,
+            )
+        new_tokens = generated[:, encoded["input_ids"].shape[1]:]
+        texts = self.tokenizer.batch_decode(new_tokens, skip_special_tokens=True)
+        prompt_tokens = encoded["attention_mask"].sum(dim=1).tolist()
+        pad_id = self.tokenizer.pad_token_id
+        completion_tokens = [int((row != pad_id).sum()) for row in new_tokens]
+        logger.debug(f"로컬 배치 생성: {len(batch)}건, {time.perf_counter() - started_at:.2f}초")
+        return [
+            LocalGeneration(
+                text=text.strip(),
+                usage={"prompt_tokens": int(prompt), "completion_tokens": completion},
+                batch_size=len(batch),
+            )
+            for text, prompt, completion in zip(texts, prompt_tokens, completion_tokens)
+        ]
+
+
+_engines: Dict[Tuple[str, str], LocalEngine] = {}
+_engines_lock = threading.Lock()
+
+
+def local_engine(model: str, device: str = "cpu") -> LocalEngine:
+    """(model, device)별 프로세스 공용 엔진. 배치 설정은 LOCAL_ENGINE_* 환경변수로."""
+    key = (model, device)
+    with _engines_lock:
+        if key not in _engines:
+            max_length = os.getenv("LOCAL_ENGINE_MAX_LENGTH")
+            _engines[key] = LocalEngine(
+                model,
+                device,
+                batch_size=int(os.getenv("LOCAL_ENGINE_BATCH_SIZE", "8")),
+                batch_wait=float(os.getenv("LOCAL_ENGINE_BATCH_WAIT_MS", "20")) / 1000,
+                max_new_tokens=int(os.getenv("LOCAL_ENGINE_MAX_NEW_TOKENS", "1024")),
+                max_length=int(max_length) if max_length else None,
+            )
+        return _engines[key]
@@ -0,0 +1,58 @@
+"""추출 프롬프트 조립.
+
+서버 측 prefix(KV) 캐시(vLLM, Ollama, OpenAI prompt caching, Anthropic cache_control)는 요청 사이에
+똑같은 앞부분만 재사용하므로, 문서와 무관한 고정 부분(지시문, 스키마, 형식 지시)을 항상 앞에 두고
+문서(`{content}`)를 맨 뒤에 둔다. 프레임워크는 템플릿을 직접 이어 붙이지 말고 여기 함수들을 쓴다.
+"""
+from __future__ import annotations
+
+import os
+import re
+from typing import Any, Dict, List, Tuple
+
+CONTENT_FIELD = "content"
+_CONTENT_PATTERN = re.compile(r"(?<!\{)\{" + CONTENT_FIELD + r"(?:![rsa])?(?::[^{}]*)?\}")
+
+
+def build_template(instructions: str, *sections: str) -> str:
+    """고정 지시문과 추가 고정 섹션 뒤에 문서 자리표시자를 붙인 템플릿"""
+    parts = [instructions, *sections]
+    return "\n".join(part for part in parts if part) + "\n{" + CONTENT_FIELD + "}"
+
+
+def _content_offset(template: str) -> int:
+    """템플릿에서 `{content}` 자리표시자가 시작하는 위치 (없으면 끝). `{{content}}`처럼 이스케이프된 것은 제외."""
+    match = _CONTENT_PATTERN.search(template)
+    return match.start() if match else len(template)
+
+
+def insert_static(template: str, *sections: str) -> str:
+    """형식 지시 등 고정 섹션을 문서 자리표시자 앞에 끼워 넣는다 (문서가 항상 마지막에 오도록)."""
+    sections = tuple(section for section in sections if section)
+    if not sections:
+        return template
+    index = _content_offset(template)
+    head, tail = template[:index], template[index:]
+    return head.rstrip("\n") + "\n" + "\n".join(sections) + "\n" + tail
+
+
+def split_prompt(template: str, inputs: Dict[str, Any]) -> Tuple[str, str]:
+    """템플릿을 (문서 앞 고정 부분, 문서부터 끝까지)로 나눠 각각 채운다."""
+    index = _content_offset(template)
+    return template[:index].format(**inputs), template[index:].format(**inputs)
+
+
+def anthropic_cache_enabled() -> bool:
+    return os.getenv("ANTHROPIC_PROMPT_CACHE", "true").lower() in ("1", "true", "yes")
+
+
+def anthropic_content(template: str, inputs: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Anthropic user 메시지 블록. 고정 부분에 cache_control을 달아 tools+고정 지시를 캐시한다.
+    (모델별 최소 길이 1024~2048 토큰보다 짧으면 provider가 캐시하지 않는다)"""
+    prefix, document = split_prompt(template, inputs)
+    if not prefix.strip():
+        return [{"type": "text", "text": document}]
+    block: Dict[str, Any] = {"type": "text", "text": prefix}
+    if anthropic_cache_enabled():
+        block["cache_control"] = {"type": "ephemeral"}
+    return [block, {"type": "text", "text": document}]
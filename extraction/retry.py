@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import os
+import json
+import random
+import asyncio
+from enum import Enum
+from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, FrozenSet, Optional
+
+from pydantic import ValidationError
+
+from structured_output_kit.utils.rate_limiter import is_rate_limit_error, retry_after_seconds
+
+
+class ErrorKind(str, Enum):
+    """재시도 판단을 위한 오류 분류"""
+    RATE_LIMIT = "rate_limit"    # 429
+    TRANSIENT = "transient"      # 네트워크/타임아웃/5xx
+    VALIDATION = "validation"    # 응답 파싱·스키마 검증 실패
+    AUTH = "auth"                # 401/403, 키 누락
+    CLIENT = "client"            # 그 밖의 4xx (잘못된 요청)
+
+
+_TRANSIENT_NAMES = (
+    "APIConnectionError", "APITimeoutError", "InternalServerError", "ServiceUnavailableError",
+    "OverloadedError", "ConnectError", "ConnectTimeout", "ReadTimeout", "ReadError",
+    "RemoteProtocolError", "PoolTimeout", "ServerError", "DeadlineExceeded", "ServiceUnavailable",
+)
+_AUTH_NAMES = ("AuthenticationError", "PermissionDeniedError", "Unauthenticated", "PermissionDenied")
+_VALIDATION_NAMES = ("InstructorRetryException", "OutputParserException", "IncompleteOutputException")
+_CLIENT_NAMES = ("CassetteMissError",)  # 재생 모드에서 기록 없는 요청: 재시도해도 같은 결과
+
+
+def _status_code(exc: BaseException) -> Optional[int]:
+    for attr in ("status_code", "code", "status"):
+        value = getattr(exc, attr, None)
+        if isinstance(value, int) and 100 <= value < 600:
+            return value
+    response = getattr(exc, "response", None)
+    value = getattr(response, "status_code", None)
+    return value if isinstance(value, int) else None
+
+
+def _caused_by(exc: BaseException, names: tuple) -> bool:
+    """SDK가 감싸서 다시 던진 예외(`raise ... from err`)까지 따라가며 이름 확인"""
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        seen.add(id(exc))
+        if {cls.__name__ for cls in type(exc).__mro__} & set(names):
+            return True
+        exc = exc.__cause__ or exc.__context__
+    return False
+
+
+def classify_error(exc: BaseException) -> ErrorKind:
+    """SDK별 예외를 `ErrorKind`로 분류한다. 판단이 어려운 예외는 TRANSIENT로 본다."""
+    if is_rate_limit_error(exc):
+        return ErrorKind.RATE_LIMIT
+    names = {cls.__name__ for cls in type(exc).__mro__}
+    if _caused_by(exc, _CLIENT_NAMES):
+        return ErrorKind.CLIENT
+    status = _status_code(exc)
+    if status in (401, 403) or names & set(_AUTH_NAMES):
+        return ErrorKind.AUTH
+    if status is not None:
+        if status in (408, 409) or status >= 500:
+            return ErrorKind.TRANSIENT
+        if 400 <= status < 500:
+            return ErrorKind.CLIENT
+    if names & set(_TRANSIENT_NAMES) or isinstance(exc, (TimeoutError, ConnectionError, asyncio.TimeoutError)):
+        return ErrorKind.TRANSIENT
+    if names & set(_VALIDATION_NAMES) or isinstance(exc, (ValidationError, json.JSONDecodeError, KeyError, TypeError, ValueError)):
+        return ErrorKind.VALIDATION
+    return ErrorKind.TRANSIENT
+
+
+@dataclass
+class AttemptRecord:
+    """한 번의 시도에 대한 기록"""
+    attempt: int
+    latency: float                  # API 호출 시간(초)
+    error_kind: Optional[str] = None
+    error: Optional[str] = None
+    rate_limit_wait: float = 0.0    # 호출 전 rate limiter 대기(초)
+    backoff: float = 0.0            # 다음 시도 전 대기(초)
+    api_time: Optional[float] = None         # 그중 HTTP 호출에 쓴 시간(초), 프레임워크가 측정한 경우만
+    prompt_tokens: Optional[int] = None
+    completion_tokens: Optional[int] = None
+    cached_tokens: Optional[int] = None      # 입력 중 prefix 캐시에서 읽은 토큰 수
+    ttft: Optional[float] = None             # 첫 토큰까지 시간(초)
+    decode_time: Optional[float] = None      # 출력 토큰 생성 시간(초)
+    load_time: Optional[float] = None        # 모델 로드 시간(초), Ollama가 보고한 경우만
+    cost: Optional[float] = None             # 가격표로 계산한 USD 비용 (단가를 모르면 None)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class RetryPolicy:
+    """지수 백오프 + full jitter 재시도 정책.
+
+    `retry_on`에 속한 오류만 재시도하고, 서버가 Retry-After를 주면 그 값을 우선한다
+    (`max_delay`로 상한). 검증 오류도 재시도하려면 `retry_on`에 VALIDATION을 추가한다.
+    """
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+    multiplier: float = 2.0
+    jitter: bool = True
+    retry_on: FrozenSet[ErrorKind] = field(
+        default_factory=lambda: frozenset({ErrorKind.RATE_LIMIT, ErrorKind.TRANSIENT})
+    )
+
+    @classmethod
+    def from_env(cls, api_delay_seconds: float = 0) -> "RetryPolicy":
+        """환경변수(RETRY_BASE_DELAY, RETRY_MAX_DELAY, RETRY_ON_VALIDATION)로 정책 생성.
+        기본 지연은 RETRY_BASE_DELAY가 우선이고, 없으면 `api_delay_seconds`, 그것도 없으면 1초."""
+        retry_on = {ErrorKind.RATE_LIMIT, ErrorKind.TRANSIENT}
+        if os.getenv("RETRY_ON_VALIDATION", "false").lower() in ("1", "true", "yes"):
+            retry_on.add(ErrorKind.VALIDATION)
+        base_delay = os.getenv("RETRY_BASE_DELAY")
+        return cls(
+            base_delay=float(base_delay) if base_delay else float(api_delay_seconds or 1.0),
+            max_delay=float(os.getenv("RETRY_MAX_DELAY", "30.0")),
+            retry_on=frozenset(retry_on),
+        )
+
+    def should_retry(self, kind: ErrorKind) -> bool:
+        return kind in self.retry_on
+
+    def delay(self, attempt: int, exc: Optional[BaseException] = None) -> float:
+        """`attempt`(1부터)번째 실패 후 기다릴 시간"""
+        if exc is not None:
+            retry_after = retry_after_seconds(exc)
+            if retry_after is not None:
+                return min(retry_after, self.max_delay)
+        ceiling = min(self.max_delay, self.base_delay * self.multiplier ** (attempt - 1))
+        return random.uniform(0, ceiling) if self.jitter else ceiling
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import os
+import json
+import hashlib
+import threading
+import importlib.util
+from typing import Any, Dict, List, Optional, Tuple, get_args, get_origin
+
+from loguru import logger
+from pydantic import BaseModel, create_model
+
+
+SCHEMA_DIR = os.path.join(os.path.dirname(__file__), "schema")
+
+
+def _remove_optional(schema: type[BaseModel]) -> type[BaseModel]:
+    """Optional 필드를 필수 필드로 바꾼 모델 생성 (Google OpenAI 호환 엔드포인트용)"""
+    fields = {}
+    for name, field in schema.model_fields.items():
+        typ = field.annotation
+        if get_origin(typ) is not None and get_origin(typ).__name__ == "Union":
+            args = [a for a in get_args(typ) if a is not type(None)]
+            if args:
+                typ = args[0]
+        fields[name] = (typ, ...)
+    return create_model(
+        schema.__name__ + "Required",
+        **fields,
+        __base__=schema.__base__
+    )
+
+
+def _sub_model(schema: type[BaseModel], field_names: List[str]) -> type[BaseModel]:
+    """최상위 필드 일부만 가진 하위 모델 생성 (필드 정의/설명은 그대로 유지)"""
+    missing = [name for name in field_names if name not in schema.model_fields]
+    if missing:
+        raise ValueError(f"{schema.__name__}에 없는 필드: {missing}")
+    fields = {name: (schema.model_fields[name].annotation, schema.model_fields[name]) for name in field_names}
+    return create_model(
+        f"{schema.__name__}_{'_'.join(field_names)}"[:64],
+        __doc__=schema.__doc__,
+        **fields,
+    )
+
+
+class SchemaRegistry:
+    """스키마 파일에서 로드한 ExtractInfo 클래스와 파생 스키마를 캐싱하는 레지스트리.
+
+    로드된 클래스는 (path, mtime, sha256) 키로 캐싱되어 파일이 바뀌지 않는 한
+    모듈을 다시 실행하지 않는다. 같은 클래스 객체가 계속 재사용되므로 JSON 스키마,
+    Anthropic tool 스키마, Google용 required 변형, LangChain format instructions도
+    클래스별로 한 번만 생성된다. 반환된 dict는 공유 객체이므로 수정하지 않는다.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._models: Dict[Tuple[str, int, str], type[BaseModel]] = {}
+        self._latest: Dict[str, Tuple[str, int, str]] = {}
+        self._derived: Dict[Tuple[Any, str], Any] = {}
+
+    @staticmethod
+    def resolve(schema_name: str) -> Tuple[str, str]:
+        """스키마 이름 또는 파일 경로를 (file_path, module_name)으로 변환"""
+        if schema_name.endswith('.py') or '/' in schema_name or '\\' in schema_name:
+            file_path = os.path.realpath(schema_name)
+            module_name = os.path.splitext(os.path.basename(file_path))[0]
+        else:
+            file_path = os.path.realpath(os.path.join(SCHEMA_DIR, f"{schema_name}.py"))
+            module_name = schema_name
+        return file_path, module_name
+
+    def load(self, schema_name: str) -> type[BaseModel]:
+        """스키마 파일의 ExtractInfo 클래스를 반환 (파일 변경 시에만 다시 로드)"""
+        file_path, module_name = self.resolve(schema_name)
+        with open(file_path, "rb") as f:
+            source = f.read()
+        key = (file_path, os.stat(file_path).st_mtime_ns, hashlib.sha256(source).hexdigest())
+
+        with self._lock:
+            model = self._models.get(key)
+            if model is not None:
+                return model
+
+            spec = importlib.util.spec_from_file_location(module_name, file_path)
+            mod = importlib.util.module_from_spec(spec)
+            assert spec and spec.loader
+            spec.loader.exec_module(mod)  # type: ignore[attr-defined]
+            model = getattr(mod, 'ExtractInfo')
+
+            # 같은 파일의 이전 버전은 버린다
+            stale = self._latest.get(file_path)
+            if stale is not None:
+                old = self._models.pop(stale, None)
+                self._derived = {k: v for k, v in self._derived.items() if k[0] is not old}
+            self._models[key] = model
+            self._latest[file_path] = key
+            logger.debug(f"스키마 로드: {file_path}")
+            return model
+
+    def _derive(self, model: Any, kind: str, builder) -> Any:
+        with self._lock:
+            cache_key = (model, kind)
+            if cache_key not in self._derived:
+                self._derived[cache_key] = builder(model)
+            return self._derived[cache_key]
+
+    def json_schema(self, model: type[BaseModel]) -> dict:
+        return self._derive(model, "json_schema", lambda m: m.model_json_schema())
+
+    def digest(self, model: type[BaseModel]) -> str:
+        """JSON 스키마의 sha256 (캐시 키 등에 사용)"""
+        return self._derive(
+            model, "digest",
+            lambda m: hashlib.sha256(
+                json.dumps(self.json_schema(m), sort_keys=True, ensure_ascii=False).encode("utf-8")
+            ).hexdigest(),
+        )
+
+    def anthropic_tool(self, model: type[BaseModel]) -> dict:
+        return self._derive(model, "anthropic_tool", lambda m: {
+            "name": "extract_info",
+            "description": "Extract structured information from the given text using well-defined JSON schema.",
+            "input_schema": self.json_schema(m),
+        })
+
+    def required_variant(self, model: type[BaseModel]) -> type[BaseModel]:
+        return self._derive(model, "required_variant", _remove_optional)
+
+    def field_groups(self, model: type[BaseModel], groups: Optional[List[List[str]]] = None) -> List[Tuple[List[str], type[BaseModel]]]:
+        """최상위 필드를 그룹별 하위 모델로 나눈다. `groups`가 없으면 필드마다 하나의 그룹.
+        그룹에 포함되지 않은 필드는 마지막 그룹 하나로 묶는다."""
+        def _build(m):
+            requested = [list(group) for group in groups] if groups else [[name] for name in m.model_fields]
+            grouped = {name for group in requested for name in group}
+            rest = [name for name in m.model_fields if name not in grouped]
+            if rest:
+                requested.append(rest)
+            return [(group, _sub_model(m, group)) for group in requested if group]
+        return self._derive(model, f"field_groups:{json.dumps(groups)}", _build)
+
+    def format_instructions(self, model: type[BaseModel]) -> str:
+        def _build(m):
+            from langchain_core.output_parsers import PydanticOutputParser
+            return PydanticOutputParser(pydantic_object=m).get_format_instructions()
+        return self._derive(model, "format_instructions", _build)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._models.clear()
+            self._latest.clear()
+            self._derived.clear()
+
+
+schema_registry = SchemaRegistry()
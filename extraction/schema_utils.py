@@ -0,0 +1,34 @@
+"""스키마 어노테이션과 추출 값 비교에 쓰는 공용 도우미 (분할 병합, self-consistency 투표, cascade 검사)."""
+from __future__ import annotations
+
+from typing import Any, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+
+def unwrap_optional(annotation: Any) -> Any:
+    """`Optional[X]` → `X`"""
+    if get_origin(annotation) is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def is_model(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+
+def is_empty(value: Any) -> bool:
+    return value is None or value == "" or value == [] or value == {}
+
+
+def compact(value: Any) -> Any:
+    """비교용: 빈 값을 제거한 표현"""
+    if isinstance(value, dict):
+        return {k: compact(v) for k, v in value.items() if not is_empty(v)}
+    if isinstance(value, list):
+        return [compact(v) for v in value if not is_empty(v)]
+    if isinstance(value, str):
+        return value.strip()
+    return value
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, Iterator, List, Optional
+
+
+@dataclass
+class RunStats:
+    """한 번의 추출 요청 동안 수집되는 실행 통계.
+
+    core에서 `collect_stats()`로 열고, 프레임워크/데코레이터 쪽에서는
+    `current_stats()`로 꺼내 기록한다. contextvar 기반이라 asyncio 태스크와
+    `asyncio.to_thread` 워커에서도 요청별로 분리된다.
+    """
+    cache_hit: bool = False
+    rate_limit_wait: float = 0.0  # rate limiter에서 대기한 총 시간(초)
+    hedge_fired: int = 0  # 헤지 요청을 보낸 횟수
+    hedge_won: int = 0    # 헤지 요청이 원 요청보다 먼저 성공한 횟수
+    chunks: int = 1       # 분할 추출 시 청크 수
+    field_groups: int = 0  # 필드 그룹 병렬 추출 시 그룹 수
+    failed_groups: List[str] = field(default_factory=list)  # 재시도 후에도 실패한 필드 그룹
+    ttff: Optional[float] = None  # 스트리밍 시 첫 필드가 채워지기까지 걸린 시간(초)
+    ttft: Optional[float] = None  # 스트리밍 시 첫 토큰까지 걸린 시간(초)
+    stream_complete: bool = False  # 스트리밍 시 최상위 JSON 값이 닫힐 때까지 받았는지 (중간에 끊기면 False)
+    attempts: List[Dict[str, Any]] = field(default_factory=list)  # 시도별 기록 (AttemptRecord.to_dict)
+    samples: int = 0      # self-consistency 시 투표에 쓴 샘플 수
+    agreement: Dict[str, float] = field(default_factory=dict)  # self-consistency 필드 경로별 합의도 (0~1)
+    cascade: List[Dict[str, Any]] = field(default_factory=list)  # cascade 단계별 기록 (모델, 지연시간, 통과 여부, 실패 이유)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    def consistency(self) -> Dict[str, Any]:
+        """self-consistency 요약: 샘플 수, 필드별 합의도, 필드 평균 합의도"""
+        agreement = self.agreement
+        return {
+            "samples": self.samples,
+            "agreement": dict(agreement),
+            "consistency": sum(agreement.values()) / len(agreement) if agreement else None,
+        }
+
+    def performance(self) -> Dict[str, Any]:
+        """시도 기록을 요약한 성능 지표.
+
+        - prompt_tokens / completion_tokens: 모든 시도(청크·필드 그룹 포함)의 합
+        - cached_tokens: 입력 중 provider prefix 캐시에서 읽은 토큰 합 (보고하는 provider만)
+        - ttft: 스트리밍 첫 토큰 시간, 없으면 provider가 보고한 prefill 시간 중 최솟값
+        - decode_tps: 출력 토큰 / 생성 시간. 생성 시간을 모르면 HTTP 호출 시간에서 ttft를 뺀 값
+        - load_time: provider가 모델을 메모리에 올리느라 쓴 시간 합 (Ollama만, ttft와 별도)
+        - cost: 가격표로 계산한 USD 비용 합 (단가를 아는 시도만)
+        - retries: 첫 시도가 아닌 시도 수
+        - overhead: 시도 시간 중 HTTP 호출 밖에서 쓴 시간(파싱·검증·클라이언트 처리)의 합
+        """
+        attempts = self.attempts
+
+        def _sum(key: str) -> Optional[float]:
+            values = [a[key] for a in attempts if a.get(key) is not None]
+            return sum(values) if values else None
+
+        ttfts = [a["ttft"] for a in attempts if a.get("ttft") is not None]
+        ttft = self.ttft if self.ttft is not None else (min(ttfts) if ttfts else None)
+
+        decoded, decode_time = 0, 0.0
+        for a in attempts:
+            if not a.get("completion_tokens"):
+                continue
+            elapsed = a.get("decode_time")
+            if elapsed is None:
+                elapsed = (a.get("api_time") or a["latency"]) - (a.get("ttft") or 0.0) - (a.get("load_time") or 0.0)
+            if elapsed > 0:
+                decoded += a["completion_tokens"]
+                decode_time += elapsed
+
+        overheads = [a["latency"] - a["api_time"] for a in attempts if a.get("api_time") is not None]
+        return {
+            "prompt_tokens": _sum("prompt_tokens"),
+            "completion_tokens": _sum("completion_tokens"),
+            "cached_tokens": _sum("cached_tokens"),
+            "ttft": ttft,
+            "decode_tps": decoded / decode_time if decode_time else None,
+            "load_time": _sum("load_time"),
+            "cost": _sum("cost"),
+            "retries": sum(1 for a in attempts if a["attempt"] > 1),
+            "overhead": max(sum(overheads), 0.0) if overheads else None,
+        }
+
+
+_current_stats: ContextVar[Optional[RunStats]] = ContextVar("extraction_run_stats", default=None)
+
+
+def current_stats() -> Optional[RunStats]:
+    return _current_stats.get()
+
+
+@contextmanager
+def collect_stats() -> Iterator[RunStats]:
+    stats = RunStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import json
+import time
+from typing import Any, AsyncIterator, Iterable, Iterator, List, Optional
+
+from loguru import logger
+from pydantic import BaseModel, ValidationError
+
+from structured_output_kit.extraction.stats import RunStats, current_stats
+
+
+_CLOSERS = {"{": "}", "[": "]"}
+
+
+class PartialJSONParser:
+    """조각난 JSON 텍스트를 받아 현재까지의 내용을 유효한 JSON으로 닫아 파싱한다.
+
+    새로 들어온 문자만 한 번씩 스캔하며 (O(n)), 마지막으로 "닫으면 유효한" 위치와
+    그때의 괄호 스택을 기억한다. 값 문자열이 열려 있으면 따옴표를 닫아 부분 문자열도
+    포함하고, 완성되지 않은 키/숫자/리터럴은 잘라낸다. 코드 펜스 등 JSON 앞의 텍스트는
+    첫 `{` 또는 `[`까지 건너뛴다.
+    """
+
+    def __init__(self) -> None:
+        self.buffer = ""
+        self._pos = 0
+        self._start: Optional[int] = None
+        self._stack: List[str] = []
+        self._in_string = False
+        self._is_key = False
+        self._escape = 0          # 남은 escape 문자 수 (\uXXXX 처리)
+        self._expect_key = False
+        self._in_scalar = False
+        self._safe_len = 0
+        self._safe_stack: tuple = ()
+        self._string_safe = 0
+        self._done = False
+
+    def _mark_safe(self, end: int) -> None:
+        self._safe_len = end
+        self._safe_stack = tuple(self._stack)
+
+    def _scan(self) -> None:
+        buf = self.buffer
+        for i in range(self._pos, len(buf)):
+            ch = buf[i]
+            if self._done:
+                break
+            if self._start is None:
+                if ch in "{[":
+                    self._start = i
+                else:
+                    continue
+            if self._in_string:
+                if self._escape:
+                    unicode_escape = self._escape > 0
+                    self._escape = 4 if (self._escape == -1 and ch == "u") else max(self._escape - 1, 0)
+                    # 서로게이트 쌍의 앞 절반(\ud800-\udbff)만으로는 문자가 되지 않으므로 뒤 절반까지 기다린다
+                    if self._escape == 0 and not (unicode_escape and "d800" <= buf[i - 3:i + 1].lower() <= "dbff"):
+                        self._string_safe = i + 1
+                    continue
+                if ch == "\\":
+                    self._escape = -1
+                    continue
+                if ch == '"':
+                    self._in_string = False
+                    if not self._is_key:
+                        self._mark_safe(i + 1)
+                    continue
+                self._string_safe = i + 1
+                continue
+            if self._in_scalar:
+                if ch not in ",}] \t\r\n":
+                    continue
+                self._in_scalar = False
+                self._mark_safe(i)
+            if ch in " \t\r\n":
+                continue
+            if ch in "{[":
+                self._stack.append(ch)
+                self._expect_key = ch == "{"
+                self._mark_safe(i + 1)
+            elif ch in "}]":
+                if self._stack:
+                    self._stack.pop()
+                self._expect_key = False
+                self._mark_safe(i + 1)
+                if not self._stack:
+                    self._done = True
+            elif ch == '"':
+                self._in_string = True
+                self._is_key = bool(self._stack) and self._stack[-1] == "{" and self._expect_key
+                self._string_safe = i + 1
+            elif ch == ":":
+                self._expect_key = False
+            elif ch == ",":
+                self._expect_key = bool(self._stack) and self._stack[-1] == "{"
+            else:
+                self._in_scalar = True
+        self._pos = len(buf)
+
+    @staticmethod
+    def _close(stack) -> str:
+        return "".join(_CLOSERS[c] for c in reversed(stack))
+
+    def _candidates(self) -> Iterator[str]:
+        start = self._start or 0
+        if self._in_string and not self._is_key:
+            yield self.buffer[start:self._string_safe] + '"' + self._close(self._stack)
+        # 숫자/리터럴은 끝나기 전까지 값이 확정되지 않으므로(1 → 19 → 1995) 직전 안전 위치까지만 쓴다
+        yield self.buffer[start:self._safe_len] + self._close(self._safe_stack)
+
+    def feed(self, text: str) -> Optional[Any]:
+        """텍스트 조각을 추가하고 현재까지 파싱 가능한 값을 반환 (없으면 None)"""
+        self.buffer += text
+        self._scan()
+        return self.current()
+
+    def current(self) -> Optional[Any]:
+        if self._start is None:
+            return None
+        for candidate in self._candidates():
+            try:
+                return json.loads(candidate)
+            except json.JSONDecodeError:
+                continue
+        return None
+
+
+def _is_filled(value: Any) -> bool:
+    if isinstance(value, dict):
+        return any(_is_filled(v) for v in value.values())
+    if isinstance(value, list):
+        return any(_is_filled(v) for v in value)
+    return value not in (None, "")
+
+
+def _validate(response_model: Any, partial: Any) -> Optional[Any]:
+    """부분 결과를 스키마로 검증. 아직 검증되지 않는 상태면 None."""
+    if not isinstance(partial, dict):
+        return None
+    if hasattr(response_model, "model_validate"):
+        try:
+            return response_model.model_validate(partial)
+        except ValidationError:
+            return None
+    return partial
+
+
+class _Progress:
+    """중복 제거 및 time-to-first-token(TTFT)/time-to-first-field(TTFF) 기록"""
+
+    def __init__(self, label: str, stats: Optional[RunStats] = None) -> None:
+        self.label = label
+        self.stats = stats if stats is not None else current_stats()
+        self.started_at = time.perf_counter()
+        self.first_token_at: Optional[float] = None
+        self.first_field_at: Optional[float] = None
+        self.last: Optional[str] = None
+        self.count = 0
+
+    def token(self) -> None:
+        if self.first_token_at is None:
+            self.first_token_at = time.perf_counter() - self.started_at
+            if self.stats is not None:
+                self.stats.ttft = self.first_token_at
+
+    def accept(self, value: Any) -> bool:
+        dumped = value.model_dump(exclude_none=True) if isinstance(value, BaseModel) else value
+        key = json.dumps(dumped, ensure_ascii=False, sort_keys=True, default=str)
+        if key == self.last:
+            return False
+        self.last = key
+        self.count += 1
+        if self.first_field_at is None and _is_filled(dumped):
+            self.first_field_at = time.perf_counter() - self.started_at
+            if self.stats is not None:
+                self.stats.ttff = self.first_field_at
+            logger.info(f"{self.label} 첫 필드까지 {self.first_field_at:.2f}초")
+        return True
+
+    def finish(self, complete: bool = True) -> None:
+        if self.stats is not None:
+            self.stats.stream_complete = complete
+        if not complete:
+            logger.warning(f"{self.label} 스트림이 JSON이 닫히기 전에 끝났습니다 (max_tokens 또는 연결 끊김)")
+        logger.info(f"{self.label} 스트리밍 완료: 부분 결과 {self.count}개, 총 {time.perf_counter() - self.started_at:.2f}초")
+
+
+def stream_partials(deltas: Iterable[str], response_model: Any, label: str = "stream", stats: Optional[RunStats] = None) -> Iterator[Any]:
+    """텍스트 조각 스트림을 검증된 부분 결과 스트림으로 변환"""
+    parser = PartialJSONParser()
+    progress = _Progress(label, stats)
+    for delta in deltas:
+        if not delta:
+            continue
+        progress.token()
+        value = _validate(response_model, parser.feed(delta))
+        if value is not None and progress.accept(value):
+            yield value
+    progress.finish(parser._done)
+
+
+async def astream_partials(deltas: AsyncIterator[str], response_model: Any, label: str = "stream", stats: Optional[RunStats] = None) -> AsyncIterator[Any]:
+    """`stream_partials`의 비동기 버전"""
+    parser = PartialJSONParser()
+    progress = _Progress(label, stats)
+    async for delta in deltas:
+        if not delta:
+            continue
+        progress.token()
+        value = _validate(response_model, parser.feed(delta))
+        if value is not None and progress.accept(value):
+            yield value
+    progress.finish(parser._done)
+
+
+def stream_models(partials: Iterable[Any], response_model: Any, label: str = "stream", stats: Optional[RunStats] = None) -> Iterator[Any]:
+    """이미 객체로 오는 부분 결과(instructor `create_partial`)를 같은 형식으로 변환.
+    원문 JSON을 볼 수 없으므로 스트림이 예외 없이 끝나면 완료로 본다."""
+    progress = _Progress(label, stats)
+    for partial in partials:
+        progress.token()
+        data = partial.model_dump(exclude_none=True) if isinstance(partial, BaseModel) else partial
+        value = _validate(response_model, data)
+        if value is not None and progress.accept(value):
+            yield value
+    progress.finish()
+
+
+async def astream_models(partials: AsyncIterator[Any], response_model: Any, label: str = "stream", stats: Optional[RunStats] = None) -> AsyncIterator[Any]:
+    """`stream_models`의 비동기 버전"""
+    progress = _Progress(label, stats)
+    async for partial in partials:
+        progress.token()
+        data = partial.model_dump(exclude_none=True) if isinstance(partial, BaseModel) else partial
+        value = _validate(response_model, data)
+        if value is not None and progress.accept(value):
+            yield value
+    progress.finish()
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import time
+from functools import lru_cache
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Iterator, Optional
+
+from structured_output_kit.extraction.retry import AttemptRecord
+
+
+@dataclass
+class Usage:
+    """한 번의 LLM 호출에서 provider가 보고한 토큰 사용량/시간"""
+    prompt_tokens: Optional[int] = None
+    completion_tokens: Optional[int] = None
+    ttft: Optional[float] = None         # 첫 토큰까지 시간(초), provider가 알려주는 경우만
+    decode_time: Optional[float] = None  # 출력 토큰 생성 시간(초), provider가 알려주는 경우만
+    cached_tokens: Optional[int] = None  # 입력 중 prefix 캐시에서 읽은 토큰 수 (prompt_tokens에 포함)
+    load_time: Optional[float] = None    # 모델을 메모리에 올리는 데 쓴 시간(초), Ollama만. ttft에는 포함하지 않는다
+
+
+def _get(obj: Any, *names: str) -> Any:
+    for name in names:
+        value = obj.get(name) if isinstance(obj, dict) else getattr(obj, name, None)
+        if value is not None:
+            return value
+    return None
+
+
+def extract_usage(response: Any) -> Optional[Usage]:
+    """SDK별 응답 객체에서 토큰 사용량을 꺼낸다. 알 수 없는 형식이면 None.
+
+    - OpenAI: `usage.prompt_tokens/completion_tokens` (+ `prompt_tokens_details.cached_tokens`)
+    - Anthropic: `usage.input_tokens/output_tokens` (+ `cache_read_input_tokens/cache_creation_input_tokens`,
+      prompt_tokens는 캐시 읽기/쓰기를 포함한 전체 입력)
+    - Ollama: `prompt_eval_count/eval_count` (+ 나노초 단위 `prompt_eval_duration/eval_duration`,
+      모델 로드 시간 `load_duration`은 ttft와 따로)
+    - Google: `usage_metadata.prompt_token_count/candidates_token_count` (+ `cached_content_token_count`)
+    - LangChain AIMessage: `usage_metadata.input_tokens/output_tokens` (+ `input_token_details.cache_read`)
+    - instructor 결과 모델: `_raw_response`의 사용량
+    """
+    if response is None:
+        return None
+    raw = getattr(response, "_raw_response", None)
+    if raw is not None:
+        return extract_usage(raw)
+
+    eval_count = _get(response, "eval_count")
+    if eval_count is not None:
+        prefill = _get(response, "prompt_eval_duration")
+        decode = _get(response, "eval_duration")
+        load = _get(response, "load_duration")
+        return Usage(
+            prompt_tokens=_get(response, "prompt_eval_count"),
+            completion_tokens=eval_count,
+            ttft=prefill / 1e9 if prefill else None,
+            decode_time=decode / 1e9 if decode else None,
+            load_time=load / 1e9 if load is not None else None,
+        )
+
+    usage = _get(response, "usage", "usage_metadata")
+    if usage is None:
+        return None
+    prompt = _get(usage, "prompt_tokens", "input_tokens", "prompt_token_count")
+    completion = _get(usage, "completion_tokens", "output_tokens", "candidates_token_count")
+    if prompt is None and completion is None:
+        return None
+    cached = _get(usage, "cache_read_input_tokens")
+    if cached is not None or _get(usage, "cache_creation_input_tokens") is not None:
+        # Anthropic input_tokens는 캐시 읽기/쓰기 토큰을 빼고 보고한다
+        prompt = (prompt or 0) + (cached or 0) + (_get(usage, "cache_creation_input_tokens") or 0)
+    else:
+        details = _get(usage, "prompt_tokens_details", "input_token_details")
+        cached = _get(details, "cached_tokens", "cache_read") if details is not None else _get(usage, "cached_content_token_count")
+    return Usage(prompt_tokens=prompt, completion_tokens=completion, cached_tokens=cached)
+
+
+# experiment 데코레이터가 현재 시도의 AttemptRecord를 열어 두면 프레임워크 쪽에서
+# `api_call()`/`record_usage()`로 HTTP 호출 시간과 사용량을 채운다.
+_current_attempt: ContextVar[Optional[AttemptRecord]] = ContextVar("extraction_attempt", default=None)
+
+
+@contextmanager
+def attempt_scope(record: AttemptRecord) -> Iterator[AttemptRecord]:
+    token = _current_attempt.set(record)
+    try:
+        yield record
+    finally:
+        _current_attempt.reset(token)
+
+
+@contextmanager
+def api_call() -> Iterator[None]:
+    """감싼 구간을 현재 시도의 HTTP 호출 시간(`api_time`)으로 누적한다."""
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        record = _current_attempt.get()
+        if record is not None:
+            record.api_time = (record.api_time or 0.0) + time.perf_counter() - started_at
+
+
+def record_usage(response: Any) -> Any:
+    """응답의 토큰 사용량을 현재 시도에 기록하고 응답을 그대로 반환한다."""
+    record = _current_attempt.get()
+    usage = extract_usage(response) if record is not None else None
+    if usage is not None:
+        record.prompt_tokens = (record.prompt_tokens or 0) + (usage.prompt_tokens or 0)
+        record.completion_tokens = (record.completion_tokens or 0) + (usage.completion_tokens or 0)
+        if usage.cached_tokens is not None:
+            record.cached_tokens = (record.cached_tokens or 0) + usage.cached_tokens
+        if usage.load_time is not None:
+            record.load_time = (record.load_time or 0.0) + usage.load_time
+        record.ttft = usage.ttft if usage.ttft is not None else record.ttft
+        record.decode_time = usage.decode_time if usage.decode_time is not None else record.decode_time
+    return response
+
+
+@lru_cache(maxsize=1)
+def langchain_usage_callback() -> Any:
+    """LangChain 체인 호출(`config={"callbacks": [...]}`)에 넘기는 콜백.
+    구조화 출력 체인은 파싱된 결과만 돌려주므로, LLM 호출이 끝날 때 AIMessage의 사용량을 현재 시도에 기록한다."""
+    from langchain_core.callbacks import BaseCallbackHandler
+
+    class UsageCallbackHandler(BaseCallbackHandler):
+        run_inline = True
+
+        def on_llm_end(self, response: Any, **kwargs: Any) -> None:
+            for generations in response.generations:
+                for generation in generations:
+                    record_usage(getattr(generation, "message", None))
+
+    return UsageCallbackHandler()
@@ -1,8 +1,7 @@
 from __future__ import annotations
 
 import os
-import importlib.util
-from typing import Optional, Any
+from typing import Optional, Any, Dict, List
 from enum import Enum
 from dataclasses import asdict, is_dataclass
 from pydantic import BaseModel
@@ -11,6 +10,8 @@ import yaml
 import pandas as pd
 from importlib import resources
 
+from structured_output_kit.extraction.schema_registry import schema_registry
+
 
 def load_prompt() -> str:
     """Load extraction prompt with canonical path and fallbacks.
@@ -64,22 +65,11 @@ def get_compatible_frameworks(provider: str):
 
 
 def convert_schema(schema_name: str):
-    """Dynamically import ExtractInfo class from a schema file.
+    """Return the ExtractInfo class from a schema file (cached by path/mtime/hash).
 
     Accepts either a bare schema name or a file path ending with .py
     """
-    if schema_name.endswith('.py') or '/' in schema_name or '\\' in schema_name:
-        file_path = schema_name
-        module_name = os.path.splitext(os.path.basename(file_path))[0]
-    else:
-        file_path = os.path.join(os.path.dirname(__file__), 'schema', f'{schema_name}.py')
-        file_path = os.path.abspath(file_path)
-        module_name = schema_name
-    spec = importlib.util.spec_from_file_location(module_name, file_path)
-    mod = importlib.util.module_from_spec(spec)
-    assert spec and spec.loader
-    spec.loader.exec_module(mod)  # type: ignore[attr-defined]
-    return getattr(mod, 'ExtractInfo')
+    return schema_registry.load(schema_name)
 
 
 def record_extraction(
@@ -94,9 +84,37 @@ def record_extraction(
     csv_path: str = "result/extraction_result.csv",
     result_json_path: Optional[str] = None,
     save: Optional[bool] = False,
+    cache_hit: bool = False,
+    performance: Optional[Dict[str, Any]] = None,
 ):
-    """Append a single extraction run record to CSV (creates file/dir if missing)."""
-    record = {
+    """Append a single extraction run record to CSV (creates file/dir if missing).
+
+    `performance` is `RunStats.performance()` (tokens, TTFT, decode tok/s, retries, overhead).
+    """
+    record = extraction_record(
+        log_filename, provider, model, prompt, framework, success, latency, langfuse_url,
+        result_json_path=result_json_path, save=save, cache_hit=cache_hit, performance=performance,
+    )
+    if save:
+        save_extraction_records([record], csv_path)
+
+
+def extraction_record(
+    log_filename: str,
+    provider: str,
+    model: str,
+    prompt: str,
+    framework: str,
+    success: bool,
+    latency: float | int | None,
+    langfuse_url: str | None,
+    result_json_path: Optional[str] = None,
+    save: Optional[bool] = False,
+    cache_hit: bool = False,
+    performance: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Build one CSV row for `record_extraction` / `save_extraction_records`."""
+    return {
         "log_filename": log_filename,
         "provider": provider,
         "model": model,
@@ -107,16 +125,21 @@ def record_extraction(
         "langfuse_url": langfuse_url,
         "result_json_path": result_json_path,
         "save": save,
+        "cache_hit": cache_hit,
+        **(performance or {}),
     }
-    if save:
-        if os.path.isfile(csv_path):
-            import pandas as pd  # local import in case optional
-            df = pd.read_csv(csv_path)
-            df = pd.concat([df, pd.DataFrame([record])], ignore_index=True)
-        else:
-            os.makedirs(os.path.dirname(csv_path), exist_ok=True)
-            df = pd.DataFrame([record])
-        df.to_csv(csv_path, index=False)
+
+
+def save_extraction_records(records: List[Dict[str, Any]], csv_path: str = "result/extraction_result.csv") -> None:
+    """Append several rows at once (the file is read and rewritten once, columns are merged)."""
+    if not records:
+        return
+    df = pd.DataFrame(records)
+    if os.path.isfile(csv_path):
+        df = pd.concat([pd.read_csv(csv_path), df], ignore_index=True)
+    else:
+        os.makedirs(os.path.dirname(csv_path) or ".", exist_ok=True)
+    df.to_csv(csv_path, index=False)
 
 
 def response_parsing(response: Any) -> Any:
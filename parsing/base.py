@@ -5,11 +5,12 @@ import time
 import traceback
 from tqdm import tqdm
 from loguru import logger
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
 from abc import ABC, abstractmethod
 
 
 from structured_output_kit.utils.types import HostInfo
+from structured_output_kit.utils.accounting import UsageMeter
 
 
 def parsing_experiment(
@@ -57,6 +58,10 @@ class ParsingFramework(ABC):
         self.extra_kwargs = extra_kwargs or {}
         self.host_info = host_info
         self.prompt = prompt
+        # VLM처럼 provider를 호출하는 프레임워크가 페이지별 토큰/비용을 더한다
+        self.usage = UsageMeter()
+        # VLM처럼 페이지별로 처리하는 프레임워크에서 실패해 결과에서 빠진 페이지 번호 (1부터)
+        self.failed_pages: List[int] = []
         
         # 파일 존재 여부 확인
         if not os.path.exists(file_path):
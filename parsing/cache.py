@@ -0,0 +1,108 @@
+"""파일 내용 해시를 키로 하는 파싱 결과 캐시.
+
+Docling(EasyOCR), VLM 파싱은 파이프라인에서 가장 느린 단계인데, 같은 파일을 같은 설정으로 다시 파싱해도
+결과는 같다. (파일 바이트 sha256, 프레임워크, 정규화한 extra_kwargs, 호스트 모델, 프롬프트)를 키로
+마크다운과 메타데이터(원래 파싱 시간, VLM 토큰/비용 등)를 SQLite에 저장하고, 용량(PARSE_CACHE_MAX_MB)을
+넘으면 가장 오래 전에 쓴 항목부터 지운다(LRU). 파일 경로/이름은 키에 넣지 않으므로 서버에 업로드된
+임시 파일도 같은 내용이면 적중한다.
+"""
+from __future__ import annotations
+
+import os
+import json
+import time
+import hashlib
+import threading
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+from structured_output_kit.utils.cache import SqliteCache
+
+# 결과에 영향을 주지 않는 전송 설정은 키에서 뺀다
+_TRANSPORT_KWARGS = frozenset({"timeout", "request_timeout", "max_retries"})
+# 키 구성이 바뀌면 올려서 이전 항목을 무효화한다
+_KEY_VERSION = 1
+
+
+def file_digest(file_path: str, block_size: int = 1 << 20) -> str:
+    """파일 바이트의 sha256"""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def normalize_kwargs(extra_kwargs: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """키 비교용 extra_kwargs: None 값과 전송 설정을 빼고 키 순서를 무시한다"""
+    return {
+        key: value
+        for key, value in sorted((extra_kwargs or {}).items())
+        if value is not None and key not in _TRANSPORT_KWARGS
+    }
+
+
+class ParseCache:
+    """파싱 결과 캐시. `get_parse_cache()`로 프로세스 공용 인스턴스를 쓴다."""
+
+    def __init__(self, path: str, ttl_seconds: Optional[float] = None, max_bytes: Optional[int] = None):
+        self.store = SqliteCache(path, ttl_seconds=ttl_seconds, max_bytes=max_bytes)
+
+    @staticmethod
+    def make_key(
+        digest: str,
+        file_path: str,
+        framework: str,
+        extra_kwargs: Optional[Dict[str, Any]] = None,
+        host_info: Any = None,
+        prompt: Optional[str] = None,
+    ) -> str:
+        material = json.dumps(
+            {
+                "version": _KEY_VERSION,
+                "sha256": digest,
+                # 확장자로 파서를 고르는 프레임워크가 있어 내용과 함께 넣는다
+                "extension": os.path.splitext(file_path)[1].lower(),
+                "framework": framework,
+                "extra_kwargs": normalize_kwargs(extra_kwargs),
+                "provider": getattr(host_info, "provider", None),
+                "model": getattr(host_info, "model", None),
+                "prompt": prompt,
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """{"content": 마크다운, "metadata": {...}} 또는 None"""
+        return self.store.get(key)
+
+    def put(self, key: str, content: str, metadata: Dict[str, Any]) -> None:
+        self.store.set(key, {"content": content, "metadata": dict(metadata, cached_at=time.time())})
+
+    def stats(self) -> Dict[str, Any]:
+        return self.store.stats()
+
+
+_parse_cache: Optional[ParseCache] = None
+_parse_cache_lock = threading.Lock()
+
+
+def get_parse_cache() -> ParseCache:
+    """프로세스 공용 파싱 캐시 (경로/TTL/용량은 환경변수로 설정)"""
+    global _parse_cache
+    with _parse_cache_lock:
+        if _parse_cache is None:
+            path = os.getenv("PARSE_CACHE_PATH", os.path.join("result", ".cache", "parses.sqlite"))
+            ttl = float(os.getenv("PARSE_CACHE_TTL_SECONDS", "0"))
+            max_mb = float(os.getenv("PARSE_CACHE_MAX_MB", "1024"))
+            _parse_cache = ParseCache(
+                path,
+                ttl_seconds=ttl if ttl > 0 else None,
+                max_bytes=int(max_mb * 1024 * 1024) if max_mb > 0 else None,
+            )
+            logger.debug(f"파싱 캐시 사용: {path}")
+        return _parse_cache
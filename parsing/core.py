@@ -11,9 +11,72 @@ from typing import Optional
 
 from structured_output_kit.utils.types import ParsingRequest, ParsingResult
 from structured_output_kit.utils.logging import setup_logger
+from structured_output_kit.utils.cache import CacheMode
 
 from structured_output_kit.parsing.factory import factory
 from structured_output_kit.parsing.utils import save_parsing_result, record_parsing, get_file_info
+from structured_output_kit.parsing.cache import ParseCache, file_digest, get_parse_cache
+
+
+def _usage_fields(usage: dict) -> dict:
+    """provider를 호출한 경우(VLM)만 토큰/비용 필드를 채운다"""
+    if not usage["requests"]:
+        return {}
+    return {
+        "prompt_tokens": usage["prompt_tokens"],
+        "completion_tokens": usage["completion_tokens"],
+        "cost": usage["cost"],
+    }
+
+def _cache_key(req: ParsingRequest, mode: CacheMode) -> Optional[str]:
+    """파싱 캐시 키 (캐시를 쓰지 않거나 파일 해시 계산에 실패하면 None)"""
+    if mode is CacheMode.OFF:
+        return None
+    try:
+        digest = file_digest(req.file_path)
+    except OSError as e:
+        logger.warning(f"파싱 캐시 키 계산 실패: {e}")
+        return None
+    return ParseCache.make_key(digest, req.file_path, req.framework, req.extra_kwargs, req.host_info, req.prompt)
+
+
+def _cached_result(req: ParsingRequest, cached: dict, file_info: dict, output_dir: str) -> ParsingResult:
+    """캐시에 저장된 파싱 결과로 응답 (저장/로그 기록은 새로 파싱한 경우와 같게)"""
+    content, metadata = cached["content"], cached.get("metadata", {})
+    parse_time = metadata.get("elapsed_time")
+    original = f"{parse_time:.2f}초" if parse_time is not None else "알 수 없음"
+    logger.info(f"파싱 캐시 적중: {len(content)} 문자 (처음 파싱 시간: {original})")
+
+    result_txt_path = None
+    if req.save:
+        result_txt_path = save_parsing_result(
+            content=content,
+            file_path=req.file_path,
+            framework=req.framework,
+            output_dir=output_dir,
+            extra_kwargs=req.extra_kwargs
+        )
+
+    record_parsing(
+        file_name=file_info['file_name'],
+        framework=req.framework,
+        elapsed_time=0,
+        success=True,
+        output_dir=output_dir,
+        extra_kwargs=req.extra_kwargs,
+        cache_hit=True
+    )
+
+    return ParsingResult(
+        success=True,
+        content=content,
+        framework=req.framework,
+        file_path=req.file_path,
+        output_dir=output_dir,
+        result_txt_path=result_txt_path,
+        cache_hit=True,
+        parse_time=parse_time
+    )
 
 
 def run_parsing_core(req: ParsingRequest) -> ParsingResult:
@@ -34,6 +97,14 @@ def run_parsing_core(req: ParsingRequest) -> ParsingResult:
         
         logger.info(f"파일 정보: {file_info['file_name']} ({file_info['file_size']} bytes)")
         
+        # 같은 파일 내용·설정의 파싱 결과가 캐시에 있으면 재사용
+        cache_mode = CacheMode(req.cache_mode)
+        cache_key = _cache_key(req, cache_mode)
+        if cache_key and cache_mode.reads:
+            cached = get_parse_cache().get(cache_key)
+            if cached is not None:
+                return _cached_result(req, cached, file_info, output_dir)
+        
         # 프레임워크 인스턴스 생성
         framework_instance = factory(
             framework=req.framework,
@@ -48,6 +119,9 @@ def run_parsing_core(req: ParsingRequest) -> ParsingResult:
         start_time = datetime.now()
         
         content, success, latency = framework_instance.run(retries=1)
+        usage = _usage_fields(framework_instance.usage.to_dict())
+        if usage:
+            logger.info(f"파싱 토큰/비용: {usage}")
         
         end_time = datetime.now()
         elapsed_time = (end_time - start_time).total_seconds()
@@ -55,6 +129,17 @@ def run_parsing_core(req: ParsingRequest) -> ParsingResult:
         if success:
             logger.info(f"파싱 성공: {len(content)} 문자 추출 (소요시간: {elapsed_time:.2f}초)")
             
+            if framework_instance.failed_pages:
+                logger.warning(f"페이지 {framework_instance.failed_pages} 처리 실패: 일부 페이지가 빠진 결과라 파싱 캐시에 저장하지 않습니다")
+            elif cache_key and cache_mode.writes:
+                get_parse_cache().put(cache_key, content, {
+                    "framework": req.framework,
+                    "file_name": file_info['file_name'],
+                    "file_size": file_info['file_size'],
+                    "elapsed_time": elapsed_time,
+                    "usage": usage,
+                })
+            
             # 결과 저장
             result_txt_path = None
             if req.save:
@@ -74,7 +159,8 @@ def run_parsing_core(req: ParsingRequest) -> ParsingResult:
                 elapsed_time=elapsed_time,
                 success=True,
                 output_dir=output_dir,
-                extra_kwargs=req.extra_kwargs
+                extra_kwargs=req.extra_kwargs,
+                usage=usage
             )
             
             return ParsingResult(
@@ -83,7 +169,10 @@ def run_parsing_core(req: ParsingRequest) -> ParsingResult:
                 framework=req.framework,
                 file_path=req.file_path,
                 output_dir=output_dir,
-                result_txt_path=result_txt_path
+                result_txt_path=result_txt_path,
+                parse_time=elapsed_time,
+                failed_pages=framework_instance.failed_pages,
+                **usage
             )
         else:
             logger.error(f"파싱 실패: {content}")
@@ -95,7 +184,8 @@ def run_parsing_core(req: ParsingRequest) -> ParsingResult:
                 elapsed_time=elapsed_time,
                 success=False,
                 output_dir=output_dir,
-                extra_kwargs=req.extra_kwargs
+                extra_kwargs=req.extra_kwargs,
+                usage=usage
             )
             
             return ParsingResult(
@@ -103,7 +193,8 @@ def run_parsing_core(req: ParsingRequest) -> ParsingResult:
                 content=content,  # 오류 메시지
                 framework=req.framework,
                 file_path=req.file_path,
-                output_dir=output_dir
+                output_dir=output_dir,
+                **usage
             )
             
     except Exception as e:
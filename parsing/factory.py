@@ -2,35 +2,36 @@
 파싱 프레임워크 팩토리
 """
 
+import importlib
 from typing import Dict, Any, Optional
 from loguru import logger
 
-from .frameworks import (
-    DoclingFramework,
-    PyPDFFramework,
-    FitzFramework,
-    PDFPlumberFramework,
-    MarkItDownFramework,
-    VLMFramework
-)
-
 try:
     from utils.types import HostInfo
 except ImportError:
     from structured_output_kit.utils.types import HostInfo
 
 
-# 프레임워크 매핑
+# 프레임워크 매핑 ("모듈:클래스"). docling, fitz 등은 해당 프레임워크를 쓸 때만 import
 FRAMEWORK_MAPPING = {
-    "docling": DoclingFramework,
-    "pypdf": PyPDFFramework,
-    "fitz": FitzFramework,
-    "pdfplumber": PDFPlumberFramework,
-    "markitdown": MarkItDownFramework,
-    "vlm": VLMFramework
+    "docling": "structured_output_kit.parsing.frameworks.docling_framework:DoclingFramework",
+    "pypdf": "structured_output_kit.parsing.frameworks.pypdf_framework:PyPDFFramework",
+    "fitz": "structured_output_kit.parsing.frameworks.fitz_framework:FitzFramework",
+    "pdfplumber": "structured_output_kit.parsing.frameworks.pdfplumber_framework:PDFPlumberFramework",
+    "markitdown": "structured_output_kit.parsing.frameworks.markitdown_framework:MarkItDownFramework",
+    "vlm": "structured_output_kit.parsing.frameworks.vlm_framework:VLMFramework"
 }
 
 
+def load_framework_class(framework: str) -> type:
+    """프레임워크 클래스 로드 (처음 사용할 때 해당 모듈만 import)"""
+    if framework not in FRAMEWORK_MAPPING:
+        available_frameworks = list(FRAMEWORK_MAPPING.keys())
+        raise ValueError(f"지원하지 않는 프레임워크: {framework}. 사용 가능한 프레임워크: {available_frameworks}")
+    module_name, class_name = FRAMEWORK_MAPPING[framework].split(":", 1)
+    return getattr(importlib.import_module(module_name), class_name)
+
+
 def factory(
     framework: str,
     file_path: str,
@@ -41,11 +42,7 @@ def factory(
 ):
     """파싱 프레임워크 팩토리 함수"""
     
-    if framework not in FRAMEWORK_MAPPING:
-        available_frameworks = list(FRAMEWORK_MAPPING.keys())
-        raise ValueError(f"지원하지 않는 프레임워크: {framework}. 사용 가능한 프레임워크: {available_frameworks}")
-    
-    framework_class = FRAMEWORK_MAPPING[framework]
+    framework_class = load_framework_class(framework)
     
     logger.debug(f"Creating {framework} framework instance")
     
@@ -76,10 +73,11 @@ def get_framework_info(framework: str) -> Dict[str, Any]:
     if framework not in FRAMEWORK_MAPPING:
         raise ValueError(f"지원하지 않는 프레임워크: {framework}")
     
-    framework_class = FRAMEWORK_MAPPING[framework]
+    class_name = FRAMEWORK_MAPPING[framework].split(":", 1)[1]
     
     # 임시 인스턴스를 생성해서 정보 추출 (실제 파일 없이)
     try:
+        framework_class = load_framework_class(framework)
         # 가짜 파일 경로로 임시 인스턴스 생성
         temp_instance = framework_class.__new__(framework_class)
         temp_instance.file_path = ""
@@ -90,11 +88,11 @@ def get_framework_info(framework: str) -> Dict[str, Any]:
         return {
             "name": temp_instance.name,
             "supported_extensions": temp_instance.supported_extensions(),
-            "class_name": framework_class.__name__
+            "class_name": class_name
         }
     except Exception:
         return {
             "name": framework,
             "supported_extensions": [],
-            "class_name": framework_class.__name__
+            "class_name": class_name
         }
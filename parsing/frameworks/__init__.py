@@ -1,15 +1,26 @@
 """
 파싱 프레임워크 모음
 
-각 프레임워크별 구현체를 제공합니다.
+각 프레임워크별 구현체를 제공합니다. 구현체 모듈은 속성에 처음 접근할 때 import 됩니다.
 """
 
-from structured_output_kit.parsing.frameworks.docling_framework import DoclingFramework
-from structured_output_kit.parsing.frameworks.pypdf_framework import PyPDFFramework
-from structured_output_kit.parsing.frameworks.fitz_framework import FitzFramework
-from structured_output_kit.parsing.frameworks.pdfplumber_framework import PDFPlumberFramework
-from structured_output_kit.parsing.frameworks.markitdown_framework import MarkItDownFramework
-from structured_output_kit.parsing.frameworks.vlm_framework import VLMFramework
+import importlib
+
+_MODULES = {
+    "DoclingFramework": "docling_framework",
+    "PyPDFFramework": "pypdf_framework",
+    "FitzFramework": "fitz_framework",
+    "PDFPlumberFramework": "pdfplumber_framework",
+    "MarkItDownFramework": "markitdown_framework",
+    "VLMFramework": "vlm_framework",
+}
+
+
+def __getattr__(name):
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f"{__name__}.{_MODULES[name]}"), name)
+
 
 __all__ = [
     "DoclingFramework",
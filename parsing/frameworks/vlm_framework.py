@@ -9,6 +9,11 @@ from PIL import Image
 from pdf2image import convert_from_path
 from structured_output_kit.parsing.base import ParsingFramework
 from structured_output_kit.parsing.preprocessor import preprocess_vlm_output
+from structured_output_kit.utils.rate_limiter import rate_limiter, estimate_tokens, IMAGE_TOKEN_ESTIMATE
+from structured_output_kit.utils.ollama_host import ollama_hosts
+from structured_output_kit.utils.http_pool import http_clients
+from structured_output_kit.utils.accounting import usage_ledger
+from structured_output_kit.extraction.usage import extract_usage
 
 
 class VLMFramework(ParsingFramework):
@@ -54,9 +59,13 @@ class VLMFramework(ParsingFramework):
             
             # 결과만 추출
             page_results = [content for idx, content in results]
+            self.failed_pages = [
+                idx + 1 for idx, content in results if content.startswith(f"[페이지 {idx + 1} 처리 실패:")
+            ]
             
             # 결과 통합 (마크다운과 JSON 둘 다 반환)
-            markdown_content, json_results = self._combine_results(page_results)
+            markdown_pages, json_results = self.collect_result(page_results)
+            markdown_content = "\n\n".join(markdown_pages)
             
             # 전처리 적용 (마크다운과 JSON 둘 다 전달)
             processed_content = preprocess_vlm_output(
@@ -94,19 +103,22 @@ class VLMFramework(ParsingFramework):
             # 이미지를 base64로 인코딩
             image_base64 = self._encode_image_to_base64(image_path)
             
-            # VLM API 호출
-            if self.host_info.provider == "ollama":
-                result = self._call_ollama_vlm(image_base64, page_num)
-            elif self.host_info.provider == "openai_compatible":
-                result = self._call_openai_compatible_vlm(image_base64, page_num)
-            elif self.host_info.provider == "openai":
-                result = self._call_openai_vlm(image_base64, page_num)
-            elif self.host_info.provider == "anthropic":
-                result = self._call_anthropic_vlm(image_base64, page_num)
-            elif self.host_info.provider == "google":
-                result = self._call_google_vlm(image_base64, page_num)
-            else:
-                raise ValueError(f"지원하지 않는 VLM 호스트: {self.host_info.provider}")
+            # VLM API 호출 (provider+model 단위 rate limiter 공유)
+            limiter = rate_limiter.get(self.host_info.provider, self.host_info.model)
+            tokens = estimate_tokens(self.prompt) + IMAGE_TOKEN_ESTIMATE
+            with limiter.limit(tokens):
+                if self.host_info.provider == "ollama":
+                    result = self._call_ollama_vlm(image_base64, page_num)
+                elif self.host_info.provider == "openai_compatible":
+                    result = self._call_openai_compatible_vlm(image_base64, page_num)
+                elif self.host_info.provider == "openai":
+                    result = self._call_openai_vlm(image_base64, page_num)
+                elif self.host_info.provider == "anthropic":
+                    result = self._call_anthropic_vlm(image_base64, page_num)
+                elif self.host_info.provider == "google":
+                    result = self._call_google_vlm(image_base64, page_num)
+                else:
+                    raise ValueError(f"지원하지 않는 VLM 호스트: {self.host_info.provider}")
             
                         
             return result
@@ -115,6 +127,16 @@ class VLMFramework(ParsingFramework):
             logger.error(f"페이지 {page_num} VLM 처리 실패: {str(e)}")
             return f"[페이지 {page_num} 처리 실패: {str(e)}]"
     
+    def _record_usage(self, response: Any) -> None:
+        """페이지 응답의 토큰 사용량을 이 문서 합계와 공용 집계에 더한다"""
+        usage = extract_usage(response)
+        if usage is None:
+            return
+        usage_ledger.record(
+            "parsing", self.host_info.provider, self.host_info.model,
+            usage.prompt_tokens, usage.completion_tokens, usage.cached_tokens, meter=self.usage,
+        )
+
     def _encode_image_to_base64(self, image_path: str) -> str:
         """이미지를 base64로 인코딩"""
         import base64
@@ -124,8 +146,6 @@ class VLMFramework(ParsingFramework):
     
     def _call_ollama_vlm(self, image_base64: str, page_num: int) -> str:
         """Ollama VLM API 호출"""
-        import requests
-        
         url = f"{self.host_info.base_url}/api/generate"
         
         payload = {
@@ -134,16 +154,22 @@ class VLMFramework(ParsingFramework):
             "images": [image_base64],
             "stream": False
         }
+        # 워크플로우/서버가 고정해 둔 모델이면 요청마다 keep_alive를 갱신
+        keep_alive = ollama_hosts.keep_alive(self.host_info.base_url, self.host_info.model)
+        if keep_alive is not None:
+            payload["keep_alive"] = keep_alive
         
         # extra_kwargs에서 추가 파라미터 적용
         if self.extra_kwargs:
             payload.update(self.extra_kwargs)
         
         try:
-            response = requests.post(url, json=payload, timeout=300)
+            # 페이지마다 연결을 새로 맺지 않도록 공용 클라이언트 사용
+            response = http_clients.sync_client(url).post(url, json=payload, timeout=300)
             response.raise_for_status()
             
             result = response.json()
+            self._record_usage(result)
             content = result.get("response", "")
             
             logger.debug(f"페이지 {page_num} Ollama VLM 처리 완료")
@@ -155,8 +181,6 @@ class VLMFramework(ParsingFramework):
     
     def _call_openai_compatible_vlm(self, image_base64: str, page_num: int) -> str:
         """OpenAI Compatible VLM API 호출"""
-        import requests
-        
         url = f"{self.host_info.base_url}/chat/completions"
         
         headers = {
@@ -187,10 +211,11 @@ class VLMFramework(ParsingFramework):
             payload.update(self.extra_kwargs)
         
         try:
-            response = requests.post(url, json=payload, headers=headers, timeout=300)
+            response = http_clients.sync_client(url).post(url, json=payload, headers=headers, timeout=300)
             response.raise_for_status()
             
             result = response.json()
+            self._record_usage(result)
             content = result["choices"][0]["message"]["content"]
             
             logger.debug(f"페이지 {page_num} OpenAI Compatible VLM 처리 완료")
@@ -207,7 +232,8 @@ class VLMFramework(ParsingFramework):
             
             client = OpenAI(
                 api_key=self.host_info.api_key,
-                base_url=self.host_info.base_url
+                base_url=self.host_info.base_url,
+                http_client=http_clients.sync_client(self.host_info.base_url or os.getenv("OPENAI_BASE_URL"))
             )
             
             messages = [
@@ -234,6 +260,7 @@ class VLMFramework(ParsingFramework):
                 kwargs.update(self.extra_kwargs)
             
             response = client.chat.completions.create(**kwargs)
+            self._record_usage(response)
             content = response.choices[0].message.content
             
             logger.debug(f"페이지 {page_num} OpenAI VLM 처리 완료")
@@ -246,11 +273,13 @@ class VLMFramework(ParsingFramework):
     def _call_anthropic_vlm(self, image_base64: str, page_num: int) -> str:
         """Anthropic VLM API 호출"""
         try:
+            import anthropic
             from anthropic import Anthropic
             
             client = Anthropic(
                 api_key=self.host_info.api_key,
-                base_url=self.host_info.base_url
+                base_url=self.host_info.base_url,
+                http_client=http_clients.sdk_client(anthropic, self.host_info.base_url or os.getenv("ANTHROPIC_BASE_URL"))
             )
             
             messages = [
@@ -282,6 +311,7 @@ class VLMFramework(ParsingFramework):
                 kwargs.update(self.extra_kwargs)
             
             response = client.messages.create(**kwargs)
+            self._record_usage(response)
             content = response.content[0].text
             
             logger.debug(f"페이지 {page_num} Anthropic VLM 처리 완료")
@@ -324,6 +354,7 @@ class VLMFramework(ParsingFramework):
                 contents=contents,
                 generation_config=generation_config if generation_config else None
             )
+            self._record_usage(response)
             
             content = response.text
             
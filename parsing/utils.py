@@ -100,9 +100,11 @@ def record_parsing(
     elapsed_time: float,
     success: bool,
     output_dir: str,
-    extra_kwargs: Optional[Dict[str, Any]] = None
+    extra_kwargs: Optional[Dict[str, Any]] = None,
+    usage: Optional[Dict[str, Any]] = None,
+    cache_hit: bool = False
 ) -> list[str]:
-    """파싱 로그 기록"""
+    """파싱 로그 기록 (`usage`: VLM 파싱의 토큰 수/비용, `cache_hit`: 파싱 캐시 적중 여부)"""
     
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     log_entry = {
@@ -111,7 +113,9 @@ def record_parsing(
         "framework": framework,
         "elapsed_time": elapsed_time,
         "success": success,
-        "extra_kwargs": extra_kwargs or {}
+        "extra_kwargs": extra_kwargs or {},
+        "cache_hit": cache_hit,
+        **(usage or {})
     }
     
     # 로그 파일 경로
@@ -125,7 +129,7 @@ def record_parsing(
         f"파싱 완료: {file_name}",
         f"프레임워크: {framework}",
         f"처리 시간: {elapsed_time:.2f}초",
-        f"성공 여부: {'성공' if success else '실패'}"
+        f"성공 여부: {'성공' if success else '실패'}" + (" (캐시)" if cache_hit else "")
     ]
     
     logger.info(" | ".join(log_lines))
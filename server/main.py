@@ -1,5 +1,6 @@
 import os
 import sys
+import asyncio
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -15,9 +16,18 @@ load_dotenv()
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # 서버 시작 시 실행
+    from structured_output_kit.utils.ollama_host import ollama_hosts, warmup_targets_from_env
+    # OLLAMA_WARMUP_MODELS에 지정한 모델은 첫 요청 전에 올려 두고 서버가 떠 있는 동안 고정
+    for base_url, model in warmup_targets_from_env():
+        await asyncio.to_thread(ollama_hosts.warm, base_url, model)
     print("FastAPI 서버가 시작되었습니다.")
     yield
     # 서버 종료 시 실행
+    from structured_output_kit.extraction.factory import framework_pool
+    framework_pool.close()
+    await asyncio.to_thread(ollama_hosts.unload_all)
+    from structured_output_kit.utils.http_pool import http_clients
+    await http_clients.aclose()
     print("FastAPI 서버가 종료되었습니다.")
 
 app = FastAPI(
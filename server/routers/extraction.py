@@ -1,4 +1,5 @@
 from fastapi import APIRouter, HTTPException, Form
+from fastapi.responses import StreamingResponse
 from typing import Dict, List, Any, Optional
 import os
 import json
@@ -30,7 +31,8 @@ async def run_extraction(
     extra_kwargs: str = Form("{}", description="추가 파라미터 JSON 문자열"),
     langfuse_trace_id: Optional[str] = Form(None, description="Langfuse trace ID"),
     output_dir: Optional[str] = Form(None, description="결과 출력 디렉토리"),
-    save: bool = Form(False, description="결과 저장 여부")
+    save: bool = Form(False, description="결과 저장 여부"),
+    cache_mode: str = Form("off", description="LLM 응답 캐시 모드", enum=['off', 'read-write', 'read-only', 'refresh'])
 ) -> ExtractionResponse:
     """
     텍스트에서 구조화된 정보를 추출합니다.
@@ -74,7 +76,8 @@ async def run_extraction(
             host_info=host_info,
             langfuse_trace_id=langfuse_trace_id,
             output_dir=output_dir,
-            save=save
+            save=save,
+            cache_mode=cache_mode
         )
         
         result = await extraction_service.run_extraction(
@@ -87,7 +90,8 @@ async def run_extraction(
             host_info=request.host_info,
             langfuse_trace_id=request.langfuse_trace_id,
             output_dir=request.output_dir,
-            save=request.save
+            save=request.save,
+            cache_mode=request.cache_mode
         )
         
         return ExtractionResponse(
@@ -96,6 +100,7 @@ async def run_extraction(
             data={
                 "result": result.result,
                 "success_rate": result.success_rate,
+                "cache_hit": result.cache_hit,
             },
             result_path=result.result_json_path,
             output_dir=result.output_dir,
@@ -108,6 +113,70 @@ async def run_extraction(
         raise HTTPException(status_code=500, detail=f"추출 실행 중 오류: {str(e)}")
 
 
+@router.post(
+    "/extract/stream",
+    summary="LLM 구조화 추출 스트리밍 (SSE)",
+    response_description="text/event-stream: partial 이벤트(부분 결과) 후 final 이벤트(ExtractionResult)"
+)
+async def stream_extraction(
+    input_text: str = Form(..., description="추출할 텍스트 또는 텍스트 파일 경로"),
+    provider: str = Form(..., description="호스트 제공자",enum=['openai', 'anthropic', 'google', 'ollama', 'openai_compatible']),
+    model: str = Form(..., description="사용할 모델명"),
+    framework: str = Form("OpenAIFramework", description="사용할 프레임워크 이름 (OpenAI/Anthropic/Ollama/Instructor)"),
+    schema_name: str = Form("schema_han", description="스키마 이름"),
+    prompt: Optional[str] = Form(None, description="사용할 프롬프트 (기본값: prompt.yaml에서 로드)"),
+    base_url: Optional[str] = Form(None, description="API 기본 URL (ollama, openai_compatible용)"),
+    api_key: Optional[str] = Form(None, description="API 키"),
+    extra_kwargs: str = Form("{}", description="추가 파라미터 JSON 문자열"),
+    langfuse_trace_id: Optional[str] = Form(None, description="Langfuse trace ID"),
+    output_dir: Optional[str] = Form(None, description="결과 출력 디렉토리"),
+    save: bool = Form(False, description="결과 저장 여부"),
+) -> StreamingResponse:
+    """
+    텍스트에서 구조화된 정보를 추출하면서, 검증된 부분 결과를 Server-Sent Events로 전송합니다.
+
+    이벤트:
+    - partial: 지금까지 채워진 필드 (`data`), 요청 시작부터 경과 시간 (`elapsed`)
+    - error: 추출 중 오류
+    - final: ExtractionResult (ttff 포함)
+    """
+    if not input_text:
+        raise HTTPException(status_code=400, detail="input_text가 필요합니다.")
+    try:
+        extra_kwargs_dict = json.loads(extra_kwargs) if extra_kwargs else {}
+    except json.JSONDecodeError as e:
+        raise HTTPException(status_code=400, detail=f"extra_kwargs JSON 파싱 실패: {str(e)}")
+
+    try:
+        host_info = HostInfo(**check_host_info({
+            "provider": provider,
+            "base_url": base_url,
+            "model": model,
+            "api_key": api_key
+        }))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if framework not in get_compatible_frameworks(host_info.provider):
+        raise HTTPException(status_code=400, detail=f"호환되지 않는 프레임워크: {framework}")
+
+    async def _events():
+        async for event in extraction_service.stream_extraction(
+            prompt=prompt,
+            input_text=input_text,
+            schema_name=schema_name,
+            extra_kwargs=extra_kwargs_dict,
+            framework=framework,
+            host_info=host_info,
+            langfuse_trace_id=langfuse_trace_id,
+            output_dir=output_dir,
+            save=save,
+        ):
+            payload = dict(event["data"], elapsed=event["elapsed"]) if event["event"] == "partial" else event["data"]
+            yield f"event: {event['event']}\ndata: {json.dumps(payload, ensure_ascii=False, default=str)}\n\n"
+
+    return StreamingResponse(_events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
 @router.get("/providers", summary="사용 가능한 호스트 목록", response_description="호스트 문자열 배열 반환")
 async def get_providers() -> Dict[str, Any]:
     """
@@ -15,7 +15,7 @@ import tempfile
 from structured_output_kit.utils.types import ParsingRequest, ParsingResponse, HostInfo
 from structured_output_kit.parsing.core import run_parsing_core
 from structured_output_kit.parsing.factory import get_available_frameworks, get_framework_info
-from structured_output_kit.extraction.utils import check_host_info
+from structured_output_kit.utils.common import check_host_info
 
 router = APIRouter()
 
@@ -284,7 +284,8 @@ async def parse_document(
     model: Optional[str] = Form(None, description="vlm 사용시 모델명"),
     api_key: Optional[str] = Form(None, description="vlm 사용시 API 키"),
     prompt: Optional[str] = Form(None, description="vlm 사용시 프롬프트"),
-    save: bool = Form(False)
+    save: bool = Form(False),
+    cache_mode: str = Form("read-write", description="파싱 결과 캐시 모드 (파일 내용 해시 기준)", enum=['off', 'read-write', 'read-only', 'refresh'])
 ) -> ParsingResponse:
     """파일 업로드 및 파싱"""
     
@@ -330,7 +331,8 @@ async def parse_document(
             extra_kwargs=extra_kwargs_dict,
             host_info=host_info,
             prompt=prompt,
-            save=save
+            save=save,
+            cache_mode=cache_mode
         )
         
         # 파싱 실행
@@ -350,7 +352,8 @@ async def parse_document(
                     "content": result.content,
                     "framework": result.framework,
                     "file_name": file.filename,
-                    "content_length": len(result.content)
+                    "content_length": len(result.content),
+                    "cache_hit": result.cache_hit
                 },
                 result_path=result.result_txt_path,
                 output_dir=result.output_dir,
@@ -377,7 +380,8 @@ async def parse_from_url(
     extra_kwargs: Dict[str, Any] = {},
     host_info: Optional[HostInfo] = None,
     prompt: Optional[str] = None,
-    save: bool = False
+    save: bool = False,
+    cache_mode: str = "read-write"
 ) -> ParsingResponse:
     """URL에서 파일을 다운로드하여 파싱"""
     
@@ -401,7 +405,8 @@ async def parse_from_url(
             extra_kwargs=extra_kwargs,
             host_info=host_info,
             prompt=prompt,
-            save=save
+            save=save,
+            cache_mode=cache_mode
         )
         
         # 파싱 실행
@@ -421,7 +426,8 @@ async def parse_from_url(
                     "content": result.content,
                     "framework": result.framework,
                     "file_url": file_url,
-                    "content_length": len(result.content)
+                    "content_length": len(result.content),
+                    "cache_hit": result.cache_hit
                 },
                 result_path=result.result_txt_path,
                 output_dir=result.output_dir,
@@ -1,8 +1,62 @@
-from fastapi import APIRouter
-from typing import Dict, List, Any
+from fastapi import APIRouter, Form
+from typing import Dict, List, Any, Optional
+import asyncio
 import os
 
+from structured_output_kit.utils.ollama_host import ollama_hosts, native_base_url
+from structured_output_kit.utils.accounting import usage_ledger
+
 router = APIRouter()
 
-# utils 라우터는 이제 빈 상태로 유지하거나 다른 유틸리티 기능들을 위해 사용할 수 있습니다.
 # providers, frameworks, schemas 엔드포인트는 각각 extraction과 evaluation 라우터로 이동했습니다.
+
+
+@router.get("/ollama")
+async def ollama_status(base_url: Optional[str] = None) -> Dict[str, Any]:
+    """고정 중인 Ollama 모델(warm-up 로드 시간 포함)과 현재 메모리에 올라와 있는 모델"""
+    try:
+        loaded = await asyncio.to_thread(ollama_hosts.loaded_models, base_url)
+    except Exception:
+        loaded = None  # 서버에 닿지 않으면 고정 정보만
+    return {
+        "base_url": native_base_url(base_url),
+        "keep_alive": ollama_hosts.pin_keep_alive,
+        "pinned": ollama_hosts.status(),
+        "loaded": loaded,
+    }
+
+
+@router.post("/ollama/warmup")
+async def ollama_warmup(
+    model: str = Form(..., description="미리 올려 둘 Ollama 모델"),
+    base_url: Optional[str] = Form(None, description="Ollama 서버 주소 (/v1 유무 무관)"),
+) -> Dict[str, Any]:
+    """모델을 올리고 keep_alive로 고정한다. 응답의 load_time이 모델 로드 시간(초)."""
+    result = await asyncio.to_thread(ollama_hosts.warm, base_url, model)
+    return result.to_dict()
+
+
+@router.post("/ollama/unload")
+async def ollama_unload(
+    model: str = Form(..., description="내릴 Ollama 모델"),
+    base_url: Optional[str] = Form(None, description="Ollama 서버 주소 (/v1 유무 무관)"),
+) -> Dict[str, Any]:
+    """고정을 풀고 모델을 메모리에서 내린다 (keep_alive=0)."""
+    await asyncio.to_thread(ollama_hosts.unload, base_url, model)
+    return {"model": model, "base_url": native_base_url(base_url), "unloaded": True}
+
+
+@router.get("/usage")
+async def usage(prices: bool = False) -> Dict[str, Any]:
+    """서버 시작(또는 마지막 초기화) 이후 추출/VLM 파싱/평가 임베딩의 토큰·비용 합계.
+    `by_model`은 (kind, provider, model)별 상세, `prices=true`면 적용 중인 가격표도 함께 반환."""
+    summary = usage_ledger.summary()
+    if prices:
+        summary["prices"] = usage_ledger.prices.prices()
+    return summary
+
+
+@router.post("/usage/reset")
+async def usage_reset() -> Dict[str, Any]:
+    """집계를 비운다. 응답은 비우기 전 합계."""
+    return usage_ledger.reset()
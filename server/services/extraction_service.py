@@ -1,12 +1,12 @@
 import os
 from datetime import datetime
-from typing import Optional
+from typing import Any, AsyncIterator, Dict, Optional
 from loguru import logger
 from langfuse import get_client
 
 from structured_output_kit.extraction.utils import get_compatible_frameworks, load_prompt
 from structured_output_kit.utils.types import ExtractionRequest, HostInfo, ExtractionResult
-from structured_output_kit.extraction.core import run_extraction_core
+from structured_output_kit.extraction.core import run_extraction_core_async, run_extraction_stream
 
 from dotenv import load_dotenv
 
@@ -28,7 +28,8 @@ class ExtractionService:
         host_info: Optional[HostInfo] = None,
         langfuse_trace_id: Optional[str] = None,
         output_dir: Optional[str] = None,
-        save: Optional[bool] = False
+        save: Optional[bool] = False,
+        cache_mode: str = "off"
     ) -> ExtractionResult:
         """추출 작업을 실행합니다."""
 
@@ -62,7 +63,7 @@ class ExtractionService:
 
             extra_kwargs = dict(extra_kwargs or {})
 
-            core_result = run_extraction_core(
+            core_result = await run_extraction_core_async(
                 ExtractionRequest(
                     prompt=prompt if prompt else load_prompt(),
                     input_text=input_text,
@@ -73,7 +74,8 @@ class ExtractionService:
                     host_info=host_info,
                     langfuse_trace_id=langfuse_trace_id,
                     output_dir=output_dir,
-                    save=save
+                    save=save,
+                    cache_mode=cache_mode
                 )
             )
 
@@ -85,8 +87,41 @@ class ExtractionService:
                 result_json_path=core_result.result_json_path,
                 langfuse_url=core_result.langfuse_url,
                 output_dir=core_result.output_dir,
+                cache_hit=core_result.cache_hit,
             )
 
         except Exception as e:
             logger.error(f"Extraction failed: {str(e)}")
             raise e
+
+    async def stream_extraction(
+        self,
+        prompt: Optional[str],
+        input_text: str,
+        schema_name: str = "schema_han",
+        extra_kwargs: Optional[dict] = None,
+        framework: str = 'OpenAIFramework',
+        host_info: Optional[HostInfo] = None,
+        langfuse_trace_id: Optional[str] = None,
+        output_dir: Optional[str] = None,
+        save: Optional[bool] = False,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """스트리밍 추출 이벤트(partial/error/final)를 순서대로 반환합니다."""
+        if host_info is None:
+            raise ValueError("host_info가 필요합니다.")
+        if framework not in get_compatible_frameworks(host_info.provider):
+            raise ValueError(f"호환되지 않는 프레임워크: {framework}")
+
+        request = ExtractionRequest(
+            prompt=prompt if prompt else load_prompt(),
+            input_text=input_text,
+            schema_name=schema_name,
+            extra_kwargs=dict(extra_kwargs or {}),
+            framework=framework,
+            host_info=host_info,
+            langfuse_trace_id=langfuse_trace_id,
+            output_dir=output_dir,
+            save=save,
+        )
+        async for event in run_extraction_stream(request):
+            yield event
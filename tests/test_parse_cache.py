@@ -0,0 +1,59 @@
+"""파싱 캐시: 일부 페이지가 실패한 VLM 결과는 캐시에 저장하지 않는다."""
+import pytest
+
+from structured_output_kit.parsing import cache as parse_cache
+from structured_output_kit.parsing.core import run_parsing_core
+from structured_output_kit.parsing.frameworks.vlm_framework import VLMFramework
+from structured_output_kit.utils.types import HostInfo, ParsingRequest
+
+
+@pytest.fixture
+def vlm_document(tmp_path, monkeypatch):
+    """2쪽짜리 문서. `failing` 집합에 든 페이지는 provider 호출이 실패한다."""
+    document = tmp_path / "resume.png"
+    document.write_bytes(b"\x89PNG fake")
+    failing = set()
+    calls = []
+
+    def fake_call(self, image_base64, page_num):
+        calls.append(page_num)
+        if page_num in failing:
+            raise TimeoutError("read timed out")
+        return f"# 페이지 {page_num}"
+
+    monkeypatch.setattr(VLMFramework, "_prepare_images", lambda self: ["page_1.png", "page_2.png"])
+    monkeypatch.setattr(VLMFramework, "_encode_image_to_base64", lambda self, path: "")
+    monkeypatch.setattr(VLMFramework, "_call_openai_vlm", fake_call)
+    monkeypatch.setattr(parse_cache, "_parse_cache", parse_cache.ParseCache(str(tmp_path / "parses.sqlite")))
+    return str(document), failing, calls
+
+
+def _parse(file_path, tmp_path):
+    return run_parsing_core(ParsingRequest(
+        file_path=file_path,
+        framework="vlm",
+        host_info=HostInfo(provider="openai", model="gpt-4o-mini", api_key="test"),
+        prompt="마크다운으로 옮겨 주세요",
+        output_dir=str(tmp_path / "out"),
+    ))
+
+
+def test_partial_page_failure_is_not_cached(vlm_document, tmp_path):
+    file_path, failing, calls = vlm_document
+    failing.add(2)
+
+    first = _parse(file_path, tmp_path)
+    assert first.success and not first.cache_hit
+    assert first.failed_pages == [2]
+    assert parse_cache.get_parse_cache().stats()["entries"] == 0
+
+    # provider가 회복되면 다시 파싱해 빠진 페이지까지 채우고, 그 결과만 캐시한다
+    failing.clear()
+    second = _parse(file_path, tmp_path)
+    assert not second.cache_hit and second.failed_pages == []
+    assert "페이지 2" in second.content
+    assert sorted(calls) == [1, 1, 2, 2]
+
+    third = _parse(file_path, tmp_path)
+    assert third.cache_hit and third.content == second.content
+    assert len(calls) == 4
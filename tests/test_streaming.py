@@ -0,0 +1,80 @@
+"""스트리밍 부분 JSON 파서: 한 글자씩 넣어도 확정되지 않은 값을 내보내지 않는다."""
+import json
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel
+
+from structured_output_kit.extraction.stats import RunStats
+from structured_output_kit.extraction.streaming import PartialJSONParser, stream_partials
+
+
+def _feed_chars(text):
+    parser = PartialJSONParser()
+    return parser, [parser.feed(ch) for ch in text]
+
+
+def test_number_is_emitted_only_when_complete():
+    _, values = _feed_chars('{"age": 1995, "name": "kim"}')
+    ages = [value["age"] for value in values if value and "age" in value]
+    assert set(ages) == {1995}
+
+
+@pytest.mark.parametrize("literal, expected", [("true", True), ("false", False), ("null", None), ("-12.5e3", -12.5e3)])
+def test_literals_are_trimmed_until_complete(literal, expected):
+    parser, values = _feed_chars('{"a": ' + literal)
+    assert all(value == {} for value in values if value is not None)
+    assert parser.feed("}") == {"a": expected}
+
+
+def test_unfinished_top_level_number_in_array():
+    parser, values = _feed_chars("[1, 23")
+    assert values[-1] == [1]
+    assert parser.feed("]") == [1, 23]
+
+
+def test_open_string_value_is_closed_but_key_is_not():
+    parser = PartialJSONParser()
+    assert parser.feed('{"name": "ki') == {"name": "ki"}
+    assert parser.feed('m", "addr') == {"name": "kim"}
+
+
+def test_escape_sequences_are_not_split():
+    text = '{"memo": "a\\"b\\\\c\\nd"}'
+    _, values = _feed_chars(text)
+    memos = [value["memo"] for value in values if value and "memo" in value]
+    assert memos[-1] == 'a"b\\c\nd'
+    # 각 부분 값은 최종 값의 앞부분이어야 한다 (반쯤 들어온 escape가 다른 문자로 보이면 안 됨)
+    assert all(memos[-1].startswith(memo) for memo in memos)
+
+
+def test_unicode_escapes_and_surrogate_pairs():
+    final = {"name": "김철수 😀"}
+    text = json.dumps(final, ensure_ascii=True)
+    _, values = _feed_chars(text)
+    names = [value["name"] for value in values if value and "name" in value]
+    assert names[-1] == final["name"]
+    assert all(final["name"].startswith(name) for name in names)
+
+
+def test_text_before_json_is_skipped():
+    parser = PartialJSONParser()
+    assert parser.feed("결과입니다:\n```json\n") is None
+    assert parser.feed('{"a": [1, {"b": "x"}]}\n```') == {"a": [1, {"b": "x"}]}
+    assert parser._done
+
+
+class Person(BaseModel):
+    name: Optional[str] = None
+    age: Optional[int] = None
+
+
+def test_stream_records_whether_json_closed():
+    text = '{"name": "kim", "age": 30}'
+    truncated = RunStats()
+    partials = list(stream_partials(list(text[:-6]), Person, stats=truncated))
+    assert partials[-1].name == "kim" and not truncated.stream_complete
+
+    complete = RunStats()
+    partials = list(stream_partials(list(text), Person, stats=complete))
+    assert partials[-1].age == 30 and complete.stream_complete
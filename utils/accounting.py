@@ -0,0 +1,252 @@
+"""토큰/비용 집계 (추출, VLM 파싱, 평가 임베딩 공통).
+
+- `PriceTable`: 모델별 100만 토큰당 USD 단가(input, cached_input, output). 기본 표에 PRICE_TABLE_PATH(JSON)를
+  덮어써 쓴다. 키는 모델 이름 또는 `provider/모델` (glob 패턴 가능, 더 구체적인 키 우선)
+- `UsageMeter`: 요청/문서 하나의 토큰·비용 합계 (여러 스레드에서 더해도 안전)
+- `UsageLedger`: 프로세스 공용 누적기 `usage_ledger`. kind(extraction/parsing/embedding) × provider × model별 합계로
+  `/v1/utils/usage`에서 조회한다
+
+단가를 모르는 모델은 토큰만 세고 비용은 None으로 둔다(`unpriced_requests`로 집계). 로컬 provider(ollama,
+transformers, huggingface)는 0원. Anthropic 캐시 쓰기 할증은 따로 구분하지 않고 input 단가로 계산한다.
+
+PRICE_TABLE_PATH 예시:
+    {"gpt-4o": {"input": 2.5, "cached_input": 1.25, "output": 10},
+     "openai_compatible/Qwen/*": {"input": 0.2, "output": 0.6}}
+"""
+from __future__ import annotations
+
+import os
+import json
+import time
+import threading
+from fnmatch import fnmatchcase
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+KINDS = ("extraction", "parsing", "embedding")
+
+
+@dataclass(frozen=True)
+class Price:
+    """100만 토큰당 USD 단가"""
+    input: float = 0.0
+    output: float = 0.0
+    cached_input: Optional[float] = None  # 없으면 input 단가
+
+    def cost(self, prompt_tokens: int, completion_tokens: int, cached_tokens: int = 0) -> float:
+        cached = min(cached_tokens, prompt_tokens)
+        cached_price = self.input if self.cached_input is None else self.cached_input
+        return ((prompt_tokens - cached) * self.input + cached * cached_price + completion_tokens * self.output) / 1e6
+
+
+# 공개 가격표 기준 기본값. 바뀌면 PRICE_TABLE_PATH로 덮어쓴다.
+DEFAULT_PRICES: Dict[str, Price] = {
+    "gpt-4o": Price(2.50, 10.00, 1.25),
+    "gpt-4o-2024-*": Price(2.50, 10.00, 1.25),
+    "gpt-4o-mini*": Price(0.15, 0.60, 0.075),
+    "gpt-4.1": Price(2.00, 8.00, 0.50),
+    "gpt-4.1-2025-*": Price(2.00, 8.00, 0.50),
+    "gpt-4.1-mini*": Price(0.40, 1.60, 0.10),
+    "gpt-4.1-nano*": Price(0.10, 0.40, 0.025),
+    "o4-mini*": Price(1.10, 4.40, 0.275),
+    "claude-3-5-haiku*": Price(0.80, 4.00, 0.08),
+    "claude-3-7-sonnet*": Price(3.00, 15.00, 0.30),
+    "claude-sonnet-4*": Price(3.00, 15.00, 0.30),
+    "claude-opus-4*": Price(15.00, 75.00, 1.50),
+    "gemini-2.0-flash*": Price(0.10, 0.40, 0.025),
+    "gemini-2.5-flash*": Price(0.30, 2.50, 0.075),
+    "gemini-2.5-pro*": Price(1.25, 10.00, 0.31),
+    "text-embedding-3-small": Price(0.02),
+    "text-embedding-3-large": Price(0.13),
+    "text-embedding-ada-002": Price(0.10),
+    # 로컬 실행
+    "ollama/*": Price(),
+    "transformers/*": Price(),
+    "huggingface/*": Price(),
+}
+
+
+class PriceTable:
+    """모델 단가 조회. `price_table`로 프로세스 공용 인스턴스를 쓴다."""
+
+    def __init__(self, prices: Optional[Dict[str, Price]] = None, path: Optional[str] = None):
+        self._prices = dict(DEFAULT_PRICES if prices is None else prices)
+        self._path = path
+        self._loaded = prices is not None
+        self._lock = threading.Lock()
+
+    def _ensure_loaded(self) -> None:
+        # 환경변수는 .env 로드 뒤 첫 사용 시점에 읽는다
+        with self._lock:
+            if self._loaded:
+                return
+            self._loaded = True
+            path = self._path or os.getenv("PRICE_TABLE_PATH")
+            if path:
+                self._prices.update(load_prices(path))
+
+    def prices(self) -> Dict[str, Dict[str, Any]]:
+        self._ensure_loaded()
+        return {key: asdict(price) for key, price in self._prices.items()}
+
+    def lookup(self, provider: Optional[str], model: Optional[str]) -> Optional[Price]:
+        """`provider/model` 키를 먼저, 그다음 모델 이름 키를 찾는다. glob 패턴은 긴 패턴부터."""
+        self._ensure_loaded()
+        model = model or ""
+        patterns = sorted((key for key in self._prices if any(c in key for c in "*?[")), key=len, reverse=True)
+        for name in (f"{provider}/{model}", model):
+            if name in self._prices:
+                return self._prices[name]
+            for pattern in patterns:
+                if fnmatchcase(name, pattern):
+                    return self._prices[pattern]
+        return None
+
+    def cost(
+        self,
+        provider: Optional[str],
+        model: Optional[str],
+        prompt_tokens: Optional[int],
+        completion_tokens: Optional[int],
+        cached_tokens: Optional[int] = None,
+        batch: bool = False,
+    ) -> Optional[float]:
+        """USD 비용. 단가를 모르면 None. `batch`면 provider batch API 할인(BATCH_PRICE_FACTOR, 기본 0.5) 적용."""
+        price = self.lookup(provider, model)
+        if price is None:
+            return None
+        cost = price.cost(prompt_tokens or 0, completion_tokens or 0, cached_tokens or 0)
+        return cost * float(os.getenv("BATCH_PRICE_FACTOR", "0.5")) if batch else cost
+
+
+def load_prices(path: str) -> Dict[str, Price]:
+    """JSON 가격표 파일을 읽는다 (`{"모델": {"input": .., "output": .., "cached_input": ..}}`)"""
+    with open(path, "r", encoding="utf-8") as f:
+        raw = json.load(f)
+    prices = {}
+    for key, entry in raw.items():
+        try:
+            prices[key] = Price(
+                input=float(entry.get("input", 0.0)),
+                output=float(entry.get("output", 0.0)),
+                cached_input=float(entry["cached_input"]) if entry.get("cached_input") is not None else None,
+            )
+        except (AttributeError, TypeError, ValueError) as e:
+            logger.warning(f"가격표 항목 무시: {key} ({e})")
+    logger.info(f"가격표 로드: {path} ({len(prices)}개)")
+    return prices
+
+
+class UsageMeter:
+    """토큰/비용 합계. 페이지 병렬 처리처럼 여러 스레드가 함께 더해도 안전하다."""
+
+    def __init__(self):
+        self.requests = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.cached_tokens = 0
+        self.cost: Optional[float] = None
+        self.unpriced_requests = 0  # 단가를 몰라 비용에서 빠진 요청 수
+        self._lock = threading.Lock()
+
+    def add(
+        self,
+        prompt_tokens: Optional[int],
+        completion_tokens: Optional[int],
+        cached_tokens: Optional[int],
+        cost: Optional[float],
+    ) -> None:
+        with self._lock:
+            self.requests += 1
+            self.prompt_tokens += prompt_tokens or 0
+            self.completion_tokens += completion_tokens or 0
+            self.cached_tokens += cached_tokens or 0
+            if cost is None:
+                self.unpriced_requests += 1
+            else:
+                self.cost = (self.cost or 0.0) + cost
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "prompt_tokens": self.prompt_tokens,
+                "completion_tokens": self.completion_tokens,
+                "cached_tokens": self.cached_tokens,
+                "cost": self.cost,
+                "unpriced_requests": self.unpriced_requests,
+            }
+
+
+class UsageLedger:
+    """프로세스 전체의 provider 호출 토큰/비용 누적. `usage_ledger`로 공용 인스턴스를 쓴다."""
+
+    def __init__(self, prices: Optional[PriceTable] = None):
+        self.prices = prices or price_table
+        self._meters: Dict[Tuple[str, str, str], UsageMeter] = {}
+        self._lock = threading.Lock()
+        self.since = time.time()
+
+    def record(
+        self,
+        kind: str,
+        provider: Optional[str],
+        model: Optional[str],
+        prompt_tokens: Optional[int],
+        completion_tokens: Optional[int],
+        cached_tokens: Optional[int] = None,
+        batch: bool = False,
+        meter: Optional[UsageMeter] = None,
+    ) -> Optional[float]:
+        """호출 한 건을 기록하고 비용(USD, 모르면 None)을 반환한다. `meter`가 있으면 거기에도 더한다."""
+        cost = self.prices.cost(provider, model, prompt_tokens, completion_tokens, cached_tokens, batch=batch)
+        key = (kind, provider or "", model or "")
+        with self._lock:
+            ledger_meter = self._meters.get(key)
+            if ledger_meter is None:
+                ledger_meter = self._meters[key] = UsageMeter()
+        ledger_meter.add(prompt_tokens, completion_tokens, cached_tokens, cost)
+        if meter is not None:
+            meter.add(prompt_tokens, completion_tokens, cached_tokens, cost)
+        return cost
+
+    def summary(self) -> Dict[str, Any]:
+        """전체/종류별 합계와 (kind, provider, model)별 상세"""
+        with self._lock:
+            items = list(self._meters.items())
+        rows: List[Dict[str, Any]] = [
+            {"kind": kind, "provider": provider, "model": model, **meter.to_dict()}
+            for (kind, provider, model), meter in sorted(items)
+        ]
+
+        def _total(selected: List[Dict[str, Any]]) -> Dict[str, Any]:
+            costs = [row["cost"] for row in selected if row["cost"] is not None]
+            return {
+                "requests": sum(row["requests"] for row in selected),
+                "prompt_tokens": sum(row["prompt_tokens"] for row in selected),
+                "completion_tokens": sum(row["completion_tokens"] for row in selected),
+                "cached_tokens": sum(row["cached_tokens"] for row in selected),
+                "cost": sum(costs) if costs else None,
+                "unpriced_requests": sum(row["unpriced_requests"] for row in selected),
+            }
+
+        return {
+            "since": self.since,
+            "total": _total(rows),
+            "by_kind": {kind: _total([row for row in rows if row["kind"] == kind]) for kind in KINDS},
+            "by_model": rows,
+        }
+
+    def reset(self) -> Dict[str, Any]:
+        """집계를 비우고, 비우기 전 요약을 반환한다."""
+        summary = self.summary()
+        with self._lock:
+            self._meters = {}
+            self.since = time.time()
+        return summary
+
+
+price_table = PriceTable()
+usage_ledger = UsageLedger()
@@ -1,9 +1,7 @@
-from json import load
 import os
 from typing import Any
 from pydantic import BaseModel
 from dotenv import load_dotenv
-from scipy.constants import h
 
 load_dotenv()
 
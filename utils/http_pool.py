@@ -0,0 +1,161 @@
+"""provider 호출에 쓰는 공용 httpx 클라이언트 (base_url의 origin별 연결 풀).
+
+프레임워크 인스턴스나 VLM 페이지마다 SDK 클라이언트를 새로 만들면 매번 TCP/TLS 연결부터 다시 맺는다.
+여기서 origin(`scheme://host:port`)마다 sync/async 클라이언트를 하나씩 만들어 두고 모든 프레임워크와
+파싱 VLM 호출이 같이 쓰게 해서, keep-alive 연결(HTTPS면 HTTP/2 다중화)을 요청 사이에 재사용한다.
+
+- 연결 한도는 HTTP_POOL_MAX_CONNECTIONS / HTTP_POOL_MAX_KEEPALIVE / HTTP_POOL_KEEPALIVE_EXPIRY로 설정
+- HTTP/2는 HTTP2=auto(기본, `h2` 패키지가 있을 때만) | true | false. `pip install "httpx[http2]"`
+- 요청별 타임아웃은 SDK가 요청마다 넘기므로 여기 기본값은 SDK 밖에서 직접 부를 때만 쓰인다
+- 공유 클라이언트는 SDK 클라이언트의 close()로 닫히면 안 되므로, 닫기는 이 registry가 맡는다
+- httpx 대신 httpx2 위에 만든 SDK(anthropic 1.x 최신판 등)는 httpx 클라이언트를 받지 않으므로
+  `sdk_client()`/`sdk_async_client()`가 None을 돌려줘 SDK 기본 클라이언트를 쓰게 한다
+"""
+from __future__ import annotations
+
+import os
+import threading
+import importlib.util
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+from loguru import logger
+
+
+@dataclass
+class PoolConfig:
+    """공용 클라이언트의 연결 풀 설정"""
+    max_connections: int = 200
+    max_keepalive: int = 50
+    keepalive_expiry: float = 60.0   # 유휴 연결을 유지하는 시간(초)
+    http2: bool = False
+    timeout: float = 600.0
+    connect_timeout: float = 10.0
+
+    @classmethod
+    def from_env(cls) -> "PoolConfig":
+        return cls(
+            max_connections=int(os.getenv("HTTP_POOL_MAX_CONNECTIONS", "200")),
+            max_keepalive=int(os.getenv("HTTP_POOL_MAX_KEEPALIVE", "50")),
+            keepalive_expiry=float(os.getenv("HTTP_POOL_KEEPALIVE_EXPIRY", "60")),
+            http2=_http2_enabled(os.getenv("HTTP2", "auto").lower()),
+        )
+
+    def client_kwargs(self) -> Dict[str, Any]:
+        return {
+            "limits": httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+            "timeout": httpx.Timeout(self.timeout, connect=self.connect_timeout),
+            "http2": self.http2,
+            "follow_redirects": True,
+        }
+
+
+def _http2_enabled(setting: str) -> bool:
+    if setting in ("0", "false", "no", "off"):
+        return False
+    available = importlib.util.find_spec("h2") is not None
+    if setting in ("1", "true", "yes", "on") and not available:
+        logger.warning("HTTP2=true지만 h2 패키지가 없어 HTTP/1.1을 사용합니다 (pip install \"httpx[http2]\")")
+    return available
+
+
+_warned_sdks: set = set()
+
+
+def accepts_httpx(sdk: Any, default_name: str, client_type: type) -> bool:
+    """SDK의 기본 HTTP 클라이언트(`DefaultHttpxClient` 등)가 httpx 클래스를 상속하는지.
+    Stainless 계열 SDK는 `http_client`를 기본 클라이언트와 같은 라이브러리의 인스턴스로만 받는다."""
+    default = getattr(sdk, default_name, None)
+    if default is None or issubclass(default, client_type):
+        return True
+    name = getattr(sdk, "__name__", str(sdk))
+    if name not in _warned_sdks:
+        _warned_sdks.add(name)
+        logger.warning(f"{name} SDK가 httpx 클라이언트를 받지 않아 공용 연결 풀 대신 SDK 기본 클라이언트를 사용합니다")
+    return False
+
+
+def origin(base_url: Optional[str]) -> str:
+    """`https://api.openai.com/v1` → `https://api.openai.com:443`. base_url이 없으면 SDK 기본 주소용 키."""
+    if not base_url:
+        return "default"
+    parts = urlsplit(base_url if "://" in base_url else f"http://{base_url}")
+    port = parts.port or (443 if parts.scheme == "https" else 80)
+    return f"{parts.scheme}://{parts.hostname}:{port}"
+
+
+class HttpClientRegistry:
+    """origin별 공용 httpx.Client / httpx.AsyncClient. `http_clients`로 프로세스 공용 인스턴스를 쓴다."""
+
+    def __init__(self, config: Optional[PoolConfig] = None):
+        self._config = config
+        self._sync: Dict[str, httpx.Client] = {}
+        self._async: Dict[str, httpx.AsyncClient] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def config(self) -> PoolConfig:
+        # 환경변수는 .env 로드 뒤 첫 사용 시점에 읽는다
+        if self._config is None:
+            self._config = PoolConfig.from_env()
+        return self._config
+
+    def sync_client(self, base_url: Optional[str] = None) -> httpx.Client:
+        key = origin(base_url)
+        with self._lock:
+            client = self._sync.get(key)
+            if client is None or client.is_closed:
+                client = self._sync[key] = httpx.Client(**self.config.client_kwargs())
+                logger.debug(f"공용 HTTP 클라이언트 생성: {key} (http2={self.config.http2})")
+            return client
+
+    def async_client(self, base_url: Optional[str] = None) -> httpx.AsyncClient:
+        key = origin(base_url)
+        with self._lock:
+            client = self._async.get(key)
+            if client is None or client.is_closed:
+                client = self._async[key] = httpx.AsyncClient(**self.config.client_kwargs())
+                logger.debug(f"공용 비동기 HTTP 클라이언트 생성: {key} (http2={self.config.http2})")
+            return client
+
+    def sdk_client(self, sdk: Any, base_url: Optional[str] = None) -> Optional[httpx.Client]:
+        """`sdk` 모듈에 `http_client`로 넘길 공용 클라이언트. SDK가 httpx 클라이언트를 받지 않으면 None."""
+        return self.sync_client(base_url) if accepts_httpx(sdk, "DefaultHttpxClient", httpx.Client) else None
+
+    def sdk_async_client(self, sdk: Any, base_url: Optional[str] = None) -> Optional[httpx.AsyncClient]:
+        """`sdk_client`의 비동기 버전"""
+        return self.async_client(base_url) if accepts_httpx(sdk, "DefaultAsyncHttpxClient", httpx.AsyncClient) else None
+
+    def is_shared(self, client: Any) -> bool:
+        """SDK 클라이언트(또는 httpx 클라이언트)가 이 registry의 연결을 쓰는지"""
+        http_client = getattr(client, "_client", client)
+        with self._lock:
+            return any(http_client is shared for shared in (*self._sync.values(), *self._async.values()))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"sync": sorted(self._sync), "async": sorted(self._async), "http2": self.config.http2}
+
+    def close(self) -> None:
+        """sync 클라이언트를 닫는다 (async 클라이언트는 `aclose()`로)."""
+        with self._lock:
+            clients, self._sync = list(self._sync.values()), {}
+        for client in clients:
+            client.close()
+
+    async def aclose(self) -> None:
+        """모든 공용 클라이언트를 닫는다. 서버 종료 시 호출."""
+        self.close()
+        with self._lock:
+            clients, self._async = list(self._async.values()), {}
+        for client in clients:
+            await client.aclose()
+
+
+http_clients = HttpClientRegistry()
@@ -0,0 +1,196 @@
+"""Ollama 호스트 관리: 모델 warm-up, 실행 동안 keep_alive 고정, 종료 시 unload.
+
+Ollama는 요청이 없으면 기본 5분 뒤 모델을 내리고, 다음 첫 요청이 수 초짜리 모델 로드를 떠안아
+지연시간 측정을 오염시킨다. 서버/워크플로우 시작 시 `warm()`으로 빈 프롬프트를 보내 모델을 미리 올리고
+(`load_duration`을 로드 시간으로 따로 기록), 실행 동안은 요청마다 `keep_alive()` 값을 실어 보내
+타이머를 갱신하고, 끝나면 `keep_alive=0`으로 내린다.
+
+base_url은 `/v1`(OpenAI 호환 경로)이 붙어 있어도 native API 루트(`/api/...`)로 맞춰 쓴다.
+"""
+from __future__ import annotations
+
+import os
+import time
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import httpx
+from loguru import logger
+
+from structured_output_kit.utils.http_pool import http_clients
+
+DEFAULT_BASE_URL = "http://localhost:11434"
+
+
+def native_base_url(base_url: Optional[str]) -> str:
+    """`http://host:11434/v1` → `http://host:11434` (native API 루트)"""
+    url = (base_url or os.getenv("OLLAMA_BASE_URL") or os.getenv("OLLAMA_BASEURL") or DEFAULT_BASE_URL).rstrip("/")
+    return url[:-3] if url.endswith("/v1") else url
+
+
+@dataclass
+class WarmupResult:
+    """모델 한 개의 warm-up 결과"""
+    model: str
+    base_url: str
+    load_time: Optional[float] = None  # Ollama가 보고한 모델 로드 시간(초). 이미 올라와 있었으면 0에 가깝다
+    elapsed: float = 0.0               # warm-up 요청 전체 시간(초)
+    already_loaded: bool = False       # warm-up 전에 이미 메모리에 있었는지 (/api/ps)
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class OllamaHostManager:
+    """Ollama 모델 warm-up/고정/해제를 관리한다. `ollama_hosts`로 프로세스 공용 인스턴스를 쓴다."""
+
+    def __init__(self, keep_alive: Optional[str] = None, timeout: float = 600.0):
+        # 고정 중에 요청마다 실어 보내는 keep_alive. 비정상 종료 시에도 언젠가는 내려가도록 무기한(-1) 대신 시간으로
+        self.pin_keep_alive = keep_alive or os.getenv("OLLAMA_PIN_KEEP_ALIVE", "30m")
+        self.timeout = timeout
+        self._pinned: Dict[Tuple[str, str], WarmupResult] = {}
+        # `pinned()` 블록이 여러 개(동시 워크플로우) 같은 모델을 잡을 수 있어 참조 수로 관리한다
+        self._leases: Dict[Tuple[str, str], int] = {}
+        self._lease_pinned: set = set()  # `pinned()`가 처음 고정한 모델 (마지막 블록이 끝나면 고정 해제)
+        self._owned: set = set()         # 이 프로세스가 올린 모델 (마지막 블록이 끝나면 unload)
+        self._lock = threading.Lock()
+
+    def keep_alive(self, base_url: Optional[str], model: str) -> Optional[str]:
+        """고정된 모델이면 요청에 넣을 keep_alive 값, 아니면 None (Ollama 기본값 사용)"""
+        with self._lock:
+            return self.pin_keep_alive if (native_base_url(base_url), model) in self._pinned else None
+
+    def loaded_models(self, base_url: Optional[str]) -> List[str]:
+        """현재 메모리에 올라와 있는 모델 이름 (/api/ps)"""
+        url = native_base_url(base_url)
+        response = http_clients.sync_client(url).get(f"{url}/api/ps", timeout=10.0)
+        response.raise_for_status()
+        return [entry.get("name") or entry.get("model") for entry in response.json().get("models", [])]
+
+    def warm(self, base_url: Optional[str], model: str) -> WarmupResult:
+        """빈 프롬프트로 모델을 올리고 keep_alive로 고정한다. 실패해도 예외 대신 `error`에 담아 반환."""
+        url = native_base_url(base_url)
+        result = WarmupResult(model=model, base_url=url)
+        started_at = time.perf_counter()
+        try:
+            try:
+                loaded = self.loaded_models(url)
+                result.already_loaded = model in loaded or f"{model}:latest" in loaded
+            except httpx.HTTPError:
+                pass  # /api/ps가 없는 구버전/프록시: 로드 여부만 모른다
+            response = http_clients.sync_client(url).post(
+                f"{url}/api/generate",
+                json={"model": model, "prompt": "", "stream": False, "keep_alive": self.pin_keep_alive},
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+            load_duration = response.json().get("load_duration")
+            result.load_time = load_duration / 1e9 if load_duration is not None else None
+        except Exception as e:
+            result.error = str(e)
+            logger.warning(f"Ollama warm-up 실패: {model} @ {url}: {e}")
+            return result
+        finally:
+            result.elapsed = time.perf_counter() - started_at
+
+        with self._lock:
+            self._pinned[(url, model)] = result
+        load_time = f"{result.load_time:.2f}초" if result.load_time is not None else "알 수 없음"
+        logger.info(f"Ollama 모델 준비: {model} @ {url} (로드 {load_time}, 이미 로드됨: {result.already_loaded})")
+        return result
+
+    def unload(self, base_url: Optional[str], model: str) -> None:
+        """`keep_alive=0`으로 모델을 내리고 고정을 푼다."""
+        url = native_base_url(base_url)
+        with self._lock:
+            self._pinned.pop((url, model), None)
+            self._leases.pop((url, model), None)
+            self._lease_pinned.discard((url, model))
+            self._owned.discard((url, model))
+        try:
+            response = http_clients.sync_client(url).post(
+                f"{url}/api/generate", json={"model": model, "keep_alive": 0}, timeout=30.0
+            )
+            response.raise_for_status()
+            logger.info(f"Ollama 모델 해제: {model} @ {url}")
+        except Exception as e:
+            logger.warning(f"Ollama 모델 해제 실패: {model} @ {url}: {e}")
+
+    def unload_all(self) -> None:
+        with self._lock:
+            targets = list(self._pinned)
+        for url, model in targets:
+            self.unload(url, model)
+
+    def status(self) -> List[Dict[str, Any]]:
+        """고정 중인 모델의 warm-up 결과"""
+        with self._lock:
+            return [result.to_dict() for result in self._pinned.values()]
+
+    @contextmanager
+    def pinned(self, targets: Iterable[Tuple[Optional[str], str]]) -> Iterator[List[WarmupResult]]:
+        """블록 동안 모델들을 올려 두고, 이 프로세스가 새로 올린 모델만 마지막 블록이 끝날 때 내린다.
+
+        - 서버 시작 시 `warm()`으로 고정한 모델은 고정도 로드도 그대로 둔다
+        - warm-up 전에 이미 메모리에 있던 모델(`already_loaded`, 공유 Ollama 서버의 다른 사용자 등)은
+          블록이 끝나면 keep_alive 고정만 풀고 내리지 않는다
+        - 동시에 실행 중인 다른 블록이 같은 모델을 쓰고 있으면 참조 수가 0이 될 때까지 기다린다
+        """
+        results, leased = [], []
+        for base_url, model in dict.fromkeys((native_base_url(url), model) for url, model in targets):
+            key = (base_url, model)
+            with self._lock:
+                first = key not in self._pinned and not self._leases.get(key)
+            result = self.warm(base_url, model)
+            results.append(result)
+            if result.error is not None:
+                continue
+            with self._lock:
+                self._leases[key] = self._leases.get(key, 0) + 1
+                if first:
+                    self._lease_pinned.add(key)
+                    if not result.already_loaded:
+                        self._owned.add(key)
+            leased.append(key)
+        try:
+            yield results
+        finally:
+            for key in leased:
+                self._release(key)
+
+    def _release(self, key: Tuple[str, str]) -> None:
+        """`pinned()` 블록 하나가 끝남. 마지막 블록이면 고정을 풀고, 이 프로세스가 올린 모델이면 내린다."""
+        with self._lock:
+            remaining = self._leases.get(key, 0) - 1
+            if remaining > 0:
+                self._leases[key] = remaining
+                return
+            self._leases.pop(key, None)
+            if key not in self._lease_pinned:
+                return
+            self._lease_pinned.discard(key)
+            owned = key in self._owned
+            if not owned:
+                self._pinned.pop(key, None)
+        if owned:
+            self.unload(*key)
+        else:
+            logger.info(f"Ollama 모델 고정 해제 (실행 전부터 로드돼 있어 내리지 않음): {key[1]} @ {key[0]}")
+
+
+def warmup_targets_from_env() -> List[Tuple[str, str]]:
+    """`OLLAMA_WARMUP_MODELS=qwen3:8b,llava@http://gpu:11434` → [(base_url, model), ...]"""
+    targets = []
+    for entry in os.getenv("OLLAMA_WARMUP_MODELS", "").split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        model, _, base_url = entry.partition("@")
+        targets.append((native_base_url(base_url or None), model.strip()))
+    return targets
+
+
+ollama_hosts = OllamaHostManager()
@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import os
+import re
+import json
+import time
+import random
+import asyncio
+import threading
+from collections import deque
+from contextlib import contextmanager, asynccontextmanager
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterator, AsyncIterator, Optional, Tuple
+
+from loguru import logger
+
+
+# AIMD 파라미터
+DECREASE_FACTOR = 0.5      # 429 발생 시 허용 RPM에 곱하는 비율
+INCREASE_STEP = 1.0        # 성공 1회당 늘리는 RPM
+MIN_RPM = 1.0              # 적응형 RPM 하한
+CHARS_PER_TOKEN = 4        # 프롬프트 길이로 토큰 수를 추정할 때 사용
+IMAGE_TOKEN_ESTIMATE = 1000  # 이미지 1장당 추정 토큰 수 (VLM)
+
+
+def estimate_tokens(*texts: Any) -> int:
+    """문자 길이 기반의 대략적인 토큰 수 추정"""
+    return sum(len(str(text)) for text in texts if text) // CHARS_PER_TOKEN + 1
+
+
+_RATE_LIMIT_NAMES = frozenset({"RateLimitError", "TooManyRequests", "ResourceExhausted"})
+_HTTP_429 = re.compile(r"\b429\b")
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """SDK별 예외에서 429(rate limit) 여부를 판별"""
+    for attr in ("status_code", "code", "status"):
+        if getattr(exc, attr, None) == 429:
+            return True
+    response = getattr(exc, "response", None)
+    if getattr(response, "status_code", None) == 429:
+        return True
+    if {cls.__name__ for cls in type(exc).__mro__} & _RATE_LIMIT_NAMES:
+        return True
+    # 상태 코드를 잃고 메시지로만 감싼 예외: 숫자 429와 rate/too many가 함께 있어야 한다
+    # (본문 길이, 토큰 수, 요청 ID 등에 섞인 429는 제외)
+    message = str(exc).lower()
+    return bool(_HTTP_429.search(message)) and ("rate" in message or "too many" in message)
+
+
+def retry_after_seconds(exc: BaseException) -> Optional[float]:
+    """예외에 담긴 HTTP 응답의 Retry-After 헤더(초 또는 HTTP-date)를 초 단위로 반환"""
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None) or getattr(exc, "headers", None)
+    if not headers:
+        return None
+    for name in ("retry-after-ms", "Retry-After-Ms"):
+        value = headers.get(name)
+        if value:
+            try:
+                return max(float(value) / 1000.0, 0.0)
+            except ValueError:
+                pass
+    value = headers.get("retry-after") or headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """분당 `rate`만큼 채워지는 토큰 버킷.
+
+    `reserve`는 잔량이 음수가 되는 것을 허용하고 대기해야 할 시간을 돌려준다.
+    락 안에서는 계산만 하고 실제 대기는 호출자가 하므로 sync/async 모두에서 쓸 수 있다.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        self.rate = float(rate_per_minute)
+        self.capacity = float(capacity or rate_per_minute)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self.updated_at
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate / 60.0)
+        self.updated_at = now
+
+    def set_rate(self, rate_per_minute: float, now: Optional[float] = None) -> None:
+        self._refill(now or time.monotonic())
+        self.rate = float(rate_per_minute)
+        self.tokens = min(self.tokens, self.rate)
+
+    def reserve(self, amount: float, now: Optional[float] = None) -> float:
+        now = now or time.monotonic()
+        self._refill(now)
+        self.tokens -= amount
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens * 60.0 / self.rate
+
+
+class RateLimiter:
+    """provider+model 하나에 대한 RPM/TPM 제한기 (AIMD 적응형).
+
+    설정된 RPM/TPM을 토큰 버킷으로 강제하고, 429를 받으면 허용 RPM을 절반으로
+    줄이고(Retry-After가 있으면 그 시간 동안 전체 대기), 성공할 때마다 설정값까지
+    조금씩 다시 늘린다. RPM이 설정되지 않은 경우에는 첫 429 시점의 최근 1분 요청 수를
+    기준으로 적응형 제한을 시작한다.
+    """
+
+    def __init__(self, key: str, rpm: Optional[float] = None, tpm: Optional[float] = None):
+        self.key = key
+        self.max_rpm = rpm
+        self.rpm = rpm
+        self.requests = TokenBucket(rpm) if rpm else None
+        self.tokens = TokenBucket(tpm) if tpm else None
+        self.blocked_until = 0.0
+        self.throttled = 0
+        self._recent: deque = deque()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: int) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._recent.append(now)
+            while self._recent and now - self._recent[0] > 60.0:
+                self._recent.popleft()
+            wait = max(self.blocked_until - now, 0.0)
+            if self.requests is not None:
+                wait = max(wait, self.requests.reserve(1, now))
+            if self.tokens is not None and tokens:
+                wait = max(wait, self.tokens.reserve(tokens, now))
+            return wait
+
+    def acquire(self, tokens: int = 0) -> float:
+        """요청 1건(추정 토큰 `tokens`)을 보낼 수 있을 때까지 대기하고 대기 시간을 반환"""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            logger.debug(f"[{self.key}] rate limit 대기 {wait:.2f}초")
+            time.sleep(wait)
+        return wait
+
+    async def aacquire(self, tokens: int = 0) -> float:
+        wait = self._reserve(tokens)
+        if wait > 0:
+            logger.debug(f"[{self.key}] rate limit 대기 {wait:.2f}초")
+            await asyncio.sleep(wait)
+        return wait
+
+    def on_success(self) -> None:
+        """additive increase"""
+        with self._lock:
+            if self.rpm is None or self.requests is None:
+                return
+            rpm = self.rpm + INCREASE_STEP
+            if self.max_rpm is not None:
+                rpm = min(rpm, self.max_rpm)
+            if rpm != self.rpm:
+                self.rpm = rpm
+                self.requests.set_rate(rpm)
+
+    def on_rate_limited(self, retry_after: Optional[float] = None) -> None:
+        """multiplicative decrease"""
+        with self._lock:
+            now = time.monotonic()
+            self.throttled += 1
+            base = self.rpm or max(len(self._recent), MIN_RPM)
+            self.rpm = max(base * DECREASE_FACTOR, MIN_RPM)
+            if self.requests is None:
+                self.requests = TokenBucket(self.rpm, capacity=1)
+            else:
+                self.requests.set_rate(self.rpm, now)
+            # Retry-After가 없으면 새 RPM 기준으로 한 칸 + 약간의 jitter 만큼 쉰다
+            pause = retry_after if retry_after is not None else 60.0 / self.rpm * (1 + random.random())
+            self.blocked_until = max(self.blocked_until, now + pause)
+            logger.warning(f"[{self.key}] 429 감지 → 허용 RPM {self.rpm:.1f}, {pause:.2f}초 대기")
+
+    @contextmanager
+    def limit(self, tokens: int = 0) -> Iterator[float]:
+        """호출 구간을 감싸 대기/성공/429 피드백을 한 번에 처리"""
+        wait = self.acquire(tokens)
+        try:
+            yield wait
+        except Exception as e:
+            if is_rate_limit_error(e):
+                self.on_rate_limited(retry_after_seconds(e))
+            raise
+        self.on_success()
+
+    @asynccontextmanager
+    async def alimit(self, tokens: int = 0) -> AsyncIterator[float]:
+        wait = await self.aacquire(tokens)
+        try:
+            yield wait
+        except Exception as e:
+            if is_rate_limit_error(e):
+                self.on_rate_limited(retry_after_seconds(e))
+            raise
+        self.on_success()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "key": self.key,
+                "rpm": self.rpm,
+                "max_rpm": self.max_rpm,
+                "tpm": self.tokens.rate if self.tokens else None,
+                "throttled": self.throttled,
+                "recent_requests": len(self._recent),
+            }
+
+
+class RateLimiterRegistry:
+    """provider+model별 `RateLimiter`를 프로세스 단위로 공유한다.
+
+    제한값은 `RATE_LIMITS` 환경변수(JSON)에서 읽는다. 키는 "provider/model" 또는
+    "provider"이며 더 구체적인 키가 우선한다.
+        RATE_LIMITS='{"openai": {"rpm": 500, "tpm": 200000}, "anthropic/claude-3-5-haiku-latest": {"rpm": 50}}'
+    설정이 없는 provider/model도 429를 받으면 적응형으로 속도를 줄인다.
+    """
+
+    def __init__(self, limits: Optional[Dict[str, Dict[str, float]]] = None):
+        self.limits = limits if limits is not None else self._load_limits()
+        self._limiters: Dict[Tuple[str, str], RateLimiter] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _load_limits() -> Dict[str, Dict[str, float]]:
+        raw = os.getenv("RATE_LIMITS", "").strip()
+        if not raw:
+            return {}
+        try:
+            return json.loads(raw)
+        except json.JSONDecodeError as e:
+            logger.warning(f"RATE_LIMITS 파싱 실패, 제한 없이 진행: {e}")
+            return {}
+
+    def get(self, provider: Optional[str], model: Optional[str]) -> RateLimiter:
+        key = (provider or "", model or "")
+        with self._lock:
+            limiter = self._limiters.get(key)
+            if limiter is None:
+                conf = self.limits.get(f"{key[0]}/{key[1]}") or self.limits.get(key[0]) or {}
+                limiter = RateLimiter(f"{key[0]}/{key[1]}", rpm=conf.get("rpm"), tpm=conf.get("tpm"))
+                self._limiters[key] = limiter
+            return limiter
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            limiters = list(self._limiters.values())
+        return {limiter.key: limiter.stats() for limiter in limiters}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._limiters.clear()
+
+
+rate_limiter = RateLimiterRegistry()
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Literal
 import langfuse
 from pydantic import BaseModel, Field, model_validator
 
@@ -25,6 +25,34 @@ class ExtractionRequest(BaseModel):
     langfuse_trace_id: Optional[str] = Field(None, description="Langfuse trace ID")
     output_dir: Optional[str] = Field(None, description="결과 출력 디렉토리")
     save: bool = False
+    cache_mode: Literal["off", "read-write", "read-only", "refresh"] = Field("off", description="LLM 응답 캐시 모드 (off, read-write, read-only, refresh)")
+    # 헤지 요청 (tail latency 감소)
+    hedge: bool = Field(False, description="최근 지연시간 백분위수를 넘기면 중복 요청을 보낼지 여부")
+    hedge_percentile: Optional[float] = Field(None, ge=50, le=100, description="헤지 기준 백분위수 (기본값: HEDGE_PERCENTILE 또는 95)")
+    hedge_hosts: Optional[List[HostInfo]] = Field(None, description="헤지 요청을 보낼 보조 호스트 목록 (없으면 같은 호스트로 보냄)")
+    # 긴 문서 분할 추출
+    chunking: bool = Field(False, description="문서가 chunk_max_tokens를 넘으면 청크로 나눠 병렬 추출 후 병합")
+    chunk_max_tokens: int = Field(6000, ge=256, description="청크당 최대 토큰 수 (문자 길이 기반 추정)")
+    chunk_overlap_tokens: int = Field(400, ge=0, description="인접 청크 간 겹치는 토큰 수")
+    chunk_concurrency: int = Field(4, ge=1, description="동시에 추출할 청크 수")
+    # 필드 그룹 병렬 추출
+    parallel_fields: bool = Field(False, description="최상위 필드를 그룹으로 나눠 그룹마다 병렬로 추출한 뒤 조립")
+    field_groups: Optional[List[List[str]]] = Field(None, description="필드 그룹 지정 (예: [['personal_info','summary_info'],['careers']]). 없으면 필드마다 한 그룹")
+    field_group_concurrency: int = Field(8, ge=1, description="동시에 추출할 필드 그룹 수")
+    # self-consistency (여러 샘플 추출 후 필드별 투표)
+    consistency_samples: int = Field(1, ge=1, le=20, description="문서당 추출 샘플 수. 2 이상이면 필드별 다수결로 합치고 합의도를 보고")
+    consistency_strings: Literal["vote", "centroid"] = Field("vote", description="문자열 필드 병합 방식 (vote: 다수결, centroid: 임베딩 중심에 가장 가까운 값)")
+    consistency_concurrency: int = Field(5, ge=1, description="n= 미지원 provider에서 동시에 보낼 샘플 요청 수")
+    consistency_temperature: Optional[float] = Field(0.7, ge=0, le=2, description="샘플링 temperature (extra_kwargs의 temperature가 우선, None이면 설정하지 않음)")
+    consistency_embedder: Optional[HostInfo] = Field(None, description="centroid 방식의 임베딩 호스트 (없으면 로컬 huggingface 모델)")
+    # 추출 전 입력 압축
+    compact: bool = Field(False, description="추출 전에 base64 이미지, 반복 머리말/꼬리말, 표 패딩, 공백을 걷어 입력 토큰을 줄일지 여부")
+    compact_drop_irrelevant: bool = Field(False, description="압축 시 스키마 필드와 관련 없는 제목 섹션도 뺄지 여부 (손실 가능)")
+    # 작은 모델 우선 추출 (cascade)
+    cascade_hosts: Optional[List[HostInfo]] = Field(None, description="host_info 결과가 검사를 통과하지 못하면 순서대로 다시 추출할 상위 모델 목록")
+    cascade_framework: Optional[str] = Field(None, description="상위 모델에 쓸 프레임워크 (없으면 framework와 같음)")
+    cascade_min_filled: float = Field(0.0, ge=0, le=1, description="통과 기준: 채워진 leaf 필드 비율 하한")
+    cascade_required_fields: List[str] = Field(default_factory=list, description="통과 기준: 반드시 채워져야 하는 필드 경로 (예: personal_info.name, careers.company_name)")
 
     
 class ExtractionResult(BaseModel):
@@ -35,6 +63,30 @@ class ExtractionResult(BaseModel):
     output_dir: str
     result_json_path: str
     langfuse_url: Optional[str] = None
+    batch_index: Optional[int] = Field(None, description="배치 실행 시 입력 요청의 순번")
+    provider_batch_id: Optional[str] = Field(None, description="provider batch API로 실행한 경우 batch ID")
+    cache_hit: bool = Field(False, description="응답 캐시에서 결과를 가져왔는지 여부")
+    attempts: List[Dict[str, Any]] = Field(default_factory=list, description="시도별 기록 (지연시간, 오류 분류, rate limit 대기, 백오프)")
+    hedge_fired: int = Field(0, description="보낸 헤지 요청 수")
+    hedge_won: int = Field(0, description="헤지 요청이 먼저 성공한 횟수")
+    chunks: int = Field(1, description="분할 추출에 사용한 청크 수")
+    field_groups: int = Field(0, description="필드 그룹 병렬 추출에 사용한 그룹 수")
+    failed_groups: List[str] = Field(default_factory=list, description="실패한 필드 그룹")
+    ttff: Optional[float] = Field(None, description="스트리밍 시 첫 필드가 채워지기까지 걸린 시간(초)")
+    prompt_tokens: Optional[int] = Field(None, description="입력 토큰 수 (provider 보고값, 모든 시도 합)")
+    completion_tokens: Optional[int] = Field(None, description="출력 토큰 수 (provider 보고값, 모든 시도 합)")
+    cached_tokens: Optional[int] = Field(None, description="입력 중 prefix 캐시에서 읽은 토큰 수 (provider 보고값)")
+    ttft: Optional[float] = Field(None, description="첫 토큰까지 시간(초). 스트리밍 또는 provider가 prefill 시간을 보고하는 경우")
+    decode_tps: Optional[float] = Field(None, description="출력 토큰 생성 속도 (tokens/s)")
+    load_time: Optional[float] = Field(None, description="모델 로드 시간(초). Ollama가 보고한 경우만, ttft와 별도")
+    cost: Optional[float] = Field(None, description="가격표로 계산한 USD 비용 (모든 시도 합, 단가를 모르는 모델이면 None)")
+    retries: int = Field(0, description="재시도 횟수")
+    overhead: Optional[float] = Field(None, description="HTTP 호출 밖에서 쓴 프레임워크 처리 시간(초)")
+    samples: int = Field(0, description="self-consistency 투표에 쓴 샘플 수")
+    agreement: Dict[str, float] = Field(default_factory=dict, description="self-consistency 필드 경로별 합의도 (0~1)")
+    consistency: Optional[float] = Field(None, description="self-consistency 필드 평균 합의도 (신뢰도 신호)")
+    compaction: Optional[Dict[str, Any]] = Field(None, description="입력 압축 보고 (원본/압축 토큰 수, 감소율, 단계별 제거 건수, 추정 지연시간 절감)")
+    cascade: Optional[Dict[str, Any]] = Field(None, description="cascade 보고 (상위 모델로 올렸는지, 최종 단계/모델, 단계별 지연시간과 실패 이유)")
 
 class EvaluationRequest(BaseModel):
     pred_json_path: str
@@ -50,6 +102,8 @@ class EvaluationResult(BaseModel):
     overall_score: float
     eval_result_path: str
     output_dir: str
+    embedding_tokens: Optional[int] = Field(None, description="유사도 계산에 쓴 임베딩 입력 토큰 수 (문자 길이 기반 추정)")
+    cost: Optional[float] = Field(None, description="임베딩 USD 비용 (단가를 모르는 모델이면 None)")
 
 
 class ParsingRequest(BaseModel):
@@ -60,6 +114,7 @@ class ParsingRequest(BaseModel):
     prompt: Optional[str] = Field(None, description="VLM 사용시 사용할 프롬프트")
     output_dir: Optional[str] = Field(None, description="결과 출력 디렉토리")
     save: bool = False
+    cache_mode: Literal["off", "read-write", "read-only", "refresh"] = Field("read-write", description="파싱 결과 캐시 모드 (파일 내용 해시 기준, 기본값: read-write)")
 
 
 class ParsingResult(BaseModel):
@@ -69,6 +124,12 @@ class ParsingResult(BaseModel):
     file_path: str
     output_dir: Optional[str] = None
     result_txt_path: Optional[str] = None
+    prompt_tokens: Optional[int] = Field(None, description="VLM 파싱 입력 토큰 수 (모든 페이지 합, provider 보고값)")
+    completion_tokens: Optional[int] = Field(None, description="VLM 파싱 출력 토큰 수 (모든 페이지 합)")
+    cost: Optional[float] = Field(None, description="VLM 파싱 USD 비용 (단가를 모르는 모델이면 None)")
+    cache_hit: bool = Field(False, description="파싱 캐시에서 결과를 가져왔는지 여부")
+    parse_time: Optional[float] = Field(None, description="실제 파싱에 걸린 시간(초). 캐시 적중이면 처음 파싱할 때의 시간")
+    failed_pages: List[int] = Field(default_factory=list, description="처리에 실패해 결과에서 빠진 페이지 번호 (VLM 파싱)")
 
 class BaseResponse(BaseModel):
     success: bool
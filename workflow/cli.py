@@ -9,6 +9,7 @@ from pathlib import Path
 
 from structured_output_kit.workflow.utils import load_workflow_config
 from structured_output_kit.workflow.core import WorkflowExecutor
+from structured_output_kit.extraction.cassette import use_cassette
 
 
 app = typer.Typer(help="통합 워크플로우 실행 도구")
@@ -21,7 +22,10 @@ def run(
     parallel: Optional[bool] = typer.Option(None, "--parallel", help="병렬 실행 여부 (설정 파일 값 재정의)"),
     fail_fast: Optional[bool] = typer.Option(None, "--fail-fast", help="실패시 즉시 중단 여부 (설정 파일 값 재정의)"),
     output_dir: Optional[str] = typer.Option(None, "--output", help="결과 출력 디렉토리 (설정 파일 값 재정의)"),
-    dry_run: bool = typer.Option(False, "--dry-run", help="실제 실행 없이 설정만 검증")
+    dry_run: bool = typer.Option(False, "--dry-run", help="실제 실행 없이 설정만 검증"),
+    cassette: Optional[str] = typer.Option(None, "--cassette", help="HTTP 기록/재생 카세트 파일 (JSONL)"),
+    cassette_mode: str = typer.Option("off", "--cassette-mode", help="카세트 모드 (off, record, replay). replay는 네트워크 없이 실행"),
+    cassette_latency: bool = typer.Option(False, "--cassette-latency", help="재생 시 기록된 원래 지연시간 재현"),
 ):
     """YAML 설정을 기반으로 워크플로우 실행"""
     
@@ -56,6 +60,9 @@ def run(
             typer.echo("✅ 설정 파일 검증 완료. 실제 실행하려면 --dry-run 옵션을 제거하세요.")
             return
         
+        if cassette_mode != "off":
+            use_cassette(cassette, cassette_mode, cassette_latency)
+
         # 워크플로우 실행
         typer.echo(f"🚀 워크플로우 시작: {config.name}")
         executor = WorkflowExecutor(config)
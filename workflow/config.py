@@ -2,7 +2,7 @@
 Workflow configuration models using Pydantic
 """
 
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Union, Literal
 from pydantic import BaseModel, Field, validator
 import os
 
@@ -15,6 +15,7 @@ class ParsingConfig(BaseModel):
     prompt: Optional[str] = Field(None, description="VLM 사용시 프롬프트")
     host_info: Optional[Dict[str, Any]] = Field(None, description="VLM 사용시 호스트 정보")
     save: bool = Field(True, description="결과 저장 여부")
+    cache_mode: Literal["off", "read-write", "read-only", "refresh"] = Field("read-write", description="파싱 결과 캐시 모드 (파일 내용 해시 기준)")
     
     @validator('file_path')
     def validate_file_path(cls, v):
@@ -34,6 +35,28 @@ class ExtractionConfig(BaseModel):
     extra_kwargs: Dict[str, Any] = Field(default_factory=dict, description="추가 파라미터")
     langfuse_trace_id: Optional[str] = Field(None, description="Langfuse trace ID")
     save: bool = Field(True, description="결과 저장 여부")
+    cache_mode: Literal["off", "read-write", "read-only", "refresh"] = Field("off", description="LLM 응답 캐시 모드")
+    hedge: bool = Field(False, description="느린 요청에 대해 헤지 요청을 보낼지 여부")
+    hedge_percentile: Optional[float] = Field(None, description="헤지 기준 백분위수")
+    hedge_hosts: List[Dict[str, Any]] = Field(default_factory=list, description="헤지 요청을 보낼 보조 호스트 정보 목록")
+    chunking: bool = Field(False, description="긴 문서를 청크로 나눠 병렬 추출 후 병합")
+    chunk_max_tokens: int = Field(6000, description="청크당 최대 토큰 수")
+    chunk_overlap_tokens: int = Field(400, description="인접 청크 간 겹치는 토큰 수")
+    chunk_concurrency: int = Field(4, description="동시에 추출할 청크 수")
+    parallel_fields: bool = Field(False, description="최상위 필드 그룹별로 병렬 추출 후 조립")
+    field_groups: Optional[List[List[str]]] = Field(None, description="필드 그룹 지정 (없으면 필드마다 한 그룹)")
+    field_group_concurrency: int = Field(8, description="동시에 추출할 필드 그룹 수")
+    consistency_samples: int = Field(1, ge=1, le=20, description="문서당 추출 샘플 수 (2 이상이면 필드별 투표)")
+    consistency_strings: Literal["vote", "centroid"] = Field("vote", description="문자열 필드 병합 방식")
+    consistency_concurrency: int = Field(5, description="동시에 보낼 샘플 요청 수")
+    consistency_temperature: Optional[float] = Field(0.7, description="샘플링 temperature")
+    consistency_embedder: Optional[Dict[str, Any]] = Field(None, description="centroid 방식의 임베딩 호스트 정보")
+    compact: bool = Field(False, description="추출 전 입력 압축 (이미지, 반복 머리말/꼬리말, 표 패딩, 공백 제거)")
+    compact_drop_irrelevant: bool = Field(False, description="압축 시 스키마와 관련 없는 섹션도 제거")
+    cascade_hosts: List[Dict[str, Any]] = Field(default_factory=list, description="host_info 결과가 검사를 통과하지 못하면 순서대로 다시 추출할 상위 모델 호스트 정보 목록")
+    cascade_framework: Optional[str] = Field(None, description="상위 모델에 쓸 프레임워크 (없으면 framework와 같음)")
+    cascade_min_filled: float = Field(0.0, ge=0, le=1, description="cascade 통과 기준: 채워진 필드 비율 하한")
+    cascade_required_fields: List[str] = Field(default_factory=list, description="cascade 통과 기준: 반드시 채워져야 하는 필드 경로")
 
 
 class EvaluationConfig(BaseModel):
@@ -68,6 +91,7 @@ class WorkflowConfig(BaseModel):
     # 실행 옵션
     parallel: bool = Field(False, description="병렬 실행 여부")
     fail_fast: bool = Field(True, description="실패시 즉시 중단 여부")
+    ollama_warmup: bool = Field(True, description="시작 시 Ollama 모델을 미리 올려 고정하고 끝나면 해제")
     
     @validator('parsing')
     def validate_parsing_or_input_text(cls, v, values):
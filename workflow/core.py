@@ -14,8 +14,10 @@ from structured_output_kit.workflow.utils import create_workflow_output_dir, sav
 
 # 기존 core 함수들 import
 from structured_output_kit.parsing.core import run_parsing_core
-from structured_output_kit.extraction.core import run_extraction_core
+from structured_output_kit.extraction.core import run_extraction_core_async
+from structured_output_kit.extraction.cascade import summarize as summarize_cascade
 from structured_output_kit.evaluation.core import run_evaluation_core
+from structured_output_kit.utils.ollama_host import ollama_hosts
 
 # 기존 타입들 import
 from structured_output_kit.utils.types import (
@@ -69,6 +71,7 @@ class WorkflowResult:
         self.end_time: Optional[datetime] = None
         self.combination_results: List[CombinationResult] = []
         self.overall_success = False
+        self.ollama_warmup: List[Dict[str, Any]] = []  # 시작 시 warm-up한 Ollama 모델별 로드 시간
         
     def add_combination_result(self, result: CombinationResult):
         """조합 결과 추가"""
@@ -93,7 +96,8 @@ class WorkflowResult:
             "end_time": self.end_time.isoformat() if self.end_time else None,
             "duration_seconds": (self.end_time - self.start_time).total_seconds() if self.end_time else None,
             "output_dir": self.output_dir,
-            "overall_success": self.overall_success
+            "overall_success": self.overall_success,
+            "ollama_warmup": self.ollama_warmup
         }
 
 
@@ -109,10 +113,37 @@ class WorkflowExecutor:
         logger.info(f"총 조합 수: {config.get_total_combinations()}")
         logger.info(f"출력 디렉토리: {self.output_dir}")
     
+    def _ollama_targets(self) -> List[Tuple[Optional[str], str]]:
+        """워크플로우가 쓰는 Ollama 모델 (추출, 헤지/cascade 호스트, VLM 파싱)"""
+        host_infos = []
+        for config in self.config.extraction:
+            host_infos.append(config.host_info)
+            host_infos.extend(config.hedge_hosts)
+            host_infos.extend(config.cascade_hosts)
+        host_infos.extend(config.host_info for config in self.config.parsing or [] if config.host_info)
+        return [
+            (host.get("base_url"), host["model"])
+            for host in host_infos
+            if host.get("provider") == "ollama" and host.get("model")
+        ]
+
     async def execute(self) -> WorkflowResult:
         """워크플로우 전체 실행"""
         workflow_result = WorkflowResult(self.config, self.output_dir)
-        
+        targets = self._ollama_targets() if self.config.ollama_warmup else []
+        if not targets:
+            return await self._execute(workflow_result)
+
+        # 첫 조합이 모델 로드 시간을 떠안지 않도록 미리 올려 두고, 끝나면 실행 전에 없던 모델만 (다른 워크플로우가 쓰고 있지 않을 때) 내린다
+        pin = ollama_hosts.pinned(targets)
+        warmups = await asyncio.to_thread(pin.__enter__)
+        workflow_result.ollama_warmup = [warmup.to_dict() for warmup in warmups]
+        try:
+            return await self._execute(workflow_result)
+        finally:
+            await asyncio.to_thread(pin.__exit__, None, None, None)
+
+    async def _execute(self, workflow_result: WorkflowResult) -> WorkflowResult:
         try:
             combinations = self.config.get_combinations()
             
@@ -252,7 +283,8 @@ class WorkflowExecutor:
             host_info=host_info,
             prompt=config.prompt,
             output_dir=output_dir,
-            save=config.save
+            save=config.save,
+            cache_mode=config.cache_mode
         )
         
         # 기존 run_parsing_core 함수 사용
@@ -273,11 +305,33 @@ class WorkflowExecutor:
             host_info=host_info,
             langfuse_trace_id=config.langfuse_trace_id,
             output_dir=output_dir,
-            save=config.save
+            save=config.save,
+            cache_mode=config.cache_mode,
+            hedge=config.hedge,
+            hedge_percentile=config.hedge_percentile,
+            hedge_hosts=[HostInfo(**host) for host in config.hedge_hosts] or None,
+            chunking=config.chunking,
+            chunk_max_tokens=config.chunk_max_tokens,
+            chunk_overlap_tokens=config.chunk_overlap_tokens,
+            chunk_concurrency=config.chunk_concurrency,
+            parallel_fields=config.parallel_fields,
+            field_groups=config.field_groups,
+            field_group_concurrency=config.field_group_concurrency,
+            consistency_samples=config.consistency_samples,
+            consistency_strings=config.consistency_strings,
+            consistency_concurrency=config.consistency_concurrency,
+            consistency_temperature=config.consistency_temperature,
+            consistency_embedder=HostInfo(**config.consistency_embedder) if config.consistency_embedder else None,
+            compact=config.compact,
+            compact_drop_irrelevant=config.compact_drop_irrelevant,
+            cascade_hosts=[HostInfo(**host) for host in config.cascade_hosts] or None,
+            cascade_framework=config.cascade_framework,
+            cascade_min_filled=config.cascade_min_filled,
+            cascade_required_fields=config.cascade_required_fields
         )
         
-        # 기존 run_extraction_core 함수 사용
-        return run_extraction_core(extraction_request)
+        # 비동기 추출 코어 사용 (병렬 실행 시 이벤트 루프를 막지 않음)
+        return await run_extraction_core_async(extraction_request)
     
     async def _execute_evaluation(self, config: EvaluationConfig, 
                                 pred_json_path: str, output_dir: str) -> Optional[EvaluationResult]:
@@ -328,19 +382,46 @@ class WorkflowExecutor:
             if result.parsing_result:
                 detail["parsing_output_dir"] = result.parsing_result.output_dir
                 detail["parsing_result_path"] = result.parsing_result.result_txt_path
+                detail["parsing_prompt_tokens"] = result.parsing_result.prompt_tokens
+                detail["parsing_completion_tokens"] = result.parsing_result.completion_tokens
+                detail["parsing_cost"] = result.parsing_result.cost
+                detail["parsing_cache_hit"] = result.parsing_result.cache_hit
+                detail["parsing_time"] = result.parsing_result.parse_time
             
             if result.extraction_result:
                 detail["extraction_output_dir"] = result.extraction_result.output_dir
                 detail["extraction_result_path"] = result.extraction_result.result_json_path
                 detail["extraction_success_rate"] = result.extraction_result.success_rate
                 detail["extraction_latency"] = result.extraction_result.latency
+                detail["extraction_cache_hit"] = result.extraction_result.cache_hit
+                detail["extraction_hedge_fired"] = result.extraction_result.hedge_fired
+                detail["extraction_hedge_won"] = result.extraction_result.hedge_won
+                detail["extraction_chunks"] = result.extraction_result.chunks
+                detail["extraction_failed_groups"] = result.extraction_result.failed_groups
+                detail["extraction_prompt_tokens"] = result.extraction_result.prompt_tokens
+                detail["extraction_completion_tokens"] = result.extraction_result.completion_tokens
+                detail["extraction_cached_tokens"] = result.extraction_result.cached_tokens
+                detail["extraction_ttft"] = result.extraction_result.ttft
+                detail["extraction_decode_tps"] = result.extraction_result.decode_tps
+                detail["extraction_load_time"] = result.extraction_result.load_time
+                detail["extraction_cost"] = result.extraction_result.cost
+                detail["extraction_retries"] = result.extraction_result.retries
+                detail["extraction_overhead"] = result.extraction_result.overhead
+                detail["extraction_samples"] = result.extraction_result.samples
+                detail["extraction_consistency"] = result.extraction_result.consistency
+                detail["extraction_compaction"] = result.extraction_result.compaction
+                detail["extraction_cascade"] = result.extraction_result.cascade
             
             if result.evaluation_result:
                 detail["evaluation_output_dir"] = result.evaluation_result.output_dir
                 detail["evaluation_result_path"] = result.evaluation_result.eval_result_path
                 detail["evaluation_score"] = result.evaluation_result.overall_score
+                detail["evaluation_embedding_tokens"] = result.evaluation_result.embedding_tokens
+                detail["evaluation_cost"] = result.evaluation_result.cost
             
             summary["combination_details"].append(detail)
+        summary["usage"] = self._usage_summary(summary["combination_details"])
+        summary["cascade"] = self._cascade_summary(summary["combination_details"])
         
         # 요약 파일 저장
         summary_path = os.path.join(self.output_dir, "workflow_summary.json")
@@ -352,6 +433,43 @@ class WorkflowExecutor:
         # 콘솔에 요약 출력
         self._print_workflow_summary(summary)
     
+    @staticmethod
+    def _usage_summary(details: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """조합별 토큰/비용을 단계별로 합친다 (비용은 단가를 아는 호출만)"""
+        def _sum(key: str) -> Optional[float]:
+            values = [detail[key] for detail in details if detail.get(key) is not None]
+            return sum(values) if values else None
+
+        usage = {
+            "parsing": {
+                "prompt_tokens": _sum("parsing_prompt_tokens"),
+                "completion_tokens": _sum("parsing_completion_tokens"),
+                "cost": _sum("parsing_cost"),
+            },
+            "extraction": {
+                "prompt_tokens": _sum("extraction_prompt_tokens"),
+                "completion_tokens": _sum("extraction_completion_tokens"),
+                "cached_tokens": _sum("extraction_cached_tokens"),
+                "cost": _sum("extraction_cost"),
+            },
+            "evaluation": {
+                "embedding_tokens": _sum("evaluation_embedding_tokens"),
+                "cost": _sum("evaluation_cost"),
+            },
+        }
+        costs = [stage["cost"] for stage in usage.values() if stage["cost"] is not None]
+        usage["total_cost"] = sum(costs) if costs else None
+        return usage
+
+    @staticmethod
+    def _cascade_summary(details: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """cascade를 쓴 추출 설정별 escalation 비율과 blended latency"""
+        by_config: Dict[int, List[Optional[Dict[str, Any]]]] = {}
+        for detail in details:
+            by_config.setdefault(detail["extraction_idx"], []).append(detail.get("extraction_cascade"))
+        summaries = {f"extraction_{idx}": summarize_cascade(reports) for idx, reports in sorted(by_config.items())}
+        return {name: summary for name, summary in summaries.items() if summary}
+
     def _print_workflow_summary(self, summary: Dict[str, Any]):
         """콘솔에 워크플로우 요약 출력"""
         print("\n" + "="*80)
@@ -362,6 +480,16 @@ class WorkflowExecutor:
         print(f"📈 성공률: {summary['success_rate']:.1%}")
         print(f"⏱️  실행 시간: {summary['duration_seconds']:.1f}초")
         print(f"📁 결과 디렉토리: {summary['output_dir']}")
+        for warmup in summary.get('ollama_warmup') or []:
+            load_time = f"{warmup['load_time']:.2f}초" if warmup.get('load_time') is not None else warmup.get('error')
+            print(f"🔥 Ollama warm-up: {warmup['model']} (로드 {load_time})")
+        if summary.get('usage', {}).get('total_cost') is not None:
+            print(f"💰 비용: ${summary['usage']['total_cost']:.4f}")
+        for name, cascade in (summary.get('cascade') or {}).items():
+            print(
+                f"🪜 cascade {name}: 상위 모델 {cascade['escalated']}/{cascade['documents']}건 "
+                f"({cascade['escalation_rate']:.1%}), blended latency {cascade['blended_latency']:.2f}초"
+            )
         
         if summary['combination_details']:
             print(f"\n📋 조합별 상세 결과:")